@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""``extract_all`` wall time against worker processes on a synthetic campaign.
+
+Writes a campaign of *N* catalysts (one reactant, one product, an OPT and an SP
+level; about 20 calcs per catalyst) with realistic outputs from
+:mod:`pya3eda.bench` — OPT + frequency runs for the optimisations, fragment-EDA
+runs for the EDA single points — and times a cold
+:func:`~pya3eda.extractor.data.extract_all` (parsed-output cache removed first)
+for each ``--jobs`` value. ``1`` is the serial path; the others parse OPTs and
+SPs in one pipelined pool:
+
+    python benchmarks/bench_extract.py [--catalysts 100] [--cycles 50] [--jobs 1,2,4,8]
+
+Every run must return the same data as the serial one; the script asserts that.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "src")]
+
+from pya3eda.bench import OutputShape, eda_output, opt_output  # noqa: E402
+from pya3eda.cache import CACHE_DIR  # noqa: E402
+from pya3eda.config import (  # noqa: E402
+    CatalystConfig,
+    Config,
+    LevelConfig,
+    SpeciesConfig,
+    TheoryConfig,
+)
+from pya3eda.extractor.data import extract_all  # noqa: E402
+from pya3eda.extractor.table import ExtractedTable  # noqa: E402
+from pya3eda.registry import CalcRegistry  # noqa: E402
+from pya3eda.vocab import Mode  # noqa: E402
+
+
+def config_for(catalysts: int) -> Config:
+    """A campaign of *catalysts* catalysts with one OPT and one EDA SP level."""
+    return Config(
+        levels=[
+            LevelConfig(
+                opt=TheoryConfig(method="wB97X-V", basis="def2-SVP", solvent="smd"),
+                sp=[TheoryConfig(method="wB97M-V", basis="def2-TZVPPD", solvent="smd", eda2=1)],
+            )
+        ],
+        reactants=[SpeciesConfig(name="prop2enal")],
+        products=[SpeciesConfig(name="product")],
+        catalysts=[CatalystConfig(name=f"cat{i}") for i in range(catalysts)],
+    )
+
+
+def write_campaign(base: Path, catalysts: int, shape: OutputShape) -> CalcRegistry:
+    """Write an input and a successful output for every calc of the campaign."""
+    registry = CalcRegistry(config_for(catalysts), base)
+    opt, eda = opt_output(shape), eda_output(shape)
+    for spec in registry.all_calcs:
+        spec.input_path.parent.mkdir(parents=True, exist_ok=True)
+        spec.input_path.touch()
+        eda_sp = spec.id.mode == Mode.SP and spec.id.calc_type is not None
+        spec.output_path.write_text(eda if eda_sp else opt)
+    return registry
+
+
+def _cold_extract(registry: CalcRegistry, jobs: int) -> tuple[ExtractedTable, float]:
+    """``extract_all`` with *jobs* workers and an empty parsed-output cache, and its wall time."""
+    shutil.rmtree(registry.base_dir / CACHE_DIR, ignore_errors=True)
+    t0 = time.perf_counter()
+    result = extract_all(registry, criteria="all", jobs=jobs)
+    return result, time.perf_counter() - t0
+
+
+def main() -> None:
+    """Time ``extract_all`` for each requested worker count."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--catalysts", type=int, default=100)
+    ap.add_argument("--cycles", type=int, default=50, help="optimisation cycles per output")
+    ap.add_argument("--jobs", default="1,2,4,8")
+    args = ap.parse_args()
+    shape = OutputShape(cycles=args.cycles)
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = write_campaign(Path(tmp), args.catalysts, shape)
+        print(f"{len(registry.all_calcs):,} calcs, {os.cpu_count()} CPUs")
+        serial, t_serial = _cold_extract(registry, 1)
+        print(f"jobs= 1: {t_serial:8.2f} s")
+        for jobs in (int(j) for j in args.jobs.split(",")):
+            if jobs == 1:
+                continue
+            result, t = _cold_extract(registry, jobs)
+            assert result == serial, f"jobs={jobs} differs from the serial path"
+            print(f"jobs={jobs:2d}: {t:8.2f} s  ({t_serial / t:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Single-pass OPT scan vs one regex pass per field, and the tail-first file read.
+
+Inflates the synthetic OPT output from ``tests/synthetic_outputs.py`` to a
+realistic size — many optimisation cycles (energy + orientation table each) and
+a long frequency section — then times what ``extractor.data._extract_opt`` used
+to do (one full-text pass per ``parse_*`` field) against the single
+:func:`~pya3eda.parser.qchem.scan_opt_output` traversal, and against the
+tail-first :func:`~pya3eda.parser.tail.scan_opt_file` it now reads the file with:
+
+    python benchmarks/bench_opt_scan.py [--cycles 2000] [--repeat 3]
+
+All paths must return identical values; the script asserts that before timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from pya3eda.parser import qchem  # noqa: E402
+from pya3eda.parser.tail import scan_opt_file  # noqa: E402
+from pya3eda.parser.xyz import parse_output_xyz  # noqa: E402
+from tests.synthetic_outputs import OPT_OUTPUT  # noqa: E402
+
+_CYCLE = """\
+ Total energy =  -191.60000000
+
+ Standard Nuclear Orientation (Angstroms)
+    I     Atom           X            Y            Z
+ ----------------------------------------------------------------
+{rows} ----------------------------------------------------------------
+   Gradient    0.001234    0.000300    NO
+"""
+_ROW = "    {i}      C       0.4205497061    -1.6552069740    -0.2948977242\n"
+_MODE = " Frequency:    {f:8.2f}\n" + "  C   0.010  -0.020   0.030\n" * 40
+
+
+def build_output(cycles: int) -> str:
+    """Return OPT_OUTPUT with *cycles* extra optimisation cycles and a frequency section."""
+    rows = "".join(_ROW.format(i=i) for i in range(1, 41))
+    body = _CYCLE.format(rows=rows) * cycles
+    freqs = "".join(_MODE.format(f=100.0 + i) for i in range(cycles // 4))
+    head, tail = OPT_OUTPUT.split(" Final energy", 1)
+    thermo_head, thermo_tail = tail.split(" STANDARD THERMO", 1)
+    return f"{head}{body} Final energy{thermo_head}{freqs} STANDARD THERMO{thermo_tail}"
+
+
+def per_field(text: str) -> tuple[object, ...]:
+    """The pre-scanner extraction: one full-text pass per field."""
+    return (
+        qchem.parse_energy(text),
+        qchem.parse_enthalpy(text),
+        qchem.parse_entropy(text),
+        qchem.parse_thermo_conditions(text),
+        qchem.parse_translational_entropy(text),
+        qchem.parse_zpve(text),
+        qchem.parse_imaginary_freq(text),
+        parse_output_xyz(text),
+    )
+
+
+# What per_field reads — and, like extraction of a gas-phase OPT, no SMD block.
+_READ = (
+    "energy",
+    "enthalpy",
+    "entropy",
+    "thermo",
+    "trans_entropy",
+    "zpve",
+    "imag_freq",
+    "geometry",
+)
+
+
+def _fields(s: qchem.OptOutputSummary | None) -> tuple[object, ...]:
+    """The fields :func:`per_field` reads, taken from a scanner summary."""
+    assert s is not None
+    return (
+        s.energy,
+        s.enthalpy,
+        s.entropy,
+        s.thermo,
+        s.trans_entropy,
+        s.zpve,
+        s.imag_freq,
+        s.geometry,
+    )
+
+
+def single_pass(text: str) -> tuple[object, ...]:
+    """The scanner extraction: every field in one traversal."""
+    return _fields(qchem.scan_opt_output(text, _READ))
+
+
+def tail_first(path: Path) -> tuple[object, ...]:
+    """The tail-first file read: only the end of the file is decoded and scanned."""
+    return _fields(scan_opt_file(path, _READ))
+
+
+def _best(fn: Callable[[Any], object], arg: Any, repeat: int) -> float:
+    """Best-of-*repeat* wall time of ``fn(arg)`` in seconds."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main() -> None:
+    """Build the inflated output, check parity, and print both timings."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--cycles", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    text = build_output(args.cycles)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "opt.out"
+        path.write_text(text, encoding="utf-8")
+        assert per_field(text) == single_pass(text), "scanner disagrees with per-field parsers"
+        assert tail_first(path) == single_pass(text), "tail-first read disagrees with full scan"
+
+        t_fields = _best(per_field, text, args.repeat)
+        t_scan = _best(single_pass, text, args.repeat)
+        t_tail = _best(tail_first, path, args.repeat)
+    print(f"output size        : {len(text) / 1e6:8.1f} MB")
+    print(f"per-field passes   : {t_fields * 1e3:8.1f} ms")
+    print(f"single-pass scan   : {t_scan * 1e3:8.1f} ms")
+    print(f"speedup            : {t_fields / t_scan:8.2f}x")
+    print(f"tail-first file    : {t_tail * 1e3:8.1f} ms (incl. read)")
+
+
+if __name__ == "__main__":
+    main()
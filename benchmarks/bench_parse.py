@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Every output parser on large synthetic Q-Chem outputs, with a JSON report.
+
+The same suite as ``pya3eda bench parse`` (see :mod:`pya3eda.bench`), runnable
+from a source checkout without installing the package:
+
+    python benchmarks/bench_parse.py [--cycles 2000] [--atoms 60] [--modes 500]
+        [--repeat 5] [--output report.json] [--baseline previous.json]
+
+Save a report per release with ``--output`` and pass one back as ``--baseline``
+to print each parser's time relative to it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "src")]
+
+from pya3eda.bench import (  # noqa: E402
+    OutputShape,
+    format_report,
+    load_report,
+    run_parse_benchmarks,
+    write_report,
+)
+
+
+def main() -> None:
+    """Run the suite, print the table, and write the report if asked."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--cycles", type=int, default=2000)
+    ap.add_argument("--atoms", type=int, default=60)
+    ap.add_argument("--modes", type=int, default=500)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--output", type=Path)
+    ap.add_argument("--baseline", type=Path)
+    args = ap.parse_args()
+
+    baseline = load_report(args.baseline) if args.baseline else None
+    shape = OutputShape(cycles=args.cycles, atoms=args.atoms, modes=args.modes)
+    report = run_parse_benchmarks(shape, repeat=args.repeat)
+    print(format_report(report, baseline))
+    if args.output:
+        write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
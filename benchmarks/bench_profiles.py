@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Profile assembly time against catalyst count.
+
+Builds the registry of a Diels-Alder campaign with *N* catalysts (two
+reactants, so preTS / postTS stages carry alternative complexes and NI
+references), fills an :class:`~pya3eda.extractor.table.ExtractedTable` with
+random energies for every calc, and times compiling the registry's profiles
+into a :class:`~pya3eda.extractor.stages.ProfileMatrix` and one
+:meth:`~pya3eda.extractor.stages.ProfileMatrix.evaluate` — the cost of each
+further what-if evaluation:
+
+    python benchmarks/bench_profiles.py [--catalysts 10,100,500] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "src")]
+
+from pya3eda.config import (  # noqa: E402
+    CatalystConfig,
+    Config,
+    LevelConfig,
+    SpeciesConfig,
+    TheoryConfig,
+)
+from pya3eda.extractor.stages import ProfileMatrix  # noqa: E402
+from pya3eda.extractor.table import ExtractedTable  # noqa: E402
+from pya3eda.ids import ExtractedData  # noqa: E402
+from pya3eda.registry import CalcRegistry  # noqa: E402
+
+
+def config_for(catalysts: int) -> Config:
+    """A two-reactant campaign of *catalysts* catalysts with one OPT and one EDA SP level."""
+    return Config(
+        levels=[
+            LevelConfig(
+                opt=TheoryConfig(method="wB97X-V", basis="def2-SVP", solvent="smd"),
+                sp=[TheoryConfig(method="wB97M-V", basis="def2-TZVPPD", solvent="smd", eda2=1)],
+            )
+        ],
+        reactants=[SpeciesConfig(name="prop2enal"), SpeciesConfig(name="buta13diene")],
+        products=[SpeciesConfig(name="product")],
+        catalysts=[CatalystConfig(name=f"cat{i}") for i in range(catalysts)],
+    )
+
+
+def random_table(registry: CalcRegistry, seed: int = 0) -> ExtractedTable:
+    """Random but complete extracted data for every calc of *registry*."""
+    rnd = random.Random(seed)
+    return ExtractedTable.from_data(
+        ExtractedData(
+            calc_id=spec.id,
+            energy=rnd.uniform(-1e5, -1e4),
+            G=rnd.uniform(-1e5, -1e4),
+            H=rnd.uniform(-1e5, -1e4),
+            s_corr=rnd.uniform(0.05, 0.15),
+            s_trans=rnd.uniform(0.03, 0.05),
+            temperature=298.15,
+        )
+        for spec in registry.all_calcs
+    )
+
+
+def main() -> None:
+    """Time compiling and evaluating the profiles for each catalyst count."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--catalysts", default="10,100,500")
+    ap.add_argument("--repeat", type=int, default=5, help="evaluations to average")
+    args = ap.parse_args()
+    for n in (int(c) for c in args.catalysts.split(",")):
+        registry = CalcRegistry(config_for(n), Path("/bench"))
+        table = random_table(registry)
+        t0 = time.perf_counter()
+        matrix = ProfileMatrix(registry.all_profiles)
+        t_compile = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            profiles = matrix.evaluate(table)
+        t_eval = (time.perf_counter() - t0) / args.repeat
+        print(
+            f"{n:5d} catalysts, {len(registry.all_calcs):7,} calcs, {len(profiles):6,} profiles: "
+            f"compile {t_compile * 1e3:8.1f} ms, evaluate {t_eval * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
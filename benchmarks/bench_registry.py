@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Registry construction time and memory at screening scale (10k / 100k / 1M calcs).
+
+Builds a :class:`~pya3eda.registry.CalcRegistry` from a synthetic config whose
+catalyst count is chosen to enumerate roughly *N* calculations, and reports the
+construction time, the memory the registry holds (:mod:`tracemalloc`) and the
+cost of a ``CalcID``-keyed dict lookup with an equal-but-distinct key (what
+``registry.get(spec.id.to_opt())`` does). The identity types are then compared
+with their former pydantic definitions (``--no-legacy`` skips that), and
+``--compiled`` also times a cold and a warm
+:func:`~pya3eda.registry.compiled.load_registry` of the config written to YAML:
+
+    python benchmarks/bench_registry.py [--sizes 10000,100000,1000000] [--no-legacy] [--compiled]
+
+Memory is measured in a separate build from time, since tracing slows
+allocation down.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import yaml
+from pydantic import BaseModel
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "src")]
+
+from pya3eda.config import (  # noqa: E402
+    CatalystConfig,
+    Config,
+    LevelConfig,
+    SpeciesConfig,
+    TheoryConfig,
+)
+from pya3eda.ids import CalcID, CalcSpec  # noqa: E402
+from pya3eda.registry import CalcRegistry  # noqa: E402
+from pya3eda.registry.compiled import load_registry  # noqa: E402
+from pya3eda.vocab import CalcType, Mode, Stage  # noqa: E402
+
+# One reactant and one product: three uncatalysed calcs, and per catalyst the
+# catalyst itself plus preTS / TS / postTS in three EDA calc types each.
+_UNCATALYSED = 3
+_PER_CATALYST = 10
+
+
+class LegacyCalcID(BaseModel, frozen=True):
+    """The former pydantic ``CalcID``."""
+
+    method_key: str
+    catalyst: str | None = None
+    stage: Stage
+    species: str
+    calc_type: CalcType | None = None
+    mode: Mode = Mode.OPT
+    sp_subfolder: str | None = None
+
+
+class LegacyCalcSpec(BaseModel, frozen=True):
+    """The former pydantic ``CalcSpec``, level-wide tuples copied onto every spec."""
+
+    id: LegacyCalcID
+    input_path: Path
+    output_path: Path
+    method_name: str
+    basis_set: str
+    dispersion: str
+    solvent: str
+    eda2: int | None = None
+    sp_subfolder: str | None = None
+    is_fragmented: bool = False
+    present_reactants: tuple[str, ...] = ()
+    present_products: tuple[str, ...] = ()
+    present_catalysts: tuple[str, ...] = ()
+    all_reactants: tuple[str, ...] = ()
+    all_products: tuple[str, ...] = ()
+    all_catalysts: tuple[str, ...] = ()
+
+
+def config_for(calcs: int) -> Config:
+    """A config enumerating about *calcs* calculations (one OPT level)."""
+    catalysts = max(1, (calcs - _UNCATALYSED) // _PER_CATALYST)
+    return Config(
+        levels=[LevelConfig(opt=TheoryConfig(method="wB97X-V", basis="def2-SVP", solvent="smd"))],
+        reactants=[SpeciesConfig(name="prop2enal")],
+        products=[SpeciesConfig(name="product")],
+        catalysts=[CatalystConfig(name=f"cat{i}") for i in range(catalysts)],
+    )
+
+
+def _timed(build: Callable[[], object]) -> tuple[object, float]:
+    """``build()`` and its wall time, with the cyclic GC paused as in a fresh process."""
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        result = build()
+        return result, time.perf_counter() - t0
+    finally:
+        gc.enable()
+
+
+def _held_bytes(build: Callable[[], object]) -> int:
+    """Memory still allocated once ``build()`` returns (its result kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return held
+
+
+def _lookup_ns(table: Mapping[Any, object], probes: Sequence[object]) -> float:
+    """Mean time of one ``table[probe]`` lookup, in nanoseconds."""
+    t0 = time.perf_counter()
+    for probe in probes:
+        table[probe]
+    return (time.perf_counter() - t0) / len(probes) * 1e9
+
+
+def _legacy_specs(specs: tuple[CalcSpec, ...]) -> list[LegacyCalcSpec]:
+    """The registry's specs rebuilt as the former pydantic models."""
+    return [
+        LegacyCalcSpec(
+            id=LegacyCalcID(
+                method_key=s.id.method_key,
+                catalyst=s.id.catalyst,
+                stage=s.id.stage,
+                species=s.id.species,
+                calc_type=s.id.calc_type,
+                mode=s.id.mode,
+                sp_subfolder=s.id.sp_subfolder,
+            ),
+            input_path=s.input_path,
+            output_path=s.output_path,
+            method_name=s.method_name,
+            basis_set=s.basis_set,
+            dispersion=s.dispersion,
+            solvent=s.solvent,
+            eda2=s.eda2,
+            sp_subfolder=s.sp_subfolder,
+            is_fragmented=s.is_fragmented,
+            present_reactants=s.present_reactants,
+            present_products=s.present_products,
+            present_catalysts=s.present_catalysts,
+            all_reactants=tuple(s.all_reactants),
+            all_products=tuple(s.all_products),
+            all_catalysts=tuple(s.all_catalysts),
+        )
+        for s in specs
+    ]
+
+
+def _current_specs(specs: tuple[CalcSpec, ...]) -> list[CalcSpec]:
+    """The registry's specs rebuilt as the current types (fresh ids, shared contexts)."""
+    return [
+        CalcSpec(
+            id=CalcID(
+                method_key=s.id.method_key,
+                catalyst=s.id.catalyst,
+                stage=s.id.stage,
+                species=s.id.species,
+                calc_type=s.id.calc_type,
+                mode=s.id.mode,
+                sp_subfolder=s.id.sp_subfolder,
+            ),
+            input_path=s.input_path,
+            output_path=s.output_path,
+            context=s.context,
+            is_fragmented=s.is_fragmented,
+            present_reactants=s.present_reactants,
+            present_products=s.present_products,
+            present_catalysts=s.present_catalysts,
+        )
+        for s in specs
+    ]
+
+
+def _compiled_load(config: Config) -> tuple[float, float]:
+    """Wall time of a cold (enumerate + store) and a warm (restore) ``load_registry``."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.yaml"
+        path.write_text(yaml.safe_dump(config.model_dump(mode="json")))
+        _, cold = _timed(lambda: load_registry(path))
+        _, warm = _timed(lambda: load_registry(path))
+    return cold, warm
+
+
+def run(size: int, legacy: bool, compiled: bool) -> None:
+    """Benchmark a registry of about *size* calcs and print one block of results."""
+    config = config_for(size)
+    base = Path("/campaign")
+    registry, t_build = _timed(lambda: CalcRegistry(config, base))
+    assert isinstance(registry, CalcRegistry)
+    specs = registry.all_calcs
+    n = len(specs)
+    held = _held_bytes(lambda: CalcRegistry(config, base))
+
+    ids = [s.id for s in specs]
+    probes = [cid.replace() for cid in ids]  # equal, but not the same objects
+    ns = _lookup_ns(dict.fromkeys(ids), probes)
+
+    print(f"== {n:,} calcs ({len(registry.all_profiles):,} profiles) ==")
+    print(f"registry build        : {t_build:8.2f} s  ({n / t_build:,.0f} calcs/s)")
+    print(f"registry held memory  : {held / 2**20:8.1f} MiB ({held / n:,.0f} B/calc)")
+    print(f"CalcID dict lookup    : {ns:8.0f} ns")
+    if compiled:
+        cold, warm = _compiled_load(config)
+        print(f"load_registry cold    : {cold:8.2f} s  (enumerate, validate, store)")
+        print(f"load_registry warm    : {warm:8.2f} s  (compiled cache)")
+
+    if not legacy:
+        return
+    ids_and_specs: list[tuple[str, Callable[[], Sequence[object]]]] = [
+        ("current", lambda: _current_specs(specs)),
+        ("pydantic (former)", lambda: _legacy_specs(specs)),
+    ]
+    for label, build in ids_and_specs:
+        rebuilt, t = _timed(build)
+        assert isinstance(rebuilt, Sequence)
+        keys = [s.id for s in rebuilt]
+        lookup = _lookup_ns(dict.fromkeys(keys), [type(k)(**_fields(k)) for k in keys])
+        del rebuilt, keys
+        mem = _held_bytes(build)
+        print(
+            f"{label:<22}: {t:8.2f} s to build the specs, "
+            f"{mem / n:,.0f} B/spec, {lookup:,.0f} ns/lookup"
+        )
+
+
+def _fields(cid: object) -> dict[str, object]:
+    """Constructor keyword arguments reproducing *cid* (either identity type)."""
+    names = ("method_key", "catalyst", "stage", "species", "calc_type", "mode", "sp_subfolder")
+    return {name: getattr(cid, name) for name in names}
+
+
+def main() -> None:
+    """Benchmark each requested size."""
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="10000,100000,1000000")
+    ap.add_argument("--no-legacy", dest="legacy", action="store_false")
+    ap.add_argument("--compiled", action="store_true")
+    args = ap.parse_args()
+    for size in (int(s) for s in args.sizes.split(",")):
+        run(size, args.legacy, args.compiled)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""Parser micro-benchmarks on large synthetic Q-Chem outputs (``pya3eda bench parse``).
+
+The unit-test fixtures are trimmed to the lines each parser looks for, so they
+say nothing about how parsing scales with the outputs that actually dominate a
+campaign: long optimisations with a frequency analysis, ``print = 2`` SMD
+per-atom tables, EDA runs with many SCFs. This module generates realistic outputs
+of configurable size (:class:`OutputShape`), runs every parser over them
+(:data:`CASES`) as decoded text and as raw bytes, and records for each the best
+and median wall time of several calls plus the peak memory it allocates
+(:mod:`tracemalloc`). :func:`run_parse_benchmarks` returns a JSON-serialisable
+report; :func:`compare_reports` diffs two of them, e.g. across releases.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Mapping
+from functools import partial
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pya3eda.errors import PyA3EDAError
+from pya3eda.parser import qchem
+from pya3eda.parser._buffer import Text
+from pya3eda.parser.trajectory import parse_trajectory
+from pya3eda.parser.xyz import parse_output_fragments, parse_output_xyz
+from pya3eda.vocab import CalcType
+
+REPORT_SCHEMA = 1
+"""Version of the report layout written by :func:`run_parse_benchmarks`."""
+
+BUFFERS = ("str", "bytes")
+"""How outputs are handed to the parsers: decoded text, or the raw file bytes."""
+
+_ELEMENTS = ("C", "H", "O", "N")
+_RULE = " " + "-" * 64 + "\n"
+_THANK_YOU = """\
+        *************************************************************
+        *                                                           *
+        *  Thank you very much for using Q-Chem.  Have a nice day.  *
+        *                                                           *
+        *************************************************************
+"""
+
+
+class OutputShape(NamedTuple):
+    """Size of the generated outputs."""
+
+    cycles: int = 100  # optimisation cycles (SCF + orientation + convergence table each)
+    atoms: int = 40
+    modes: int = 120  # normal modes in the frequency analysis
+    scf_iterations: int = 12  # rows per SCF iteration table
+    fragments: int = 2  # EDA fragments (one CDS table each, plus the whole system's)
+
+
+DEFAULT_SHAPE = OutputShape()
+"""The shape ``pya3eda bench parse`` generates by default (~0.5 MB OPT output)."""
+
+
+class ParseCase(NamedTuple):
+    """One benchmarked parser call: *func* applied to the generated *output*."""
+
+    name: str
+    output: str  # "opt", "running" or "eda" (see generate_outputs)
+    func: Callable[[Text], object]
+
+
+CASES: tuple[ParseCase, ...] = (
+    ParseCase("scan_opt_output", "opt", qchem.scan_opt_output),
+    ParseCase("parse_energy", "opt", qchem.parse_energy),
+    ParseCase("parse_thermo_conditions", "opt", qchem.parse_thermo_conditions),
+    ParseCase("parse_imaginary_freq", "opt", qchem.parse_imaginary_freq),
+    ParseCase("parse_zpve", "opt", qchem.parse_zpve),
+    ParseCase("parse_enthalpy", "opt", qchem.parse_enthalpy),
+    ParseCase("parse_entropy", "opt", qchem.parse_entropy),
+    ParseCase("parse_translational_entropy", "opt", qchem.parse_translational_entropy),
+    ParseCase("parse_opt_converged", "opt", qchem.parse_opt_converged),
+    ParseCase("parse_smd", "eda", qchem.parse_smd),
+    ParseCase("parse_cds_print", "eda", qchem.parse_cds_print),
+    ParseCase(
+        "parse_eda_energies[pol_cat]",
+        "eda",
+        partial(qchem.parse_eda_energies, calc_type=CalcType.POL_CAT),
+    ),
+    ParseCase(
+        "parse_eda_energies[full_cat]",
+        "eda",
+        partial(qchem.parse_eda_energies, calc_type=CalcType.FULL_CAT),
+    ),
+    ParseCase("parse_status[successful]", "opt", qchem.parse_status),
+    ParseCase("parse_status[running]", "running", qchem.parse_status),
+    ParseCase("parse_output_xyz", "opt", parse_output_xyz),
+    ParseCase("parse_output_fragments", "opt", parse_output_fragments),
+    ParseCase("parse_trajectory", "opt", parse_trajectory),
+)
+"""Every benchmarked parser, with the output it reads."""
+
+
+# ---------------------------------------------------------------------------
+# Synthetic outputs
+# ---------------------------------------------------------------------------
+
+
+def _coords(i: int, step: int = 0) -> tuple[float, float, float]:
+    """Deterministic, slowly relaxing coordinates of atom *i* at optimisation *step*."""
+    shift = 0.1 / (step + 1)
+    return 3 * math.sin(i) + shift, 3 * math.cos(1.7 * i) - shift, 0.37 * i % 4.0 + shift
+
+
+def _molecule(shape: OutputShape) -> str:
+    """The echoed ``$molecule`` block, split into ``shape.fragments`` fragments."""
+    lines = [" $molecule", " 0 1"]
+    per_fragment = max(1, shape.atoms // shape.fragments)
+    for i in range(shape.atoms):
+        if i % per_fragment == 0 and i // per_fragment < shape.fragments:
+            lines += [" ---", " 0 1"]
+        lines.append(f" {_ELEMENTS[i % 4]:<2} {'  '.join(f'{c:.6f}' for c in _coords(i))}")
+    return "\n".join([*lines, " $end", ""])
+
+
+def _orientation(shape: OutputShape, step: int) -> str:
+    """One ``Standard Nuclear Orientation`` block at optimisation *step*."""
+    rows = "".join(
+        f"{i + 1:5d}      {_ELEMENTS[i % 4]:<2}"
+        + "".join(f"{c:16.10f}" for c in _coords(i, step))
+        + "\n"
+        for i in range(shape.atoms)
+    )
+    return (
+        " Standard Nuclear Orientation (Angstroms)\n"
+        "    I     Atom           X            Y            Z\n"
+        f"{_RULE}{rows}{_RULE}"
+    )
+
+
+def _scf(shape: OutputShape, energy: float) -> str:
+    """An SCF iteration table converging on *energy*."""
+    rows = "".join(
+        f" {n:4d}    {energy + 10.0**-n:.10f}      {10.0**-n:.2e}\n"
+        for n in range(1, shape.scf_iterations)
+    )
+    last = f" {shape.scf_iterations:4d}    {energy:.10f}      1.00e-09  00000 "
+    return (
+        " ---------------------------------------\n"
+        "  Cycle       Energy         DIIS Error\n"
+        " ---------------------------------------\n"
+        f"{rows}{last}Convergence criterion met\n"
+        " ---------------------------------------\n"
+    )
+
+
+def _cycle(shape: OutputShape, step: int) -> str:
+    """One optimisation cycle: geometry, SCF, energy and the convergence table."""
+    energy = -191.7 - 0.01 / (step + 1)
+    gradient = 0.05 / (step + 1)
+    return (
+        f"{_orientation(shape, step)}\n"
+        f"{_scf(shape, energy)}\n"
+        f" Total energy in the final basis set =  {energy:.10f}\n"
+        f" Total energy =  {energy:.8f}\n\n"
+        f" ** OPTIMIZATION CYCLE {step + 1:3d} **\n"
+        f"                 Maximum     Tolerance    Cnvgd?\n"
+        f"   Gradient    {gradient:.6f}    0.000300    {'YES' if gradient < 3e-4 else 'NO'}\n"
+        f"   Energy change  {0.01 / (step + 1) ** 2:.6f}    0.000001    NO\n\n"
+    )
+
+
+def _frequencies(shape: OutputShape) -> str:
+    """A vibrational analysis of ``shape.modes`` modes, three per block as Q-Chem prints."""
+    blocks = []
+    for first in range(0, shape.modes, 3):
+        modes = range(first, min(first + 3, shape.modes))
+        cols = len(modes)
+        atoms = "".join(
+            f" {_ELEMENTS[i % 4]:<2}   " + "   ".join(["0.012 -0.034  0.056"] * cols) + "\n"
+            for i in range(shape.atoms)
+        )
+        blocks.append(
+            " Mode:" + "".join(f"{m + 1:22d}" for m in modes) + "\n"
+            " Frequency:" + "".join(f"{40.0 + 25.0 * m:17.2f}" for m in modes) + "\n"
+            " Force Cnst:" + "      0.1234" * cols + "\n"
+            " Red. Mass:" + "       2.3456" * cols + "\n"
+            " IR Active:" + "          YES" * cols + "\n"
+            " IR Intens:" + "       12.345" * cols + "\n"
+            "               X      Y      Z" + "        X      Y      Z" * (cols - 1) + "\n"
+            f"{atoms} TransDip   " + "   ".join(["0.001 -0.002  0.003"] * cols) + "\n\n"
+        )
+    return " **                       VIBRATIONAL ANALYSIS                       **\n\n" + "".join(
+        blocks
+    )
+
+
+_THERMO = """\
+ STANDARD THERMODYNAMIC QUANTITIES AT   298.15 K  AND     1.00 ATM
+
+   This Molecule has  0 Imaginary Frequencies
+   Zero point vibrational energy:       38.832 kcal/mol
+
+   Translational Entropy:        37.991  cal/mol.K
+   Rotational Entropy:           23.366  cal/mol.K
+   Vibrational Entropy:           5.187  cal/mol.K
+
+   Total Enthalpy:               42.162 kcal/mol
+   Total Entropy:                66.544  cal/mol.K
+
+   QRRHO-Total Enthalpy:         42.119 kcal/mol
+   QRRHO-Total Entropy:          66.534  cal/mol.K
+
+"""
+
+
+def opt_output(shape: OutputShape = DEFAULT_SHAPE) -> str:
+    """A successful OPT + frequency output of the given *shape*."""
+    cycles = "".join(_cycle(shape, step) for step in range(shape.cycles))
+    final = -191.7 - 0.01 / shape.cycles
+    return (
+        f"Running on host bench01\n{_molecule(shape)}\n{cycles}"
+        f" Final energy is {final:.12f}\n\n"
+        "        ******************************\n"
+        "        **  OPTIMIZATION CONVERGED  **\n"
+        "        ******************************\n\n"
+        f"{_orientation(shape, shape.cycles)}\n{_frequencies(shape)}{_THERMO}"
+        " Total job time:  1802.20s(wall), 54550.65s(cpu)\n\n"
+        f"{_THANK_YOU}"
+    )
+
+
+def running_output(shape: OutputShape = DEFAULT_SHAPE) -> str:
+    """The same optimisation, still running: no completion or failure marker anywhere."""
+    return opt_output(shape).split(" Final energy is", 1)[0]
+
+
+def _cds_table(atoms: range, total: float) -> str:
+    """A ``print = 2`` SMD per-atom CDS table over *atoms*, ending in its ``Total:``."""
+    rows = "".join(
+        f"    {i + 1:4d}  {_ELEMENTS[i % 4]:<2}  {-0.1 * (i % 7):10.3f}  {0.02 * (i % 5):10.3f}\n"
+        for i in atoms
+    )
+    return (
+        "    Atom     CDS (kcal/mol)   Area (Ang**2)\n"
+        f"{rows}\n    Total:               {total:.3f}\n"
+        " ----------------------------------\n\n"
+    )
+
+
+def eda_output(shape: OutputShape = DEFAULT_SHAPE) -> str:
+    """A successful fragment-EDA single point with SMD and ``print = 2`` CDS tables.
+
+    Each fragment's SCF is followed by its CDS table; the polarised supersystem
+    then takes ``shape.cycles`` steps (a guess energy, an SCF and a whole-system
+    CDS table each), before the full SCF, the SMD summary and BSSE.
+    """
+    per_fragment = max(1, shape.atoms // shape.fragments)
+    everything = range(shape.atoms)
+    parts = [f"Running on host bench01\n{_molecule(shape)}\n"]
+    for k in range(shape.fragments):
+        atoms = range(k * per_fragment, min((k + 1) * per_fragment, shape.atoms))
+        parts += [_scf(shape, -900.0 - k), "\n", _cds_table(atoms, -1.2 - k)]
+    for step in range(shape.cycles):
+        guess = -1814.157030967601 - 0.01 / (step + 1)
+        parts += [
+            f"Energy prior to optimization (guess energy) = {guess:.12f}\n",
+            _scf(shape, guess - 0.04),
+            "\n",
+            _cds_table(everything, -2.4 - 0.01 / (step + 1)),
+        ]
+    parts += [
+        _scf(shape, -1815.1481418253),
+        "\n",
+        " ====================  Detailed SMD energy components  ====================\n"
+        " (3)  G-ENP(liq) elect-nuc-pol free energy of system    -1815.150000000 a.u.\n"
+        " (4)  G-CDS(liq) cavity-dispersion-solvent structure            -2.4110 kcal/mol\n"
+        " (6)  G-S(liq) free energy of system                    -1815.153842000 a.u.\n"
+        " ==========================================================================\n\n",
+        _cds_table(everything, -2.411),
+        "   Evaluating the BSSE with fragment SCF in the supersystem basis\n"
+        "   BSSE (kJ/mol) = 0.3295\n\n"
+        " Total job time:  800.00s(wall), 19200.00s(cpu)\n\n",
+        _THANK_YOU,
+    ]
+    return "".join(parts)
+
+
+def generate_outputs(shape: OutputShape = DEFAULT_SHAPE) -> dict[str, str]:
+    """Every output :data:`CASES` reads, by name."""
+    return {
+        "opt": opt_output(shape),
+        "running": running_output(shape),
+        "eda": eda_output(shape),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _timings(func: Callable[[Text], object], text: Text, repeat: int) -> list[float]:
+    """Wall times of *repeat* calls of ``func(text)``, after one warm-up call."""
+    func(text)  # compiles any bytes twin of the parser's patterns
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(text)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def _peak_bytes(func: Callable[[Text], object], text: Text) -> int:
+    """Peak memory allocated by one call of ``func(text)``."""
+    tracemalloc.start()
+    try:
+        func(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(
+    cases: tuple[ParseCase, ...], outputs: Mapping[str, str], repeat: int
+) -> Iterator[dict[str, Any]]:
+    """One result row per case and buffer kind."""
+    for buffer in BUFFERS:
+        texts: dict[str, Text] = {
+            name: text.encode() if buffer == "bytes" else text for name, text in outputs.items()
+        }
+        for case in cases:
+            text = texts[case.output]
+            times = _timings(case.func, text, repeat)
+            best = min(times)
+            yield {
+                "name": case.name,
+                "output": case.output,
+                "buffer": buffer,
+                "best_s": best,
+                "median_s": statistics.median(times),
+                "mb_per_s": len(text) / 1e6 / best if best > 0 else None,
+                "peak_bytes": _peak_bytes(case.func, text),
+            }
+
+
+def run_parse_benchmarks(
+    shape: OutputShape = DEFAULT_SHAPE,
+    *,
+    repeat: int = 5,
+    cases: tuple[ParseCase, ...] = CASES,
+) -> dict[str, Any]:
+    """Generate outputs of *shape*, benchmark every case, and return the report.
+
+    Each case is timed over *repeat* calls on both :data:`BUFFERS`; the report
+    records the environment and sizes alongside, so reports taken on the same
+    machine can be compared across releases (:func:`compare_reports`).
+    """
+    from pya3eda import __version__
+
+    if repeat < 1:
+        raise PyA3EDAError(f"repeat must be at least 1 (got {repeat})")
+    outputs = generate_outputs(shape)
+    return {
+        "schema": REPORT_SCHEMA,
+        "pya3eda": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "shape": shape._asdict(),
+        "repeat": repeat,
+        "outputs": {name: len(text.encode()) for name, text in outputs.items()},
+        "results": list(_measure(cases, outputs, repeat)),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+
+class Comparison(NamedTuple):
+    """One case's best time in a baseline report and in the current one."""
+
+    name: str
+    buffer: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        """Current over baseline time: above 1 is a slowdown."""
+        return self.current_s / self.baseline_s if self.baseline_s > 0 else math.inf
+
+
+def write_report(report: Mapping[str, Any], path: Path) -> None:
+    """Write *report* to *path* as JSON."""
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """Read a report written by :func:`write_report`.
+
+    Raises:
+        PyA3EDAError: *path* is unreadable, not JSON, or not a report of this schema.
+    """
+    try:
+        report = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise PyA3EDAError(f"Cannot read benchmark report {path}: {exc}") from exc
+    if not isinstance(report, dict) or report.get("schema") != REPORT_SCHEMA:
+        raise PyA3EDAError(f"{path} is not a schema-{REPORT_SCHEMA} benchmark report")
+    return report
+
+
+def compare_reports(baseline: Mapping[str, Any], current: Mapping[str, Any]) -> list[Comparison]:
+    """Pair up the cases present in both reports, in the current report's order."""
+    before = {(r["name"], r["buffer"]): r["best_s"] for r in baseline["results"]}
+    return [
+        Comparison(r["name"], r["buffer"], before[r["name"], r["buffer"]], r["best_s"])
+        for r in current["results"]
+        if (r["name"], r["buffer"]) in before
+    ]
+
+
+def format_report(report: Mapping[str, Any], baseline: Mapping[str, Any] | None = None) -> str:
+    """Render *report* as a table, with the ratio to *baseline* when given."""
+    ratios = {}
+    if baseline is not None:
+        ratios = {(c.name, c.buffer): c.ratio for c in compare_reports(baseline, report)}
+    sizes = ", ".join(f"{name} {size / 1e6:.1f} MB" for name, size in report["outputs"].items())
+    lines = [
+        f"pya3eda {report['pya3eda']} · Python {report['python']} · {sizes}",
+        f"{'case':<30} {'buffer':<6} {'best ms':>9} {'median ms':>10} {'MB/s':>8} {'peak KiB':>9}"
+        + ("  vs base" if baseline is not None else ""),
+    ]
+    for r in report["results"]:
+        rate = "-" if r["mb_per_s"] is None else f"{r['mb_per_s']:.0f}"
+        line = (
+            f"{r['name']:<30} {r['buffer']:<6} {r['best_s'] * 1e3:9.2f} "
+            f"{r['median_s'] * 1e3:10.2f} {rate:>8} {r['peak_bytes'] / 1024:9.1f}"
+        )
+        ratio = ratios.get((r["name"], r["buffer"]))
+        if ratio is not None:
+            line += f"  {ratio:6.2f}x"
+        lines.append(line)
+    return "\n".join(lines)
@@ -9,21 +9,30 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pya3eda.builder.molecule import (
+    OptGeometry,
     _load_xyz,
     build_fragmented_molecule,
     build_standard_molecule,
+    read_opt_geometry,
 )
 from pya3eda.builder.rem import build_opt_rem, build_sp_rem
+from pya3eda.cache import CacheKind, OutputCache, cached
 from pya3eda.errors import TemplateNotFoundError
-from pya3eda.ids import CalcSpec
-from pya3eda.parser.qchem import parse_status
+from pya3eda.ids import CalcID, CalcSpec
+from pya3eda.listing import FileIndex
+from pya3eda.parser.batch import resolve_jobs, run_many
+from pya3eda.parser.tail import parse_status_file
 from pya3eda.parser.xyz import parse_xyz
 from pya3eda.registry import CalcRegistry
 from pya3eda.utils import read_text, write_text
 from pya3eda.vocab import CalcType, Mode, Stage
 
+if TYPE_CHECKING:
+    from pya3eda.status.checker import StatusSnapshot
+
 log = logging.getLogger(__name__)
 
 
@@ -38,6 +47,7 @@ def build_all(
     *,
     overwrite: str | None = None,
     sp_strategy: str = "smart",
+    jobs: int = 1,
 ) -> None:
     """Create ``.in`` files for every calculation in *registry*.
 
@@ -55,14 +65,37 @@ def build_all(
         ``"always"`` — always generate SP files.
         ``"smart"``  — only if the OPT converged successfully (status + validation check).
         ``"never"``  — skip SP files entirely.
+    jobs : int
+        Worker processes the OPT outputs supplying SP geometries are parsed
+        across, up front (``0`` → one per CPU). With ``1`` each is read when
+        its SP is built.
     """
     base_template_path = template_dir / "base_template.in"
     base_template = read_text(base_template_path)
     if base_template is None:
         raise TemplateNotFoundError(f"Base template not found: {base_template_path}")
 
-    for spec in registry.all_calcs:
-        _build_one(spec, registry, template_dir, base_template, overwrite, sp_strategy)
+    files = FileIndex()
+    geometries = None
+    if resolve_jobs(jobs) > 1 and sp_strategy != "never":
+        geometries = _sp_geometries(registry, overwrite, jobs, files)
+
+    from pya3eda.status.checker import StatusSnapshot
+
+    with OutputCache.open(registry.base_dir) as cache:
+        snapshot = StatusSnapshot(cache, files=files)
+        for spec in registry.all_calcs:
+            _build_one(
+                spec,
+                registry,
+                template_dir,
+                base_template,
+                overwrite,
+                sp_strategy,
+                cache,
+                geometries,
+                snapshot,
+            )
 
 
 def build_calc(
@@ -72,12 +105,19 @@ def build_calc(
     *,
     overwrite: str | None = None,
     sp_strategy: str = "smart",
+    snapshot: StatusSnapshot | None = None,
 ) -> None:
-    """Build the input file for a single calculation (e.g. an SP once its OPT is done)."""
+    """Build the input file for a single calculation (e.g. an SP once its OPT is done).
+
+    *snapshot* holds the caller's statuses (an SP is gated on its OPT's) and
+    directory index; a written input is added to the index.
+    """
     base_template = read_text(template_dir / "base_template.in")
     if base_template is None:
         raise TemplateNotFoundError(f"Base template not found: {template_dir / 'base_template.in'}")
-    _build_one(spec, registry, template_dir, base_template, overwrite, sp_strategy)
+    _build_one(
+        spec, registry, template_dir, base_template, overwrite, sp_strategy, snapshot=snapshot
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -92,28 +132,40 @@ def _build_one(
     base_template: str,
     overwrite: str | None,
     sp_strategy: str,
+    cache: OutputCache | None = None,
+    geometries: dict[CalcID, OptGeometry | None] | None = None,
+    snapshot: StatusSnapshot | None = None,
 ) -> None:
-    """Assemble and write a single Q-Chem input file."""
+    """Assemble and write a single Q-Chem input file.
+
+    *geometries* holds OPT outputs already parsed by :func:`_sp_geometries`;
+    *snapshot* holds the statuses and directory index the build's checks share.
+    """
     cid = spec.id
     file_path = spec.input_path
+    if snapshot is None:
+        from pya3eda.status.checker import StatusSnapshot
+
+        snapshot = StatusSnapshot(cache)
+    files = snapshot.files
 
     # SP strategy gate
     if cid.mode == Mode.SP:
         if sp_strategy == "never":
             return
-        if sp_strategy == "smart" and not _opt_successful(spec, registry):
+        if sp_strategy == "smart" and not _opt_successful(spec, registry, snapshot):
             log.info("Skipping SP (OPT not successful): %s", file_path)
             return
 
     # Overwrite gate
-    if file_path.exists():
-        if not _should_overwrite(file_path, overwrite):
+    if files.is_file(file_path):
+        if not _should_overwrite(file_path, overwrite, cache, files):
             log.info("Skipping (exists): %s", file_path)
             return
         log.info("Overwriting: %s", file_path)
 
     # Molecule section
-    result = _build_molecule_section(spec, registry, template_dir)
+    result = _build_molecule_section(spec, registry, template_dir, geometries)
     if result is None:
         log.error("Failed to build molecule section: %s", file_path)
         return
@@ -148,41 +200,93 @@ def _build_one(
         return
 
     write_text(file_path, content)
+    files.add(file_path)
     log.info("Written: %s", file_path)
 
 
-def _opt_successful(sp_spec: CalcSpec, registry: CalcRegistry) -> bool:
-    """Check whether the corresponding OPT calculation completed successfully."""
+def _sp_geometries(
+    registry: CalcRegistry, overwrite: str | None, jobs: int, files: FileIndex
+) -> dict[CalcID, OptGeometry | None]:
+    """Parse, across *jobs* processes, the OPT outputs of every SP input that may be written.
+
+    An SP input that exists is only rewritten under an *overwrite* policy; the
+    status gates are applied later, so this may parse a few outputs that end up unused.
+    """
+    opt_ids = dict.fromkeys(
+        spec.id.to_opt()
+        for spec in registry.by_mode(Mode.SP)
+        if overwrite is not None or not files.is_file(spec.input_path)
+    )
+    opt_specs = []
+    for opt_id in opt_ids:
+        try:
+            opt_specs.append(registry.get(opt_id))
+        except KeyError:
+            continue
+    parsed = run_many(read_opt_geometry, [spec.output_path for spec in opt_specs], jobs=jobs)
+    return {spec.id: geometry for spec, geometry in zip(opt_specs, parsed, strict=True)}
+
+
+def _opt_successful(
+    sp_spec: CalcSpec, registry: CalcRegistry, snapshot: StatusSnapshot | None = None
+) -> bool:
+    """Check whether the corresponding OPT calculation completed successfully.
+
+    The OPT's status is taken from *snapshot* (a fresh one by default).
+    """
     try:
         opt_spec = registry.get(sp_spec.id.to_opt())
     except KeyError:
         return False
 
-    from pya3eda.status.checker import Status, get_status
+    from pya3eda.status.checker import Status, StatusSnapshot
 
-    status, _ = get_status(opt_spec)
+    if snapshot is None:
+        snapshot = StatusSnapshot()
+    status, _ = snapshot.status(opt_spec)
     return status == Status.SUCCESSFUL
 
 
-def _should_overwrite(file_path: Path, overwrite: str | None) -> bool:
+def _should_overwrite(
+    file_path: Path,
+    overwrite: str | None,
+    cache: OutputCache | None = None,
+    files: FileIndex | None = None,
+) -> bool:
     """Return *True* if *file_path* should be overwritten given the policy."""
     if overwrite == "all":
         return True
     if overwrite is None:
         return False
+    if files is None:
+        files = FileIndex()
     # Check current file status
     out_path = file_path.with_suffix(".out")
     err_path = file_path.with_suffix(".err")
-    out_text = read_text(out_path) or ""
-    err_text = read_text(err_path) or ""
-    status, _ = parse_status(out_text, err_text)
+    status = cached(
+        cache,
+        _RAW_STATUS,
+        (out_path, err_path),
+        lambda: _raw_status(out_path, err_path),
+        stamp=files.stamp,
+    )
     return status.upper() == overwrite.upper()
 
 
+_RAW_STATUS: CacheKind[str] = CacheKind("raw_status", str)
+
+
+def _raw_status(out_path: Path, err_path: Path) -> str:
+    """Classify an output from its ``.out`` / ``.err`` alone (no sentinel, no validation)."""
+    status, _ = parse_status_file(out_path, read_text(err_path) or "", detail=False)
+    return status
+
+
 def _build_molecule_section(
     spec: CalcSpec,
     registry: CalcRegistry,
     template_dir: Path,
+    geometries: dict[CalcID, OptGeometry | None] | None = None,
 ) -> tuple[str, int] | None:
     """Load XYZ templates and build the molecule section.
 
@@ -190,12 +294,15 @@ def _build_molecule_section(
     """
     cid = spec.id
 
-    # For SP: read the OPT output to use optimised coordinates
-    opt_output_text: str | None = None
+    # For SP: the OPT output supplies the optimised coordinates
+    opt_geometry: OptGeometry | None = None
     if cid.mode == Mode.SP:
+        opt_id = cid.to_opt()
         try:
-            opt_spec = registry.get(cid.to_opt())
-            opt_output_text = read_text(opt_spec.output_path)
+            if geometries is not None and opt_id in geometries:
+                opt_geometry = geometries[opt_id]
+            else:
+                opt_geometry = read_opt_geometry(registry.get(opt_id).output_path)
         except KeyError:
             pass
 
@@ -215,15 +322,15 @@ def _build_molecule_section(
             cid.catalyst,
             cid.species,
             cid.calc_type,
-            opt_output_text,
+            opt_geometry,
         )
-    return _build_standard(template_dir, template_name, opt_output_text)
+    return _build_standard(template_dir, template_name, opt_geometry)
 
 
 def _build_standard(
     template_dir: Path,
     template_name: str,
-    opt_output_text: str | None,
+    opt_geometry: OptGeometry | None,
 ) -> tuple[str, int] | None:
     """Build molecule section from a standard (non-fragmented) XYZ file."""
     xyz_text = _load_xyz(template_dir, template_name)
@@ -232,7 +339,7 @@ def _build_standard(
     data = parse_xyz(xyz_text)
     if data is None:
         return None
-    mol = build_standard_molecule(xyz_text, opt_output_text)
+    mol = build_standard_molecule(xyz_text, opt_geometry)
     if mol is None:
         return None
     return mol, data.n_atoms
@@ -244,7 +351,7 @@ def _build_fragmented(
     catalyst: str | None,
     species: str,
     calc_type: str | None,
-    opt_output_text: str | None,
+    opt_geometry: OptGeometry | None,
 ) -> tuple[str, int] | None:
     """Build molecule section from fragmented (catalyst + substrate) XYZ files."""
     composite_text = _load_xyz(template_dir, template_name, calc_type)
@@ -265,7 +372,7 @@ def _build_fragmented(
         return None
 
     mol = build_fragmented_molecule(
-        composite_text, cat_text, sub_text, opt_output_text, label=template_name
+        composite_text, cat_text, sub_text, opt_geometry, label=template_name
     )
     if mol is None:
         return None
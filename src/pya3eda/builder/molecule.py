@@ -9,13 +9,53 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-
-from pya3eda.parser.xyz import XYZData, parse_output_fragments, parse_output_xyz, parse_xyz
-from pya3eda.utils import read_text
+from typing import NamedTuple
+
+from pya3eda.parser._buffer import Text
+from pya3eda.parser.tail import read_head, scan_opt_file
+from pya3eda.parser.xyz import (
+    MOLECULE_BLOCK_RE,
+    MoleculeLayout,
+    XYZData,
+    parse_output_fragments,
+    parse_output_xyz,
+    parse_xyz,
+)
+from pya3eda.utils import find_file, is_compressed, map_file, read_text
 
 log = logging.getLogger(__name__)
 
 
+class OptGeometry(NamedTuple):
+    """What an SP input takes from its OPT's output — parsed, never the raw text."""
+
+    xyz: XYZData | None  # last Standard Nuclear Orientation (None → unparseable)
+    layout: MoleculeLayout | None  # fragmentation of the echoed $molecule block
+
+
+def opt_geometry(output_text: Text) -> OptGeometry:
+    """Parse the optimised geometry and fragment layout from an OPT output."""
+    return OptGeometry(parse_output_xyz(output_text), parse_output_fragments(output_text))
+
+
+def read_opt_geometry(path: Path) -> OptGeometry | None:
+    """:func:`opt_geometry` of the output file at *path* (``None`` if missing or empty).
+
+    A compressed output is never decompressed whole: the geometry is read from its
+    streamed ends (:func:`~pya3eda.parser.tail.scan_opt_file`) and the layout from
+    a head long enough to hold the echoed ``$molecule`` block.
+    """
+    source = find_file(path)
+    if source is not None and is_compressed(source):
+        summary = scan_opt_file(source, ("geometry",))
+        if summary is None:
+            return None
+        layout = parse_output_fragments(read_head(source, MOLECULE_BLOCK_RE))
+        return OptGeometry(summary.geometry, layout)
+    with map_file(path) as buf:
+        return opt_geometry(buf) if buf else None
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -46,16 +86,25 @@ def _format_fragmented(
     )
 
 
-def _coords_from_output(output_text: str | None, template: XYZData) -> tuple[list[str], bool]:
+def _as_geometry(output: str | OptGeometry | None) -> OptGeometry | None:
+    """Parse an OPT output given as text; pass an already-parsed one through."""
+    if isinstance(output, OptGeometry):
+        return output
+    return opt_geometry(output) if output else None
+
+
+def _coords_from_output(
+    output: str | OptGeometry | None, template: XYZData
+) -> tuple[list[str], bool]:
     """Return optimised coordinates from output, falling back to template.
 
     The flag reports whether the coordinates actually came from the output, since only then
     is that output's echoed fragmentation relevant.
     """
-    if output_text:
-        data = parse_output_xyz(output_text)
-        if data:
-            return data.atoms, True
+    geometry = _as_geometry(output)
+    if geometry is not None:
+        if geometry.xyz:
+            return geometry.xyz.atoms, True
         log.warning("Failed to parse output; falling back to template coordinates")
     return template.atoms, False
 
@@ -81,7 +130,7 @@ def _load_xyz(templates_dir: Path, name: str, calc_type: str | None = None) -> s
 
 def build_standard_molecule(
     xyz_text: str,
-    output_text: str | None = None,
+    output_text: str | OptGeometry | None = None,
 ) -> str | None:
     """Build a standard (single-fragment) molecule section.
 
@@ -89,9 +138,9 @@ def build_standard_molecule(
     ----------
     xyz_text : str
         XYZ template content (n_atoms / charge mult / atoms).
-    output_text : str | None
+    output_text : str | OptGeometry | None
         If given, optimised coordinates are extracted from this Q-Chem output
-        instead of the template (SP mode).
+        (or its already-parsed :class:`OptGeometry`) instead of the template (SP mode).
     """
     template = parse_xyz(xyz_text)
     if template is None:
@@ -106,7 +155,7 @@ def build_fragmented_molecule(
     composite_xyz_text: str,
     catalyst_xyz_text: str,
     substrate_xyz_text: str,
-    output_text: str | None = None,
+    output_text: str | OptGeometry | None = None,
     label: str = "<templates>",
 ) -> str | None:
     """Build a fragmented (EDA) molecule section.
@@ -127,8 +176,9 @@ def build_fragmented_molecule(
         XYZ for the catalyst fragment alone.
     substrate_xyz_text : str
         XYZ for the substrate fragment alone.
-    output_text : str | None
-        If given, optimised coordinates replace the template atoms (SP mode).
+    output_text : str | OptGeometry | None
+        If given, optimised coordinates replace the template atoms (SP mode); the
+        output may also be passed already parsed, as an :class:`OptGeometry`.
     label : str
         Template name used in diagnostics.
     """
@@ -152,10 +202,11 @@ def build_fragmented_molecule(
             substrate.n_atoms,
         )
 
-    atoms, from_output = _coords_from_output(output_text, composite)
+    geometry = _as_geometry(output_text)
+    atoms, from_output = _coords_from_output(geometry, composite)
 
     # Prefer the fragmentation the optimisation itself ran with; fall back to the templates.
-    layout = parse_output_fragments(output_text) if from_output and output_text else None
+    layout = geometry.layout if from_output and geometry else None
     if layout is not None and len(layout.fragments) == 2:
         cat_frag, sub_frag = layout.fragments
         if cat_frag.n_atoms + sub_frag.n_atoms == len(atoms):
@@ -0,0 +1,269 @@
+"""Persistent parsed-output cache.
+
+Re-reading and re-parsing every ``.out`` / ``.err`` is what makes ``status`` and
+``extract`` slow on a large campaign — mostly for calculations that finished long
+ago. :class:`OutputCache` stores what was parsed from an output in
+``base_dir/.pya3eda/cache.sqlite``, keyed by the identity of the files it was
+derived from — ``(st_size, st_mtime_ns, st_ino)`` — and serves it back until any
+of them changes.
+
+Every entry has a :class:`CacheKind`, which names what was parsed and the type
+of the value. Values are stored as JSON and validated back into that type, so a
+cache file planted in a shared campaign directory can at worst yield wrong
+values of the expected types — it can never run code, as unpickling it could.
+
+The cache is strictly best-effort: a read-only campaign directory, a locked or
+corrupt database, or entries written by another PyA3EDA version all simply miss,
+and the caller parses the file as it would without a cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Generic, TypeVar
+
+from pydantic import ConfigDict, TypeAdapter
+
+from pya3eda.utils import find_file
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = ".pya3eda"
+"""Per-campaign state directory, created beneath the config's base directory."""
+
+_DB_NAME = "cache.sqlite"
+_SCHEMA = 3
+# A file modified this recently may change again within the same timestamp tick
+# without changing size — indistinguishable by stat. Its results are used, never stored.
+_RACY_NS = 2_000_000_000
+_COMMIT_EVERY = 500
+
+T = TypeVar("T")
+
+Stamp = tuple[int, int, int] | None
+"""A file's ``(st_size, st_mtime_ns, st_ino)``; ``None`` when it does not exist."""
+
+
+class CacheKind(Generic[T]):
+    """A kind of :class:`OutputCache` entry: its *name* and the type of its values.
+
+    *value_type* is anything pydantic can validate from JSON — a model, a
+    ``NamedTuple``, an enum, a tuple of them, … Declare one per kind at module level;
+    building its ``TypeAdapter`` is the costly part.
+    """
+
+    def __init__(self, name: str, value_type: Any) -> None:
+        """A kind called *name* whose values are of *value_type*."""
+        self.name = name
+        self._adapter: TypeAdapter[T] = TypeAdapter(
+            value_type, config=ConfigDict(ser_json_inf_nan="constants")
+        )
+
+    def dump(self, value: T) -> bytes:
+        """*value* as JSON."""
+        return self._adapter.dump_json(value)
+
+    def load(self, blob: bytes) -> T:
+        """The value dumped as *blob* (``ValueError`` if it is not one of this kind)."""
+        return self._adapter.validate_json(blob)
+
+    def __repr__(self) -> str:
+        """``CacheKind('status')``."""
+        return f"CacheKind({self.name!r})"
+
+
+def file_stamp(path: Path) -> Stamp:
+    """Return the identity of the file at *path* (``None`` if missing).
+
+    A compressed output stands in for a missing one (see :func:`~pya3eda.utils.find_file`),
+    so compacting an output changes its stamp.
+    """
+    source = find_file(path)
+    if source is None:
+        return None
+    try:
+        st = source.stat()
+    except OSError:  # removed since it was found
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def cached(
+    cache: OutputCache | None,
+    kind: CacheKind[T],
+    paths: tuple[Path, ...],
+    parse: Callable[[], T],
+    extra: object = (),
+    *,
+    stamp: Callable[[Path], Stamp] = file_stamp,
+) -> T:
+    """Return ``parse()``, served from *cache* while every file in *paths* is unchanged.
+
+    The entry is filed under ``paths[0]``; *extra* holds any other input the parse
+    depends on. The files are stamped *before* parsing, so a file changing mid-parse
+    can only cause a later miss, never a stale hit. ``None`` results are not stored.
+    *stamp* stamps one file (e.g. :meth:`~pya3eda.listing.FileIndex.stamp`, to use
+    directory listings already made).
+    """
+    return cached_many(cache, kind, [(paths, extra)], lambda _: [parse()], stamp=stamp)[0]
+
+
+def cached_many(
+    cache: OutputCache | None,
+    kind: CacheKind[T],
+    entries: Sequence[tuple[tuple[Path, ...], object]],
+    parse: Callable[[list[int]], list[T]],
+    *,
+    stamp: Callable[[Path], Stamp] = file_stamp,
+) -> list[T]:
+    """:func:`cached` over many ``(paths, extra)`` *entries* at once.
+
+    *parse* is called once, with the indices of every entry the cache missed, and
+    returns their values in that order — so the misses can be parsed as a batch
+    (e.g. across worker processes, see :mod:`pya3eda.parser.batch`).
+    """
+    if cache is None:
+        return parse(list(range(len(entries))))
+    stamps = [tuple(stamp(p) for p in paths) for paths, _ in entries]
+    results: list[Any] = [
+        cache.lookup(kind, paths[0], stamp, extra)
+        for (paths, extra), stamp in zip(entries, stamps, strict=True)
+    ]
+    misses = [i for i, hit in enumerate(results) if hit is None]
+    if misses:
+        for i, value in zip(misses, parse(misses), strict=True):
+            results[i] = value
+            if value is not None:
+                paths, extra = entries[i]
+                cache.store(kind, paths[0], stamps[i], value, extra)
+    return results
+
+
+class OutputCache:
+    """Parsed results per output path, valid while the source files are unchanged.
+
+    Entries are addressed by a :class:`CacheKind` (what was parsed, e.g. a
+    status) and a *path*; each remembers the :data:`Stamp` of every file it was derived from plus
+    any *extra* inputs of the parse, and is only returned when all of them match.
+    Use as a context manager (or call :meth:`close`) to flush pending writes.
+    """
+
+    def __init__(self, conn: sqlite3.Connection | None) -> None:
+        """Wrap an open *conn* (``None`` → a disabled cache that always misses)."""
+        self._conn = conn
+        self._pending = 0
+
+    @classmethod
+    def open(cls, base_dir: Path) -> OutputCache:
+        """Open (creating if needed) the cache of the campaign rooted at *base_dir*."""
+        from pya3eda import __version__
+
+        try:
+            cache_dir = Path(base_dir) / CACHE_DIR
+            cache_dir.mkdir(exist_ok=True)
+            conn = sqlite3.connect(cache_dir / _DB_NAME, timeout=5.0)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " kind TEXT, path TEXT, key TEXT, value BLOB, PRIMARY KEY (kind, path))"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            version = f"{_SCHEMA}:{__version__}"
+            row = conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != version:
+                # Parsers may have changed: nothing written by another version is trusted.
+                conn.execute("DELETE FROM entries")
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+                conn.commit()
+        except (OSError, sqlite3.Error) as exc:
+            log.debug("Output cache unavailable under %s: %s", base_dir, exc)
+            return cls(None)
+        return cls(conn)
+
+    def lookup(
+        self, kind: CacheKind[T], path: Path, stamps: tuple[Stamp, ...], extra: object = ()
+    ) -> T | None:
+        """Return the value stored for ``(kind, path)`` if *stamps* and *extra* match."""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT key, value FROM entries WHERE kind = ? AND path = ?",
+                (kind.name, str(path)),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] != _key(stamps, extra):
+            return None
+        try:
+            return kind.load(row[1])
+        except ValueError:  # truncated blob, a value of another shape, … → miss
+            return None
+
+    def store(
+        self,
+        kind: CacheKind[T],
+        path: Path,
+        stamps: tuple[Stamp, ...],
+        value: T,
+        extra: object = (),
+    ) -> None:
+        """Remember *value* for ``(kind, path)`` under *stamps* and *extra*.
+
+        Skipped while any source file is still within the racy window of its
+        last modification (see ``_RACY_NS``).
+        """
+        if self._conn is None:
+            return
+        now = time.time_ns()
+        if any(s is not None and now - s[1] < _RACY_NS for s in stamps):
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (kind.name, str(path), _key(stamps, extra), kind.dump(value)),
+            )
+            self._pending += 1
+            if self._pending >= _COMMIT_EVERY:
+                self._commit(self._conn)
+        except sqlite3.Error as exc:
+            log.debug("Output cache write failed: %s", exc)
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._conn is None:
+            return
+        self._commit(self._conn)
+        self._conn.close()
+        self._conn = None
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit pending writes (dropping them if the database is locked)."""
+        try:
+            conn.commit()
+        except sqlite3.Error as exc:
+            log.debug("Output cache commit failed: %s", exc)
+        self._pending = 0
+
+    def __enter__(self) -> OutputCache:
+        """Return the cache itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the cache."""
+        self.close()
+
+
+def _key(stamps: tuple[Stamp, ...], extra: object) -> str:
+    """Serialise an entry's validity key."""
+    return json.dumps([stamps, extra])
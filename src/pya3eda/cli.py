@@ -6,7 +6,9 @@ Each command takes the YAML config as its first argument:
 * ``pya3eda run CONFIG``      — submit calculations (local or SLURM)
 * ``pya3eda status CONFIG``   — check calculation status
 * ``pya3eda extract CONFIG``  — extract data, profiles, CSVs, plots
+* ``pya3eda compact CONFIG``  — compress the outputs of successful calculations
 * ``pya3eda pipeline CONFIG`` — build → OPT → SP (as each OPT succeeds) → extract
+* ``pya3eda bench parse``     — benchmark the output parsers on synthetic outputs
 
 Running ``pya3eda`` with no command prints this help. This is the only module
 that drives process exit: every :class:`~pya3eda.errors.PyA3EDAError` is caught
@@ -116,6 +118,16 @@ SaveScratchOpt = Annotated[bool, typer.Option("--save-scratch", help="Keep the s
 ForceOpt = Annotated[bool, typer.Option("-F", "--force", help="Proceed despite mismatches.")]
 TemplateDirOpt = Annotated[Path, typer.Option("--template-dir", help="Template directory.")]
 NoPlotsOpt = Annotated[bool, typer.Option("--no-plots", help="Skip plot generation.")]
+JobsOpt = Annotated[
+    int,
+    typer.Option("-j", "--jobs", help="Worker processes for parsing outputs (0 = one per CPU)."),
+]
+IoThreadsOpt = Annotated[
+    int,
+    typer.Option(
+        "--io-threads", min=1, help="Threads that list and read outputs concurrently (slow FS)."
+    ),
+]
 
 
 # ---------------------------------------------------------------------------
@@ -138,14 +150,14 @@ def _registry(config_path: Path) -> tuple[CalcRegistry, Path]:
 
     ``pydantic``/``yaml`` (~60 ms) are imported here rather than at module top so
     ``--help``/``--version``/shell-completion — which never load a config — pay
-    nothing for them.
+    nothing for them. An unchanged config's registry comes from the compiled
+    cache (:mod:`pya3eda.registry.compiled`), without re-validating or
+    re-enumerating it.
     """
-    from pya3eda.config import load_config
-    from pya3eda.registry import CalcRegistry
+    from pya3eda.registry.compiled import load_registry
 
-    config = load_config(config_path)
-    base_dir = config_path.resolve().parent
-    return CalcRegistry(config, base_dir), base_dir
+    registry = load_registry(config_path)
+    return registry, registry.base_dir
 
 
 def _run_options(
@@ -205,6 +217,7 @@ def build(
         str, typer.Option("--sp-strategy", help="When to write SP inputs: always, smart, never.")
     ] = "smart",
     template_dir: TemplateDirOpt = Path("templates"),
+    jobs: JobsOpt = 1,
 ) -> None:
     """Generate Q-Chem input files for all registered calculations."""
     with _errors():
@@ -216,6 +229,7 @@ def build(
             template_dir=template_dir,
             overwrite="all" if overwrite else None,
             sp_strategy=sp_strategy,
+            jobs=jobs,
         )
 
 
@@ -244,6 +258,7 @@ def run(
     wait: Annotated[
         bool, typer.Option("--wait", help="Block until all jobs finish (implied for local).")
     ] = False,
+    io_threads: IoThreadsOpt = 1,
 ) -> None:
     """Submit calculations via the local or SLURM backend."""
     with _errors():
@@ -256,6 +271,7 @@ def run(
             backend=backend,
             max_cores=max_cores,
             wait=wait,
+            io_threads=io_threads,
             options=_run_options(
                 cpus=cpus,
                 parallel=parallel,
@@ -278,13 +294,65 @@ def run(
 
 
 @app.command()
-def status(config_path: ConfigArg) -> None:
+def status(
+    config_path: ConfigArg,
+    jobs: JobsOpt = 1,
+    io_threads: IoThreadsOpt = 1,
+    recheck: Annotated[
+        bool,
+        typer.Option(
+            "--recheck", help="Re-read outputs the job ledger already records as finished."
+        ),
+    ] = False,
+    watch: Annotated[
+        bool, typer.Option("--watch", help="Keep running, printing status changes as they happen.")
+    ] = False,
+    interval: Annotated[
+        float, typer.Option("--interval", min=0.1, help="Seconds between --watch refreshes.")
+    ] = 5.0,
+    fmt: Annotated[
+        str, typer.Option("--format", help="Report format: text, jsonl, or csv.")
+    ] = "text",
+    summary_only: Annotated[
+        bool, typer.Option("--summary-only", help="Report only the per-status counts.")
+    ] = False,
+) -> None:
     """Print a status report for all registered calculations."""
     with _errors():
-        from pya3eda.status.checker import check_all
+        if watch and (fmt != "text" or summary_only):
+            from pya3eda.errors import RunOptionError
 
+            raise RunOptionError("--watch prints a text report; drop --format / --summary-only")
         registry, _ = _registry(config_path)
-        check_all(registry)
+        if fmt != "text":
+            from pya3eda.status.export import export_all
+
+            export_all(
+                registry,
+                fmt,
+                summary_only=summary_only,
+                jobs=jobs,
+                io_threads=io_threads,
+                recheck=recheck,
+            )
+            return
+        if watch:
+            from pya3eda.status.watch import watch_all
+
+            watch_all(
+                registry, interval=interval, jobs=jobs, io_threads=io_threads, recheck=recheck
+            )
+            return
+
+        from pya3eda.status.checker import check_all
+
+        check_all(
+            registry,
+            jobs=jobs,
+            io_threads=io_threads,
+            recheck=recheck,
+            summary_only=summary_only,
+        )
 
 
 @app.command()
@@ -292,6 +360,14 @@ def extract(
     config_path: ConfigArg,
     criteria: Annotated[str, typer.Option("--criteria", help="Status filter.")] = "SUCCESSFUL",
     no_plots: NoPlotsOpt = False,
+    jobs: JobsOpt = 1,
+    io_threads: IoThreadsOpt = 1,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental", help="Re-extract only outputs changed since the last such run."
+        ),
+    ] = False,
 ) -> None:
     """Extract data, assemble profiles, export CSVs, and generate plots."""
     with _errors():
@@ -299,10 +375,43 @@ def extract(
         from pya3eda.pipeline import finalize_extraction
 
         registry, base_dir = _registry(config_path)
-        extracted = extract_all(registry, criteria=criteria)
+        extracted = extract_all(
+            registry,
+            criteria=criteria,
+            jobs=jobs,
+            io_threads=io_threads,
+            incremental=incremental,
+        )
         finalize_extraction(registry, extracted, base_dir, plots=not no_plots)
 
 
+@app.command()
+def compact(
+    config_path: ConfigArg,
+    fmt: Annotated[
+        str, typer.Option("--format", help="Compression format: gz, zst, or xz.")
+    ] = "gz",
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j", "--jobs", help="Worker processes for compressing outputs (0 = one per CPU)."
+        ),
+    ] = 1,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force", help="Also compress outputs `extract --incremental` has not recorded."
+        ),
+    ] = False,
+) -> None:
+    """Compress the outputs of all SUCCESSFUL calculations that have been extracted."""
+    with _errors():
+        from pya3eda.compact import compact_all
+
+        registry, _ = _registry(config_path)
+        compact_all(registry, fmt=fmt, jobs=jobs, force=force)
+
+
 @app.command()
 def pipeline(
     config_path: ConfigArg,
@@ -364,7 +473,47 @@ def pipeline(
         )
 
 
-_COMMANDS = frozenset({"build", "run", "status", "extract", "pipeline"})
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+bench_app = typer.Typer(no_args_is_help=True, help="Benchmark PyA3EDA on synthetic outputs.")
+app.add_typer(bench_app, name="bench")
+
+
+@bench_app.command("parse")
+def bench_parse(
+    cycles: Annotated[int, typer.Option("--cycles", help="Optimisation cycles.")] = 100,
+    atoms: Annotated[int, typer.Option("--atoms", help="Atoms in the molecule.")] = 40,
+    modes: Annotated[int, typer.Option("--modes", help="Normal modes in the frequencies.")] = 120,
+    repeat: Annotated[int, typer.Option("-r", "--repeat", help="Timed calls per parser.")] = 5,
+    output: Annotated[
+        Path | None, typer.Option("-o", "--output", help="Write the JSON report here.")
+    ] = None,
+    baseline: Annotated[
+        Path | None,
+        typer.Option("--baseline", exists=True, dir_okay=False, help="Report to compare with."),
+    ] = None,
+) -> None:
+    """Time and memory-profile every output parser on large synthetic Q-Chem outputs."""
+    with _errors():
+        from pya3eda.bench import (
+            OutputShape,
+            format_report,
+            load_report,
+            run_parse_benchmarks,
+            write_report,
+        )
+
+        before = load_report(baseline) if baseline is not None else None
+        shape = OutputShape(cycles=cycles, atoms=atoms, modes=modes)
+        report = run_parse_benchmarks(shape, repeat=repeat)
+        typer.echo(format_report(report, before))
+        if output is not None:
+            write_report(report, output)
+
+
+_COMMANDS = frozenset({"build", "run", "status", "extract", "compact", "pipeline", "bench"})
 
 
 def _default_command(argv: list[str]) -> list[str]:
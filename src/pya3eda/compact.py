@@ -0,0 +1,96 @@
+"""Compression of finished outputs (``pya3eda compact``).
+
+Completed Q-Chem outputs dominate a campaign's disk usage, and once a job has
+succeeded and been extracted its output is only ever read again. :func:`compact_all`
+compresses every such output in place — ``job.out`` becomes ``job.out.gz``
+(or ``.zst`` / ``.xz``) — across worker processes. "Extracted" means the data
+stored by ``extract --incremental`` is current for the output
+(:func:`~pya3eda.extractor.data.current_extractions`); SUCCESSFUL outputs
+without such a record are skipped unless forced. Every reader looks for the
+compressed file when the plain one is missing (see :func:`~pya3eda.utils.find_file`),
+so ``status``, ``extract`` and ``build`` keep working unchanged.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from functools import partial
+from pathlib import Path
+
+from pya3eda.cache import OutputCache
+from pya3eda.errors import RunOptionError
+from pya3eda.extractor.data import current_extractions
+from pya3eda.listing import FileIndex
+from pya3eda.parser.batch import run_many
+from pya3eda.registry import CalcRegistry
+from pya3eda.status.checker import Status, get_statuses
+from pya3eda.utils import COMPRESSED_SUFFIXES, open_compressed
+
+log = logging.getLogger(__name__)
+
+FORMATS = tuple(suffix.lstrip(".") for suffix in COMPRESSED_SUFFIXES)
+"""Compression formats, by file suffix: ``gz``, ``zst``, ``xz``."""
+
+_COPY_CHUNK = 1 << 20
+
+
+def compress_file(path: Path, fmt: str = "gz") -> Path:
+    """Compress *path* to ``<path>.<fmt>``, remove the original, and return the new path.
+
+    The compressed file is written under a temporary name and renamed into place,
+    so an interrupted run never leaves a truncated output behind; it keeps the
+    original's modification time.
+    """
+    target = path.with_name(f"{path.name}.{fmt}")
+    partial_path = path.with_name(f".{path.name}.part.{fmt}")
+    st = path.stat()
+    try:
+        with path.open("rb") as src, open_compressed(partial_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    os.utime(partial_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    partial_path.replace(target)
+    path.unlink()
+    return target
+
+
+def compact_all(
+    registry: CalcRegistry, *, fmt: str = "gz", jobs: int = 1, force: bool = False
+) -> list[Path]:
+    """Compress the output of every SUCCESSFUL, extracted calculation in *registry*.
+
+    Statuses are checked, and outputs compressed, across *jobs* worker processes
+    (``0`` → one per CPU). A SUCCESSFUL output with no current incremental
+    extraction record is skipped (and counted in a warning) unless *force* is
+    set. Outputs already compressed are left alone. Returns the compressed files.
+    """
+    if fmt not in FORMATS:
+        raise RunOptionError(
+            f"Unknown compression format {fmt!r} (choose from {', '.join(FORMATS)})"
+        )
+    files = FileIndex()
+    # Every calc, compressed outputs included: an SP's record is keyed on its OPT's
+    # output, which may be compressed already.
+    specs = registry.all_calcs
+    with OutputCache.open(registry.base_dir) as cache:
+        statuses = get_statuses(specs, cache, jobs=jobs, files=files)
+        extracted = [True] * len(specs) if force else current_extractions(specs, statuses, cache)
+    successful = [
+        (spec.output_path, current)
+        for spec, (status, _), current in zip(specs, statuses, extracted, strict=True)
+        if status == Status.SUCCESSFUL and files.is_file(spec.output_path)
+    ]
+    done = [path for path, current in successful if current]
+    if len(done) < len(successful):
+        log.warning(
+            "Skipped %d successful output(s) not yet extracted; run `pya3eda extract "
+            "--incremental` first, or pass --force",
+            len(successful) - len(done),
+        )
+    compressed = run_many(partial(compress_file, fmt=fmt), done, jobs=jobs)
+    log.info("Compressed %d successful output(s) to .%s", len(compressed), fmt)
+    return compressed
@@ -6,10 +6,11 @@ It is validated on load via Pydantic and never mutated afterwards.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from importlib import import_module
 from pathlib import Path
 from typing import Self
 
-import yaml
 from pydantic import BaseModel, field_validator, model_validator
 
 # ---------------------------------------------------------------------------
@@ -74,6 +75,72 @@ class CatalystConfig(BaseModel, frozen=True):
     dimer: bool = False  # True → also run a `dimer` stage and add a DISS dissociation bar
 
 
+# ---------------------------------------------------------------------------
+# Complex enumeration bounds
+# ---------------------------------------------------------------------------
+
+#: A combination generator: included species names (config order) in, the
+#: combinations to enumerate as complexes out.
+ComboGenerator = Callable[[tuple[str, ...]], Iterable[Iterable[str]]]
+
+
+class ComplexConfig(BaseModel, frozen=True):
+    """Which combinations of included species are enumerated as complexes.
+
+    By default every subset of the included reactants (products) becomes a
+    reactant cluster / preTS complex (postTS complex), so the calc count grows
+    as 2ⁿ. ``max_size`` caps the combination size, ``allowed`` lists the
+    combinations explicitly, and ``generator`` (``"module:function"``) names a
+    :data:`ComboGenerator` that yields them. The complex of *all* included
+    species is always enumerated, since it is the profile's preTS/postTS stage.
+    """
+
+    max_size: int | None = None  # None → unbounded
+    allowed: list[list[str]] | None = None  # None → every combination
+    generator: str | None = None  # "module:function" → ComboGenerator
+
+    @field_validator("max_size")
+    @classmethod
+    def _validate_max_size(cls, v: int | None) -> int | None:
+        """Ensure *max_size* is at least 1 when set."""
+        if v is not None and v < 1:
+            raise ValueError(f"max_size must be at least 1, got {v}")
+        return v
+
+    @field_validator("generator")
+    @classmethod
+    def _validate_generator(cls, v: str | None) -> str | None:
+        """Fail at load time when the generator cannot be imported."""
+        if v is not None:
+            _import_generator(v)
+        return v
+
+    @model_validator(mode="after")
+    def _one_source(self) -> Self:
+        """Reject ``allowed`` together with ``generator`` (ambiguous source)."""
+        if self.allowed is not None and self.generator is not None:
+            raise ValueError("complexes: set either 'allowed' or 'generator', not both")
+        return self
+
+    def generator_func(self) -> ComboGenerator | None:
+        """The imported ``generator`` callable (``None`` when unset)."""
+        return None if self.generator is None else _import_generator(self.generator)
+
+
+def _import_generator(path: str) -> ComboGenerator:
+    """Import ``"package.module:function"`` and return the callable."""
+    module_name, sep, attr = path.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"generator must be 'module:function', got {path!r}")
+    try:
+        func = getattr(import_module(module_name), attr)
+    except (ImportError, AttributeError) as exc:
+        raise ValueError(f"cannot import generator {path!r}: {exc}") from exc
+    if not callable(func):
+        raise ValueError(f"generator {path!r} is not callable")
+    return func  # type: ignore[no-any-return]
+
+
 # ---------------------------------------------------------------------------
 # Top-level config
 # ---------------------------------------------------------------------------
@@ -86,6 +153,7 @@ class Config(BaseModel, frozen=True):
     catalysts: list[CatalystConfig] = []
     reactants: list[SpeciesConfig]
     products: list[SpeciesConfig]
+    complexes: ComplexConfig = ComplexConfig()
 
     @field_validator("levels")
     @classmethod
@@ -111,6 +179,23 @@ class Config(BaseModel, frozen=True):
             raise ValueError("At least one product is required")
         return v
 
+    @model_validator(mode="after")
+    def _allowed_complexes_known(self) -> Self:
+        """Each allowed combination names included species of one side only."""
+        if self.complexes.allowed is None:
+            return self
+        sides = (
+            {r.name for r in self.reactants if r.include},
+            {p.name for p in self.products if p.include},
+        )
+        for combo in self.complexes.allowed:
+            if not combo or not any(set(combo) <= side for side in sides):
+                raise ValueError(
+                    f"complexes.allowed entry {combo!r} must name included reactants "
+                    "or included products only"
+                )
+        return self
+
     @model_validator(mode="after")
     def _merge_duplicate_opts(self) -> Self:
         """Auto-merge levels that share the same OPT theory.
@@ -151,6 +236,7 @@ def load_config(path: str | Path) -> Config:
     (missing file, non-mapping YAML, schema violation) surfaces as
     :class:`~pya3eda.errors.ConfigError` so the CLI maps it to one exit code.
     """
+    import yaml
     from pydantic import ValidationError
 
     from pya3eda.errors import ConfigError
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import pandas as pd
 
+from pya3eda.extractor.table import ExtractedTable
 from pya3eda.ids import (
     CalcID,
     DeltaDeltaData,
@@ -22,6 +24,23 @@ from pya3eda.vocab import CalcType, Mode, Stage, Surface
 log = logging.getLogger(__name__)
 
 _Row = dict[str, Any]
+_Id = TypeVar("_Id", CalcID, ProfileID)
+_V = TypeVar("_V")
+
+# Raw-data CSV columns taken from the extracted table, after the CalcID fields
+_RAW_COLUMNS = (
+    "status",
+    "energy",
+    "sp_energy",
+    "H",
+    "G",
+    "h_corr",
+    "s_corr",
+    "s_trans",
+    "temperature",
+    "zpve",
+    "imag_freq",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -31,7 +50,7 @@ _Row = dict[str, Any]
 
 def export_all(
     registry: CalcRegistry,
-    extracted: dict[CalcID, ExtractedData],
+    extracted: Mapping[CalcID, ExtractedData],
     profiles: dict[ProfileID, ProfileData],
     delta_delta: list[DeltaDeltaData],
     base_dir: Path,
@@ -40,73 +59,91 @@ def export_all(
     results_dir = base_dir / "results"
     total = 0
 
+    # Split everything by method key once, rather than rescanning it per method
+    extracted_by_mk = _split_table(ExtractedTable.of(extracted))
+    profiles_by_mk = _by_method_key(profiles)
+    delta_delta_by_mk: dict[str, list[DeltaDeltaData]] = {}
+    for dd in delta_delta:
+        delta_delta_by_mk.setdefault(dd.method_key, []).append(dd)
+
     for mk in registry.method_keys:
         mk_dir = results_dir / mk
+        mk_extracted = extracted_by_mk.get(mk, ExtractedTable.from_data(()))
+        mk_profiles = profiles_by_mk.get(mk, {})
 
         # Raw calc data + per-profile CSVs
-        total += export_raw(extracted, mk, mk_dir / "raw_data")
-        total += _export_raw_profiles(profiles, mk, mk_dir / "raw_data")
+        total += export_raw(mk_extracted, mk, mk_dir / "raw_data")
+        total += _export_raw_profiles(mk_profiles, mk, mk_dir / "raw_data")
 
         # Combined profiles (per catalyst, mirroring plot traces)
-        total += _export_profiles(profiles, mk, mk_dir / "profiles")
+        total += _export_profiles(mk_profiles, mk, mk_dir / "profiles")
 
         # Delta-delta
-        total += _export_delta_delta(delta_delta, mk, mk_dir / "delta_delta")
+        total += _export_delta_delta(delta_delta_by_mk.get(mk, []), mk, mk_dir / "delta_delta")
 
         # XYZ files
-        total += _export_xyz(extracted, mk, mk_dir / "xyz_files")
+        total += _export_xyz(mk_extracted, mk, mk_dir / "xyz_files")
 
     log.info("Exported %d files total", total)
 
 
+def _by_method_key(items: dict[_Id, _V]) -> dict[str, dict[_Id, _V]]:
+    """Split *items* (keyed by CalcID or ProfileID) by method key, keeping their order."""
+    groups: dict[str, dict[_Id, _V]] = {}
+    for key, value in items.items():
+        groups.setdefault(key.method_key, {})[key] = value
+    return groups
+
+
+def _split_table(table: ExtractedTable) -> dict[str, ExtractedTable]:
+    """Split *table* by method key, keeping its row order."""
+    rows: dict[str, list[int]] = {}
+    for i, cid in enumerate(table.ids):
+        rows.setdefault(cid.method_key, []).append(i)
+    return {mk: table.take(mk_rows) for mk, mk_rows in rows.items()}
+
+
 # ---------------------------------------------------------------------------
 # Raw calculation data
 # ---------------------------------------------------------------------------
 
 
 def export_raw(
-    extracted: dict[CalcID, ExtractedData],
+    extracted: Mapping[CalcID, ExtractedData],
     method_key: str,
     out_dir: Path,
 ) -> int:
     """Write per-calculation raw data CSVs; return number of files written."""
-    rows_opt: list[_Row] = []
-    rows_sp: list[_Row] = []
-
-    for cid, data in extracted.items():
-        if cid.method_key != method_key:
-            continue
-        row = {
-            "catalyst": cid.catalyst or "no_cat",
-            "stage": cid.stage,
-            "species": cid.species,
-            "calc_type": cid.calc_type or "",
-            "mode": cid.mode,
-            "status": data.status,
-            "energy": data.energy,
-            "sp_energy": data.sp_energy,
-            "H": data.H,
-            "G": data.G,
-            "h_corr": data.h_corr,
-            "s_corr": data.s_corr,
-            "s_trans": data.s_trans,
-            "temperature": data.temperature,
-            "zpve": data.zpve,
-            "imag_freq": data.imag_freq,
-        }
-        if cid.mode == Mode.OPT:
-            rows_opt.append(row)
-        else:
-            rows_sp.append(row)
+    table = ExtractedTable.of(extracted)
+    rows_opt: list[int] = []
+    rows_sp: list[int] = []
+    for i, cid in enumerate(table.ids):
+        if cid.method_key == method_key:
+            (rows_opt if cid.mode == Mode.OPT else rows_sp).append(i)
 
     count = 0
     if rows_opt:
-        count += _write_csv(rows_opt, out_dir / f"opt_{method_key}.csv")
+        count += _write_frame(_raw_frame(table, rows_opt), out_dir / f"opt_{method_key}.csv")
     if rows_sp:
-        count += _write_csv(rows_sp, out_dir / f"sp_{method_key}.csv")
+        count += _write_frame(_raw_frame(table, rows_sp), out_dir / f"sp_{method_key}.csv")
     return count
 
 
+def _raw_frame(table: ExtractedTable, rows: list[int]) -> pd.DataFrame:
+    """The raw-data CSV columns of *rows*: the CalcID fields, then the table's columns."""
+    ids = [table.ids[i] for i in rows]
+    frame = pd.DataFrame(
+        {
+            "catalyst": [cid.catalyst or "no_cat" for cid in ids],
+            "stage": [cid.stage for cid in ids],
+            "species": [cid.species for cid in ids],
+            "calc_type": [cid.calc_type or "" for cid in ids],
+            "mode": [cid.mode for cid in ids],
+        }
+    )
+    return pd.concat([frame, table.frame(rows)[list(_RAW_COLUMNS)]], axis=1)
+
+
 def _export_raw_profiles(
     profiles: dict[ProfileID, ProfileData],
     method_key: str,
@@ -283,7 +320,7 @@ def _export_delta_delta(
 
 
 def _export_xyz(
-    extracted: dict[CalcID, ExtractedData],
+    extracted: Mapping[CalcID, ExtractedData],
     method_key: str,
     out_dir: Path,
 ) -> int:
@@ -323,7 +360,12 @@ def _write_csv(rows: list[_Row], path: Path) -> int:
     """Write rows to CSV.  Returns 1 on success, 0 on failure."""
     if not rows:
         return 0
+    return _write_frame(pd.DataFrame(rows), path)
+
+
+def _write_frame(frame: pd.DataFrame, path: Path) -> int:
+    """Write *frame* to CSV.  Returns 1."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    pd.DataFrame(rows).to_csv(path, index=False)
-    log.info("Saved %d rows to %s", len(rows), path)
+    frame.to_csv(path, index=False)
+    log.info("Saved %d rows to %s", len(frame), path)
     return 1
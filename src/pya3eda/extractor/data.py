@@ -6,19 +6,37 @@ missing thermal/entropy/temperature input raises :class:`IncompleteDataError`
 rather than silently yielding ``None`` (a free energy with a missing correction
 "is not true"). A calc that did not run at all (no electronic energy) is simply
 absent. ``extract_all`` aggregates these so one error lists every gap.
+
+Across worker processes (``jobs`` > 1) OPT and SP outputs are parsed in one
+pool, OPTs first; each OPT is extracted as soon as it is parsed, and each SP as
+soon as both its output and its OPT are, so the SPs no longer wait for the
+slowest OPT. Results and errors are those of the serial path (``jobs=1``), in
+registry order.
+
+``incremental=True`` also remembers each calculation's :class:`ExtractedData`
+in the parsed-output cache, keyed by the stamp of its output and — for an SP —
+of its OPT's output, and re-extracts only what changed since: new or modified
+outputs, and the SPs of a modified OPT.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from typing import Any, NamedTuple
 
+from pya3eda.cache import CacheKind, OutputCache, Stamp, cached_many, file_stamp
 from pya3eda.errors import IncompleteDataError
+from pya3eda.extractor.table import ExtractedTable
 from pya3eda.ids import CalcID, CalcSpec, ExtractedData
 from pya3eda.parser import qchem
-from pya3eda.parser.xyz import format_xyz, parse_output_xyz
+from pya3eda.parser._buffer import Text
+from pya3eda.parser.batch import iter_many, parse_many, resolve_jobs, run_many
+from pya3eda.parser.tail import distill_file, scan_opt_file
+from pya3eda.parser.xyz import format_xyz
 from pya3eda.registry import CalcRegistry
-from pya3eda.status.checker import Status, get_status
-from pya3eda.utils import convert_unit, read_text, standard_state_correction
+from pya3eda.status.checker import Status, StatusSnapshot
+from pya3eda.utils import convert_unit, find_file, is_compressed, map_file
 from pya3eda.vocab import Mode
 
 log = logging.getLogger(__name__)
@@ -29,10 +47,32 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+class OptThermo(NamedTuple):
+    """What the SPs run on an OPT's geometry take from it, parsed once per OPT.
+
+    ``extract`` and the pipeline keep one per extracted OPT for the whole run —
+    a few floats, not the output or its geometry — so their memory does not grow
+    with the size of the outputs.
+    """
+
+    h_corr: float | None  # kcal/mol (QRRHO preferred)
+    s_corr: float | None  # kcal/(mol·K) (QRRHO preferred)
+    s_trans: float | None  # kcal/(mol·K)
+    temperature: float | None  # K
+    pressure: float | None  # atm
+    zpve: float | None  # kcal/mol
+    g_enp_ha: float | None  # SMD G-ENP(liq), for the SP CDS cross-check
+    g_s_ha: float | None  # SMD G-S(liq)
+
+
 def extract_all(
     registry: CalcRegistry,
     criteria: str = "SUCCESSFUL",
-) -> dict[CalcID, ExtractedData]:
+    *,
+    jobs: int = 1,
+    io_threads: int = 1,
+    incremental: bool = False,
+) -> ExtractedTable:
     """Extract data for every qualifying calculation in the registry.
 
     Parameters
@@ -41,11 +81,23 @@ def extract_all(
         The registry of all expected calculations.
     criteria : str
         Status-based filter (``"SUCCESSFUL"``, ``"all"``, etc.).
+    jobs : int
+        Worker processes the outputs are classified and parsed across
+        (``0`` → one per CPU; see :mod:`pya3eda.parser.batch`). ``1`` runs
+        the serial path.
+    io_threads : int
+        Threads that list, stat and read outputs concurrently when ``jobs`` is 1
+        (for filesystems where I/O latency, not parsing, dominates).
+    incremental : bool
+        Reuse the data extracted by an earlier incremental run for every output
+        (and, for an SP, OPT output) unchanged since, and store what is
+        extracted now. The result is the same as without it.
 
     Returns
     -------
-    dict[CalcID, ExtractedData]
-        Keyed by ``CalcID``.  Calcs that did not run are omitted.
+    ExtractedTable
+        A ``Mapping[CalcID, ExtractedData]`` in registry order, with ``H`` and
+        ``G`` derived for all rows at once. Calcs that did not run are omitted.
 
     Raises
     ------
@@ -54,29 +106,74 @@ def extract_all(
         computed (missing thermal correction, entropy, temperature, …). All such
         gaps are collected and reported together.
     """
-    results: dict[CalcID, ExtractedData] = {}
-    errors: list[str] = []
+    # Process OPT first (SP needs the OPT thermo for its corrections)
+    opt_cache: dict[CalcID, OptThermo] = {}
+    specs = [*registry.by_mode(Mode.OPT), *registry.by_mode(Mode.SP)]
+    outcomes: list[_Outcome] = [None] * len(specs)
+
+    with OutputCache.open(registry.base_dir) as cache:
+        snapshot = StatusSnapshot(cache, jobs=jobs, io_threads=io_threads)
+        statuses = snapshot.statuses(specs)
+        keys = _extracted_keys(specs, statuses, criteria) if incremental else {}
+        todo = [
+            i for i in range(len(specs)) if not _reuse(i, specs, keys, cache, outcomes, opt_cache)
+        ]
+        todo_specs = [specs[i] for i in todo]
+        todo_statuses = [statuses[i] for i in todo]
+        if resolve_jobs(jobs) > 1:
+            fresh = _extract_pipelined(todo_specs, todo_statuses, criteria, cache, jobs, opt_cache)
+        else:
+            parsed = _parse_outputs(todo_specs, todo_statuses, criteria, cache, jobs, io_threads)
+            fresh = [
+                _outcome(spec, output, opt_cache)
+                for spec, output in zip(todo_specs, parsed, strict=True)
+            ]
+        for i, outcome in zip(todo, fresh, strict=True):
+            outcomes[i] = outcome
+            if i in keys and not isinstance(outcome, IncompleteDataError):
+                stamps, extra = keys[i]
+                value = (outcome, opt_cache.get(specs[i].id))
+                cache.store(_EXTRACTED, specs[i].output_path, stamps, value, extra)
+    if incremental:
+        log.info("Re-extracted %d of %d calculations", len(todo), len(specs))
+
+    rows = [
+        (i, outcome) for i, outcome in enumerate(outcomes) if isinstance(outcome, ExtractedData)
+    ]
+    table = ExtractedTable.from_data(
+        (data for _, data in rows), (_solvent_active(specs[i].solvent) for i, _ in rows)
+    )
+    gaps = {rows[row][0]: message for row, message in table.derive().items()}
+    errors = [
+        str(outcome) if isinstance(outcome, IncompleteDataError) else gaps[i]
+        for i, outcome in enumerate(outcomes)
+        if isinstance(outcome, IncompleteDataError) or i in gaps
+    ]
+    if errors:
+        raise IncompleteDataError.combine(errors)
 
-    # Process OPT first (SP needs OPT content for thermo corrections)
-    opt_content_cache: dict[CalcID, str] = {}
+    log.info("Extracted %d calculations", len(table))
+    return table
 
-    for mode in (Mode.OPT, Mode.SP):
-        for spec in registry.all_calcs:
-            if spec.id.mode != mode:
-                continue
-            try:
-                data = extract_one(spec, criteria, opt_content_cache)
-            except IncompleteDataError as exc:
-                errors.append(str(exc))
-                continue
-            if data is not None:
-                results[spec.id] = data
 
-    if errors:
-        raise IncompleteDataError.combine(errors)
+def current_extractions(
+    specs: Sequence[CalcSpec],
+    statuses: list[tuple[Status, str]],
+    cache: OutputCache,
+    criteria: str = "SUCCESSFUL",
+) -> list[bool]:
+    """Whether each of *specs* has data stored by an incremental extraction that is still current.
 
-    log.info("Extracted %d calculations", len(results))
-    return results
+    Only ``extract --incremental`` stores extracted data, and a record is current
+    while the output (and, for an SP, its OPT's output and gate under *criteria*)
+    is unchanged since. *specs* must include the OPTs of its SPs, as in
+    :func:`extract_all`.
+    """
+    keys = _extracted_keys(specs, statuses, criteria)
+    return [
+        i in keys and cache.lookup(_EXTRACTED, spec.output_path, *keys[i]) is not None
+        for i, spec in enumerate(specs)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -87,80 +184,334 @@ def extract_all(
 def extract_one(
     spec: CalcSpec,
     criteria: str,
-    opt_cache: dict[CalcID, str],
+    opt_cache: dict[CalcID, OptThermo],
+    cache: OutputCache | None = None,
+    *,
+    snapshot: StatusSnapshot | None = None,
 ) -> ExtractedData | None:
-    """Extract data for a single CalcSpec."""
-    # Status gate
-    status, _ = get_status(spec)
-    if criteria.lower() != "all" and status != Status.SUCCESSFUL:
-        return None
+    """Extract data for a single CalcSpec.
 
-    content = read_text(spec.output_path)
-    if not content:
+    An OPT output is read tail first (:func:`~pya3eda.parser.tail.scan_opt_file`)
+    and its :class:`OptThermo` cached in *opt_cache* for the SPs that take their
+    thermo from it.
+    With a persistent *cache*, what was parsed from an unchanged output is reused.
+    The status gate is answered from *snapshot* (a fresh one over *cache* by default).
+    """
+    if snapshot is None:
+        snapshot = StatusSnapshot(cache)
+    status = snapshot.status(spec)
+    data = _extract(spec, _parse_outputs([spec], [status], criteria, cache)[0], opt_cache)
+    if data is None:
         return None
+    table = ExtractedTable.from_data([data], [_solvent_active(spec.solvent)])
+    gaps = table.derive()
+    if gaps:
+        raise IncompleteDataError(gaps[0])
+    return table.row(0)
+
+
+_Outcome = ExtractedData | IncompleteDataError | None
+"""What extracting one spec came to: its data, the gap that failed it, or nothing."""
+
+
+def _outcome(
+    spec: CalcSpec,
+    output: qchem.OptOutputSummary | _SPParse | None,
+    opt_cache: dict[CalcID, OptThermo],
+) -> _Outcome:
+    """:func:`_extract`, with an :class:`IncompleteDataError` returned instead of raised."""
+    try:
+        return _extract(spec, output, opt_cache)
+    except IncompleteDataError as exc:
+        return exc
+
+
+# Cache kind of an incremental run's extracted data: what extracting a spec came
+# to, and the thermo of an OPT.
+_EXTRACTED: CacheKind[tuple[ExtractedData | None, OptThermo | None]] = CacheKind(
+    "extracted", tuple[ExtractedData | None, OptThermo | None]
+)
+
+
+def _passes(criteria: str, status: Status) -> bool:
+    """True if a calc of *status* passes the *criteria* status gate."""
+    return criteria.lower() == "all" or status == Status.SUCCESSFUL
+
+
+def _extracted_keys(
+    specs: Sequence[CalcSpec], statuses: list[tuple[Status, str]], criteria: str
+) -> dict[int, tuple[tuple[Stamp, ...], object]]:
+    """The stamps and extra key of every gated spec's stored extraction, by index.
+
+    An OPT's data depends on its output and the fields read from it; an SP's on
+    its output, its calc type, and its OPT's output and gate — so re-running or
+    re-gating an OPT re-extracts its SPs.
+    """
+    stamps = {
+        i: file_stamp(spec.output_path)
+        for i, (spec, (status, _)) in enumerate(zip(specs, statuses, strict=True))
+        if _passes(criteria, status)
+    }
+    opts = {spec.id: i for i, spec in enumerate(specs) if spec.id.mode == Mode.OPT}
+    keys: dict[int, tuple[tuple[Stamp, ...], object]] = {}
+    for i, stamp in stamps.items():
+        spec = specs[i]
+        if spec.id.mode == Mode.OPT:
+            keys[i] = ((stamp,), _opt_fields(spec))
+        else:
+            opt = opts.get(spec.id.to_opt(), -1)
+            keys[i] = ((stamp, stamps.get(opt)), (spec.id.calc_type, opt in stamps))
+    return keys
+
+
+def _reuse(
+    i: int,
+    specs: Sequence[CalcSpec],
+    keys: dict[int, tuple[tuple[Stamp, ...], object]],
+    cache: OutputCache,
+    outcomes: list[_Outcome],
+    opt_cache: dict[CalcID, OptThermo],
+) -> bool:
+    """Fill in spec *i*'s outcome (and OPT thermo) from the store; False on a miss."""
+    if i not in keys:
+        return False
+    stamps, extra = keys[i]
+    stored = cache.lookup(_EXTRACTED, specs[i].output_path, stamps, extra)
+    if stored is None:
+        return False
+    outcomes[i], thermo = stored
+    if thermo is not None:
+        opt_cache[specs[i].id] = thermo
+    return True
+
+
+def _extract_pipelined(
+    specs: Sequence[CalcSpec],
+    statuses: list[tuple[Status, str]],
+    criteria: str,
+    cache: OutputCache,
+    jobs: int,
+    opt_cache: dict[CalcID, OptThermo],
+) -> list[_Outcome]:
+    """The :func:`_outcome` of every spec (OPTs listed first), parsing in one pool.
+
+    Outputs the *cache* misses are parsed across *jobs* worker processes, OPTs
+    first. An OPT is extracted as soon as it is parsed; an SP once its output is
+    parsed and its OPT (if the registry has it) extracted — exactly when the
+    serial path would see the same *opt_cache* entry.
+    """
+    outcomes: list[_Outcome] = [None] * len(specs)
+    unextracted = {spec.id for spec in specs if spec.id.mode == Mode.OPT}
+    waiting: dict[CalcID, list[tuple[int, qchem.OptOutputSummary | _SPParse | None]]] = {}
+
+    def extract(i: int, output: qchem.OptOutputSummary | _SPParse | None) -> None:
+        cid = specs[i].id
+        if cid.mode == Mode.OPT:
+            outcomes[i] = _outcome(specs[i], output, opt_cache)
+            unextracted.discard(cid)
+            for j, sp in waiting.pop(cid, ()):
+                outcomes[j] = _outcome(specs[j], sp, opt_cache)
+        elif cid.to_opt() in unextracted:
+            waiting.setdefault(cid.to_opt(), []).append((i, output))
+        else:
+            outcomes[i] = _outcome(specs[i], output, opt_cache)
+
+    misses: list[int] = []
+    stamps: dict[int, tuple[Stamp, ...]] = {}
+    for i, (spec, (status, _)) in enumerate(zip(specs, statuses, strict=True)):
+        output = None
+        if _passes(criteria, status):
+            kind, extra = _cache_entry(spec)
+            stamps[i] = (file_stamp(spec.output_path),)
+            output = cache.lookup(kind, spec.output_path, stamps[i], extra)
+            if output is None:
+                misses.append(i)
+                continue
+        extract(i, output)
+
+    for k, output in iter_many(_parse_output, [specs[i] for i in misses], jobs=jobs):
+        i = misses[k]
+        if output is not None:
+            kind, extra = _cache_entry(specs[i])
+            cache.store(kind, specs[i].output_path, stamps[i], output, extra)
+        extract(i, output)
+    return outcomes
+
 
+def _cache_entry(spec: CalcSpec) -> tuple[CacheKind[Any], object]:
+    """The :class:`OutputCache` kind and extra input of *spec*'s parsed output."""
+    if spec.id.mode == Mode.OPT:
+        return _OPT_OUTPUT, _opt_fields(spec)
+    return _SP_OUTPUT, spec.id.calc_type
+
+
+def _parse_output(spec: CalcSpec) -> qchem.OptOutputSummary | _SPParse | None:
+    """Parse *spec*'s output as its extraction needs (run in a worker)."""
+    if spec.id.mode == Mode.OPT:
+        return scan_opt_file(spec.output_path, _opt_fields(spec))
+    return _parse_sp(spec)
+
+
+def _parse_outputs(
+    specs: Sequence[CalcSpec],
+    statuses: list[tuple[Status, str]],
+    criteria: str,
+    cache: OutputCache | None,
+    jobs: int = 1,
+    io_threads: int = 1,
+) -> list[qchem.OptOutputSummary | _SPParse | None]:
+    """Parse the output of every spec passing the status gate (``None`` for the rest).
+
+    Outputs the *cache* cannot answer for are parsed across *jobs* worker
+    processes (or *io_threads* threads).
+    """
+    parsed: list[qchem.OptOutputSummary | _SPParse | None] = [None] * len(specs)
+    # Status gate
+    gated = [i for i, (status, _) in enumerate(statuses) if _passes(criteria, status)]
+    opts = [i for i in gated if specs[i].id.mode == Mode.OPT]
+    sps = [i for i in gated if specs[i].id.mode != Mode.OPT]
+
+    summaries = cached_many(
+        cache,
+        _OPT_OUTPUT,
+        [((specs[i].output_path,), _opt_fields(specs[i])) for i in opts],
+        lambda misses: _scan_opts([specs[opts[k]] for k in misses], jobs, io_threads),
+    )
+    sp_parses = cached_many(
+        cache,
+        _SP_OUTPUT,
+        [((specs[i].output_path,), specs[i].id.calc_type) for i in sps],
+        lambda misses: run_many(
+            _parse_sp, [specs[sps[k]] for k in misses], jobs=jobs, threads=io_threads
+        ),
+    )
+    for i, summary in zip(opts, summaries, strict=True):
+        parsed[i] = summary
+    for i, sp in zip(sps, sp_parses, strict=True):
+        parsed[i] = sp
+    return parsed
+
+
+def _scan_opts(
+    specs: list[CalcSpec], jobs: int, io_threads: int = 1
+) -> list[qchem.OptOutputSummary | None]:
+    """Tail-first scan of each OPT output for the fields its extraction reads."""
+    summaries: list[qchem.OptOutputSummary | None] = [None] * len(specs)
+    for fields in dict.fromkeys(_opt_fields(spec) for spec in specs):
+        group = [i for i, spec in enumerate(specs) if _opt_fields(spec) == fields]
+        paths = [specs[i].output_path for i in group]
+        for i, summary in zip(
+            group, parse_many(paths, fields, jobs=jobs, threads=io_threads), strict=True
+        ):
+            summaries[i] = summary
+    return summaries
+
+
+def _extract(
+    spec: CalcSpec,
+    output: qchem.OptOutputSummary | _SPParse | None,
+    opt_cache: dict[CalcID, OptThermo],
+) -> ExtractedData | None:
+    """Compute the data of *spec* from its parsed *output* (``None`` → nothing to extract)."""
+    if output is None:
+        return None
     cid = spec.id
+    if isinstance(output, qchem.OptOutputSummary):
+        thermo = _opt_thermo(output)
+        opt_cache[cid] = thermo
+        return _extract_opt(cid, output, thermo)
+    return _extract_sp(cid, spec, output, opt_cache)
+
+
+# Every OPT-output field extraction reads; a gas-phase output has no SMD block to find.
+_OPT_FIELDS = (
+    "energy",
+    "thermo",
+    "imag_freq",
+    "zpve",
+    "enthalpy",
+    "entropy",
+    "trans_entropy",
+    "geometry",
+)
+
 
-    if cid.mode == Mode.OPT:
-        opt_cache[cid] = content
-        return _extract_opt(cid, spec, content)
-    return _extract_sp(cid, spec, content, opt_cache)
+def _opt_fields(spec: CalcSpec) -> tuple[str, ...]:
+    """The OPT-output fields extraction reads for *spec*; SMD only when solvated."""
+    return (*_OPT_FIELDS, "smd") if _solvent_active(spec.solvent) else _OPT_FIELDS
 
 
 def _extract_opt(
     cid: CalcID,
-    spec: CalcSpec,
-    content: str,
+    summary: qchem.OptOutputSummary,
+    thermo: OptThermo,
 ) -> ExtractedData | None:
-    """Parse an OPT output and compute derived H/G (fail-loud on missing thermo)."""
-    energy_result = qchem.parse_energy(content)
-    if energy_result is None:
+    """An OPT's data from its scanned *summary*; H/G are left to :meth:`ExtractedTable.derive`."""
+    if summary.energy is None:
         return None  # primary energy absent → calc did not run / unparseable
-    E = energy_result.value_kcal
-
-    h_corr = qchem.parse_enthalpy(content)
-    s_corr = qchem.parse_entropy(content)
-    thermo = qchem.parse_thermo_conditions(content)
-    temperature = thermo.temperature if thermo else None
-    pressure = thermo.pressure if thermo else None
-    H, G = _derive_hg(cid, E, h_corr, s_corr, temperature, pressure, spec.solvent)
-
-    s_trans = qchem.parse_translational_entropy(content)
-    zpve = qchem.parse_zpve(content)
-    imag = qchem.parse_imaginary_freq(content)
-    xyz_data = parse_output_xyz(content)
-    xyz_text = format_xyz(xyz_data) if xyz_data is not None else None
+    xyz_text = format_xyz(summary.geometry) if summary.geometry is not None else None
 
     return ExtractedData(
         calc_id=cid,
         status="SUCCESSFUL",
-        energy=E,
-        h_corr=h_corr,
-        s_corr=s_corr,
-        s_trans=s_trans,
-        temperature=temperature,
-        zpve=zpve,
-        imag_freq=imag,
-        H=H,
-        G=G,
+        energy=summary.energy.value_kcal,
+        h_corr=thermo.h_corr,
+        s_corr=thermo.s_corr,
+        s_trans=thermo.s_trans,
+        temperature=thermo.temperature,
+        pressure=thermo.pressure,
+        zpve=thermo.zpve,
+        imag_freq=summary.imag_freq,
         xyz_text=xyz_text,
     )
 
 
+class _SPParse(NamedTuple):
+    """What SP extraction reads from an SP output."""
+
+    energy_kcal: float | None  # with the EDA CDS / BSSE corrections applied
+    cds_kcal: float | None  # an EDA SP's print=2 G_CDS, for the OPT cross-check
+
+
+# Cache kinds of the parsed outputs (a missing or empty output parses to None,
+# which is never stored).
+_OPT_OUTPUT: CacheKind[qchem.OptOutputSummary | None] = CacheKind(
+    "opt", qchem.OptOutputSummary | None
+)
+_SP_OUTPUT: CacheKind[_SPParse | None] = CacheKind("sp", _SPParse | None)
+
+
+def _parse_sp(spec: CalcSpec) -> _SPParse | None:
+    """Parse the SP output of *spec* (``None`` when it is missing or empty).
+
+    A compressed output is streamed once through
+    :func:`~pya3eda.parser.tail.distill_file`, keeping only the lines its energy
+    is read from, rather than decompressed whole.
+    """
+    source = find_file(spec.output_path)
+    if source is not None and is_compressed(source):
+        distilled, size = distill_file(source, *qchem.sp_energy_patterns(spec.id.calc_type))
+        return _parse_sp_energy(distilled, spec.id.calc_type) if size else None
+    with map_file(spec.output_path) as content:
+        if not content:
+            return None
+        return _parse_sp_energy(content, spec.id.calc_type)
+
+
 def _extract_sp(
     cid: CalcID,
     spec: CalcSpec,
-    content: str,
-    opt_cache: dict[CalcID, str],
+    sp: _SPParse,
+    opt_cache: dict[CalcID, OptThermo],
 ) -> ExtractedData | None:
-    """Parse an SP output; compute H/G from the OPT thermo (fail-loud)."""
-    sp_energy_kcal = _parse_sp_energy(content, spec.id.calc_type)
+    """An SP's data, with its OPT's thermo (fail-loud); H/G are derived later, as for OPTs."""
+    sp_energy_kcal = sp.energy_kcal
     if sp_energy_kcal is None:
         return None  # primary energy absent → calc did not run / unparseable
 
     opt_id = cid.to_opt()
-    opt_content = opt_cache.get(opt_id)
-    if not opt_content:
+    thermo = opt_cache.get(opt_id)
+    if thermo is None:
         # The SP ran (has an electronic energy) but the OPT it depends on was not
         # extracted — H/G would be untrue. Fail loud rather than emit None.
         raise IncompleteDataError(
@@ -168,38 +519,32 @@ def _extract_sp(
             f"({opt_id}) was not extracted — cannot compute H/G"
         )
 
-    _validate_sp_cds(cid, content, opt_content, spec.solvent)
-
-    h_corr, s_corr, s_trans, temperature, zpve, pressure = _opt_thermo(opt_content)
-    H, G = _derive_hg(cid, sp_energy_kcal, h_corr, s_corr, temperature, pressure, spec.solvent)
+    _validate_sp_cds(cid, sp.cds_kcal, thermo, spec.solvent)
 
     return ExtractedData(
         calc_id=cid,
         status="SUCCESSFUL",
         energy=None,
         sp_energy=sp_energy_kcal,
-        h_corr=h_corr,
-        s_corr=s_corr,
-        s_trans=s_trans,
-        temperature=temperature,
-        zpve=zpve,
-        H=H,
-        G=G,
+        h_corr=thermo.h_corr,
+        s_corr=thermo.s_corr,
+        s_trans=thermo.s_trans,
+        temperature=thermo.temperature,
+        pressure=thermo.pressure,
+        zpve=thermo.zpve,
     )
 
 
-def _parse_sp_energy(content: str, calc_type: str | None) -> float | None:
+def _parse_sp_energy(content: Text, calc_type: str | None) -> _SPParse:
     """Parse the SP energy, applying EDA/BSSE/CDS corrections as needed."""
     if not calc_type:
         # Regular SP — just the total energy
         energy = qchem.parse_energy(content)
-        if energy is None:
-            return None
-        return energy.value_kcal
+        return _SPParse(energy.value_kcal if energy is not None else None, None)
     # EDA SP
     eda = qchem.parse_eda_energies(content, calc_type)
     if eda is None:
-        return None
+        return _SPParse(None, None)
     sp_kcal = eda.sp_energy_kcal
 
     # CDS correction
@@ -210,7 +555,7 @@ def _parse_sp_energy(content: str, calc_type: str | None) -> float | None:
     if eda.bsse_kcal is not None:
         sp_kcal += eda.bsse_kcal
 
-    return sp_kcal
+    return _SPParse(sp_kcal, eda.cds_kcal)
 
 
 # SP↔OPT G_CDS agreement tolerance (kcal/mol). CDS is geometry-only, and the SP
@@ -218,7 +563,7 @@ def _parse_sp_energy(content: str, calc_type: str | None) -> float | None:
 _CDS_TOLERANCE_KCAL = 1e-3
 
 
-def _validate_sp_cds(cid: CalcID, sp_content: str, opt_content: str, solvent: str) -> None:
+def _validate_sp_cds(cid: CalcID, sp_cds: float | None, opt: OptThermo, solvent: str) -> None:
     """Warn if an EDA SMD SP's G_CDS disagrees with its OPT's G_CDS.
 
     G_CDS (cavity-dispersion-solvent-structure) depends only on geometry and the
@@ -231,11 +576,9 @@ def _validate_sp_cds(cid: CalcID, sp_content: str, opt_content: str, solvent: st
     """
     if cid.calc_type is None or not _solvent_active(solvent):
         return
-    sp_cds = qchem.parse_cds_print(sp_content)
-    opt_smd = qchem.parse_smd(opt_content)
-    if sp_cds is None or opt_smd is None or opt_smd.g_s_ha is None or opt_smd.g_enp_ha is None:
+    if sp_cds is None or opt.g_s_ha is None or opt.g_enp_ha is None:
         return
-    opt_cds = convert_unit(opt_smd.g_s_ha - opt_smd.g_enp_ha, "hartree", "kcal/mol")
+    opt_cds = convert_unit(opt.g_s_ha - opt.g_enp_ha, "hartree", "kcal/mol")
     diff = abs(sp_cds - opt_cds)
     if diff > _CDS_TOLERANCE_KCAL:
         log.warning(
@@ -259,58 +602,17 @@ def _solvent_active(solvent: str) -> bool:
     return bool(solvent) and solvent.lower() not in ("false", "gas")
 
 
-def _derive_hg(
-    cid: CalcID,
-    energy: float,
-    h_corr: float | None,
-    s_corr: float | None,
-    temperature: float | None,
-    pressure: float | None,
-    solvent: str,
-) -> tuple[float, float]:
-    """Compute ``(H, G)`` from a present electronic *energy* + thermo inputs.
-
-    Raises :class:`IncompleteDataError` naming any input that is missing — the
-    energy is present, so a silently-``None`` H/G "is not true".
-    """
-    if h_corr is None or s_corr is None or temperature is None:
-        missing = [
-            name
-            for name, value in (
-                ("h_corr (enthalpy correction)", h_corr),
-                ("s_corr (entropy)", s_corr),
-                ("temperature", temperature),
-            )
-            if value is None
-        ]
-        raise IncompleteDataError(
-            f"{cid}: electronic energy present but cannot compute H/G — "
-            f"missing {', '.join(missing)}"
-        )
-
-    H = energy + h_corr
-    G = H - temperature * s_corr
-
-    if _solvent_active(solvent):
-        if pressure is None:
-            raise IncompleteDataError(
-                f"{cid}: electronic energy present but cannot apply the solvent "
-                f"standard-state correction to G — missing pressure"
-            )
-        G += standard_state_correction(temperature, pressure)
-
-    return H, G
-
-
-def _opt_thermo(
-    opt_text: str,
-) -> tuple[float | None, float | None, float | None, float | None, float | None, float | None]:
-    """Return ``(h_corr, s_corr, s_trans, temperature, zpve, pressure)`` from an OPT output."""
-    h_corr = qchem.parse_enthalpy(opt_text)
-    s_corr = qchem.parse_entropy(opt_text)
-    s_trans = qchem.parse_translational_entropy(opt_text)
-    thermo = qchem.parse_thermo_conditions(opt_text)
-    zpve = qchem.parse_zpve(opt_text)
-    temperature = thermo.temperature if thermo else None
-    pressure = thermo.pressure if thermo else None
-    return h_corr, s_corr, s_trans, temperature, zpve, pressure
+def _opt_thermo(summary: qchem.OptOutputSummary) -> OptThermo:
+    """The :class:`OptThermo` of an OPT's scanned *summary*."""
+    thermo = summary.thermo
+    smd = summary.smd
+    return OptThermo(
+        h_corr=summary.enthalpy,
+        s_corr=summary.entropy,
+        s_trans=summary.trans_entropy,
+        temperature=thermo.temperature if thermo else None,
+        pressure=thermo.pressure if thermo else None,
+        zpve=summary.zpve,
+        g_enp_ha=smd.g_enp_ha if smd else None,
+        g_s_ha=smd.g_s_ha if smd else None,
+    )
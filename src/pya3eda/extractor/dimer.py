@@ -15,6 +15,7 @@ extraction — nothing here parses files.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 
 from pya3eda.errors import IncompleteDataError
 from pya3eda.ids import CalcID, DeltaDeltaData, ExtractedData
@@ -35,7 +36,7 @@ def _surface_value(data: ExtractedData, energy_type: str) -> float | None:
 def apply_dimer_corrections(
     dd_list: list[DeltaDeltaData],
     registry: CalcRegistry,
-    extracted: dict[CalcID, ExtractedData],
+    extracted: Mapping[CalcID, ExtractedData],
 ) -> list[DeltaDeltaData]:
     """Add the dimer dissociation (DISS) term for every ``dimer: true`` catalyst.
 
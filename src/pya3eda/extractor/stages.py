@@ -1,10 +1,35 @@
-"""Assemble energy profiles from extracted data + ProfileSpecs."""
+"""Assemble energy profiles from extracted data + ProfileSpecs.
+
+Stage compositions are fixed by the registry, so every stage sum is a linear
+map from calc energies to stage energies. :class:`ProfileMatrix` compiles the
+profile specs once into a sparse incidence matrix — one row per candidate
+composition (primary + alternatives) of every stage, holding the columns of
+the calcs it sums — and evaluates every profile of every method, mode and
+surface from a handful of array operations:
+
+* candidate E / G sums: gather-and-add over the matrix rows (a missing calc
+  or quantity is ``NaN`` and poisons its sums, as "no data" should);
+* leader / follower selection: ``argmin`` over each stage's candidate rows,
+  with followers reading the choice of their leader's stage;
+* non-interacting G: the same gather over the ``NiStageRef`` calcs;
+* normalisation: one subtraction of each profile's reference stage.
+
+The matrix is stored padded to the widest row (ELLPACK layout) in plain NumPy
+index arrays; no sparse-matrix library is needed. Compile one with
+:meth:`ProfileMatrix.of` and call :meth:`~ProfileMatrix.evaluate` as often as
+needed — e.g. for what-if evaluations over edited extracted data.
+"""
 
 from __future__ import annotations
 
 import logging
+import weakref
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
 
 from pya3eda import constants as C
+from pya3eda.extractor.table import ExtractedTable, _standard_state_correction
 from pya3eda.ids import (
     CalcID,
     ExtractedData,
@@ -13,16 +38,17 @@ from pya3eda.ids import (
     ProfileID,
     ProfileSpec,
     StageData,
-    StageSpec,
 )
 from pya3eda.registry import CalcRegistry
-from pya3eda.utils import convert_unit, standard_state_correction
-from pya3eda.vocab import CalcType
+from pya3eda.utils import convert_unit
+from pya3eda.vocab import CalcType, Surface
 
 log = logging.getLogger(__name__)
 
 _SelKey = tuple[str, str, str | None, str | None, str]
 
+_compiled: weakref.WeakKeyDictionary[CalcRegistry, ProfileMatrix] = weakref.WeakKeyDictionary()
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -31,261 +57,320 @@ _SelKey = tuple[str, str, str | None, str | None, str]
 
 def build_profiles(
     registry: CalcRegistry,
-    extracted: dict[CalcID, ExtractedData],
+    extracted: Mapping[CalcID, ExtractedData],
 ) -> dict[ProfileID, ProfileData]:
     """Assemble all profiles by summing energies per stage.
 
-    For each ``ProfileSpec`` in the registry, look up each stage's
-    ``CalcID`` list in *extracted* and sum E / G.  Missing data causes
-    the stage (and profile) to be skipped.
+    For each ``ProfileSpec`` in the registry, each stage sums E / G over its
+    ``CalcID`` list in *extracted*.  Missing data leaves the stage's energy
+    ``None``.
 
     When stages carry ``alternatives`` (preTS / postTS complex subsets),
-    selection leaders (full_cat) evaluate all candidates and record the
-    best-E / best-G indices.  Followers (pol_cat, frz_cat) reuse those
-    indices so every calc_type uses the same complex choice.
-    """
-    results: dict[ProfileID, ProfileData] = {}
-
-    # Selection leaders determine which candidate complex to use.
-    # key = (method_key, mode, sp_subfolder, catalyst, stage_name)
-    # value = (best_E_index, best_G_index) into [primary, *alternatives]
-    selections: dict[_SelKey, tuple[int, int]] = {}
-
-    leaders = [p for p in registry.all_profiles if p.selection_leader]
-    followers = [p for p in registry.all_profiles if not p.selection_leader]
-
-    for pspec in leaders + followers:
-        results[pspec.id] = _build_one(pspec, extracted, selections)
-
-    # Build NI profiles from full_cat specs (same assembly, G from ni_ref)
-    for pspec in leaders:
-        ni_pd = _build_one(pspec, extracted, selections, is_ni=True)
-        results[ni_pd.profile_id] = ni_pd
+    selection leaders (full_cat) evaluate all candidates and take the
+    best-E / best-G ones.  Followers (pol_cat, frz_cat) reuse those choices
+    so every calc_type uses the same complex.  Every leader also yields an
+    NI profile (``calc_type=CalcType.NI``).
 
+    The registry's profiles are compiled into a :class:`ProfileMatrix` once
+    and reused by later calls.
+    """
+    results = ProfileMatrix.of(registry).evaluate(extracted)
     log.info("Built %d profiles", len(results))
     return results
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _sum_energies(
-    calc_ids: tuple[CalcID, ...],
-    extracted: dict[CalcID, ExtractedData],
-) -> tuple[float | None, float | None]:
-    """Sum E and G across a set of calculations."""
-    E_total: float = 0.0
-    G_total: float = 0.0
-    has_E = True
-    has_G = True
-
-    for cid in calc_ids:
-        data = extracted.get(cid)
-        if data is None:
-            # No fallback: a stage sum that references missing data is genuinely
-            # underivable. Log so the resulting None is not silent.
-            log.debug("Stage energy sum incomplete: no extracted data for %s", cid)
-            return (None, None)
-
-        e_val = data.energy if data.energy is not None else data.sp_energy
-        if e_val is not None and has_E:
-            E_total += e_val
-        else:
-            has_E = False
-
-        if data.G is not None and has_G:
-            G_total += data.G
-        else:
-            has_G = False
-
-    return (E_total if has_E else None, G_total if has_G else None)
-
-
-def _argmin(vals: list[float | None]) -> int:
-    """Index of the smallest non-None value, or 0 if all are None."""
-    best_idx = 0
-    best_val = float("inf")
-    for i, v in enumerate(vals):
-        if v is not None and v < best_val:
-            best_val = v
-            best_idx = i
-    return best_idx
-
-
-def _sel_key(pid: ProfileID, stage_name: str) -> _SelKey:
-    """Selection-map key scoping the candidate choice."""
-    return (pid.method_key, pid.mode, pid.sp_subfolder, pid.catalyst, stage_name)
+class ProfileMatrix:
+    """Profile specs compiled to a sparse incidence matrix over calc columns.
 
+    Every stage of every profile is a *slot*; its candidate compositions
+    (primary first, then alternatives) are consecutive matrix rows.  Leaders
+    are laid out before followers, so a follower's slot can point at the
+    slot whose selection it reuses.
+    """
 
-# ---------------------------------------------------------------------------
-# Profile assembly
-# ---------------------------------------------------------------------------
+    __slots__ = (
+        "_bounds",
+        "_calc_ids",
+        "_groups",
+        "_labels",
+        "_leaders",
+        "_names",
+        "_ni",
+        "_ni_of",
+        "_ni_profiles",
+        "_profiles",
+        "_ref_slot",
+        "_rows",
+        "_source",
+        "_warn_slots",
+    )
 
+    def __init__(self, profiles: Iterable[ProfileSpec]) -> None:
+        """Compile *profiles*; the result evaluates them in leader-first order."""
+        specs = list(profiles)
+        self._profiles = [p for p in specs if p.selection_leader]
+        self._leaders = len(self._profiles)
+        self._profiles += [p for p in specs if not p.selection_leader]
+        self._ni_profiles = [
+            p.id.model_copy(update={"calc_type": CalcType.NI})
+            for p in self._profiles[: self._leaders]
+        ]
+
+        columns: dict[CalcID, int] = {}
+        rows: list[list[int]] = []  # calc columns summed by each candidate row
+        labels: list[str] = []  # species label of each candidate row
+        ni_index: dict[NiStageRef, int] = {}
+        ni_of: list[int] = []  # NiStageRef of each candidate row (-1: none)
+        groups: list[list[int]] = []  # candidate rows of each slot
+        names: list[str] = []  # stage name of each slot
+        source: list[int] = []  # slot whose candidate choice each slot uses
+        ref_slot: list[int] = []  # reference stage slot of each slot's profile (-1: none)
+        warn_slots: list[int] = []  # follower slots choosing among alternatives
+        bounds: list[tuple[int, int]] = []
+        # key = (method_key, mode, sp_subfolder, catalyst, stage_name) → choosing slot
+        selections: dict[_SelKey, int] = {}
+
+        for pspec in self._profiles:
+            start = len(groups)
+            ref = next(
+                (start + i for i, s in enumerate(pspec.stages) if s.name == pspec.ref_stage), -1
+            )
+            for stage in pspec.stages:
+                slot = len(groups)
+                candidates = [(stage.calc_ids, stage.label, stage.ni_ref)]
+                candidates += [(a.calc_ids, a.label, a.ni_ref) for a in stage.alternatives]
+                groups.append(list(range(len(rows), len(rows) + len(candidates))))
+                for cids, label, ni in candidates:
+                    rows.append([columns.setdefault(cid, len(columns)) for cid in cids])
+                    labels.append(label)
+                    ni_of.append(-1 if ni is None else ni_index.setdefault(ni, len(ni_index)))
+                names.append(stage.name)
+                ref_slot.append(ref)
+                if not stage.alternatives:
+                    source.append(slot)
+                    continue
+                key = _sel_key(pspec.id, stage.name)
+                if pspec.selection_leader or key not in selections:
+                    selections[key] = slot
+                source.append(slot if pspec.selection_leader else selections[key])
+                if not pspec.selection_leader:
+                    warn_slots.append(slot)
+            bounds.append((start, len(groups)))
+
+        for ni in ni_index:
+            for cid in (*ni.ref_cids, *ni.trans_cids):
+                columns.setdefault(cid, len(columns))
+
+        self._calc_ids = list(columns)
+        pad = len(columns)  # the always-zero column padding each row
+        self._rows = _padded(rows, pad)
+        self._groups = _padded(groups, len(rows))  # padding → an all-NaN candidate
+        self._labels = [*labels, ""]
+        self._ni = _NiMatrix(
+            _padded([[columns[c] for c in ni.ref_cids] for ni in ni_index], pad),
+            _padded([[columns[c] for c in ni.trans_cids] for ni in ni_index], pad),
+            np.array([len(ni.trans_cids) for ni in ni_index], dtype=np.float64),
+            np.array([ni.apply_ssc_to_g_ni for ni in ni_index], dtype=bool),
+        )
+        self._ni_of = np.array([*ni_of, -1], dtype=np.intp)
+        self._names = names
+        self._source = np.array(source, dtype=np.intp)
+        self._ref_slot = np.array(ref_slot, dtype=np.intp)
+        self._warn_slots = np.array(warn_slots, dtype=np.intp)
+        self._bounds = bounds
+
+    @classmethod
+    def of(cls, registry: CalcRegistry) -> ProfileMatrix:
+        """The compiled profiles of *registry* (compiled on first use, then kept)."""
+        matrix = _compiled.get(registry)
+        if matrix is None:
+            matrix = _compiled[registry] = cls(registry.all_profiles)
+        return matrix
+
+    def evaluate(self, extracted: Mapping[CalcID, ExtractedData]) -> dict[ProfileID, ProfileData]:
+        """Every compiled profile, then the NI profile of every leader, from *extracted*."""
+        table = ExtractedTable.of(extracted)
+        rows = table.rows(self._calc_ids)
+
+        def values(name: str) -> np.ndarray:
+            """Column *name* per calc column (``NaN`` if not extracted), then the zero pad."""
+            return np.append(np.append(table.column(name), np.nan)[rows], 0.0)
+
+        energy, sp_energy = values("energy"), values("sp_energy")
+        cand_e = _with_nan(_row_sums(np.where(np.isnan(energy), sp_energy, energy), self._rows))
+        cand_g = _with_nan(_row_sums(values("G"), self._rows))
+
+        # Selection: best candidate of each slot, read through each slot's source.
+        slots = np.arange(len(self._names))
+        e_row = self._groups[slots, _argmin(cand_e[self._groups])[self._source]]
+        g_row = self._groups[slots, _argmin(cand_g[self._groups])[self._source]]
+        stage_e, stage_g = cand_e[e_row], cand_g[g_row]
+        labels = [self._labels[r] for r in g_row.tolist()]
+
+        g_ni = _with_nan(
+            self._ni.g(values("H"), values("s_corr"), values("s_trans"), values("temperature"))
+        )
+        ni_of = self._ni_of[g_row]
+        stage_g_ni = np.where(ni_of >= 0, g_ni[ni_of], stage_g)
+
+        for slot in self._warn_slots[
+            np.isnan(stage_e[self._warn_slots]) | np.isnan(stage_g[self._warn_slots])
+        ].tolist():
+            # Followers reuse the leader's candidate for geometry consistency.
+            # If that candidate lacks data for this calc_type the value stays None
+            # by design (no fallback) — log so the gap is visible rather than silent.
+            pid = self._profiles[self._slot_profile(slot)].id
+            log.warning(
+                "Profile %s stage '%s': leader-selected candidate has no %s data "
+                "(E=%s, G=%s); left as None (no fallback).",
+                pid,
+                self._names[slot],
+                pid.calc_type,
+                _optional(stage_e[slot]),
+                _optional(stage_g[slot]),
+            )
 
-def _build_one(
-    pspec: ProfileSpec,
-    extracted: dict[CalcID, ExtractedData],
-    selections: dict[_SelKey, tuple[int, int]],
-    *,
-    is_ni: bool = False,
-) -> ProfileData:
-    """Assemble a single profile from its spec and extracted energies.
+        has_ref = self._ref_slot >= 0
+        rel_e = np.where(has_ref, stage_e - stage_e[self._ref_slot], np.nan)
+        rel_g = np.where(has_ref, stage_g - stage_g[self._ref_slot], np.nan)
+        rel_g_ni = np.where(has_ref, stage_g_ni - stage_g_ni[self._ref_slot], np.nan)
 
-    When *is_ni* is True the profile carries ``calc_type=CalcType.NI``:
-    G is taken from the non-interacting reference (``ni_ref``) for
-    complex stages, from the normal sum for endpoints, and E is
-    always ``None``.
-    """
-    stages: list[StageData] = []
-
-    for stage_spec in pspec.stages:
-        if stage_spec.alternatives:
-            sd = _build_stage_best(stage_spec, pspec, extracted, selections, is_ni=is_ni)
-        else:
-            E, G = _sum_energies(stage_spec.calc_ids, extracted)
-            if is_ni and stage_spec.ni_ref is not None:
-                G = _g_ni_for_stage(stage_spec.ni_ref, extracted)
+        energies = (stage_e.tolist(), stage_g.tolist(), rel_e.tolist(), rel_g.tolist())
+        results: dict[ProfileID, ProfileData] = {}
+        for pspec, bounds in zip(self._profiles, self._bounds, strict=True):
+            results[pspec.id] = self._profile(
+                pspec.id, bounds, labels, pspec.id.calc_type, *energies
+            )
+        none = [None] * len(self._names)
+        ni_energies = (none, stage_g_ni.tolist(), none, rel_g_ni.tolist())
+        for pid, bounds in zip(self._ni_profiles, self._bounds, strict=False):
+            results[pid] = self._profile(pid, bounds, labels, CalcType.NI, *ni_energies)
+        return results
+
+    def _slot_profile(self, slot: int) -> int:
+        """Index of the profile *slot* belongs to."""
+        return next(p for p, (start, stop) in enumerate(self._bounds) if start <= slot < stop)
+
+    def _profile(
+        self,
+        pid: ProfileID,
+        bounds: tuple[int, int],
+        labels: list[str],
+        calc_type: CalcType | None,
+        e: Sequence[float | None],
+        g: Sequence[float | None],
+        rel_e: Sequence[float | None],
+        rel_g: Sequence[float | None],
+    ) -> ProfileData:
+        """The profile *pid* from the per-slot energies of its slots (*bounds*)."""
+        start, stop = bounds
+        normalised = stop > start and self._ref_slot[start] >= 0
+        stages: list[StageData] = []
+        for slot in range(start, stop):
             sd = StageData(
-                name=stage_spec.name,
-                calc_type=CalcType.NI if is_ni else pspec.id.calc_type,
-                species_label=stage_spec.label,
-                E=None if is_ni else E,
-                G=G,
+                name=self._names[slot],
+                calc_type=calc_type,
+                species_label=labels[slot],
+                E=_optional(e[slot]),
+                G=_optional(g[slot]),
             )
-        stages.append(sd)
+            if normalised:
+                rel = {Surface.E: rel_e[slot], Surface.G: rel_g[slot]}
+                sd = sd.model_copy(
+                    update={"_rel": {f: v for f, v in rel.items() if _optional(v) is not None}}
+                )
+            stages.append(sd)
+        return ProfileData(profile_id=pid, stages=tuple(stages))
+
+
+class _NiMatrix:
+    """The ``NiStageRef`` calcs of a :class:`ProfileMatrix`, one row per reference."""
+
+    __slots__ = ("_apply_ssc", "_m", "_ref", "_trans")
+
+    def __init__(
+        self, ref: np.ndarray, trans: np.ndarray, m: np.ndarray, apply_ssc: np.ndarray
+    ) -> None:
+        """Padded *ref* / *trans* calc columns, trans counts *m* and SSC flags."""
+        self._ref = ref
+        self._trans = trans
+        self._m = m
+        self._apply_ssc = apply_ssc
+
+    def g(
+        self, h: np.ndarray, s_corr: np.ndarray, s_trans: np.ndarray, temperature: np.ndarray
+    ) -> np.ndarray:
+        """Non-interacting free energy of every reference (``NaN`` if underivable).
+
+        *ref_cids*   provide H (electronic + enthalpy correction) and
+                     non-translational entropy (rot + vib).
+        *trans_cids* provide translational entropy only.
+
+        G_ni = Σ_ref(H - H_trans) + m·H_trans
+               - T·[Σ_ref(S_tot - S_trans) + Σ_trans(S_trans)]
+               + m · ssc (when ``apply_ssc_to_g_ni``)
+
+        where m = len(trans_cids) and T is the first non-zero reference
+        temperature.
+        """
+        real = self._ref != len(h) - 1
+        temps = np.where(real, temperature[self._ref], np.nan)
+        has_temp = ~np.isnan(temps) & (temps != 0)
+        first = temps[np.arange(len(temps)), np.argmax(has_temp, axis=1)]
+        temp = np.where(has_temp.any(axis=1), first, np.nan)
+
+        h_trans = 2.5 * C.MOLAR_GAS_CONSTANT * temp * convert_unit(1.0, "J/mol", "kcal/mol")
+        h_nontrans = np.zeros(len(temp))
+        s_nontrans = np.zeros(len(temp))
+        for k in range(self._ref.shape[1]):
+            cols = self._ref[:, k]
+            h_nontrans += np.where(real[:, k], h[cols] - h_trans, 0.0)
+            s_nontrans += s_corr[cols] - s_trans[cols]
+        s_trans_sum = _row_sums(s_trans, self._trans)
+        g_ni = h_nontrans + self._m * h_trans - temp * (s_nontrans + s_trans_sum)
+        ssc = _standard_state_correction(temp, np.ones_like(temp))
+        result: np.ndarray = np.where(self._apply_ssc, g_ni + self._m * ssc, g_ni)
+        return result
 
-    pid = pspec.id.model_copy(update={"calc_type": CalcType.NI}) if is_ni else pspec.id
-    return ProfileData(profile_id=pid, stages=_normalize(stages, pspec.ref_stage))
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
 
-def _build_stage_best(
-    stage_spec: StageSpec,
-    pspec: ProfileSpec,
-    extracted: dict[CalcID, ExtractedData],
-    selections: dict[_SelKey, tuple[int, int]],
-    *,
-    is_ni: bool = False,
-) -> StageData:
-    """Build a stage by selecting the best candidate composition.
 
-    For *selection leaders* (full_cat), all candidates are evaluated and
-    the best-E / best-G indices are recorded in *selections*.  Followers
-    reuse the recorded indices so every calc_type shares the same complex.
-    """
-    key = _sel_key(pspec.id, stage_spec.name)
-
-    # All candidates: primary first, then alternatives
-    candidates: list[tuple[tuple[CalcID, ...], str, NiStageRef | None]] = [
-        (stage_spec.calc_ids, stage_spec.label, stage_spec.ni_ref),
-    ]
-    for alt in stage_spec.alternatives:
-        candidates.append((alt.calc_ids, alt.label, alt.ni_ref))
-
-    # Evaluate energy sums for every candidate
-    evals = [_sum_energies(cids, extracted) for cids, _, _ in candidates]
-
-    if pspec.selection_leader or key not in selections:
-        e_idx = _argmin([e for e, _ in evals])
-        g_idx = _argmin([g for _, g in evals])
-        selections[key] = (e_idx, g_idx)
-    else:
-        e_idx, g_idx = selections[key]
-
-    E_val = evals[e_idx][0]
-    G_val = evals[g_idx][1]
-    _, g_label, g_ni_ref = candidates[g_idx]
-
-    # Followers reuse the leader's candidate index for geometry consistency.
-    # If that candidate lacks data for this calc_type the value stays None by
-    # design (no fallback) — log so the gap is visible rather than silent.
-    if not pspec.selection_leader and (E_val is None or G_val is None):
-        log.warning(
-            "Profile %s stage '%s': leader-selected candidate has no %s data "
-            "(E=%s, G=%s); left as None (no fallback).",
-            pspec.id,
-            stage_spec.name,
-            pspec.id.calc_type,
-            E_val,
-            G_val,
-        )
-
-    if is_ni and g_ni_ref is not None:
-        G_val = _g_ni_for_stage(g_ni_ref, extracted)
+def _padded(rows: Sequence[Sequence[int]], pad: int) -> np.ndarray:
+    """*rows* as one index array, each padded with *pad* to the widest row (at least 1)."""
+    width = max([1, *map(len, rows)])
+    array = np.full((len(rows), width), pad, dtype=np.intp)
+    for i, row in enumerate(rows):
+        array[i, : len(row)] = row
+    return array
 
-    return StageData(
-        name=stage_spec.name,
-        calc_type=CalcType.NI if is_ni else pspec.id.calc_type,
-        species_label=g_label,
-        E=None if is_ni else E_val,
-        G=G_val,
-    )
 
+def _row_sums(values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Sum of *values* over each row of indices, added left to right from 0."""
+    total = np.zeros(len(rows))
+    for k in range(rows.shape[1]):
+        total += values[rows[:, k]]
+    return total
 
-def _normalize(stages: list[StageData], ref_stage: str) -> tuple[StageData, ...]:
-    """Subtract the reference stage energies to produce relative values."""
-    ref = next((s for s in stages if s.name == ref_stage), None)
-    if ref is None:
-        return tuple(stages)
-    return tuple(
-        s.model_copy(
-            update={
-                "_rel": {
-                    f: getattr(s, f) - getattr(ref, f)
-                    for f in StageData.energy_types()
-                    if getattr(s, f) is not None and getattr(ref, f) is not None
-                }
-            }
-        )
-        for s in stages
-    )
 
+def _with_nan(values: np.ndarray) -> np.ndarray:
+    """*values* followed by a ``NaN`` (what padding indices point at)."""
+    return np.append(values, np.nan)
 
-def _g_ni_for_stage(
-    ni: NiStageRef,
-    extracted: dict[CalcID, ExtractedData],
-) -> float | None:
-    """Non-interacting free energy for one stage.
 
-    *ni.ref_cids*   provide H (electronic + enthalpy correction) and
-                    non-translational entropy (rot + vib).
-    *ni.trans_cids* provide translational entropy only.
-    *ni.apply_ssc_to_g_ni*  whether to add standard-state correction to G_ni (solvent).
+def _argmin(values: np.ndarray) -> np.ndarray:
+    """Per row, the column of the smallest non-``NaN`` value (0 if all are ``NaN``)."""
+    result: np.ndarray = np.argmin(np.where(np.isnan(values), np.inf, values), axis=1)
+    return result
 
-    G_ni = Σ_ref(H - H_trans) + m·H_trans
-           - T·[Σ_ref(S_tot - S_trans) + Σ_trans(S_trans)]
-           + m · ssc
 
-    where m = len(trans_cids).
-    """
-    ref = [extracted.get(c) for c in ni.ref_cids]
-    if not all(
-        d and d.H is not None and d.s_corr is not None and d.s_trans is not None for d in ref
-    ):
-        return None
-    trans = [extracted.get(c) for c in ni.trans_cids]
-    if not all(d and d.s_trans is not None for d in trans):
-        return None
-    # Both guards above proved every entry is present with the fields used
-    # below; rebuild as non-optional lists so the arithmetic type-checks.
-    ref_data = [d for d in ref if d is not None]
-    trans_data = [d for d in trans if d is not None]
-    temp = next((d.temperature for d in ref_data if d.temperature), None)
-    if not temp:
-        return None
-
-    h_trans = convert_unit(2.5 * C.MOLAR_GAS_CONSTANT * temp, "J/mol", "kcal/mol")
-    m = len(trans_data)
-
-    h_nontrans = sum(d.H - h_trans for d in ref_data if d.H is not None)
-    s_nontrans = sum(
-        d.s_corr - d.s_trans for d in ref_data if d.s_corr is not None and d.s_trans is not None
-    )
-    s_trans_sum = sum(d.s_trans for d in trans_data if d.s_trans is not None)
-    g_ni = h_nontrans + m * h_trans - temp * (s_nontrans + s_trans_sum)
+def _optional(value: float | None) -> float | None:
+    """*value*, or ``None`` for a missing (``None`` / ``NaN``) energy."""
+    return None if value is None or value != value else value
 
-    if ni.apply_ssc_to_g_ni:
-        g_ni += m * standard_state_correction(temp)
 
-    return g_ni
+def _sel_key(pid: ProfileID, stage_name: str) -> _SelKey:
+    """Selection-map key scoping the candidate choice."""
+    return (pid.method_key, pid.mode, pid.sp_subfolder, pid.catalyst, stage_name)
@@ -0,0 +1,253 @@
+"""Columnar extracted data: one float64 column per quantity, in registry order.
+
+:func:`~pya3eda.extractor.data.extract_all` returns an :class:`ExtractedTable`
+rather than one pydantic model per calculation. The numeric fields of every
+calculation — E, SP energy, thermal corrections, T, P, ZPVE, H and G — are NumPy
+columns (``NaN`` where a value is missing) addressed through a ``CalcID`` → row
+index, and :meth:`ExtractedTable.derive` computes ``H``, ``G`` and the solvent
+standard-state correction for all rows at once.
+
+The table is a read-only ``Mapping[CalcID, ExtractedData]``: looking a calc up
+returns an :class:`~pya3eda.ids.ExtractedData` view of its row, so profile
+assembly and other code written against the former dict keep working. The
+raw-data CSVs are written straight from the columns (:meth:`ExtractedTable.frame`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from pya3eda import constants as C
+from pya3eda.ids import CalcID, ExtractedData
+from pya3eda.utils import convert_unit
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+FLOAT_COLUMNS = (
+    "energy",  # E (kcal/mol), OPTs
+    "sp_energy",  # kcal/mol, SPs (with EDA / BSSE corrections)
+    "h_corr",  # kcal/mol
+    "s_corr",  # kcal/(mol·K)
+    "s_trans",  # kcal/(mol·K)
+    "temperature",  # K
+    "pressure",  # atm
+    "zpve",  # kcal/mol
+    "H",  # E + h_corr
+    "G",  # H - T·S (+ SSC in solvent)
+)
+"""The ``ExtractedData`` fields stored as float64 columns."""
+
+
+class ExtractedTable(Mapping[CalcID, ExtractedData]):
+    """Extracted data of many calculations, column by column.
+
+    Build one with :meth:`from_data`. Rows keep the order they were given in
+    (registry order, for ``extract_all``). Indexing by ``CalcID`` builds an
+    ``ExtractedData`` view of the row; changing that view does not change the
+    table.
+    """
+
+    __slots__ = ("_columns", "_ids", "_imag_freq", "_index", "_solvated", "_status", "_xyz_text")
+
+    def __init__(
+        self,
+        ids: Sequence[CalcID],
+        columns: Mapping[str, Sequence[float] | np.ndarray],
+        *,
+        status: Sequence[str],
+        imag_freq: Sequence[int | None],
+        xyz_text: Sequence[str | None],
+        solvated: Sequence[bool] | np.ndarray | None = None,
+    ) -> None:
+        """Wrap per-row *ids* and *columns* (every name in :data:`FLOAT_COLUMNS`).
+
+        *solvated* marks the rows whose ``G`` takes the standard-state
+        correction in :meth:`derive` (none by default).
+        """
+        self._ids = tuple(ids)
+        self._index = {cid: i for i, cid in enumerate(self._ids)}
+        if len(self._index) != len(self._ids):
+            raise ValueError("ExtractedTable rows must have distinct CalcIDs")
+        self._columns = {name: _frozen(columns[name]) for name in FLOAT_COLUMNS}
+        self._status = tuple(status)
+        self._imag_freq = tuple(imag_freq)
+        self._xyz_text = tuple(xyz_text)
+        n = len(self._ids)
+        self._solvated = _frozen(np.zeros(n, bool) if solvated is None else solvated, bool)
+        lengths = {len(c) for c in self._columns.values()}
+        lengths |= {len(self._status), len(self._imag_freq), len(self._xyz_text)}
+        if lengths | {len(self._solvated)} != {n}:
+            raise ValueError("ExtractedTable columns must all have one value per row")
+
+    @classmethod
+    def from_data(
+        cls, data: Iterable[ExtractedData], solvated: Iterable[bool] | None = None
+    ) -> ExtractedTable:
+        """A table of the rows in *data*, with their *solvated* flags."""
+        rows = list(data)
+        columns = {
+            name: np.array(
+                [np.nan if (v := getattr(d, name)) is None else v for d in rows], dtype=np.float64
+            )
+            for name in FLOAT_COLUMNS
+        }
+        return cls(
+            [d.calc_id for d in rows],
+            columns,
+            status=[d.status for d in rows],
+            imag_freq=[d.imag_freq for d in rows],
+            xyz_text=[d.xyz_text for d in rows],
+            solvated=None if solvated is None else list(solvated),
+        )
+
+    @classmethod
+    def of(cls, extracted: Mapping[CalcID, ExtractedData]) -> ExtractedTable:
+        """*extracted* itself if it is a table, else a table of its values."""
+        if isinstance(extracted, ExtractedTable):
+            return extracted
+        return cls.from_data(extracted.values())
+
+    def take(self, rows: Sequence[int]) -> ExtractedTable:
+        """A table of *rows* only, in the given order (``H``/``G`` as derived here)."""
+        picked = np.asarray(rows, dtype=np.intp)
+        return ExtractedTable(
+            [self._ids[i] for i in picked],
+            {name: self._columns[name][picked] for name in FLOAT_COLUMNS},
+            status=[self._status[i] for i in picked],
+            imag_freq=[self._imag_freq[i] for i in picked],
+            xyz_text=[self._xyz_text[i] for i in picked],
+            solvated=self._solvated[picked],
+        )
+
+    # -- Mapping -------------------------------------------------------------
+
+    def __getitem__(self, cid: CalcID) -> ExtractedData:
+        """The ``ExtractedData`` view of *cid*'s row."""
+        return self.row(self._index[cid])
+
+    def __iter__(self) -> Iterator[CalcID]:
+        """The row ids, in row order."""
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self._ids)
+
+    def __contains__(self, cid: object) -> bool:
+        """True if *cid* has a row."""
+        return cid in self._index
+
+    # -- Columns -------------------------------------------------------------
+
+    @property
+    def ids(self) -> tuple[CalcID, ...]:
+        """The ``CalcID`` of every row, in row order."""
+        return self._ids
+
+    def index(self, cid: CalcID) -> int:
+        """The row of *cid* (``KeyError`` if it has none)."""
+        return self._index[cid]
+
+    def rows(self, cids: Iterable[CalcID]) -> np.ndarray:
+        """The row of each of *cids*, ``-1`` where it has none."""
+        index = self._index
+        return np.fromiter((index.get(cid, -1) for cid in cids), dtype=np.intp)
+
+    def column(self, name: str) -> np.ndarray:
+        """The read-only float64 column *name* (one of :data:`FLOAT_COLUMNS`)."""
+        return self._columns[name]
+
+    def row(self, i: int) -> ExtractedData:
+        """An ``ExtractedData`` view of row *i*."""
+        values: dict[str, Any] = {name: _scalar(self._columns[name][i]) for name in FLOAT_COLUMNS}
+        return ExtractedData.model_construct(
+            calc_id=self._ids[i],
+            status=self._status[i],
+            imag_freq=self._imag_freq[i],
+            xyz_text=self._xyz_text[i],
+            **values,
+        )
+
+    def frame(self, rows: Sequence[int] | None = None) -> pd.DataFrame:
+        """*rows* (default: all) as a DataFrame: ``status``, the float columns, ``imag_freq``."""
+        import pandas as pd
+
+        picked = np.arange(len(self._ids)) if rows is None else np.asarray(rows, dtype=np.intp)
+        data: dict[str, object] = {"status": [self._status[i] for i in picked]}
+        data.update({name: self._columns[name][picked] for name in FLOAT_COLUMNS})
+        data["imag_freq"] = [self._imag_freq[i] for i in picked]
+        return pd.DataFrame(data)
+
+    # -- Derivation ----------------------------------------------------------
+
+    def derive(self) -> dict[int, str]:
+        """Compute ``H`` and ``G`` of every row from its energy and thermo, at once.
+
+        ``H = E + h_corr`` and ``G = H - T·s_corr``, plus the standard-state
+        correction in solvated rows, where ``E`` is the OPT energy or else the SP
+        energy. Returns, by row, why a row with an energy cannot be derived: the
+        ``IncompleteDataError`` message naming each missing input. Such a row's
+        ``H`` and ``G`` are ``NaN``.
+        """
+        c = self._columns
+        energy = np.where(np.isnan(c["energy"]), c["sp_energy"], c["energy"])
+        has_energy = ~np.isnan(energy)
+        thermo = {
+            "h_corr (enthalpy correction)": np.isnan(c["h_corr"]),
+            "s_corr (entropy)": np.isnan(c["s_corr"]),
+            "temperature": np.isnan(c["temperature"]),
+        }
+        lacks_thermo = np.logical_or.reduce(list(thermo.values())) & has_energy
+        lacks_pressure = ~lacks_thermo & has_energy & self._solvated & np.isnan(c["pressure"])
+        underivable = lacks_thermo | lacks_pressure
+        gaps: dict[int, str] = {}
+        for i in np.flatnonzero(underivable).tolist():
+            if lacks_thermo[i]:
+                missing = ", ".join(name for name, absent in thermo.items() if absent[i])
+                gaps[i] = (
+                    f"{self._ids[i]}: electronic energy present but cannot compute H/G — "
+                    f"missing {missing}"
+                )
+            else:
+                gaps[i] = (
+                    f"{self._ids[i]}: electronic energy present but cannot apply the solvent "
+                    f"standard-state correction to G — missing pressure"
+                )
+
+        h = energy + c["h_corr"]
+        g = h - c["temperature"] * c["s_corr"]
+        g = np.where(
+            self._solvated, g + _standard_state_correction(c["temperature"], c["pressure"]), g
+        )
+        h[underivable] = np.nan
+        g[underivable] = np.nan
+        self._columns = {**c, "H": _frozen(h), "G": _frozen(g)}
+        return gaps
+
+
+def _standard_state_correction(temperature: np.ndarray, pressure: np.ndarray) -> np.ndarray:
+    """:func:`pya3eda.utils.standard_state_correction` over arrays (``NaN`` in → ``NaN`` out)."""
+    pressure_pa = pressure * convert_unit(1.0, "atm", "Pa")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = (C.MOLAR_GAS_CONSTANT * temperature * C.M3_TO_L) / pressure_pa
+        correction_j = C.MOLAR_GAS_CONSTANT * temperature * np.log(ratio)
+    result: np.ndarray = correction_j * convert_unit(1.0, "J/mol", "kcal/mol")
+    return result
+
+
+def _frozen(
+    values: Sequence[float] | Sequence[bool] | np.ndarray, dtype: type = np.float64
+) -> np.ndarray:
+    """*values* as a read-only array of *dtype*."""
+    array: np.ndarray = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+def _scalar(value: np.float64) -> float | None:
+    """A column value as a Python float (``None`` for ``NaN``)."""
+    return None if np.isnan(value) else float(value)
@@ -1,16 +1,19 @@
 """Typed identifiers and specifications for calculations and profiles.
 
 Every calculation and energy profile in the system is identified by a frozen,
-hashable model that can be used as a dictionary key.  ``CalcSpec`` and
+hashable value that can be used as a dictionary key.  ``CalcSpec`` and
 ``ProfileSpec`` carry the full derived metadata needed by downstream modules.
 """
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
 from pathlib import Path
-from typing import ClassVar, NamedTuple
+from typing import Any, ClassVar, NamedTuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler
+from pydantic_core import core_schema
 
 from pya3eda.vocab import CalcType, Mode, Stage, Surface
 
@@ -18,29 +21,171 @@ from pya3eda.vocab import CalcType, Mode, Stage, Surface
 # Calculation identity
 # ---------------------------------------------------------------------------
 
+# A registry holds one CalcID and one CalcSpec per expected calculation, and
+# screening-sized configs enumerate 10^5-10^6 of them, every one a dict key in
+# several indexes. Both are therefore plain ``__slots__`` value types rather than
+# pydantic models: no per-instance ``__dict__`` or validation machinery, interned
+# strings, and (for CalcID) a hash computed once. Vocabulary fields are still
+# coerced to their enums, so an unknown stage / mode / calc type fails loudly.
 
-class CalcID(BaseModel, frozen=True):
-    """Unique, hashable identifier for a single calculation."""
+_CALC_ID_FIELDS = (
+    "method_key",
+    "catalyst",
+    "stage",
+    "species",
+    "calc_type",
+    "mode",
+    "sp_subfolder",
+)
+
+
+def _intern(value: str | None) -> str | None:
+    """*value* interned (``None`` unchanged)."""
+    return None if value is None else sys.intern(value)
+
+
+class CalcID:
+    """Unique, hashable identifier for a single calculation.
+
+    Immutable; construct with keyword arguments. Compares, hashes and pickles
+    by value.
+    """
+
+    __slots__ = (*_CALC_ID_FIELDS, "_hash")
 
     method_key: str  # OPT-level folder, e.g. "wB97X-V_def2-SVP_smd"
-    catalyst: str | None = None  # None → uncatalyzed, else catalyst name
+    catalyst: str | None  # None → uncatalyzed, else catalyst name
     stage: Stage
     species: str  # e.g. "prop2enal", "lip-prop2enal", "ts_lip-tscomplex"
-    calc_type: CalcType | None = None  # full_cat | pol_cat | frz_cat | None
-    mode: Mode = Mode.OPT
-    sp_subfolder: str | None = None  # e.g. "wB97M-V_def2-TZVPPD_smd_sp"
+    calc_type: CalcType | None  # full_cat | pol_cat | frz_cat | None
+    mode: Mode
+    sp_subfolder: str | None  # e.g. "wB97M-V_def2-TZVPPD_smd_sp"
+    _hash: int
+
+    def __init__(
+        self,
+        *,
+        method_key: str,
+        catalyst: str | None = None,
+        stage: str,
+        species: str,
+        calc_type: str | None = None,
+        mode: str = Mode.OPT,
+        sp_subfolder: str | None = None,
+    ) -> None:
+        """Validate and intern the fields (an out-of-vocabulary value raises ``ValueError``)."""
+        self._set(
+            (
+                sys.intern(method_key),
+                _intern(catalyst),
+                Stage(stage),
+                sys.intern(species),
+                None if calc_type is None else CalcType(calc_type),
+                Mode(mode),
+                _intern(sp_subfolder),
+            )
+        )
+
+    @classmethod
+    def _from_fields(cls, fields: tuple[object, ...]) -> CalcID:
+        """A CalcID of already-validated *fields* (in :data:`_CALC_ID_FIELDS` order)."""
+        cid = object.__new__(cls)
+        cid._set(fields)
+        return cid
+
+    def _set(self, fields: tuple[object, ...]) -> None:
+        """Store *fields* and their hash (the only writes a CalcID ever sees)."""
+        for name, value in zip(_CALC_ID_FIELDS, fields, strict=True):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", hash(fields))
+
+    def _fields(self) -> tuple[object, ...]:
+        """The field values, in :data:`_CALC_ID_FIELDS` order."""
+        return (
+            self.method_key,
+            self.catalyst,
+            self.stage,
+            self.species,
+            self.calc_type,
+            self.mode,
+            self.sp_subfolder,
+        )
+
+    def replace(self, **changes: str | None) -> CalcID:
+        """A copy with the given fields changed (validated like the constructor)."""
+        values = dict(zip(_CALC_ID_FIELDS, self._fields(), strict=True))
+        values.update(changes)
+        return CalcID(**values)  # type: ignore[arg-type]
 
     def to_opt(self) -> CalcID:
         """The OPT calculation this id derives from (``mode='opt'``, no SP subfolder)."""
-        return self.model_copy(update={"mode": Mode.OPT, "sp_subfolder": None})
+        fields = self._fields()
+        return CalcID._from_fields((*fields[:5], Mode.OPT, None))
 
+    def __eq__(self, other: object) -> bool:
+        """Equal when every field is."""
+        if not isinstance(other, CalcID):
+            return NotImplemented
+        return self._hash == other._hash and self._fields() == other._fields()
 
-class CalcSpec(BaseModel, frozen=True):
-    """Full specification of a calculation, including path and metadata."""
+    def __hash__(self) -> int:
+        """The hash computed at construction."""
+        return self._hash
 
-    id: CalcID
-    input_path: Path  # relative to base_dir
-    output_path: Path  # .in → .out
+    def __setattr__(self, name: str, value: object) -> None:
+        """Refuse: a CalcID is immutable."""
+        raise AttributeError(f"CalcID is immutable (cannot set {name!r})")
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse: a CalcID is immutable."""
+        raise AttributeError(f"CalcID is immutable (cannot delete {name!r})")
+
+    def __reduce__(self) -> tuple[Callable[..., CalcID], tuple[object, ...]]:
+        """Pickle by value (the hash is recomputed: string hashes differ per process)."""
+        return CalcID._from_fields, (self._fields(),)
+
+    def __repr__(self) -> str:
+        """``CalcID(method_key=..., ...)`` with the plain field values."""
+        values = (None if v is None else str(v) for v in self._fields())
+        fields = ", ".join(f"{n}={v!r}" for n, v in zip(_CALC_ID_FIELDS, values, strict=True))
+        return f"CalcID({fields})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Accept CalcID instances as they are in pydantic models (e.g. ``StageSpec``).
+
+        In JSON a CalcID is the list of its field values, validated like the
+        constructor's arguments on the way back in.
+        """
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_after_validator_function(
+                cls._from_json,
+                core_schema.list_schema(core_schema.nullable_schema(core_schema.str_schema())),
+            ),
+            python_schema=core_schema.is_instance_schema(cls),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._to_json, when_used="json"
+            ),
+        )
+
+    @classmethod
+    def _from_json(cls, values: list[str | None]) -> CalcID:
+        """The CalcID whose fields are *values*, in :data:`_CALC_ID_FIELDS` order."""
+        return cls(**dict(zip(_CALC_ID_FIELDS, values, strict=True)))  # type: ignore[arg-type]
+
+    def _to_json(self) -> list[str | None]:
+        """The field values as plain strings, in :data:`_CALC_ID_FIELDS` order."""
+        return [None if v is None else str(v) for v in self._fields()]
+
+
+class CalcContext(NamedTuple):
+    """Theory and reaction context shared by every calculation of one level's theory.
+
+    The registry builds one per (level, OPT or SP theory); each of its
+    :class:`CalcSpec`\\s references it instead of carrying copies.
+    """
 
     # Original (unsanitized) values for Q-Chem input content
     method_name: str
@@ -52,18 +197,163 @@ class CalcSpec(BaseModel, frozen=True):
     # SP path info
     sp_subfolder: str | None = None  # e.g. "wB97M-V_def2-TZVPPD_smd_sp"
 
-    # Molecule structure
-    is_fragmented: bool = False  # True for catalytic complexes
-
-    # Reaction context (for profile assembly)
-    present_reactants: tuple[str, ...] = ()
-    present_products: tuple[str, ...] = ()
-    present_catalysts: tuple[str, ...] = ()
+    # Every species of the reaction (for profile assembly)
     all_reactants: tuple[str, ...] = ()
     all_products: tuple[str, ...] = ()
     all_catalysts: tuple[str, ...] = ()
 
 
+_CALC_SPEC_FIELDS = (
+    "id",
+    "input_path",
+    "output_path",
+    "context",
+    "is_fragmented",
+    "present_reactants",
+    "present_products",
+    "present_catalysts",
+)
+
+
+class CalcSpec:
+    """Full specification of a calculation, including path and metadata.
+
+    Immutable; construct with keyword arguments. The level-wide metadata lives
+    in the shared :class:`CalcContext` and is exposed as properties.
+    """
+
+    __slots__ = _CALC_SPEC_FIELDS
+
+    id: CalcID
+    input_path: Path  # relative to base_dir
+    output_path: Path  # .in → .out
+    context: CalcContext
+
+    # Molecule structure
+    is_fragmented: bool  # True for catalytic complexes
+
+    # Species present in this calculation (for profile assembly)
+    present_reactants: tuple[str, ...]
+    present_products: tuple[str, ...]
+    present_catalysts: tuple[str, ...]
+
+    def __init__(
+        self,
+        *,
+        id: CalcID,
+        input_path: Path,
+        output_path: Path,
+        context: CalcContext,
+        is_fragmented: bool = False,
+        present_reactants: tuple[str, ...] = (),
+        present_products: tuple[str, ...] = (),
+        present_catalysts: tuple[str, ...] = (),
+    ) -> None:
+        """Store the fields as given."""
+        self._set(
+            (
+                id,
+                input_path,
+                output_path,
+                context,
+                is_fragmented,
+                present_reactants,
+                present_products,
+                present_catalysts,
+            )
+        )
+
+    @classmethod
+    def _from_values(cls, values: tuple[object, ...]) -> CalcSpec:
+        """A CalcSpec of *values* (in ``__slots__`` order)."""
+        spec = object.__new__(cls)
+        spec._set(values)
+        return spec
+
+    def _set(self, values: tuple[object, ...]) -> None:
+        """Store *values* (the only writes a CalcSpec ever sees)."""
+        for name, value in zip(_CALC_SPEC_FIELDS, values, strict=True):
+            object.__setattr__(self, name, value)
+
+    @property
+    def method_name(self) -> str:
+        """Q-Chem method (as configured)."""
+        return self.context.method_name
+
+    @property
+    def basis_set(self) -> str:
+        """Q-Chem basis set (as configured)."""
+        return self.context.basis_set
+
+    @property
+    def dispersion(self) -> str:
+        """Dispersion correction (``"false"`` when none)."""
+        return self.context.dispersion
+
+    @property
+    def solvent(self) -> str:
+        """Implicit solvent (``"false"`` in the gas phase)."""
+        return self.context.solvent
+
+    @property
+    def eda2(self) -> int | None:
+        """EDA2 option (SP calculations only)."""
+        return self.context.eda2
+
+    @property
+    def sp_subfolder(self) -> str | None:
+        """SP sub-folder name (SP calculations only)."""
+        return self.context.sp_subfolder
+
+    @property
+    def all_reactants(self) -> tuple[str, ...]:
+        """Every reactant of the reaction."""
+        return self.context.all_reactants
+
+    @property
+    def all_products(self) -> tuple[str, ...]:
+        """Every product of the reaction."""
+        return self.context.all_products
+
+    @property
+    def all_catalysts(self) -> tuple[str, ...]:
+        """Every catalyst of the reaction."""
+        return self.context.all_catalysts
+
+    def _values(self) -> tuple[object, ...]:
+        """The field values, in ``__slots__`` order."""
+        return tuple(getattr(self, name) for name in _CALC_SPEC_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        """Equal when every field is."""
+        if not isinstance(other, CalcSpec):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        """Hash of the id (equal specs have equal ids)."""
+        return hash(self.id)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Refuse: a CalcSpec is immutable."""
+        raise AttributeError(f"CalcSpec is immutable (cannot set {name!r})")
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse: a CalcSpec is immutable."""
+        raise AttributeError(f"CalcSpec is immutable (cannot delete {name!r})")
+
+    def __reduce__(self) -> tuple[Callable[..., CalcSpec], tuple[object, ...]]:
+        """Pickle by value."""
+        return CalcSpec._from_values, (self._values(),)
+
+    def __repr__(self) -> str:
+        """``CalcSpec(id=..., input_path=..., ...)``."""
+        fields = ", ".join(
+            f"{n}={v!r}" for n, v in zip(_CALC_SPEC_FIELDS, self._values(), strict=True)
+        )
+        return f"CalcSpec({fields})"
+
+
 # ---------------------------------------------------------------------------
 # Profile identity
 # ---------------------------------------------------------------------------
@@ -153,6 +443,9 @@ class ProfileSpec(BaseModel, frozen=True):
 class ExtractedData(BaseModel):
     """Parsed result for a single calculation output file."""
 
+    # JSON (the parsed-output cache) keeps non-finite values instead of nulling them.
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+
     calc_id: CalcID
     status: str = ""
 
@@ -162,6 +455,7 @@ class ExtractedData(BaseModel):
     s_corr: float | None = None  # total entropy correction
     s_trans: float | None = None  # translational entropy
     temperature: float | None = None
+    pressure: float | None = None  # atm
     zpve: float | None = None
     imag_freq: int | None = None
 
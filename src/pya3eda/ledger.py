@@ -0,0 +1,224 @@
+"""Persistent job ledger: every submission and observed status transition.
+
+Job state otherwise lives only in memory (the throttler's active jobs, the
+pipeline's in-flight map) and is rebuilt on every command by re-reading outputs.
+:class:`JobLedger` keeps it in ``base_dir/.pya3eda/jobs.sqlite``: per
+calculation (keyed by its input path) the current status and the job that last
+ran it — job id, backend, cores, submit / start / end times — plus an
+append-only history of every status transition.
+
+``run`` and ``pipeline`` record each submission; every status check records
+what it observed. A calculation whose recorded status is terminal (see
+:data:`TERMINAL`) is then reported from the ledger without touching its files;
+only calculations still queued, running or never seen are re-inspected.
+Resubmitting through PyA3EDA makes a calculation non-terminal again; one
+re-run or edited by hand needs ``pya3eda status --recheck``.
+
+Like the output cache, the ledger is best-effort: an unwritable campaign
+directory or a locked database disables it and every status is read from disk.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import NamedTuple
+
+from pya3eda.cache import CACHE_DIR
+
+log = logging.getLogger(__name__)
+
+_DB_NAME = "jobs.sqlite"
+_QUERY_BATCH = 500  # input paths per lookup (below SQLite's bound-parameter limit)
+
+SUBMITTED = "submitted"
+"""Status recorded for a calculation when a job is submitted for it."""
+
+TERMINAL = frozenset({"SUCCESSFUL", "CRASH", "terminated", "VALIDATION"})
+"""Recorded statuses trusted without re-reading the calculation's files."""
+
+
+class LedgerEntry(NamedTuple):
+    """What the ledger knows about one calculation."""
+
+    status: str  # a Status value, or SUBMITTED
+    detail: str
+    job_id: str | None  # the last job submitted for it (None if never submitted here)
+    backend: str | None
+    cores: int | None
+    submitted: float | None  # epoch seconds
+    started: float | None  # first seen running after submission
+    ended: float | None  # first seen in a terminal status after submission
+
+    @property
+    def terminal(self) -> bool:
+        """Whether the recorded status is final (see :data:`TERMINAL`)."""
+        return self.status in TERMINAL
+
+
+class JobLedger:
+    """Current state and transition history of every calculation of a campaign.
+
+    Use as a context manager (or call :meth:`close`) to close the database.
+    """
+
+    def __init__(self, conn: sqlite3.Connection | None) -> None:
+        """Wrap an open *conn* (``None`` → a disabled ledger that records nothing)."""
+        self._conn = conn
+
+    @classmethod
+    def open(cls, base_dir: Path) -> JobLedger:
+        """Open (creating if needed) the ledger of the campaign rooted at *base_dir*."""
+        try:
+            ledger_dir = Path(base_dir) / CACHE_DIR
+            ledger_dir.mkdir(exist_ok=True)
+            conn = sqlite3.connect(ledger_dir / _DB_NAME, timeout=5.0)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS calcs ("
+                " path TEXT PRIMARY KEY, status TEXT, detail TEXT, job_id TEXT, backend TEXT,"
+                " cores INTEGER, submitted REAL, started REAL, ended REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transitions ("
+                " path TEXT, status TEXT, detail TEXT, job_id TEXT, at REAL)"
+            )
+            conn.commit()
+        except (OSError, sqlite3.Error) as exc:
+            log.debug("Job ledger unavailable under %s: %s", base_dir, exc)
+            return cls(None)
+        return cls(conn)
+
+    def entries(self, input_paths: Iterable[Path] | None = None) -> dict[str, LedgerEntry]:
+        """What is recorded for each of *input_paths* (``None`` → every calculation).
+
+        Keyed by input path (as a string); paths with no record are left out.
+        """
+        if self._conn is None:
+            return {}
+        query = (
+            "SELECT path, status, detail, job_id, backend, cores, submitted, started, ended"
+            " FROM calcs"
+        )
+        try:
+            if input_paths is None:
+                rows = self._conn.execute(query).fetchall()
+            else:
+                paths = [str(p) for p in input_paths]
+                rows = []
+                for i in range(0, len(paths), _QUERY_BATCH):
+                    batch = paths[i : i + _QUERY_BATCH]
+                    marks = ", ".join("?" * len(batch))
+                    rows += self._conn.execute(f"{query} WHERE path IN ({marks})", batch)
+        except sqlite3.Error:
+            return {}
+        return {row[0]: LedgerEntry(*row[1:]) for row in rows}
+
+    def entry(self, input_path: Path) -> LedgerEntry | None:
+        """What is recorded for the calculation of *input_path* (``None`` if nothing)."""
+        return self.entries([input_path]).get(str(input_path))
+
+    def history(self, input_path: Path) -> list[tuple[str, str, str | None, float]]:
+        """Every ``(status, detail, job_id, time)`` recorded for *input_path*, oldest first."""
+        if self._conn is None:
+            return []
+        try:
+            return self._conn.execute(
+                "SELECT status, detail, job_id, at FROM transitions WHERE path = ? ORDER BY rowid",
+                (str(input_path),),
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+
+    def record_submission(self, input_path: Path, job_id: str, *, backend: str, cores: int) -> None:
+        """Record that job *job_id* was submitted for *input_path*."""
+        if self._conn is None:
+            return
+        now = time.time()
+        detail = f"Job {job_id} submitted ({backend}, {cores} cores)"
+        self._write(
+            self._conn,
+            "INSERT INTO calcs VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL)"
+            " ON CONFLICT (path) DO UPDATE SET status = excluded.status,"
+            " detail = excluded.detail, job_id = excluded.job_id, backend = excluded.backend,"
+            " cores = excluded.cores, submitted = excluded.submitted, started = NULL,"
+            " ended = NULL",
+            [(str(input_path), SUBMITTED, detail, job_id, backend, cores, now)],
+            [(str(input_path), SUBMITTED, detail, job_id, now)],
+        )
+
+    def record_statuses(self, observed: Iterable[tuple[Path, str, str]]) -> None:
+        """Record each observed ``(input_path, status, detail)``.
+
+        A transition is logged only when the status differs from the recorded
+        one. The first ``running`` after a submission sets its start time, the
+        first terminal status its end time.
+        """
+        if self._conn is None:
+            return
+        observed = list(observed)
+        known = self.entries(input_path for input_path, _, _ in observed)
+        now = time.time()
+        updates, transitions = [], []
+        for input_path, status, detail in observed:
+            path = str(input_path)
+            entry = known.get(path)
+            if entry is not None and (entry.status, entry.detail) == (status, detail):
+                continue
+            submitted = entry is not None and entry.submitted is not None
+            started = entry.started if entry is not None else None
+            ended = entry.ended if entry is not None else None
+            if submitted and started is None and status == "running":
+                started = now
+            if submitted and ended is None and status in TERMINAL:
+                ended = now
+            updates.append((path, status, detail, started, ended))
+            if entry is None or entry.status != status:
+                job_id = entry.job_id if entry is not None else None
+                transitions.append((path, status, detail, job_id, now))
+        self._write(
+            self._conn,
+            "INSERT INTO calcs (path, status, detail, started, ended) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (path) DO UPDATE SET status = excluded.status,"
+            " detail = excluded.detail, started = excluded.started, ended = excluded.ended",
+            updates,
+            transitions,
+        )
+
+    def close(self) -> None:
+        """Close the database (every change is committed as it is recorded)."""
+        if self._conn is None:
+            return
+        self._conn.close()
+        self._conn = None
+
+    def _write(
+        self,
+        conn: sqlite3.Connection,
+        calcs_sql: str,
+        calcs: Sequence[tuple[object, ...]],
+        transitions: Sequence[tuple[object, ...]],
+    ) -> None:
+        """Apply *calcs* rows with *calcs_sql* and append *transitions*, in one commit."""
+        try:
+            conn.executemany(calcs_sql, calcs)
+            conn.executemany("INSERT INTO transitions VALUES (?, ?, ?, ?, ?)", transitions)
+            conn.commit()
+        except sqlite3.Error as exc:
+            log.debug("Job ledger write failed: %s", exc)
+
+    def __enter__(self) -> JobLedger:
+        """Return the ledger itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the ledger."""
+        self.close()
@@ -0,0 +1,173 @@
+"""Directory listings shared by every per-calculation file check of a command.
+
+Checking a calculation touches several files next to its input — the ``.in``,
+the ``.out`` / ``.err`` (each possibly compressed) and the submission sentinels
+(``{stem}.in_<pid>.<n>`` left by SLURM, ``.{stem}.in.<pid>.qcin.<n>`` by Q-Chem).
+Asking the filesystem for each of these separately, and finding sentinels by
+``glob()`` (which lists the whole directory every time), costs metadata
+operations in proportion to the number of calculations times the size of their
+directories — slow on a parallel filesystem.
+
+A :class:`FileIndex` instead lists each directory once, with ``os.scandir``,
+the first time a file in it is asked about, and answers every later question
+about that directory from memory: whether a file exists, which (possibly
+compressed) file stands for an output, its :data:`~pya3eda.cache.Stamp`, and
+whether a calculation has a submission sentinel. File metadata is only fetched
+for the files actually stamped.
+
+An index is a snapshot: files created or removed after a directory was listed
+are not seen until the index is told (:meth:`FileIndex.add`,
+:meth:`FileIndex.invalidate`). Create one per command, or per poll of a
+long-running one.
+
+Where every metadata operation is a network round trip, :meth:`FileIndex.prefetch`
+lists a batch of directories (and stats the files about to be stamped) from a
+pool of threads, so their latencies overlap instead of adding up.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pya3eda.cache import Stamp
+from pya3eda.utils import COMPRESSED_SUFFIXES
+
+# What follows the input stem in a sentinel name — the globs
+# "{stem}.in_[0-9]*.[0-9]*" and ".{stem}.in.[0-9]*.qcin.[0-9]*".
+_SLURM_SENTINEL = re.compile(r"\.in_[0-9].*\.[0-9].*")
+_QCHEM_SENTINEL = re.compile(r"\.in\.[0-9].*\.qcin\.[0-9].*")
+
+
+class DirListing:
+    """The files of one directory, as listed by a single ``os.scandir``."""
+
+    def __init__(self, path: Path) -> None:
+        """List *path* (a missing or unreadable directory lists as empty)."""
+        self.path = path
+        self._entries: dict[str, os.DirEntry[str] | None] = {}
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file():
+                        self._entries[entry.name] = entry
+        except OSError:
+            pass
+        self._submitted: set[str] | None = None
+
+    def is_file(self, name: str) -> bool:
+        """Whether the directory holds a file called *name*."""
+        return name in self._entries
+
+    def find(self, name: str) -> str | None:
+        """*name* if it is a file, else its compressed sibling, else ``None``.
+
+        The directory-local counterpart of :func:`~pya3eda.utils.find_file`.
+        """
+        if name in self._entries:
+            return name
+        for suffix in COMPRESSED_SUFFIXES:
+            if name + suffix in self._entries:
+                return name + suffix
+        return None
+
+    def stamp(self, name: str) -> Stamp:
+        """The :data:`~pya3eda.cache.Stamp` of the file *name* stands for (``None`` if none).
+
+        Like :func:`~pya3eda.cache.file_stamp`, a compressed sibling stands in for a
+        missing file.
+        """
+        found = self.find(name)
+        if found is None:
+            return None
+        entry = self._entries[found]
+        try:
+            st = entry.stat() if entry is not None else (self.path / found).stat()
+        except OSError:  # removed since it was listed
+            return None
+        return st.st_size, st.st_mtime_ns, st.st_ino
+
+    def submitted(self, stem: str) -> bool:
+        """Whether a submission sentinel exists for the input ``{stem}.in``."""
+        if self._submitted is None:
+            self._submitted = {stem for name in self._entries for stem in _sentinel_stems(name)}
+        return stem in self._submitted
+
+    def add(self, name: str) -> None:
+        """Record the file *name* as written since the directory was listed."""
+        self._entries[name] = None
+        self._submitted = None
+
+
+class FileIndex:
+    """Lazily listed directories, one ``os.scandir`` each, shared by a command's checks."""
+
+    def __init__(self) -> None:
+        """Start with nothing listed."""
+        self._dirs: dict[Path, DirListing] = {}
+
+    def listing(self, directory: Path) -> DirListing:
+        """The listing of *directory*, scanning it on first use."""
+        listing = self._dirs.get(directory)
+        if listing is None:
+            listing = self._dirs[directory] = DirListing(directory)
+        return listing
+
+    def is_file(self, path: Path) -> bool:
+        """Whether *path* is a file (compressed siblings do not count)."""
+        return self.listing(path.parent).is_file(path.name)
+
+    def find_file(self, path: Path) -> Path | None:
+        """:func:`~pya3eda.utils.find_file`, answered from the listing of *path*'s directory."""
+        found = self.listing(path.parent).find(path.name)
+        return None if found is None else path.with_name(found)
+
+    def stamp(self, path: Path) -> Stamp:
+        """:func:`~pya3eda.cache.file_stamp`, with the file found from the listing."""
+        return self.listing(path.parent).stamp(path.name)
+
+    def submission_exists(self, input_path: Path) -> bool:
+        """Whether a SLURM or Q-Chem submission sentinel exists for *input_path*."""
+        return self.listing(input_path.parent).submitted(input_path.stem)
+
+    def prefetch(self, paths: Iterable[Path], *, threads: int = 1, stamps: bool = False) -> None:
+        """List the directories of *paths* not yet listed, up to *threads* at a time.
+
+        With *stamps*, each of *paths* is also stamped, which leaves its
+        metadata cached on the listing's directory entry.
+        """
+        paths = list(paths)
+        todo = [d for d in dict.fromkeys(p.parent for p in paths) if d not in self._dirs]
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+            for listing in pool.map(DirListing, todo):
+                self._dirs.setdefault(listing.path, listing)
+            if stamps:
+                list(pool.map(self.stamp, paths))
+
+    def add(self, path: Path) -> None:
+        """Record *path* as just written (e.g. an input built by this command)."""
+        self.listing(path.parent).add(path.name)
+
+    def invalidate(self, directory: Path | None = None) -> None:
+        """Forget the listing of *directory* (``None`` → every listing) to rescan it."""
+        if directory is None:
+            self._dirs.clear()
+        else:
+            self._dirs.pop(directory, None)
+
+
+def _sentinel_stems(name: str) -> list[str]:
+    """Every input stem the file *name* is a submission sentinel of."""
+    stems = []
+    hidden = name.startswith(".")
+    i = name.find(".in", 1)
+    while i >= 0:
+        if _SLURM_SENTINEL.fullmatch(name, i):
+            stems.append(name[:i])
+        if hidden and _QCHEM_SENTINEL.fullmatch(name, i):
+            stems.append(name[1:i])
+        i = name.find(".in", i + 1)
+    return stems
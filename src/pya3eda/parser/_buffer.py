@@ -0,0 +1,53 @@
+"""Decoded-or-raw output buffers shared by the parsers.
+
+The parsers accept either decoded ``str`` content or the raw bytes of an output —
+a ``bytes`` object or a read-only ``mmap`` of the file (see
+:func:`pya3eda.utils.map_file`). Raw buffers are scanned with the byte-pattern
+twin of each compiled ``str`` regex and only the matched groups are decoded, so
+parsing a large output never materialises a decoded copy of it.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import cache
+from mmap import mmap
+from typing import Any, TypeAlias
+
+Text: TypeAlias = str | bytes | mmap
+"""Output content: decoded text, or raw UTF-8 bytes (``bytes`` / ``mmap``)."""
+
+
+@cache
+def _bytes_twin(pattern: re.Pattern[str]) -> re.Pattern[bytes]:
+    """Compile the byte-pattern equivalent of an ASCII ``str`` *pattern*."""
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+
+
+def twin(pattern: re.Pattern[str], text: Text) -> re.Pattern[Any]:
+    """Return *pattern* itself for ``str`` *text*, else its cached byte twin."""
+    return pattern if isinstance(text, str) else _bytes_twin(pattern)
+
+
+def find(text: Text, needle: str, start: int = 0) -> int:
+    """Offset of the first ASCII *needle* in *text* at or after *start*, ``-1`` if absent."""
+    if isinstance(text, str):
+        return text.find(needle, start)
+    return text.find(needle.encode("ascii"), start)
+
+
+def contains(text: Text, needle: str) -> bool:
+    """Whether the ASCII *needle* occurs in *text* (without decoding it)."""
+    return find(text, needle) >= 0
+
+
+def rfind(text: Text, needle: str) -> int:
+    """Offset of the last ASCII *needle* in *text*, ``-1`` if absent."""
+    if isinstance(text, str):
+        return text.rfind(needle)
+    return text.rfind(needle.encode("ascii"))
+
+
+def to_str(value: str | bytes) -> str:
+    """Decode a matched group (a no-op for ``str``)."""
+    return value if isinstance(value, str) else value.decode("utf-8", "replace")
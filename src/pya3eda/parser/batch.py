@@ -0,0 +1,126 @@
+"""Parsing many outputs across worker processes.
+
+Status checks and extraction parse one output after another, and on a large
+campaign that work — reading pages and running the scanners over them — is
+CPU-bound Python that a single core serialises. :func:`run_many` spreads any
+per-item parse across a :class:`~concurrent.futures.ProcessPoolExecutor`, in
+chunks, and returns the results in input order; :func:`parse_many` is the OPT
+scanner (:func:`~pya3eda.parser.tail.scan_opt_file`) fanned out that way.
+Workers open and parse the files themselves and send back only the compact
+parsed values (summaries, statuses, geometries), never the output text.
+
+On a high-latency filesystem the time goes to ``open()`` and metadata round
+trips rather than parsing; there ``threads`` overlaps the waits of many outputs
+in a :class:`~concurrent.futures.ThreadPoolExecutor` instead (used when
+``jobs`` is 1). With ``jobs=1`` and ``threads=1`` (the defaults), or a single
+item, everything runs serially in-process.
+
+:func:`iter_many` is the unordered variant: it yields each chunk's results as
+soon as the chunk completes, so a caller can act on early results (e.g. extract
+an SP once its OPT is done) while the pool works through the rest.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import TypeVar
+
+from pya3eda.parser.qchem import OPT_FIELDS, OptOutputSummary, _check_fields
+from pya3eda.parser.tail import scan_opt_file
+
+A = TypeVar("A")
+R = TypeVar("R")
+
+# Chunks per worker: enough to balance uneven output sizes, few enough that the
+# per-chunk pickling round trip stays negligible.
+_CHUNKS_PER_WORKER = 4
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Number of worker processes for *jobs* (``0`` → one per CPU)."""
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def run_many(
+    func: Callable[[A], R],
+    items: Sequence[A],
+    *,
+    jobs: int = 1,
+    threads: int = 1,
+    chunksize: int | None = None,
+) -> list[R]:
+    """Return ``[func(item) for item in items]``, computed across *jobs* processes.
+
+    *func* and the items must be picklable (a module-level function, or a
+    :func:`functools.partial` of one). ``jobs=0`` uses one process per CPU.
+    *chunksize* defaults to a few chunks per worker. In-process (``jobs=1``),
+    up to *threads* items are worked on at once.
+    """
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1:
+        threads = min(threads, len(items))
+        if threads <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            return list(pool.map(func, items))
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * _CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items, chunksize=chunksize))
+
+
+def iter_many(
+    func: Callable[[A], R],
+    items: Sequence[A],
+    *,
+    jobs: int = 1,
+    chunksize: int | None = None,
+) -> Iterator[tuple[int, R]]:
+    """Yield ``(i, func(items[i]))`` for each item as its chunk completes, across *jobs* processes.
+
+    Chunks are submitted in input order, so earlier items tend to finish first,
+    but results arrive in completion order. *func*, the items and *chunksize* are
+    as for :func:`run_many`. In-process (``jobs=1`` or a single item) every item
+    is computed first, then yielded in input order.
+    """
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1:
+        yield from enumerate(_run_chunk(func, items))
+        return
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * _CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        starts = {
+            pool.submit(_run_chunk, func, items[start : start + chunksize]): start
+            for start in range(0, len(items), chunksize)
+        }
+        for future in as_completed(starts):
+            for offset, result in enumerate(future.result()):
+                yield starts[future] + offset, result
+
+
+def _run_chunk(func: Callable[[A], R], chunk: Sequence[A]) -> list[R]:
+    """``[func(item) for item in chunk]`` (one task of :func:`iter_many`)."""
+    return [func(item) for item in chunk]
+
+
+def parse_many(
+    paths: Iterable[Path],
+    fields: Iterable[str] = OPT_FIELDS,
+    *,
+    jobs: int = 1,
+    threads: int = 1,
+    chunksize: int | None = None,
+) -> list[OptOutputSummary | None]:
+    """Scan the OPT-output *fields* of every file in *paths*, in order, across *jobs* processes.
+
+    Each result equals ``scan_opt_file(path, fields)``: ``None`` for a missing or
+    empty file. Raises ``ValueError`` for an unknown field before any work starts.
+    *threads* is as for :func:`run_many`.
+    """
+    scan = partial(scan_opt_file, fields=_check_fields(fields))
+    return run_many(scan, list(paths), jobs=jobs, threads=threads, chunksize=chunksize)
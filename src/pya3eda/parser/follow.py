@@ -0,0 +1,117 @@
+"""Incremental following of growing Q-Chem outputs.
+
+Polling a running job with :func:`~pya3eda.parser.qchem.parse_status` re-reads its
+whole ``.out`` every time, so watching hundreds of live optimisations costs the
+sum of their sizes per poll. :class:`OutputFollower` remembers, per output, the
+byte offset it has read up to and the progress parsed so far; each
+:meth:`~OutputFollower.poll` reads and parses only the bytes appended since the
+previous one. Only complete lines are parsed — a line still being written is
+kept back until its newline arrives — so no marker is ever split across two
+reads. An output that shrinks or is replaced (a resubmitted job rewriting it) is
+detected from its size / inode and followed again from the start.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+from pya3eda.parser._buffer import contains, twin
+from pya3eda.parser.qchem import _FAILURE_TAGS, _FATAL, _KILLED, _THANK_YOU, _last_match
+
+_OPT_CYCLE = re.compile(r"Optimization Cycle:\s+(\d+)")
+# Shared with the trajectory reader: the energy and maximum gradient of each step.
+ENERGY_RE = re.compile(
+    r"(?:Total energy(?: in the final basis set)? =|Final energy is)\s+([-+]?\d+\.\d+)"
+)
+# Geometry-optimiser convergence table: "Gradient  <maximum>  <tolerance>  YES|NO".
+MAX_GRADIENT_RE = re.compile(
+    r"^\s*Gradient\s+([-+]?\d+\.\d+)\s+\d+\.\d+\s+(?:YES|NO)", re.MULTILINE
+)
+# SCF iteration row: "<cycle>  <energy>  <DIIS error>  ..."; the last row's cycle
+# number is the length of the current (or last) SCF.
+_SCF_CYCLE = re.compile(r"^\s*(\d+)\s+[-+]?\d+\.\d+\s+\d\.\d+e[-+]\d+", re.MULTILINE)
+
+
+class LiveProgress(NamedTuple):
+    """Progress of a (possibly still running) calculation, as read so far."""
+
+    opt_step: int | None = None  # last "Optimization Cycle"
+    energy_ha: float | None = None  # last SCF / final energy
+    max_gradient: float | None = None  # last optimiser maximum gradient
+    scf_cycles: int | None = None  # iterations of the current (or last) SCF
+    done: bool = False  # a completion or failure marker has been written
+
+
+@dataclass
+class _FollowState:
+    """What has been read of one output, and the progress parsed from it."""
+
+    inode: int
+    offset: int = 0
+    partial: bytes = b""  # trailing bytes of an unfinished line
+    progress: LiveProgress = field(default_factory=LiveProgress)
+
+
+class OutputFollower:
+    """Parse growing outputs incrementally, one read of the appended bytes per poll."""
+
+    def __init__(self) -> None:
+        """Start with no outputs followed."""
+        self._files: dict[Path, _FollowState] = {}
+
+    def poll(self, path: Path) -> LiveProgress:
+        """Read what was appended to *path* since the last poll; return its progress.
+
+        A missing output reports an empty :class:`LiveProgress` (and is forgotten).
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            self.forget(path)
+            return LiveProgress()
+        state = self._files.get(path)
+        if state is None or state.inode != st.st_ino or st.st_size < state.offset:
+            state = self._files[path] = _FollowState(st.st_ino)
+        if st.st_size > state.offset:
+            with path.open("rb") as fh:
+                fh.seek(state.offset)
+                appended = fh.read(st.st_size - state.offset)
+            state.offset += len(appended)
+            data = state.partial + appended
+            cut = data.rfind(b"\n") + 1
+            state.partial = data[cut:]
+            if cut:
+                state.progress = _advance(state.progress, data[:cut])
+        return state.progress
+
+    def forget(self, path: Path) -> None:
+        """Stop following *path* (e.g. once its job has finished)."""
+        self._files.pop(path, None)
+
+
+def _advance(progress: LiveProgress, lines: bytes) -> LiveProgress:
+    """Update *progress* with the complete *lines* newly appended to an output."""
+    step = _last_match(_OPT_CYCLE, lines)
+    energy = _last_match(ENERGY_RE, lines)
+    gradient = _last_match(MAX_GRADIENT_RE, lines)
+    scf = _last_match(_SCF_CYCLE, lines)
+    return LiveProgress(
+        opt_step=int(step.group(1)) if step else progress.opt_step,
+        energy_ha=float(energy.group(1)) if energy else progress.energy_ha,
+        max_gradient=float(gradient.group(1)) if gradient else progress.max_gradient,
+        scf_cycles=int(scf.group(1)) if scf else progress.scf_cycles,
+        done=progress.done or _finished(lines),
+    )
+
+
+def _finished(lines: bytes) -> bool:
+    """Whether *lines* contain a completion or failure marker (see ``parse_status``)."""
+    return (
+        contains(lines, _THANK_YOU)
+        or contains(lines, _FATAL)
+        or any(contains(lines, tag) for tag, _ in _FAILURE_TAGS)
+        or twin(_KILLED, lines).search(lines) is not None
+    )
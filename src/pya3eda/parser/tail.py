@@ -0,0 +1,289 @@
+"""Tail-first reading of Q-Chem OPT outputs.
+
+Almost every OPT field is last-match-wins — the final energy, the last thermo
+block, the last ``Standard Nuclear Orientation`` — so the answer sits in the last
+few kilobytes of an output that may run to hundreds of megabytes.
+:func:`scan_opt_file` searches windows from the end of the file, growing them
+geometrically, and runs the single-pass scanner of :mod:`pya3eda.parser.qchem`
+over each until every requested marker has been found. The one first-match-wins
+marker (the echoed ``$molecule`` input) is searched the same way from the start.
+The file is memory-mapped and scanned as bytes, so only the pages of the windows
+actually searched are ever read, and nothing but the matched values is decoded.
+A marker missing from the output (or present only as a fallback, e.g. no
+``Final energy is`` line) simply grows the window to the whole file, so results
+always equal :func:`~pya3eda.parser.qchem.scan_opt_output` over the full text —
+only the cost changes: it tracks the size of the final frequency section rather
+than the number of optimisation cycles.
+
+:func:`parse_status_windows` classifies a job the same way from a bounded head and
+tail of its output: completion and failure markers are printed in the last few
+kilobytes, ``Running on`` in the first. Only an output neither window can
+classify is scanned in full.
+
+Both also read compressed outputs (``job.out.gz`` / ``.zst`` / ``.xz`` next to the
+expected path, see :func:`~pya3eda.utils.find_file`). A compressed stream cannot
+be entered from the end, so each window is found by streaming the decompressed
+output once and keeping only its head and tail (:func:`~pya3eda.utils.read_ends`):
+memory stays bounded by the window, and the output is never decompressed whole
+unless a marker is missing from every window. :func:`read_head` finds a
+first-wins block the same way.
+
+Parsers that need a few last- or first-wins values wherever they are (SP and
+EDA energies, which may sit well before the end) instead stream the output once
+through :func:`distill_file`, which keeps only the text of those matches.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+from pya3eda.parser._buffer import Text, find, rfind, twin
+from pya3eda.parser.qchem import (
+    _FIELDS,
+    _MARKERS,
+    OPT_FIELDS,
+    OptOutputSummary,
+    _check_fields,
+    _field_markers,
+    _Hits,
+    _scan,
+    _summarize,
+    parse_status,
+)
+from pya3eda.utils import find_file, is_compressed, map_file, open_compressed, read_ends
+
+FIRST_WINDOW = 1 << 16
+"""Size in bytes of the first window searched from either end of an output."""
+
+STATUS_WINDOW = 1 << 14
+"""Size of the head and of the tail read by :func:`parse_status_windows`."""
+
+DISTILL_BLOCK = 1 << 20
+"""Bytes of output :func:`distill_file` reads (and scans) at a time."""
+
+DISTILL_OVERLAP = 1 << 12
+"""Bytes of each block :func:`distill_file` scans again with the next one."""
+
+_GROWTH = 4
+
+
+def scan_opt_file(
+    path: Path,
+    fields: Iterable[str] = OPT_FIELDS,
+    *,
+    window: int = FIRST_WINDOW,
+) -> OptOutputSummary | None:
+    """Extract the requested OPT-output *fields* from the file at *path*, tail first.
+
+    Same result as ``scan_opt_output(path.read_text(), fields)``; ``None`` when the
+    file is missing or empty. *window* is the size of the first search from each end.
+    """
+    wanted = _check_fields(fields)
+    source = find_file(path)
+    if source is not None and is_compressed(source):
+        return _scan_opt_stream(source, wanted, window)
+    with map_file(path) as buf:
+        if not buf:
+            return None
+        # Decode while the map is still open: the hits point into it.
+        return scan_opt_tail(buf, wanted, window=window)
+
+
+def scan_opt_tail(
+    text: Text,
+    fields: Iterable[str] = OPT_FIELDS,
+    *,
+    window: int = FIRST_WINDOW,
+) -> OptOutputSummary:
+    """Extract the requested OPT-output *fields* from *text* (e.g. a mapped file), tail first.
+
+    Same result as ``scan_opt_output(text, fields)``; see :func:`scan_opt_file`.
+    """
+    wanted = _check_fields(fields)
+    head, tail, required = _marker_plan(wanted)
+    hits = _tail_hits(text, tail, required, window)
+    hits.update(_head_hits(text, head, window))
+    return _summarize(hits, wanted)
+
+
+def _scan_opt_stream(path: Path, wanted: tuple[str, ...], window: int) -> OptOutputSummary | None:
+    """:func:`scan_opt_tail` over a compressed output, streaming it once per window size.
+
+    Each fourfold growth streams (decompresses) the output again from the start, since
+    only the ends of the previous pass were kept; outputs whose markers sit in the
+    first window — the common case — are streamed once.
+    """
+    head_markers, tail_markers, required = _marker_plan(wanted)
+    while True:
+        head, tail, size = read_ends(path, window)
+        if len(head) == size:  # the whole output fits in one window
+            return scan_opt_tail(head, wanted, window=window) if size else None
+        hits = _scan(tail, tail_markers) if tail_markers else {}
+        first = _scan(head, head_markers) if head_markers else {}
+        if required <= hits.keys() and head_markers <= first.keys():
+            hits.update(first)
+            return _summarize(hits, wanted)
+        window *= _GROWTH
+
+
+def _marker_plan(wanted: tuple[str, ...]) -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    """Split the markers of *wanted* into ``(head, tail, required tail)`` markers."""
+    markers = _field_markers(wanted)
+    head = frozenset(m for m in markers if _MARKERS[m].first)
+    fallbacks = {m for f in wanted for m in _FIELDS[f].fallbacks}
+    return head, markers - head, markers - head - fallbacks
+
+
+def _tail_hits(buf: Text, markers: frozenset[str], required: frozenset[str], window: int) -> _Hits:
+    """Search growing windows ending at EOF until every *required* marker is hit."""
+    if not markers:
+        return {}
+    while True:
+        start = max(len(buf) - window, 0)
+        hits = _scan(buf, markers, start)
+        if start == 0 or required <= hits.keys():
+            return hits
+        window *= _GROWTH
+
+
+def _head_hits(buf: Text, markers: frozenset[str], window: int) -> _Hits:
+    """Search growing windows starting at byte 0 until every (first-wins) marker is hit."""
+    if not markers:
+        return {}
+    while True:
+        hits = _scan(buf, markers, 0, window)
+        if window >= len(buf) or markers <= hits.keys():
+            return hits
+        window *= _GROWTH
+
+
+def read_head(path: Path, pattern: re.Pattern[str], *, window: int = FIRST_WINDOW) -> bytes:
+    """The first bytes of the output at *path*, enough for *pattern* to match.
+
+    Heads of fourfold growing windows are read (streaming a compressed output once per
+    window, see :func:`~pya3eda.utils.read_ends`) until *pattern* matches in one;
+    the whole content when it never does. For a first-wins block such as the
+    echoed ``$molecule`` input, a parser then finds in the head what it would in
+    the full output.
+    """
+    while True:
+        head, _, size = read_ends(path, window)
+        if len(head) == size or twin(pattern, head).search(head):
+            return head
+        window *= _GROWTH
+
+
+def distill_file(
+    path: Path,
+    last: Iterable[re.Pattern[str]],
+    first: Iterable[re.Pattern[str]] = (),
+    *,
+    block: int = DISTILL_BLOCK,
+    overlap: int = DISTILL_OVERLAP,
+) -> tuple[bytes, int]:
+    """Stream the output at *path* once, keeping only the matches parsers need.
+
+    Returns the text of the last match of every *last* pattern and of the first
+    match of every *first* pattern, in file order and one per line, plus the size
+    of the (decompressed) output. A parser reading only those patterns finds the
+    same values in the distilled text as in the full output, which is never held
+    in memory: blocks of whole lines are scanned, each together with the last
+    *overlap* bytes (whole lines) of the one before, so any match shorter than
+    *overlap* is seen whole.
+    """
+    last_patterns = [twin(p, b"") for p in last]
+    first_patterns = [twin(p, b"") for p in first]
+    kept: dict[tuple[bool, int], tuple[int, bytes]] = {}
+    size = 0
+    carry = pending = b""
+    with open_compressed(path) if is_compressed(path) else path.open("rb") as fh:
+        while True:
+            chunk = fh.read(block)
+            data = pending + chunk
+            cut = data.rfind(b"\n") + 1 if chunk else len(data)
+            if not cut and chunk:  # no line ends yet
+                pending = data
+                continue
+            text = carry + data[:cut]
+            pending = data[cut:]
+            base = size - len(carry)
+            for i, pattern in enumerate(last_patterns):
+                found = deque(pattern.finditer(text), maxlen=1)
+                if found:
+                    kept[True, i] = (base + found[0].start(), found[0].group())
+            for i, pattern in enumerate(first_patterns):
+                if (False, i) not in kept and (m := pattern.search(text)):
+                    kept[False, i] = (base + m.start(), m.group())
+            size += cut
+            if not chunk:
+                break
+            carry = text[text.rfind(b"\n", 0, max(len(text) - overlap, 0)) + 1 :]
+    return b"\n".join(match for _, match in sorted(kept.values())), size
+
+
+def parse_status_windows(
+    out_text: Text,
+    err_text: Text = "",
+    submission_exists: bool = False,
+    *,
+    window: int = STATUS_WINDOW,
+    detail: bool = True,
+) -> tuple[str, str]:
+    """Classify a job from the first and last *window* characters of its output.
+
+    Same contract as :func:`~pya3eda.parser.qchem.parse_status`, which is applied
+    to the head and tail joined; an output it cannot classify from them
+    (``empty`` or an unknown failure) is scanned in full.
+    """
+    if len(out_text) > 2 * window:
+        head_tail = _head_and_tail(out_text, window)
+        result = parse_status(head_tail, err_text, submission_exists, detail=detail)
+        if not _unclassified(result):
+            return result
+    return parse_status(out_text, err_text, submission_exists, detail=detail)
+
+
+def parse_status_file(
+    path: Path,
+    err_text: Text = "",
+    submission_exists: bool = False,
+    *,
+    window: int = STATUS_WINDOW,
+    detail: bool = True,
+) -> tuple[str, str]:
+    """:func:`parse_status_windows` of the output at *path*, which may be compressed.
+
+    A missing output is classified as empty text (``nofile`` unless the ``.err``
+    or sentinel says otherwise).
+    """
+    source = find_file(path)
+    if source is not None and is_compressed(source):
+        head, tail, size = read_ends(source, window)
+        if size > 2 * window:
+            head_tail = _join_lines(head, tail)
+            result = parse_status(head_tail, err_text, submission_exists, detail=detail)
+            if not _unclassified(result):
+                return result
+    with map_file(path) as out:
+        return parse_status_windows(
+            out or "", err_text, submission_exists, window=window, detail=detail
+        )
+
+
+def _head_and_tail(text: Text, window: int) -> Text:
+    """The first and last *window* characters of *text*, trimmed to whole lines and joined."""
+    return _join_lines(text[:window], text[-window:])
+
+
+def _join_lines(head: Text, tail: Text) -> Text:
+    """*head* cut after its last newline, joined to *tail* cut after its first."""
+    # Both halves are str for str text, bytes for bytes / mmap.
+    return head[: rfind(head, "\n") + 1] + tail[find(tail, "\n") + 1 :]  # type: ignore[operator]
+
+
+def _unclassified(result: tuple[str, str]) -> bool:
+    """Whether a windowed ``parse_status`` *result* may depend on the unread middle."""
+    return result[0] == "empty" or result == ("CRASH", "Unknown failure")
@@ -0,0 +1,142 @@
+"""Optimisation trajectories as NumPy arrays.
+
+:func:`~pya3eda.parser.xyz.parse_output_xyz` keeps only the last ``Standard
+Nuclear Orientation`` block of an output, as formatted strings. This module reads
+*every* block in one forward pass — each geometry step of an optimisation, with
+the energy and maximum gradient printed for it — straight into floats, with no
+per-line string formatting. :func:`iter_steps` streams the steps one by one;
+:func:`parse_trajectory` stacks them into a :class:`Trajectory` of
+``(n_steps, n_atoms, 3)`` coordinates plus the per-step energies and gradients,
+for checking convergence, writing multi-frame XYZ files
+(:func:`format_xyz_trajectory`) or restarting from any step
+(:meth:`Trajectory.frame`).
+
+A Q-Chem optimisation prints each geometry's orientation block, then its SCF,
+then the optimiser's convergence table: the energy and gradient of a step are
+therefore the last ones printed between its block and the next. A frequency job
+appended to the optimisation reprints the final geometry as one more step.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from pya3eda.parser._buffer import Text, find, twin
+from pya3eda.parser.follow import ENERGY_RE, MAX_GRADIENT_RE
+from pya3eda.parser.xyz import (
+    ORIENTATION_TAG,
+    XYZData,
+    format_coord_line,
+    read_orientation_table,
+)
+from pya3eda.utils import map_file
+
+
+class GeometryStep(NamedTuple):
+    """One orientation block of an output and what was printed for it."""
+
+    elements: list[str]
+    coords: np.ndarray  # (n_atoms, 3), Å
+    energy_ha: float | None  # last SCF / optimiser energy before the next block
+    max_gradient: float | None  # last optimiser maximum gradient before the next block
+
+
+class Trajectory(NamedTuple):
+    """Every geometry step of an output, stacked."""
+
+    elements: np.ndarray  # (n_atoms,) element symbols
+    coords: np.ndarray  # (n_steps, n_atoms, 3), Å
+    energies: np.ndarray  # (n_steps,), Ha; NaN where none was printed
+    max_gradients: np.ndarray  # (n_steps,); NaN where none was printed
+
+    def frame(self, step: int, *, charge: int = 0, multiplicity: int = 1) -> XYZData:
+        """Geometry *step* (negative counts from the end) as an :class:`XYZData`."""
+        atoms = [
+            format_coord_line(str(element), *map(float, xyz))
+            for element, xyz in zip(self.elements, self.coords[step], strict=True)
+        ]
+        return XYZData(n_atoms=len(atoms), charge=charge, multiplicity=multiplicity, atoms=atoms)
+
+
+def iter_steps(text: Text) -> Iterator[GeometryStep]:
+    """Yield the geometry steps of an output in order, in a single forward pass.
+
+    *text* may be decoded text or the raw bytes (or an ``mmap``) of the output;
+    only the coordinate rows and the matched numbers are decoded.
+    """
+    energy_re, gradient_re = twin(ENERGY_RE, text), twin(MAX_GRADIENT_RE, text)
+    start = find(text, ORIENTATION_TAG)
+    while start >= 0:
+        elements, flat, table_end = read_orientation_table(text, start)
+        following = find(text, ORIENTATION_TAG, table_end)
+        segment_end = len(text) if following < 0 else following
+        energy = deque(energy_re.finditer(text, table_end, segment_end), maxlen=1)
+        gradient = deque(gradient_re.finditer(text, table_end, segment_end), maxlen=1)
+        if elements:
+            yield GeometryStep(
+                elements=elements,
+                coords=np.array(flat).reshape(-1, 3),
+                energy_ha=float(energy[0].group(1)) if energy else None,
+                max_gradient=float(gradient[0].group(1)) if gradient else None,
+            )
+        start = following
+
+
+def parse_trajectory(text: Text) -> Trajectory | None:
+    """Stack every geometry step of an output into a :class:`Trajectory`.
+
+    Returns ``None`` when the output holds no orientation block. The trajectory
+    ends at the first step whose atoms differ from the first step's — in practice
+    a block cut short by a job killed while printing it.
+    """
+    steps = iter_steps(text)
+    first = next(steps, None)
+    if first is None:
+        return None
+    kept = [first]
+    for step in steps:
+        if step.elements != first.elements:
+            break
+        kept.append(step)
+    return Trajectory(
+        elements=np.array(first.elements),
+        coords=np.stack([step.coords for step in kept]),
+        energies=np.array([np.nan if s.energy_ha is None else s.energy_ha for s in kept]),
+        max_gradients=np.array(
+            [np.nan if s.max_gradient is None else s.max_gradient for s in kept]
+        ),
+    )
+
+
+def read_trajectory(path: Path) -> Trajectory | None:
+    """:func:`parse_trajectory` of the output at *path*; ``None`` if missing or empty."""
+    with map_file(path) as text:
+        return parse_trajectory(text) if text else None
+
+
+def format_xyz_trajectory(trajectory: Trajectory) -> str:
+    """Format *trajectory* as a multi-frame XYZ file, one frame per step.
+
+    Each frame's comment line carries the step number and, where known, its
+    energy (Ha) and maximum gradient.
+    """
+    n_atoms = len(trajectory.elements)
+    frames: list[str] = []
+    for step, coords in enumerate(trajectory.coords, start=1):
+        comment = f"step {step}"
+        energy, gradient = trajectory.energies[step - 1], trajectory.max_gradients[step - 1]
+        if not np.isnan(energy):
+            comment += f"  E = {energy:.10f}"
+        if not np.isnan(gradient):
+            comment += f"  max gradient = {gradient:.6f}"
+        frames.append(f"{n_atoms}\n{comment}")
+        frames.extend(
+            format_coord_line(str(element), *map(float, xyz))
+            for element, xyz in zip(trajectory.elements, coords, strict=True)
+        )
+    return "\n".join(frames) + "\n"
@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 from typing import NamedTuple
 
+from pya3eda.parser._buffer import Text, find, rfind, to_str, twin
+
 # ---------------------------------------------------------------------------
 # Data types
 # ---------------------------------------------------------------------------
@@ -100,12 +102,14 @@ _COORD_RE = re.compile(
     re.MULTILINE,
 )
 
+ORIENTATION_TAG = "Standard Nuclear Orientation"
+
 _MOLECULE_RE = re.compile(
     r"\$molecule\s*\n\s*([+-]?\d+)\s+(\d+)",
     re.MULTILINE,
 )
 
-_MOLECULE_BLOCK_RE = re.compile(r"\$molecule\s*\n(.*?)\$end", re.DOTALL | re.IGNORECASE)
+MOLECULE_BLOCK_RE = re.compile(r"\$molecule\s*\n(.*?)\$end", re.DOTALL | re.IGNORECASE)
 
 _CHARGE_MULT_RE = re.compile(r"^\s*([+-]?\d+)\s+(\d+)\s*$")
 
@@ -115,7 +119,7 @@ _XYZ_ATOM_RE = re.compile(
 )
 
 
-def parse_output_fragments(text: str) -> MoleculeLayout | None:
+def parse_output_fragments(text: Text) -> MoleculeLayout | None:
     """Read the fragment layout from the ``$molecule`` block echoed in a Q-Chem output.
 
     Returns the total charge/multiplicity plus one :class:`Fragment` per ``---``-separated
@@ -130,15 +134,16 @@ def parse_output_fragments(text: str) -> MoleculeLayout | None:
 
     Anchored to the *first* block on purpose: an optimisation echoes its input near the top,
     then may print a trailing ``Z-matrix Print:`` ``$molecule`` in internal coordinates that
-    carries no fragment structure at all.
+    carries no fragment structure at all. *text* may also be the raw bytes (or an
+    ``mmap``) of the output; only the block itself is decoded.
     """
-    m = _MOLECULE_BLOCK_RE.search(text)
+    m = twin(MOLECULE_BLOCK_RE, text).search(text)
     if m is None:
         return None
 
     # Split the block on its "---" fragment separators.
     segments: list[list[str]] = [[]]
-    for line in m.group(1).splitlines():
+    for line in to_str(m.group(1)).splitlines():
         if line.strip() == "---":
             segments.append([])
         else:
@@ -177,41 +182,73 @@ def parse_output_fragments(text: str) -> MoleculeLayout | None:
     )
 
 
-def parse_output_xyz(text: str) -> XYZData | None:
+def parse_output_xyz(text: Text) -> XYZData | None:
     """Extract the last optimised geometry from a Q-Chem output.
 
     Looks for the final "Standard Nuclear Orientation" block and reads the
     coordinate table.  Charge/multiplicity are extracted from the ``$molecule``
-    section.
+    section. *text* may also be the raw bytes (or an ``mmap``) of the output.
     """
     # Charge / multiplicity
-    mol_match = _MOLECULE_RE.search(text)
+    mol_match = twin(_MOLECULE_RE, text).search(text)
     charge = int(mol_match.group(1)) if mol_match else 0
     mult = int(mol_match.group(2)) if mol_match else 1
 
-    # Last orientation block
-    tag = "Standard Nuclear Orientation"
-    positions = [m.start() for m in re.finditer(re.escape(tag), text)]
-    if not positions:
+    # Last orientation block — found from the end, without copying the tail.
+    start = rfind(text, ORIENTATION_TAG)
+    if start < 0:
         return None
-    block = text[positions[-1] :]
+    return parse_orientation_block(text, start, charge=charge, multiplicity=mult)
+
+
+def parse_orientation_block(
+    text: Text,
+    start: int,
+    *,
+    charge: int = 0,
+    multiplicity: int = 1,
+) -> XYZData | None:
+    """Read the coordinate table of the orientation block beginning at offset *start*.
+
+    Walks *text* line by line from *start* in place (no slice of the remainder is
+    taken), so a geometry near the end of a multi-hundred-MB output costs only the
+    lines of its own table. Shared by :func:`parse_output_xyz` and the single-pass
+    :func:`~pya3eda.parser.qchem.scan_opt_output`.
+    """
+    elements, coords, _ = read_orientation_table(text, start)
+    if not elements:
+        return None
+    atoms = [
+        format_coord_line(element, x, y, z)
+        for element, x, y, z in zip(elements, coords[0::3], coords[1::3], coords[2::3], strict=True)
+    ]
+    return XYZData(n_atoms=len(atoms), charge=charge, multiplicity=multiplicity, atoms=atoms)
+
 
-    atoms: list[str] = []
-    for line in block.splitlines():
-        m = _COORD_RE.match(line)
+def read_orientation_table(text: Text, start: int) -> tuple[list[str], list[float], int]:
+    """Decode the coordinate table of the orientation block at offset *start*, unformatted.
+
+    Returns the element symbols, the coordinates flattened to ``[x0, y0, z0, x1, …]``
+    (Å), and the offset just past the table. Both lists are empty when no table
+    follows *start*.
+    """
+    coord_re = twin(_COORD_RE, text)
+    elements: list[str] = []
+    coords: list[float] = []
+    pos, end_of_text = start, len(text)
+    while pos < end_of_text:
+        eol = find(text, "\n", pos)
+        if eol < 0:
+            eol = end_of_text
+        m = coord_re.match(text, pos, eol)
         if m:
-            atoms.append(
-                format_coord_line(
-                    m.group(1), float(m.group(2)), float(m.group(3)), float(m.group(4))
-                )
-            )
-        elif atoms:
+            elements.append(to_str(m.group(1)))
+            coords += (float(m.group(2)), float(m.group(3)), float(m.group(4)))
+        elif elements:
             # The coordinate rows form one contiguous table; the first
             # non-matching line after it (the trailing separator) ends the
             # geometry. Stop here so a later coordinate-shaped table (normal
             # modes, a second orientation, …) cannot inflate the atom count.
             break
-
-    if not atoms:
-        return None
-    return XYZData(n_atoms=len(atoms), charge=charge, multiplicity=mult, atoms=atoms)
+        pos = eol + 1
+    return elements, coords, pos
@@ -18,17 +18,22 @@ import logging
 import os
 import time
 from collections import deque
+from collections.abc import Mapping
 from pathlib import Path
 
 from pya3eda.builder.inputs import build_all, build_calc
-from pya3eda.extractor.data import extract_one
+from pya3eda.cache import OutputCache
+from pya3eda.extractor.data import OptThermo, extract_one
 from pya3eda.ids import CalcID, CalcSpec, ExtractedData
+from pya3eda.ledger import JobLedger
+from pya3eda.listing import FileIndex
+from pya3eda.parser.follow import LiveProgress, OutputFollower
 from pya3eda.registry import CalcRegistry
 from pya3eda.runner.backend import ExecutionBackend, get_backend
 from pya3eda.runner.clusters import ClusterConfig, detect_cluster
 from pya3eda.runner.executor import RunOptions, cores_for, prepare_job, submit_job
 from pya3eda.runner.throttle import Throttler
-from pya3eda.status.checker import Status, get_status, should_process
+from pya3eda.status.checker import Status, StatusSnapshot, should_process
 from pya3eda.vocab import Mode
 
 log = logging.getLogger(__name__)
@@ -65,31 +70,37 @@ class _Pipeline:
         self.opt_criteria = opt_criteria
         self.extract_criteria = extract_criteria
 
-        self.sp_by_opt: dict[CalcID, list[CalcSpec]] = {}
         self.ready: deque[CalcSpec] = deque()
         self.inflight: dict[str, CalcSpec] = {}
         self.extracted: dict[CalcID, ExtractedData] = {}
-        self.opt_cache: dict[CalcID, str] = {}
+        self.opt_cache: dict[CalcID, OptThermo] = {}
+        self.cache: OutputCache | None = None
+        self.ledger: JobLedger | None = None
+        self.follower = OutputFollower()
+        self.progress: dict[CalcID, LiveProgress] = {}
+        # Directory listings; a directory is rescanned once a job in it finishes.
+        self.files = FileIndex()
+        # Each calc's status is classified once; a finished job's is dropped.
+        self.statuses = StatusSnapshot(files=self.files)
 
     def run(self) -> dict[CalcID, ExtractedData]:
         """Build OPT inputs, drive the scheduler to completion, return extracted data."""
         build_all(self.registry, self.template_dir, overwrite=self.overwrite, sp_strategy="never")
-        for spec in self.registry.all_calcs:
-            if spec.id.mode == Mode.SP:
-                self.sp_by_opt.setdefault(spec.id.to_opt(), []).append(spec)
-        self._seed()
-        self._loop()
+        with OutputCache.open(self.base_dir) as cache, JobLedger.open(self.base_dir) as ledger:
+            self.cache = cache
+            self.ledger = ledger
+            self.statuses = StatusSnapshot(cache, files=self.files, ledger=ledger)
+            self._seed()
+            self._loop()
         return self.extracted
 
     def _seed(self) -> None:
         """Queue OPTs that need running; complete (extract + enqueue SPs) already-done OPTs."""
-        for spec in self.registry.all_calcs:
-            if spec.id.mode != Mode.OPT:
-                continue
-            status, _ = get_status(spec)
+        opts = self.registry.by_mode(Mode.OPT)
+        for spec, (status, _) in zip(opts, self.statuses.statuses(opts), strict=True):
             if status == Status.SUCCESSFUL:
                 self._complete(spec)
-            elif should_process(spec, self.opt_criteria):
+            elif should_process(spec, self.opt_criteria, self.statuses):
                 self.ready.append(spec)
 
     def _loop(self) -> None:
@@ -98,15 +109,42 @@ class _Pipeline:
             self._submit_ready()
             finished = self.throttler.poll(self.be.is_finished)
             for jid in finished:
-                self._complete(self.inflight.pop(jid))
+                spec = self.inflight.pop(jid)
+                self.statuses.invalidate(spec)
+                self.follower.forget(spec.output_path)
+                self.progress.pop(spec.id, None)
+                self._complete(spec)
             if not finished and self.inflight:
+                self._follow_inflight()
                 time.sleep(self.throttler.poll_interval)
 
+    def _follow_inflight(self) -> None:
+        """Log the live progress of running jobs (reading only their newly written output).
+
+        Only a new optimisation step or completion is logged at INFO; SCF
+        cycles and energies change on almost every poll, so the rest is DEBUG.
+        """
+        for spec in self.inflight.values():
+            progress = self.follower.poll(spec.output_path)
+            previous = self.progress.get(spec.id, LiveProgress())
+            if progress != previous:
+                self.progress[spec.id] = progress
+                milestone = (progress.opt_step, progress.done) != (previous.opt_step, previous.done)
+                log.log(
+                    logging.INFO if milestone else logging.DEBUG,
+                    "%s: step %s, E = %s Ha, max grad %s, SCF cycles %s",
+                    spec.input_path.stem,
+                    progress.opt_step,
+                    progress.energy_ha,
+                    progress.max_gradient,
+                    progress.scf_cycles,
+                )
+
     def _submit_ready(self) -> None:
         """Submit queued specs while the core budget allows (never deadlock when idle)."""
         while self.ready:
             spec = self.ready[0]
-            if not spec.input_path.exists():
+            if not self.files.is_file(spec.input_path):
                 self.ready.popleft()
                 log.warning("Missing input, skipping: %s", spec.input_path)
                 continue
@@ -119,18 +157,20 @@ class _Pipeline:
             if in_use and in_use + cores > self.throttler.max_cores:
                 break  # busy and won't fit → wait for running jobs to finish
             self.ready.popleft()
-            job_id = submit_job(spec, job, self.be)
+            job_id = submit_job(spec, job, self.be, self.ledger)
             self.throttler.register(job_id, cores)
             self.inflight[job_id] = spec
 
     def _complete(self, spec: CalcSpec) -> None:
         """Extract a finished calc live; on a successful OPT, build/enqueue its SP(s)."""
-        data = extract_one(spec, self.extract_criteria, self.opt_cache)
+        data = extract_one(
+            spec, self.extract_criteria, self.opt_cache, self.cache, snapshot=self.statuses
+        )
         if data is not None:
             self.extracted[spec.id] = data
             self._live_csv(spec.id.method_key)
         if spec.id.mode == Mode.OPT:
-            status, _ = get_status(spec)
+            status, _ = self.statuses.status(spec)
             if status == Status.SUCCESSFUL:
                 self._enqueue_sps(spec)
             else:
@@ -138,13 +178,13 @@ class _Pipeline:
 
     def _enqueue_sps(self, opt_spec: CalcSpec) -> None:
         """Build and queue the SP inputs that depend on a just-finished OPT."""
-        for sp_spec in self.sp_by_opt.get(opt_spec.id, []):
-            status, _ = get_status(sp_spec)
+        for sp_spec in self.registry.sps_for(opt_spec.id):
+            status, _ = self.statuses.status(sp_spec)
             if status == Status.SUCCESSFUL:
                 self._complete(sp_spec)  # already done on a prior run → just extract
                 continue
-            build_calc(sp_spec, self.registry, self.template_dir)
-            if sp_spec.input_path.exists():
+            build_calc(sp_spec, self.registry, self.template_dir, snapshot=self.statuses)
+            if self.files.is_file(sp_spec.input_path):
                 self.ready.append(sp_spec)
             else:
                 log.warning("SP input not built: %s", sp_spec.id)
@@ -199,7 +239,7 @@ def run_pipeline(
 
 def finalize_extraction(
     registry: CalcRegistry,
-    extracted: dict[CalcID, ExtractedData],
+    extracted: Mapping[CalcID, ExtractedData],
     base_dir: Path,
     *,
     plots: bool = True,
@@ -8,21 +8,42 @@ The enumeration is split across :mod:`~pya3eda.registry.calcs` (calculations),
 :mod:`~pya3eda.registry.profiles` (energy profiles), and
 :mod:`~pya3eda.registry.paths` (the directory-tree layout); this module is the
 thin ``CalcRegistry`` facade that owns the derived state and the lookup API.
+
+Secondary indexes (by method key, mode, catalyst and stage, and each OPT's SP
+children) are built once at construction, so every lookup costs the size of its
+answer rather than a scan of the whole registry. Lookups return tuples — views
+of the index that callers cannot mutate. Profiles are only enumerated when first
+looked up (``status``, ``build`` and ``run`` never do).
+
+:func:`~pya3eda.registry.compiled.load_registry` restores a registry enumerated
+by an earlier command instead of enumerating it again.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable, Iterable
 from pathlib import Path
+from typing import TypeVar
 
 from pya3eda.config import Config
 from pya3eda.ids import CalcID, CalcSpec, ProfileID, ProfileSpec
 from pya3eda.registry._common import build_method_key
-from pya3eda.registry.calcs import enumerate_calcs
-from pya3eda.registry.profiles import enumerate_profiles
 from pya3eda.sanitize import sanitize
+from pya3eda.vocab import Mode
 
 __all__ = ["CalcRegistry", "build_method_key"]
 
+_T = TypeVar("_T")
+_K = TypeVar("_K", bound=Hashable)
+
+
+def _index(items: Iterable[_T], key: Callable[[_T], _K]) -> dict[_K, tuple[_T, ...]]:
+    """Group *items* by *key*, keeping their order within each group."""
+    groups: dict[_K, list[_T]] = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+    return {k: tuple(group) for k, group in groups.items()}
+
 
 class CalcRegistry:
     """Enumerates every expected calculation and energy profile from config.
@@ -36,17 +57,70 @@ class CalcRegistry:
     """
 
     def __init__(self, config: Config, base_dir: Path) -> None:
-        """Initialise the registry by enumerating all calcs and profiles."""
+        """Initialise the registry by enumerating all calcs (profiles on first use)."""
+        # Imported here: a registry restored from the compiled cache never enumerates.
+        from pya3eda.registry.calcs import enumerate_calcs
+        from pya3eda.registry.profiles import enumerate_profiles
+
+        base = Path(base_dir)
+        calcs, method_keys = enumerate_calcs(config, base)
+        self._setup(config, base, calcs, method_keys, lambda: enumerate_profiles(config))
+
+    @classmethod
+    def _restore(
+        cls,
+        config: Config,
+        base_dir: Path,
+        calcs: dict[CalcID, CalcSpec],
+        method_keys: list[str],
+        load_profiles: Callable[[], dict[ProfileID, ProfileSpec]],
+    ) -> CalcRegistry:
+        """A registry of already-enumerated *calcs* (see :mod:`~pya3eda.registry.compiled`)."""
+        registry = object.__new__(cls)
+        registry._setup(config, base_dir, calcs, method_keys, load_profiles)
+        return registry
+
+    def _setup(
+        self,
+        config: Config,
+        base_dir: Path,
+        calcs: dict[CalcID, CalcSpec],
+        method_keys: list[str],
+        load_profiles: Callable[[], dict[ProfileID, ProfileSpec]],
+    ) -> None:
+        """Store the enumerated calcs and build their indexes."""
         self._config = config
-        self._base_dir = Path(base_dir)
+        self._base_dir = base_dir
 
         # Derived ordering helpers
         self._catalyst_order: list[str] = [c.name for c in config.catalysts]
         self._dimer_catalysts: set[str] = {sanitize(c.name) for c in config.catalysts if c.dimer}
 
-        # Primary stores
-        self._calcs, self._method_keys = enumerate_calcs(config, self._base_dir)
-        self._profiles: dict[ProfileID, ProfileSpec] = enumerate_profiles(config)
+        # Primary stores (profiles are enumerated / loaded when first looked up)
+        self._calcs = calcs
+        self._method_keys = method_keys
+        self._load_profiles = load_profiles
+        self._profiles: dict[ProfileID, ProfileSpec] | None = None
+
+        # Secondary indexes (read-only tuples, registry order)
+        self._all_calcs = tuple(self._calcs.values())
+        self._by_method = _index(self._all_calcs, lambda c: c.id.method_key)
+        self._by_mode: dict[str, tuple[CalcSpec, ...]] = _index(
+            self._all_calcs, lambda c: c.id.mode
+        )
+        self._by_catalyst = _index(self._all_calcs, lambda c: c.id.catalyst)
+        self._by_stage: dict[str, tuple[CalcSpec, ...]] = _index(
+            self._all_calcs, lambda c: c.id.stage
+        )
+        self._sps_by_opt = _index(self._by_mode.get(Mode.SP, ()), lambda c: c.id.to_opt())
+
+    def _profile_store(self) -> dict[ProfileID, ProfileSpec]:
+        """The profiles by id, enumerated (and indexed) on first use."""
+        if self._profiles is None:
+            self._profiles = self._load_profiles()
+            self._all_profiles = tuple(self._profiles.values())
+            self._profiles_by_method = _index(self._all_profiles, lambda p: p.id.method_key)
+        return self._profiles
 
     # -- public API ---------------------------------------------------------
 
@@ -61,34 +135,48 @@ class CalcRegistry:
         return self._base_dir
 
     @property
-    def all_calcs(self) -> list[CalcSpec]:
+    def all_calcs(self) -> tuple[CalcSpec, ...]:
         """All registered calculation specs."""
-        return list(self._calcs.values())
+        return self._all_calcs
 
     def get(self, calc_id: CalcID) -> CalcSpec:
         """Look up a CalcSpec by its CalcID."""
         return self._calcs[calc_id]
 
-    def by_method(self, method_key: str) -> list[CalcSpec]:
+    def by_method(self, method_key: str) -> tuple[CalcSpec, ...]:
         """Return all CalcSpecs matching the given method key."""
-        return [c for c in self._calcs.values() if c.id.method_key == method_key]
+        return self._by_method.get(method_key, ())
 
-    def by_mode(self, mode: str) -> list[CalcSpec]:
+    def by_mode(self, mode: str) -> tuple[CalcSpec, ...]:
         """Return all CalcSpecs matching the given mode ('opt' or 'sp')."""
-        return [c for c in self._calcs.values() if c.id.mode == mode]
+        return self._by_mode.get(mode, ())
+
+    def by_catalyst(self, catalyst: str | None) -> tuple[CalcSpec, ...]:
+        """Return all CalcSpecs of the given (sanitised) catalyst (``None`` → uncatalysed)."""
+        return self._by_catalyst.get(catalyst, ())
+
+    def by_stage(self, stage: str) -> tuple[CalcSpec, ...]:
+        """Return all CalcSpecs of the given stage."""
+        return self._by_stage.get(stage, ())
+
+    def sps_for(self, opt_id: CalcID) -> tuple[CalcSpec, ...]:
+        """Return the SP calculations run on the geometry of the OPT *opt_id*."""
+        return self._sps_by_opt.get(opt_id, ())
 
     @property
-    def all_profiles(self) -> list[ProfileSpec]:
+    def all_profiles(self) -> tuple[ProfileSpec, ...]:
         """All registered energy-profile specs."""
-        return list(self._profiles.values())
+        self._profile_store()
+        return self._all_profiles
 
     def get_profile(self, profile_id: ProfileID) -> ProfileSpec:
         """Look up a ProfileSpec by its ProfileID."""
-        return self._profiles[profile_id]
+        return self._profile_store()[profile_id]
 
-    def profiles_for_method(self, method_key: str) -> list[ProfileSpec]:
+    def profiles_for_method(self, method_key: str) -> tuple[ProfileSpec, ...]:
         """Return all ProfileSpecs matching the given method key."""
-        return [p for p in self._profiles.values() if p.id.method_key == method_key]
+        self._profile_store()
+        return self._profiles_by_method.get(method_key, ())
 
     @property
     def method_keys(self) -> list[str]:
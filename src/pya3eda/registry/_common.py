@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pya3eda.config import TheoryConfig
+from collections.abc import Iterator, Sequence
+from itertools import combinations
+
+from pya3eda.config import ComplexConfig, SpeciesConfig, TheoryConfig
+from pya3eda.errors import ConfigError
 from pya3eda.sanitize import sanitize
 from pya3eda.vocab import CalcType
 
@@ -34,3 +38,47 @@ def _sp_subfolder(sp_theory: TheoryConfig) -> str:
 def _has_solvent(theory: TheoryConfig) -> bool:
     """Whether the theory uses an implicit solvent (→ SSC applies)."""
     return theory.solvent is not None and theory.solvent.lower() not in ("false", "gas")
+
+
+def complex_combinations(
+    incl: Sequence[SpeciesConfig], complexes: ComplexConfig, *, min_size: int = 1
+) -> Iterator[tuple[SpeciesConfig, ...]]:
+    """Lazily yield the combinations of *incl* to enumerate as complexes.
+
+    Combinations keep config order and have at least *min_size* members. The
+    source is ``complexes.generator`` or ``complexes.allowed`` when set (the
+    entries naming only species of *incl*), otherwise every combination in
+    order of size; ``complexes.max_size`` bounds them. The full *incl* set is
+    always yielded, last if no source produced it, as every profile needs it.
+    """
+    n = len(incl)
+    if n < min_size:
+        return
+    max_size = complexes.max_size or n
+    generator = complexes.generator_func()
+    if generator is None and complexes.allowed is None:
+        for size in range(min_size, min(max_size, n) + 1):
+            yield from combinations(incl, size)
+        if max_size < n:
+            yield tuple(incl)
+        return
+
+    by_name = {s.name: i for i, s in enumerate(incl)}
+    names = tuple(by_name)
+    candidates = generator(names) if generator is not None else complexes.allowed or ()
+    seen: set[tuple[int, ...]] = set()
+    for combo in candidates:
+        members = tuple(combo)
+        if not set(members) <= by_name.keys():
+            if generator is None:
+                continue  # an allowed combination of the other side
+            raise ConfigError(
+                f"complexes generator {complexes.generator!r} yielded {members!r}, "
+                f"which names species outside {names!r}"
+            )
+        idx = tuple(sorted({by_name[name] for name in members}))
+        if min_size <= len(idx) <= max_size and idx not in seen:
+            seen.add(idx)
+            yield tuple(incl[i] for i in idx)
+    if tuple(range(n)) not in seen:
+        yield tuple(incl)
@@ -2,32 +2,22 @@
 
 from __future__ import annotations
 
-from itertools import combinations
 from pathlib import Path
-from typing import TypedDict
 
 from pya3eda.config import Config, TheoryConfig
-from pya3eda.ids import CalcID, CalcSpec
-from pya3eda.registry._common import _CALC_TYPES, _TS_SPECIES, _sp_subfolder, build_method_key
+from pya3eda.ids import CalcContext, CalcID, CalcSpec
+from pya3eda.registry._common import (
+    _CALC_TYPES,
+    _TS_SPECIES,
+    _sp_subfolder,
+    build_method_key,
+    complex_combinations,
+)
 from pya3eda.registry.paths import build_input_path
 from pya3eda.sanitize import sanitize
 from pya3eda.vocab import Mode, Stage
 
 
-class _CommonCalcKwargs(TypedDict):
-    """Theory/context kwargs shared by every ``add_calc`` call in a level."""
-
-    method_name: str
-    basis_set: str
-    dispersion: str
-    solvent: str
-    eda2: int | None
-    sp_subfolder: str | None
-    all_reactants: tuple[str, ...]
-    all_products: tuple[str, ...]
-    all_catalysts: tuple[str, ...]
-
-
 def enumerate_calcs(config: Config, base_dir: Path) -> tuple[dict[CalcID, CalcSpec], list[str]]:
     """Enumerate all calc specs, returning ``(calcs, ordered_method_keys)``."""
     calcs: dict[CalcID, CalcSpec] = {}
@@ -74,17 +64,17 @@ def _enumerate_calcs_for_theory(
     incl_r = [r for r in cfg.reactants if r.include]
     incl_p = [p for p in cfg.products if p.include]
 
-    common: _CommonCalcKwargs = {
-        "method_name": theory.method,
-        "basis_set": theory.basis,
-        "dispersion": theory.dispersion or "False",
-        "solvent": theory.solvent or "false",
-        "eda2": theory.eda2 if mode == Mode.SP else None,
-        "sp_subfolder": sp_subfolder,
-        "all_reactants": all_r,
-        "all_products": all_p,
-        "all_catalysts": all_c,
-    }
+    context = CalcContext(
+        method_name=theory.method,
+        basis_set=theory.basis,
+        dispersion=theory.dispersion or "False",
+        solvent=theory.solvent or "false",
+        eda2=theory.eda2 if mode == Mode.SP else None,
+        sp_subfolder=sp_subfolder,
+        all_reactants=all_r,
+        all_products=all_p,
+        all_catalysts=all_c,
+    )
 
     # ── uncatalyzed ────────────────────────────────────────────────
     # Individual reactants
@@ -102,29 +92,27 @@ def _enumerate_calcs_for_theory(
             present_reactants=(r.name,),
             present_products=(),
             present_catalysts=(),
-            **common,
+            context=context,
         )
 
-    # Reactant combinations (include=True, ≥2)
-    if len(incl_r) > 1:
-        for size in range(2, len(incl_r) + 1):
-            for combo in combinations(incl_r, size):
-                species_name = "-".join(sanitize(s.name) for s in combo)
-                add_calc(
-                    calcs,
-                    base_dir,
-                    method_key=method_key,
-                    catalyst=None,
-                    stage=Stage.REACTANTS,
-                    species=species_name,
-                    calc_type=None,
-                    mode=mode,
-                    is_fragmented=False,
-                    present_reactants=tuple(s.name for s in combo),
-                    present_products=(),
-                    present_catalysts=(),
-                    **common,
-                )
+    # Reactant combinations (include=True, ≥2, bounded by ``complexes``)
+    for combo in complex_combinations(incl_r, cfg.complexes, min_size=2):
+        species_name = "-".join(sanitize(s.name) for s in combo)
+        add_calc(
+            calcs,
+            base_dir,
+            method_key=method_key,
+            catalyst=None,
+            stage=Stage.REACTANTS,
+            species=species_name,
+            calc_type=None,
+            mode=mode,
+            is_fragmented=False,
+            present_reactants=tuple(s.name for s in combo),
+            present_products=(),
+            present_catalysts=(),
+            context=context,
+        )
 
     # Individual products
     for p in cfg.products:
@@ -141,7 +129,7 @@ def _enumerate_calcs_for_theory(
             present_reactants=(),
             present_products=(p.name,),
             present_catalysts=(),
-            **common,
+            context=context,
         )
 
     # TS (uncatalyzed)
@@ -158,12 +146,13 @@ def _enumerate_calcs_for_theory(
         present_reactants=all_r,
         present_products=all_p,
         present_catalysts=(),
-        **common,
+        context=context,
     )
 
     # ── catalyzed ──────────────────────────────────────────────────
     for cat in cfg.catalysts:
         cat_s = sanitize(cat.name)
+        cat_only = (cat.name,)
 
         # Catalyst standalone
         add_calc(
@@ -178,8 +167,8 @@ def _enumerate_calcs_for_theory(
             is_fragmented=False,
             present_reactants=(),
             present_products=(),
-            present_catalysts=(cat.name,),
-            **common,
+            present_catalysts=cat_only,
+            context=context,
         )
 
         # Catalyst dimer (optional) — a standalone calc alongside `cat`, used
@@ -197,53 +186,53 @@ def _enumerate_calcs_for_theory(
                 is_fragmented=False,
                 present_reactants=(),
                 present_products=(),
-                present_catalysts=(cat.name,),
-                **common,
+                present_catalysts=cat_only,
+                context=context,
             )
 
-        # preTS: catalyst-reactant complexes (include=True combos, ≥1)
-        for size in range(1, len(incl_r) + 1):
-            for combo in combinations(incl_r, size):
-                combo_name = "-".join(sanitize(s.name) for s in combo)
-                species_name = f"{cat_s}-{combo_name}"
-                for ct in _CALC_TYPES:
-                    add_calc(
-                        calcs,
-                        base_dir,
-                        method_key=method_key,
-                        catalyst=cat_s,
-                        stage=Stage.PRETS,
-                        species=species_name,
-                        calc_type=ct,
-                        mode=mode,
-                        is_fragmented=True,
-                        present_reactants=tuple(s.name for s in combo),
-                        present_products=(),
-                        present_catalysts=(cat.name,),
-                        **common,
-                    )
+        # preTS: catalyst-reactant complexes (include=True combos, ≥1, bounded by ``complexes``)
+        for combo in complex_combinations(incl_r, cfg.complexes):
+            combo_name = "-".join(sanitize(s.name) for s in combo)
+            species_name = f"{cat_s}-{combo_name}"
+            present = tuple(s.name for s in combo)  # shared by the three calc types
+            for ct in _CALC_TYPES:
+                add_calc(
+                    calcs,
+                    base_dir,
+                    method_key=method_key,
+                    catalyst=cat_s,
+                    stage=Stage.PRETS,
+                    species=species_name,
+                    calc_type=ct,
+                    mode=mode,
+                    is_fragmented=True,
+                    present_reactants=present,
+                    present_products=(),
+                    present_catalysts=cat_only,
+                    context=context,
+                )
 
-        # postTS: catalyst-product complexes (include=True combos, ≥1)
-        for size in range(1, len(incl_p) + 1):
-            for combo in combinations(incl_p, size):
-                combo_name = "-".join(sanitize(s.name) for s in combo)
-                species_name = f"{cat_s}-{combo_name}"
-                for ct in _CALC_TYPES:
-                    add_calc(
-                        calcs,
-                        base_dir,
-                        method_key=method_key,
-                        catalyst=cat_s,
-                        stage=Stage.POSTTS,
-                        species=species_name,
-                        calc_type=ct,
-                        mode=mode,
-                        is_fragmented=True,
-                        present_reactants=(),
-                        present_products=tuple(s.name for s in combo),
-                        present_catalysts=(cat.name,),
-                        **common,
-                    )
+        # postTS: catalyst-product complexes (include=True combos, ≥1, bounded by ``complexes``)
+        for combo in complex_combinations(incl_p, cfg.complexes):
+            combo_name = "-".join(sanitize(s.name) for s in combo)
+            species_name = f"{cat_s}-{combo_name}"
+            present = tuple(s.name for s in combo)  # shared by the three calc types
+            for ct in _CALC_TYPES:
+                add_calc(
+                    calcs,
+                    base_dir,
+                    method_key=method_key,
+                    catalyst=cat_s,
+                    stage=Stage.POSTTS,
+                    species=species_name,
+                    calc_type=ct,
+                    mode=mode,
+                    is_fragmented=True,
+                    present_reactants=(),
+                    present_products=present,
+                    present_catalysts=cat_only,
+                    context=context,
+                )
 
         # TS (catalyzed)
         for ct in _CALC_TYPES:
@@ -259,8 +248,8 @@ def _enumerate_calcs_for_theory(
                 is_fragmented=True,
                 present_reactants=all_r,
                 present_products=all_p,
-                present_catalysts=(cat.name,),
-                **common,
+                present_catalysts=cat_only,
+                context=context,
             )
 
 
@@ -275,18 +264,10 @@ def add_calc(
     calc_type: str | None,
     mode: str,
     is_fragmented: bool,
-    method_name: str,
-    basis_set: str,
-    dispersion: str,
-    solvent: str,
-    eda2: int | None,
-    sp_subfolder: str | None,
     present_reactants: tuple[str, ...],
     present_products: tuple[str, ...],
     present_catalysts: tuple[str, ...],
-    all_reactants: tuple[str, ...],
-    all_products: tuple[str, ...],
-    all_catalysts: tuple[str, ...],
+    context: CalcContext,
 ) -> None:
     """Create CalcID + CalcSpec and register them in *calcs*."""
     cid = CalcID(
@@ -296,7 +277,7 @@ def add_calc(
         species=species,
         calc_type=calc_type,
         mode=mode,
-        sp_subfolder=sp_subfolder,
+        sp_subfolder=context.sp_subfolder,
     )
     if cid in calcs:
         return  # duplicate id (e.g. OPT theories differing only in SP-only fields)
@@ -309,7 +290,7 @@ def add_calc(
         species,
         calc_type,
         mode,
-        sp_subfolder,
+        context.sp_subfolder,
     )
     output_path = input_path.with_suffix(".out")
 
@@ -317,18 +298,10 @@ def add_calc(
         id=cid,
         input_path=input_path,
         output_path=output_path,
-        method_name=method_name,
-        basis_set=basis_set,
-        dispersion=dispersion,
-        solvent=solvent,
-        eda2=eda2,
-        sp_subfolder=sp_subfolder,
+        context=context,
         is_fragmented=is_fragmented,
         present_reactants=present_reactants,
         present_products=present_products,
         present_catalysts=present_catalysts,
-        all_reactants=all_reactants,
-        all_products=all_products,
-        all_catalysts=all_catalysts,
     )
     calcs[cid] = spec
@@ -0,0 +1,270 @@
+"""Compiled-registry cache: warm CLI starts skip config validation and enumeration.
+
+Every command used to re-read and re-validate the YAML config and re-enumerate
+every ``CalcSpec`` (and its two paths) before doing any real work.
+:func:`load_registry` instead stores the enumerated registry in
+``base_dir/.pya3eda/registry.bin`` and, while its key still matches, rebuilds
+the registry from there. The key hashes the config file's bytes, the base
+directory, the PyA3EDA version and the size and mtime of the modules that
+define the enumeration.
+
+The file is JSON, never a pickle: ``.pya3eda`` may sit in a directory other
+users can write to, and loading a planted pickle would run their code. Reading
+the file only ever builds the config, calculations and profiles it describes,
+each validated on the way in. Calculations are stored as flat rows of plain
+values, since re-creating objects is the cost being avoided, with the shared
+theory contexts stored once. The profiles follow as a separate JSON document,
+validated only when a command first looks one up (``extract``, ``pipeline``).
+
+Like :class:`~pya3eda.cache.OutputCache` the file is best effort. A missing,
+unreadable, corrupt or stale file means the registry is enumerated as usual;
+an unwritable base directory means it is not stored. A config with a
+``complexes.generator`` plugin is never stored, because the plugin's code is
+not part of the key.
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pya3eda.cache import CACHE_DIR
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from pya3eda.ids import CalcContext, CalcID, CalcSpec, ProfileID, ProfileSpec
+    from pya3eda.registry import CalcRegistry
+
+log = logging.getLogger(__name__)
+
+REGISTRY_FILE = "registry.bin"
+"""The compiled registry's file name within :data:`~pya3eda.cache.CACHE_DIR`."""
+
+_MAGIC = b"pya3eda-registry"
+_SCHEMA = 2
+_PACKAGE = Path(__file__).resolve().parents[1]
+# Modules whose code decides what a config enumerates to.
+_SOURCES = ("config.py", "ids.py", "sanitize.py", "vocab.py", "registry")
+
+
+def load_registry(config_path: Path) -> CalcRegistry:
+    """The registry of the config at *config_path*, from the compiled cache if current.
+
+    The base directory is the config's directory, as for every CLI command. A
+    cache miss loads the config, enumerates the registry and stores it.
+    """
+    config_path = Path(config_path)
+    base_dir = config_path.resolve().parent
+    cache_path = base_dir / CACHE_DIR / REGISTRY_FILE
+    source = _read_bytes(config_path)  # None → load_config reports it
+    key = None if source is None else registry_key(source, base_dir)
+    if key is not None:
+        registry = _read(cache_path, key, base_dir)
+        if registry is not None:
+            return registry
+
+    from pya3eda.config import load_config
+    from pya3eda.registry import CalcRegistry
+
+    config = load_config(config_path)
+    registry = CalcRegistry(config, base_dir)
+    # Not stored if the config was edited while it was being enumerated.
+    if (
+        key is not None
+        and config.complexes.generator is None
+        and _read_bytes(config_path) == source
+    ):
+        _write(cache_path, key, registry)
+    return registry
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    """The contents of *path* (``None`` if it cannot be read)."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def registry_key(source: bytes, base_dir: Path) -> bytes:
+    """The cache key of a config whose file holds *source*, rooted at *base_dir*."""
+    from pya3eda import __version__
+
+    digest = hashlib.sha256()
+    parts = [str(_SCHEMA), __version__, str(base_dir), *_source_stamps()]
+    for part in (*(p.encode() for p in parts), source):
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest().encode()
+
+
+def _source_stamps() -> list[str]:
+    """``path:size:mtime`` of every enumeration module (code edits invalidate the cache)."""
+    files: list[Path] = []
+    for name in _SOURCES:
+        path = _PACKAGE / name
+        files.extend(sorted(path.glob("*.py")) if path.is_dir() else [path])
+    stamps = []
+    for path in files:
+        try:
+            st = path.stat()
+        except OSError:  # not installed as plain files (e.g. zipped)
+            stamps.append(f"{path.name}:-")
+        else:
+            stamps.append(f"{path.name}:{st.st_size}:{st.st_mtime_ns}")
+    return stamps
+
+
+def _read(cache_path: Path, key: bytes, base_dir: Path) -> CalcRegistry | None:
+    """The registry stored at *cache_path* under *key* (``None`` on any mismatch)."""
+    try:
+        with cache_path.open("rb") as f:
+            if f.readline() != _MAGIC + b"\n" or f.readline() != key + b"\n":
+                return None
+            header = f.readline()
+            profiles = f.read()
+        return _restore(header, base_dir, profiles)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # unreadable, truncated, failed validation, … → miss
+        log.debug("Compiled registry %s unusable: %s", cache_path, exc)
+        return None
+
+
+def _restore(header: bytes, base_dir: Path, profiles: bytes) -> CalcRegistry:
+    """Rebuild a :class:`CalcRegistry` from the stored *header* (see :func:`_header`)."""
+    from pya3eda.config import Config
+    from pya3eda.ids import CalcContext, CalcID, CalcSpec
+    from pya3eda.registry import CalcRegistry
+    from pya3eda.vocab import CalcType, Mode, Stage
+
+    # Vocabulary by value: an unknown one is a KeyError, like any other corrupt row.
+    stages = {s.value: s for s in Stage}
+    calc_types: dict[str | None, CalcType | None] = {t.value: t for t in CalcType}
+    calc_types[None] = None
+    modes = {m.value: m for m in Mode}
+    intern = sys.intern
+    calcs: dict[CalcID, CalcSpec] = {}
+    with _gc_paused():
+        values = json.loads(header)
+        config = Config.model_validate(values["config"])
+        contexts = [
+            CalcContext._make(tuple(v) if isinstance(v, list) else v for v in context)
+            for context in values["contexts"]
+        ]
+        groups = [tuple(map(intern, group)) for group in values["groups"]]
+        for fields, input_path, context, fragmented, reactants, products, catalysts in values[
+            "rows"
+        ]:
+            mk, cat, stage, species, calc_type, mode, sub = fields
+            cid = CalcID._from_fields(
+                (
+                    intern(mk),
+                    None if cat is None else intern(cat),
+                    stages[stage],
+                    intern(species),
+                    calc_types[calc_type],
+                    modes[mode],
+                    None if sub is None else intern(sub),
+                )
+            )
+            path = Path(input_path)
+            calcs[cid] = CalcSpec._from_values(
+                (
+                    cid,
+                    path,
+                    path.with_suffix(".out"),
+                    contexts[context],
+                    fragmented,
+                    groups[reactants],
+                    groups[products],
+                    groups[catalysts],
+                )
+            )
+        return CalcRegistry._restore(
+            config, base_dir, calcs, values["method_keys"], lambda: _load_profiles(profiles)
+        )
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic GC: allocating 10^5 objects would trigger many passes that find nothing."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _profiles_adapter() -> TypeAdapter[list[ProfileSpec]]:
+    """Validates the stored profiles (built on demand: pydantic schemas cost to build)."""
+    from pydantic import TypeAdapter
+
+    from pya3eda.ids import ProfileSpec
+
+    return TypeAdapter(list[ProfileSpec])
+
+
+def _load_profiles(blob: bytes) -> dict[ProfileID, ProfileSpec]:
+    """Validate the stored profiles, by id."""
+    with _gc_paused():
+        return {profile.id: profile for profile in _profiles_adapter().validate_json(blob)}
+
+
+def _header(registry: CalcRegistry) -> dict[str, Any]:
+    """The config and every calc as JSON values; the output path is derived on load.
+
+    Each calc is a flat row whose theory context and present-species tuples are
+    indexes into ``contexts`` and ``groups``, which few distinct values fill.
+    """
+    # Contexts by identity: one is shared by every calc of a theory, and hashing
+    # its species lists per calc would cost more than the rest of the row.
+    contexts: dict[int, tuple[int, CalcContext]] = {}
+    groups: dict[tuple[str, ...], int] = {}
+    rows = []
+    for spec in registry.all_calcs:
+        rows.append(
+            (
+                spec.id._to_json(),
+                str(spec.input_path),
+                contexts.setdefault(id(spec.context), (len(contexts), spec.context))[0],
+                spec.is_fragmented,
+                groups.setdefault(spec.present_reactants, len(groups)),
+                groups.setdefault(spec.present_products, len(groups)),
+                groups.setdefault(spec.present_catalysts, len(groups)),
+            )
+        )
+    return {
+        "config": registry.config.model_dump(mode="json"),
+        "method_keys": registry.method_keys,
+        "contexts": [context for _, context in contexts.values()],
+        "groups": list(groups),
+        "rows": rows,
+    }
+
+
+def _write(cache_path: Path, key: bytes, registry: CalcRegistry) -> None:
+    """Store *registry* at *cache_path* under *key* (atomically; failures are logged)."""
+    header = json.dumps(_header(registry), separators=(",", ":")).encode()
+    profiles = _profiles_adapter().dump_json(list(registry._profile_store().values()))
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        with tmp.open("wb") as f:
+            f.write(b"\n".join((_MAGIC, key, header, profiles)))
+        tmp.replace(cache_path)
+    except OSError as exc:
+        log.debug("Compiled registry not stored under %s: %s", cache_path.parent, exc)
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
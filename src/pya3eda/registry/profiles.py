@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from itertools import combinations
 from typing import Protocol
 
-from pya3eda.config import Config, SpeciesConfig
+from pya3eda.config import ComplexConfig, Config, SpeciesConfig
 from pya3eda.ids import CalcID, NiStageRef, ProfileID, ProfileSpec, StageAlt, StageSpec
 from pya3eda.registry._common import (
     _CALC_TYPES,
@@ -14,6 +13,7 @@ from pya3eda.registry._common import (
     _has_solvent,
     _sp_subfolder,
     build_method_key,
+    complex_combinations,
 )
 from pya3eda.sanitize import sanitize
 from pya3eda.vocab import CalcType, Mode, Stage
@@ -212,12 +212,14 @@ def _build_complex_stage(
     free: list[SpeciesConfig],
     complex_stage: str,
     free_stage: str,
+    complexes: ComplexConfig,
 ) -> tuple[list[CalcID], str, list[tuple[tuple[CalcID, ...], str]]]:
     """Build one complex stage (preTS or postTS) — mirror-shared by both sides.
 
     Returns the primary ``(calc_ids, label, alternatives)`` for a stage made of
     the catalyst+included-species complex plus the free species standalone, where
-    *alternatives* are the proper-subset complexes (each as ``(calc_ids, label)``).
+    *alternatives* are the proper-subset complexes (each as ``(calc_ids, label)``)
+    that *complexes* lets the calc enumeration build.
     The reactant side passes ``(Stage.PRETS, Stage.REACTANTS)`` and ``incl_r``/``free_r``;
     the product side passes ``(Stage.POSTTS, Stage.PRODUCTS)`` and ``incl_p``/``free_p``.
     """
@@ -233,24 +235,24 @@ def _build_complex_stage(
 
     # Alternatives: proper subsets of the included species
     alt_data: list[tuple[tuple[CalcID, ...], str]] = []
-    if len(incl) > 1:
-        for size in range(1, len(incl)):
-            for combo in combinations(incl, size):
-                remaining = [s for s in incl if s not in combo]
-                alt_species = f"{cat_s}-{'-'.join(sanitize(s.name) for s in combo)}"
-                alt_ids: list[CalcID] = [
-                    cid(
-                        catalyst=cat_s,
-                        stage=complex_stage,
-                        species=alt_species,
-                        calc_type=calc_type,
-                    )
-                ]
-                alt_lbl = [f"{cat_name}-{'-'.join(s.name for s in combo)}"]
-                for s in (*remaining, *free):
-                    alt_ids.append(cid(stage=free_stage, species=sanitize(s.name)))
-                    alt_lbl.append(s.name)
-                alt_data.append((tuple(alt_ids), " + ".join(alt_lbl)))
+    for combo in complex_combinations(incl, complexes):
+        if len(combo) == len(incl):
+            continue  # the primary complex
+        remaining = [s for s in incl if s not in combo]
+        alt_species = f"{cat_s}-{'-'.join(sanitize(s.name) for s in combo)}"
+        alt_ids: list[CalcID] = [
+            cid(
+                catalyst=cat_s,
+                stage=complex_stage,
+                species=alt_species,
+                calc_type=calc_type,
+            )
+        ]
+        alt_lbl = [f"{cat_name}-{'-'.join(s.name for s in combo)}"]
+        for s in (*remaining, *free):
+            alt_ids.append(cid(stage=free_stage, species=sanitize(s.name)))
+            alt_lbl.append(s.name)
+        alt_data.append((tuple(alt_ids), " + ".join(alt_lbl)))
     return ids, " + ".join(label_parts), alt_data
 
 
@@ -292,10 +294,26 @@ def _build_catalyzed_profile(
 
     # --- preTS / postTS complex stages (mirror-shared) ---
     pre_ts_ids, pre_label, pre_alt_data = _build_complex_stage(
-        cid, cat_s, cat_name, calc_type, incl_r, free_r, Stage.PRETS, Stage.REACTANTS
+        cid,
+        cat_s,
+        cat_name,
+        calc_type,
+        incl_r,
+        free_r,
+        Stage.PRETS,
+        Stage.REACTANTS,
+        config.complexes,
     )
     post_ts_ids, post_label, post_alt_data = _build_complex_stage(
-        cid, cat_s, cat_name, calc_type, incl_p, free_p, Stage.POSTTS, Stage.PRODUCTS
+        cid,
+        cat_s,
+        cat_name,
+        calc_type,
+        incl_p,
+        free_p,
+        Stage.POSTTS,
+        Stage.PRODUCTS,
+        config.complexes,
     )
 
     # --- TS stage (+ uncatalyzed TS for the NI translational frame) ---
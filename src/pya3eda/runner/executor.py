@@ -21,6 +21,7 @@ from dataclasses import dataclass
 
 from pya3eda.errors import RunOptionError
 from pya3eda.ids import CalcSpec
+from pya3eda.ledger import JobLedger
 from pya3eda.registry import CalcRegistry
 from pya3eda.runner.backend import ExecutionBackend, get_backend
 from pya3eda.runner.clusters import ClusterConfig, detect_cluster
@@ -32,7 +33,7 @@ from pya3eda.runner.script import (
     read_input_file,
     slurm_script_text,
 )
-from pya3eda.status.checker import should_process
+from pya3eda.status.checker import StatusSnapshot, should_process
 from pya3eda.utils import write_text
 
 log = logging.getLogger(__name__)
@@ -73,8 +74,13 @@ def run_all(
     max_cores: int | None = None,
     wait: bool = False,
     options: RunOptions | None = None,
+    io_threads: int = 1,
 ) -> int:
-    """Submit jobs for every calculation matching *criteria*; return the count submitted."""
+    """Submit jobs for every calculation matching *criteria*; return the count submitted.
+
+    Statuses are classified together, up front, before anything is submitted —
+    with *io_threads* > 1, that many at a time.
+    """
     if not criteria:
         log.warning("No run criteria specified")
         return 0
@@ -92,23 +98,29 @@ def run_all(
         log.info("Throttling submissions to %d cores (%s backend)", budget, be.name)
 
     count = 0
-    for spec in registry.all_calcs:
-        if not spec.input_path.exists():
-            continue
-        if not should_process(spec, criteria):
-            continue
-
-        job = prepare_job(spec, opts, cluster, cluster_name)
-        if job is None:
-            continue
-        cores = cores_for(job)
-
-        if throttler is not None:
-            throttler.wait_for_room(cores, is_finished=be.is_finished)
-        job_id = submit_job(spec, job, be)
-        if throttler is not None:
-            throttler.register(job_id, cores)
-        count += 1
+    with JobLedger.open(registry.base_dir) as ledger:
+        snapshot = StatusSnapshot(ledger=ledger, io_threads=io_threads)
+        if io_threads > 1:
+            inputs = (spec.input_path for spec in registry.all_calcs)
+            snapshot.files.prefetch(inputs, threads=io_threads)
+        specs = [spec for spec in registry.all_calcs if snapshot.files.is_file(spec.input_path)]
+        if criteria.lower() not in ("all", "nofile"):
+            snapshot.statuses(specs)
+        for spec in specs:
+            if not should_process(spec, criteria, snapshot):
+                continue
+
+            job = prepare_job(spec, opts, cluster, cluster_name)
+            if job is None:
+                continue
+            cores = cores_for(job)
+
+            if throttler is not None:
+                throttler.wait_for_room(cores, is_finished=be.is_finished)
+            job_id = submit_job(spec, job, be, ledger)
+            if throttler is not None:
+                throttler.register(job_id, cores)
+            count += 1
 
     if throttler is not None:
         throttler.wait_all(is_finished=be.is_finished)
@@ -117,11 +129,14 @@ def run_all(
     return count
 
 
-def submit_job(spec: CalcSpec, job: JobSpec, be: ExecutionBackend) -> str:
+def submit_job(
+    spec: CalcSpec, job: JobSpec, be: ExecutionBackend, ledger: JobLedger | None = None
+) -> str:
     """Write *spec*'s script (local or SLURM) and submit it; return the job id.
 
     Shared by ``run_all`` and the dependency-aware pipeline; the caller owns the
-    core-budget accounting (``Throttler``) around it.
+    core-budget accounting (``Throttler``) around it. The submission is recorded
+    in *ledger*, if given.
     """
     text = local_script_text(job) if be.name == "local" else slurm_script_text(job)
     script_path = spec.input_path.with_suffix(".slurm")
@@ -129,6 +144,8 @@ def submit_job(spec: CalcSpec, job: JobSpec, be: ExecutionBackend) -> str:
     log.info("Submitting: %s", spec.input_path)
     job_id = be.submit(script_path)
     log.info("Submitted %s as %s", spec.input_path, job_id)
+    if ledger is not None:
+        ledger.record_submission(spec.input_path, job_id, backend=be.name, cores=cores_for(job))
     return job_id
 
 
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Iterable, Sequence
 from enum import StrEnum
 from pathlib import Path
+from typing import NamedTuple
 
+from pya3eda.cache import CacheKind, OutputCache, cached_many
 from pya3eda.ids import CalcSpec
-from pya3eda.parser.qchem import parse_imaginary_freq, parse_opt_converged, parse_status
+from pya3eda.ledger import JobLedger, LedgerEntry
+from pya3eda.listing import FileIndex
+from pya3eda.parser.batch import run_many
+from pya3eda.parser.qchem import OptOutputSummary, parse_status
+from pya3eda.parser.tail import parse_status_file, scan_opt_file
 from pya3eda.registry import CalcRegistry
 from pya3eda.utils import read_text
 from pya3eda.vocab import Mode, Stage
@@ -42,54 +49,236 @@ class Status(StrEnum):
     VALIDATION = "VALIDATION"
 
 
+_STATUS: CacheKind[tuple[Status, str]] = CacheKind("status", tuple[Status, str])
+
+
 # ---------------------------------------------------------------------------
 # Per-file status detection
 # ---------------------------------------------------------------------------
 
 
-def get_status(spec: CalcSpec) -> tuple[Status, str]:
+def get_status(
+    spec: CalcSpec,
+    cache: OutputCache | None = None,
+    *,
+    files: FileIndex | None = None,
+    ledger: JobLedger | None = None,
+) -> tuple[Status, str]:
     """Determine the status of a single calculation.
 
     Reads ``.out`` / ``.err`` / submission-sentinel files and returns
-    ``(Status, detail_message)``.
+    ``(Status, detail_message)``. With a *cache*, the result is reused for as long
+    as the ``.out`` / ``.err`` files (and the sentinel's presence) are unchanged.
+    Which files exist is looked up in *files* (a fresh index by default). With a
+    *ledger*, a status it records as terminal is returned without reading any
+    file, and the status observed otherwise is recorded in it.
+    """
+    return get_statuses([spec], cache, files=files, ledger=ledger)[0]
+
+
+def get_statuses(
+    specs: Sequence[CalcSpec],
+    cache: OutputCache | None = None,
+    *,
+    jobs: int = 1,
+    io_threads: int = 1,
+    files: FileIndex | None = None,
+    ledger: JobLedger | None = None,
+    recheck: bool = False,
+    detail: bool = True,
+) -> list[tuple[Status, str]]:
+    """:func:`get_status` for every spec in *specs*, in order.
+
+    Each calculation directory is listed once (see :class:`~pya3eda.listing.FileIndex`)
+    rather than probed and globbed per calculation. Outputs the *cache* cannot
+    answer for are classified across *jobs* worker processes (see
+    :func:`~pya3eda.parser.batch.run_many`). With *io_threads* > 1 the directories
+    are listed, the outputs stamped and (in-process) classified by that many
+    threads at once, overlapping filesystem latency. With *recheck*, statuses the
+    *ledger* records as terminal are re-read as well. Without *detail*, outputs
+    are classified without working out the detail message (see
+    :func:`~pya3eda.parser.qchem.parse_status`), which is then mostly empty, and
+    nothing is recorded in the *ledger*.
     """
-    input_path = spec.input_path
+    if files is None:
+        files = FileIndex()
+    known: dict[str, LedgerEntry] = {}
+    if ledger is not None and not recheck:
+        known = ledger.entries(spec.input_path for spec in specs)
+    if io_threads > 1:
+        outputs = [
+            spec.output_path
+            for spec in specs
+            if (entry := known.get(str(spec.input_path))) is None or not entry.terminal
+        ]
+        files.prefetch(
+            [*outputs, *(out.with_suffix(".err") for out in outputs)],
+            threads=io_threads,
+            stamps=cache is not None,
+        )
+    results: list[tuple[Status, str]] = [(Status.ABSENT, "Input file not found")] * len(specs)
+    pending: list[tuple[int, _Classify]] = []
+    for i, spec in enumerate(specs):
+        entry = known.get(str(spec.input_path))
+        if entry is not None and entry.terminal:
+            results[i] = Status(entry.status), entry.detail
+            continue
+        if not files.is_file(spec.input_path):
+            continue
+        job = _Classify(
+            spec,
+            out_path=files.find_file(spec.output_path),
+            err_path=files.find_file(spec.output_path.with_suffix(".err")),
+            submission_exists=files.submission_exists(spec.input_path),
+            detail=detail,
+        )
+        pending.append((i, job))
+
+    statuses = cached_many(
+        cache,
+        _STATUS,
+        [
+            (
+                (job.spec.output_path, job.spec.output_path.with_suffix(".err")),
+                (job.submission_exists, detail),
+            )
+            for _, job in pending
+        ],
+        lambda misses: run_many(
+            _classify, [pending[k][1] for k in misses], jobs=jobs, threads=io_threads
+        ),
+        stamp=files.stamp,
+    )
+    for (i, _), status in zip(pending, statuses, strict=True):
+        results[i] = status
+    if ledger is not None and detail:
+        ledger.record_statuses(
+            (job.spec.input_path, status.value, detail)
+            for (_, job), (status, detail) in zip(pending, statuses, strict=True)
+        )
+    return results
 
-    if not input_path.exists():
-        return Status.ABSENT, "Input file not found"
 
-    out_text = read_text(spec.output_path) or ""
-    err_text = read_text(spec.output_path.with_suffix(".err")) or ""
+class StatusSnapshot:
+    """Every calculation's status, computed at most once per command.
 
-    # Check for running job based on submission sentinel files
-    stem = input_path.stem
-    submission_exists = bool(list(input_path.parent.glob(f"{stem}.in_[0-9]*.[0-9]*"))) or bool(
-        list(input_path.parent.glob(f".{stem}.in.[0-9]*.qcin.[0-9]*"))
-    )
+    Statuses are classified lazily, on the first question about a calculation
+    (or in bulk by :meth:`statuses`, with the *jobs* / *io_threads* fan-out of
+    :func:`get_statuses`), and remembered until :meth:`invalidate` — which a
+    long-running command calls when it sees a job finish. Passing one snapshot
+    to every status check of a command (run filtering, build gates, the
+    pipeline, extraction) reads each ``.out`` / ``.err`` at most once.
+    """
+
+    def __init__(
+        self,
+        cache: OutputCache | None = None,
+        *,
+        files: FileIndex | None = None,
+        ledger: JobLedger | None = None,
+        jobs: int = 1,
+        io_threads: int = 1,
+        recheck: bool = False,
+        detail: bool = True,
+    ) -> None:
+        """Classify with *cache*, *files* (a fresh index by default) and *ledger*.
+
+        The other arguments are as for :func:`get_statuses`.
+        """
+        self.cache = cache
+        self.files = files if files is not None else FileIndex()
+        self.ledger = ledger
+        self.jobs = jobs
+        self.io_threads = io_threads
+        self.recheck = recheck
+        self.detail = detail
+        self._statuses: dict[Path, tuple[Status, str]] = {}  # by input path
+
+    def status(self, spec: CalcSpec) -> tuple[Status, str]:
+        """``(Status, detail_message)`` of *spec*, classified on first use."""
+        return self.statuses([spec])[0]
+
+    def statuses(self, specs: Sequence[CalcSpec]) -> list[tuple[Status, str]]:
+        """:meth:`status` of every spec in *specs*; those not yet known are classified together."""
+        missing = list(
+            {
+                spec.input_path: spec for spec in specs if spec.input_path not in self._statuses
+            }.values()
+        )
+        if missing:
+            fresh = get_statuses(
+                missing,
+                self.cache,
+                jobs=self.jobs,
+                io_threads=self.io_threads,
+                files=self.files,
+                ledger=self.ledger,
+                recheck=self.recheck,
+                detail=self.detail,
+            )
+            self._statuses.update(zip((spec.input_path for spec in missing), fresh, strict=True))
+        return [self._statuses[spec.input_path] for spec in specs]
+
+    def invalidate(self, spec: CalcSpec | None = None) -> None:
+        """Forget the status of *spec* (``None`` → every status) and rescan its directory."""
+        if spec is None:
+            self._statuses.clear()
+            self.files.invalidate()
+        else:
+            self._statuses.pop(spec.input_path, None)
+            self.files.invalidate(spec.input_path.parent)
+
+
+class _Classify(NamedTuple):
+    """The inputs of :func:`_classify` for one calculation (sent to a worker)."""
+
+    spec: CalcSpec
+    out_path: Path | None  # the output, or its compressed sibling; None if neither exists
+    err_path: Path | None  # likewise for the .err
+    submission_exists: bool
+    detail: bool = True
 
-    raw_status, detail = parse_status(out_text, err_text, submission_exists)
+
+def _classify(job: _Classify) -> tuple[Status, str]:
+    """Parse the ``.out`` / ``.err`` of a calculation into ``(Status, detail_message)``.
+
+    Only the head and tail of the output (which may be compressed) are read
+    unless neither classifies it.
+    """
+    spec, out_path, err_path, submission_exists, with_detail = job
+    err_text = (read_text(err_path) if err_path is not None else None) or ""
+    if out_path is None:
+        raw_status, detail = parse_status("", err_text, submission_exists, detail=with_detail)
+    else:
+        raw_status, detail = parse_status_file(
+            out_path, err_text, submission_exists, detail=with_detail
+        )
     try:
         status = Status(raw_status)
     except ValueError:
         status = Status.CRASH
 
     # Enhanced OPT validation for successful calculations
-    if status == Status.SUCCESSFUL and spec.id.mode == Mode.OPT and out_text:
-        v_status, v_detail = _validate_opt(out_text, spec)
+    if status == Status.SUCCESSFUL and out_path is not None and spec.id.mode == Mode.OPT:
+        summary = scan_opt_file(out_path, _VALIDATION_FIELDS) or OptOutputSummary()
+        v_status, v_detail = _validate_opt(summary, spec)
         if v_status is not None:
             return v_status, v_detail
 
     return status, detail
 
 
-def _validate_opt(out_text: str, spec: CalcSpec) -> tuple[Status | None, str]:
+_VALIDATION_FIELDS = ("opt_converged", "imag_freq")
+
+
+def _validate_opt(summary: OptOutputSummary, spec: CalcSpec) -> tuple[Status | None, str]:
     """Extra validation for converged OPT calculations.
 
     Returns ``(None, "")`` if everything is fine, or ``(VALIDATION, msg)`` on
     mismatch.
     """
-    converged = parse_opt_converged(out_text)
-    imag = parse_imaginary_freq(out_text)
+    converged = summary.opt_converged
+    imag = summary.imag_freq
 
     if not converged and imag is None:
         return None, ""
@@ -111,17 +300,19 @@ def _validate_opt(out_text: str, spec: CalcSpec) -> tuple[Status | None, str]:
 # ---------------------------------------------------------------------------
 
 
-def should_process(spec: CalcSpec, criteria: str) -> bool:
+def should_process(spec: CalcSpec, criteria: str, snapshot: StatusSnapshot | None = None) -> bool:
     """Return ``True`` if *spec* should be processed given *criteria*.
 
     *criteria* is one of ``"all"``, ``"nofile"``, or a status name like
-    ``"CRASH"``.
+    ``"CRASH"``. The status is taken from *snapshot* (a fresh one by default).
     """
     if criteria.lower() == "all":
         return True
+    if snapshot is None:
+        snapshot = StatusSnapshot()
     if criteria.lower() == "nofile":
-        return not spec.output_path.exists()
-    status, _ = get_status(spec)
+        return snapshot.files.find_file(spec.output_path) is None
+    status, _ = snapshot.status(spec)
     return status.value.lower() == criteria.lower()
 
 
@@ -139,7 +330,7 @@ def _rel_display(spec: CalcSpec, base_dir: Path) -> str:
     return str(rel.parent / rel.stem)
 
 
-def _interleave_opt_sp(specs: list[CalcSpec]) -> list[CalcSpec]:
+def _interleave_opt_sp(specs: Iterable[CalcSpec]) -> list[CalcSpec]:
     """Reorder so each OPT is immediately followed by its SP calcs.
 
     Preserves the natural insertion order from the registry (which mirrors
@@ -171,8 +362,45 @@ def _interleave_opt_sp(specs: list[CalcSpec]) -> list[CalcSpec]:
     return result
 
 
-def check_all(registry: CalcRegistry) -> None:
-    """Print a grouped status report, streaming each line as it is checked."""
+def check_all(
+    registry: CalcRegistry,
+    *,
+    jobs: int = 1,
+    io_threads: int = 1,
+    recheck: bool = False,
+    summary_only: bool = False,
+) -> None:
+    """Print a grouped status report, streaming each group as it is checked.
+
+    Each group's statuses are fetched together — classified across *jobs* worker
+    processes, or *io_threads* threads — and printed in registry order. Statuses
+    the job ledger records as terminal are reported from it unless *recheck*.
+    With *summary_only* only the per-status counts are printed, and outputs are
+    classified without working out their detail messages.
+    """
+    with OutputCache.open(registry.base_dir) as cache, JobLedger.open(registry.base_dir) as ledger:
+        snapshot = StatusSnapshot(
+            cache,
+            ledger=ledger,
+            jobs=jobs,
+            io_threads=io_threads,
+            recheck=recheck,
+            detail=not summary_only,
+        )
+        _report_all(registry, snapshot.statuses, rows=not summary_only)
+
+
+def _report_all(
+    registry: CalcRegistry,
+    statuses: Callable[[Sequence[CalcSpec]], list[tuple[Status, str]]],
+    *,
+    rows: bool = True,
+) -> None:
+    """Stream the grouped report of :func:`check_all`, group by group.
+
+    *statuses* returns the statuses of a group's specs (e.g.
+    :meth:`StatusSnapshot.statuses`). Without *rows* only the counts are printed.
+    """
     base_dir = registry.base_dir
     overall: dict[str, int] = {}
     divider = "-" * 60
@@ -181,6 +409,16 @@ def check_all(registry: CalcRegistry) -> None:
         specs = _interleave_opt_sp(registry.by_method(mk))
         if not specs:
             continue
+        group_counts: dict[str, int] = {}
+        if not rows:
+            for status, _ in statuses(specs):
+                group_counts[status.value] = group_counts.get(status.value, 0) + 1
+                overall[status.value] = overall.get(status.value, 0) + 1
+            _report.info("")
+            _report.info(f"    Summary for {mk}:")
+            for s, c in group_counts.items():
+                _report.info(f"    {s} : {c}")
+            continue
 
         # Compute column width from full relative paths
         max_len = max(
@@ -197,9 +435,7 @@ def check_all(registry: CalcRegistry) -> None:
         _report.info(fmt.format("Input File (rel)", "Mode", "Status", "Details"))
         _report.info(divider)
 
-        group_counts: dict[str, int] = {}
-        for spec in specs:
-            status, detail = get_status(spec)
+        for spec, (status, detail) in zip(specs, statuses(specs), strict=True):
             mode = "SP" if spec.id.mode == Mode.SP else "OPT"
             display = _rel_display(spec, base_dir)
 
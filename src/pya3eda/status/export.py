@@ -0,0 +1,148 @@
+"""Machine-readable status export: ``pya3eda status --format jsonl|csv``.
+
+:func:`export_all` streams one record per calculation, group by group as each
+is checked, to stdout (or any text stream): the :class:`~pya3eda.ids.CalcID`
+fields, the input (relative to the base directory, without suffix), status,
+detail message, wall time in seconds (successful jobs) and output size in bytes.
+The columns are :data:`FIELDS`; JSON Lines has one object per line, CSV a header
+row first.
+
+With ``summary_only`` only the per-status counts are written — one record per
+method group and status, then the overall counts with an empty ``method_key``
+(see :data:`SUMMARY_FIELDS`). Outputs are then classified without working out
+detail messages (crash reasons, wall times), the cheapest status check there is.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import re
+import sys
+from collections import Counter
+from collections.abc import Callable
+from typing import TextIO
+
+from pya3eda.cache import OutputCache
+from pya3eda.errors import RunOptionError
+from pya3eda.ids import CalcSpec
+from pya3eda.ledger import JobLedger
+from pya3eda.listing import FileIndex
+from pya3eda.registry import CalcRegistry
+from pya3eda.status.checker import Status, StatusSnapshot, _interleave_opt_sp, _rel_display
+
+FORMATS = ("jsonl", "csv")
+"""Export formats of :func:`export_all`."""
+
+FIELDS = (
+    "method_key",
+    "catalyst",
+    "stage",
+    "species",
+    "calc_type",
+    "mode",
+    "sp_subfolder",
+    "input",
+    "status",
+    "detail",
+    "wall_time_s",
+    "output_bytes",
+)
+"""The fields of a per-calculation record, in column order."""
+
+SUMMARY_FIELDS = ("method_key", "status", "count")
+"""The fields of a ``summary_only`` record, in column order."""
+
+# The detail parse_status gives a successful job ("Completed in hh:mm:ss").
+_COMPLETED = re.compile(r"Completed in (\d+):(\d{2}):(\d{2})$")
+
+_Record = dict[str, object]
+
+
+def export_all(
+    registry: CalcRegistry,
+    fmt: str,
+    *,
+    stream: TextIO | None = None,
+    summary_only: bool = False,
+    jobs: int = 1,
+    io_threads: int = 1,
+    recheck: bool = False,
+) -> None:
+    """Write the status of every calculation as *fmt* (``jsonl`` or ``csv``) to *stream*.
+
+    *stream* defaults to stdout. *jobs*, *io_threads* and *recheck* are as for
+    :func:`~pya3eda.status.checker.check_all`. Raises
+    :class:`~pya3eda.errors.RunOptionError` for an unknown *fmt*.
+    """
+    if fmt not in FORMATS:
+        raise RunOptionError(f"Unknown status format {fmt!r} (choose from {', '.join(FORMATS)})")
+    out = stream if stream is not None else sys.stdout
+    write = _writer(out, fmt, SUMMARY_FIELDS if summary_only else FIELDS)
+    overall: Counter[str] = Counter()
+
+    with OutputCache.open(registry.base_dir) as cache, JobLedger.open(registry.base_dir) as ledger:
+        snapshot = StatusSnapshot(
+            cache,
+            ledger=ledger,
+            jobs=jobs,
+            io_threads=io_threads,
+            recheck=recheck,
+            detail=not summary_only,
+        )
+        for mk in registry.method_keys:
+            specs = _interleave_opt_sp(registry.by_method(mk))
+            statuses = snapshot.statuses(specs)
+            if summary_only:
+                counts = Counter(status.value for status, _ in statuses)
+                for status_name, count in counts.items():
+                    write({"method_key": mk, "status": status_name, "count": count})
+                overall.update(counts)
+            else:
+                for spec, (status, detail) in zip(specs, statuses, strict=True):
+                    write(_record(spec, status, detail, snapshot.files, registry))
+            out.flush()
+
+    for status_name, count in overall.items():
+        write({"method_key": None, "status": status_name, "count": count})
+    out.flush()
+
+
+def _record(
+    spec: CalcSpec, status: Status, detail: str, files: FileIndex, registry: CalcRegistry
+) -> _Record:
+    """The export record of one calculation."""
+    cid = spec.id
+    stamp = files.stamp(spec.output_path)
+    return {
+        "method_key": cid.method_key,
+        "catalyst": cid.catalyst,
+        "stage": cid.stage,
+        "species": cid.species,
+        "calc_type": cid.calc_type,
+        "mode": cid.mode,
+        "sp_subfolder": cid.sp_subfolder,
+        "input": _rel_display(spec, registry.base_dir),
+        "status": status.value,
+        "detail": detail,
+        "wall_time_s": _wall_seconds(detail) if status == Status.SUCCESSFUL else None,
+        "output_bytes": stamp[0] if stamp is not None else None,
+    }
+
+
+def _wall_seconds(detail: str) -> int | None:
+    """The wall time of a successful job, from its detail message (``None`` if unknown)."""
+    m = _COMPLETED.search(detail)
+    if m is None:
+        return None
+    h, mins, s = (int(g) for g in m.groups())
+    return h * 3600 + mins * 60 + s
+
+
+def _writer(out: TextIO, fmt: str, fields: tuple[str, ...]) -> Callable[[_Record], None]:
+    """A function writing one record to *out* as *fmt* (CSV: after a header row)."""
+    if fmt == "jsonl":
+        return lambda record: print(json.dumps(record), file=out)
+    writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    return writer.writerow
@@ -0,0 +1,191 @@
+"""Live status monitoring: ``pya3eda status --watch``.
+
+Running ``pya3eda status`` in a loop rebuilds the registry and re-reads every
+output on each pass. :class:`StatusWatcher` keeps the registry's calculations
+and what was last seen of each in memory, and on every refresh re-lists the
+calculation directories (one ``os.scandir`` each), stamps the ``.out`` /
+``.err`` files — ``(size, mtime, inode)`` — and re-classifies only the
+calculations whose stamps or submission sentinel changed.
+
+Changes are detected by polling rather than inotify: jobs write their outputs
+from compute nodes, and inotify on a shared filesystem (NFS, GPFS, Lustre) only
+reports writes made by the local node, so it would miss exactly the events that
+matter.
+
+:func:`watch_all` prints the full grouped report once, then per refresh only
+the rows whose status changed and the updated counts of their method groups.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+from pya3eda.cache import OutputCache, Stamp
+from pya3eda.ids import CalcSpec
+from pya3eda.ledger import JobLedger
+from pya3eda.listing import FileIndex
+from pya3eda.registry import CalcRegistry
+from pya3eda.status.checker import (
+    Status,
+    _interleave_opt_sp,
+    _rel_display,
+    _report,
+    _report_all,
+    get_statuses,
+)
+from pya3eda.vocab import Mode
+
+log = logging.getLogger(__name__)
+
+_Key = tuple[bool, Stamp, Stamp, bool]  # input exists, .out / .err stamps, sentinel present
+
+
+class StatusChange(NamedTuple):
+    """A calculation whose status differs from the previous refresh."""
+
+    spec: CalcSpec
+    old: tuple[Status, str] | None  # None on the first refresh
+    new: tuple[Status, str]
+
+
+class StatusWatcher:
+    """The statuses of *specs*, refreshed by re-classifying only changed outputs.
+
+    *cache*, *ledger*, *jobs*, *io_threads* and *recheck* are as for
+    :func:`~pya3eda.status.checker.get_statuses`.
+    """
+
+    def __init__(
+        self,
+        specs: Iterable[CalcSpec],
+        cache: OutputCache | None = None,
+        *,
+        ledger: JobLedger | None = None,
+        jobs: int = 1,
+        io_threads: int = 1,
+        recheck: bool = False,
+    ) -> None:
+        """Watch *specs* (nothing is read until the first :meth:`refresh`)."""
+        self.specs = list(specs)
+        self.cache = cache
+        self.ledger = ledger
+        self.jobs = jobs
+        self.io_threads = io_threads
+        self.recheck = recheck
+        self._keys: dict[Path, _Key] = {}
+        self._statuses: dict[Path, tuple[Status, str]] = {}
+
+    def refresh(self) -> list[StatusChange]:
+        """Re-stat every calculation, re-classify the changed ones; return the status changes."""
+        files = FileIndex()  # listings are per refresh
+        if self.io_threads > 1:
+            outputs = [spec.output_path for spec in self.specs]
+            files.prefetch(
+                [*outputs, *(out.with_suffix(".err") for out in outputs)],
+                threads=self.io_threads,
+                stamps=True,
+            )
+        stale: list[CalcSpec] = []
+        keys: list[_Key] = []
+        for spec in self.specs:
+            key = (
+                files.is_file(spec.input_path),
+                files.stamp(spec.output_path),
+                files.stamp(spec.output_path.with_suffix(".err")),
+                files.submission_exists(spec.input_path),
+            )
+            if self._keys.get(spec.input_path) != key:
+                stale.append(spec)
+                keys.append(key)
+        if not stale:
+            return []
+
+        fresh = get_statuses(
+            stale,
+            self.cache,
+            jobs=self.jobs,
+            io_threads=self.io_threads,
+            files=files,
+            ledger=self.ledger,
+            recheck=self.recheck,
+        )
+        changes = []
+        for spec, key, status in zip(stale, keys, fresh, strict=True):
+            self._keys[spec.input_path] = key
+            old = self._statuses.get(spec.input_path)
+            self._statuses[spec.input_path] = status
+            if status != old:
+                changes.append(StatusChange(spec, old, status))
+        return changes
+
+    def statuses(self, specs: Sequence[CalcSpec]) -> list[tuple[Status, str]]:
+        """The statuses of *specs* as of the last :meth:`refresh`."""
+        return [self._statuses[spec.input_path] for spec in specs]
+
+
+def watch_all(
+    registry: CalcRegistry,
+    *,
+    interval: float = 5.0,
+    jobs: int = 1,
+    io_threads: int = 1,
+    recheck: bool = False,
+    rounds: int | None = None,
+) -> None:
+    """Print the grouped report, then every *interval* seconds only what changed.
+
+    Runs until interrupted (Ctrl-C), or for *rounds* refreshes after the first.
+    """
+    groups = {mk: _interleave_opt_sp(registry.by_method(mk)) for mk in registry.method_keys}
+    with OutputCache.open(registry.base_dir) as cache, JobLedger.open(registry.base_dir) as ledger:
+        watcher = StatusWatcher(
+            (spec for specs in groups.values() for spec in specs),
+            cache,
+            ledger=ledger,
+            jobs=jobs,
+            io_threads=io_threads,
+            recheck=recheck,
+        )
+        watcher.refresh()
+        _report_all(registry, watcher.statuses)
+        done = 0
+        try:
+            while rounds is None or done < rounds:
+                time.sleep(interval)
+                started = time.monotonic()
+                changes = watcher.refresh()
+                elapsed = time.monotonic() - started
+                log.debug("Refreshed %d calculations in %.2fs", len(watcher.specs), elapsed)
+                if changes:
+                    _report_changes(registry, groups, watcher, changes)
+                done += 1
+        except KeyboardInterrupt:
+            pass
+
+
+def _report_changes(
+    registry: CalcRegistry,
+    groups: dict[str, list[CalcSpec]],
+    watcher: StatusWatcher,
+    changes: list[StatusChange],
+) -> None:
+    """Print the changed rows, then the counts of each method group they belong to."""
+    stamp = time.strftime("%H:%M:%S")
+    for spec, old, (status, detail) in changes:
+        mode = "SP" if spec.id.mode == Mode.SP else "OPT"
+        before = old[0].value if old is not None else "-"
+        _report.info(
+            f"{stamp} {_rel_display(spec, registry.base_dir)} | {mode} | "
+            f"{before} -> {status.value} | {detail}"
+        )
+    touched = {change.spec.id.method_key for change in changes}
+    for mk, specs in groups.items():
+        if mk in touched:
+            counts = Counter(status.value for status, _ in watcher.statuses(specs))
+            summary = ", ".join(f"{s} {c}" for s, c in counts.items())
+            _report.info(f"{stamp}     Summary for {mk}: {summary}")
@@ -2,24 +2,132 @@
 
 from __future__ import annotations
 
+import gzip
+import lzma
 import math
+import mmap
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import IO, cast
 
 from pya3eda import constants as C
+from pya3eda.errors import PyA3EDAError
 
 # ---------------------------------------------------------------------------
 # File I/O
 # ---------------------------------------------------------------------------
 
+COMPRESSED_SUFFIXES = (".gz", ".zst", ".xz")
+"""Suffixes of compressed files, in the order :func:`find_file` looks for them."""
+
+_CHUNK = 1 << 20
+
 
 def read_text(path: str | Path) -> str | None:
-    """Read a text file and return its contents, or ``None`` if missing."""
-    p = Path(path)
-    if not p.is_file():
+    """Read a text file and return its contents, or ``None`` if missing.
+
+    A missing file is looked for compressed (see :func:`find_file`) and decompressed.
+    """
+    p = find_file(path)
+    if p is None:
         return None
+    if is_compressed(p):
+        with open_compressed(p) as fh:
+            return fh.read().decode("utf-8")
     return p.read_text(encoding="utf-8")
 
 
+def find_file(path: str | Path) -> Path | None:
+    """Return *path* if it is a file, else its compressed sibling, else ``None``.
+
+    The sibling is ``<name>.gz`` / ``<name>.zst`` / ``<name>.xz`` (first found), e.g.
+    ``job.out.gz`` for ``job.out`` after ``pya3eda compact``.
+    """
+    p = Path(path)
+    if p.is_file():
+        return p
+    for suffix in COMPRESSED_SUFFIXES:
+        sibling = p.with_name(p.name + suffix)
+        if sibling.is_file():
+            return sibling
+    return None
+
+
+def is_compressed(path: Path) -> bool:
+    """Whether *path* names a compressed file (by its suffix)."""
+    return path.suffix in COMPRESSED_SUFFIXES
+
+
+def open_compressed(path: Path, mode: str = "rb") -> IO[bytes]:
+    """Open the compressed file *path* as a binary stream, decompressing on read.
+
+    *mode* is ``"rb"`` or ``"wb"`` (compressing on write); the format follows the
+    suffix. ``.zst`` needs the optional ``zstandard`` package.
+    """
+    if path.suffix == ".gz":
+        return cast("IO[bytes]", gzip.open(path, mode))
+    if path.suffix == ".xz":
+        return cast("IO[bytes]", lzma.open(path, mode))
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise PyA3EDAError(
+            f"{path.name}: zstd files need the 'zstandard' package (pip install 'pya3eda[zstd]')"
+        ) from exc
+    return cast("IO[bytes]", zstandard.open(path, mode))
+
+
+def read_ends(path: Path, size: int) -> tuple[bytes, bytes, int]:
+    """Stream the file at *path* once, keeping only its first and last *size* bytes.
+
+    Returns ``(head, tail, total_size)``; a compressed file is decompressed as a
+    stream, so memory stays bounded by *size* whatever the file's length. When
+    ``len(head) == total_size`` the head is the whole content.
+    """
+    head = bytearray()
+    tail = bytearray()
+    total = 0
+    with open_compressed(path) if is_compressed(path) else path.open("rb") as fh:
+        while chunk := fh.read(_CHUNK):
+            total += len(chunk)
+            if len(head) < size:
+                head += chunk[: size - len(head)]
+            tail += chunk
+            if len(tail) > 2 * size:
+                del tail[:-size]
+    return bytes(head), bytes(tail[-size:]), total
+
+
+@contextmanager
+def map_file(path: str | Path) -> Iterator[mmap.mmap | bytes | None]:
+    """Map a file read-only for the byte-level parsers; ``None`` if missing.
+
+    Pages are read on demand and shared through the OS page cache, so parsing a
+    large output neither decodes nor copies it (and parallel readers share one
+    copy). An empty file, which cannot be mapped, yields ``b""``. The map is
+    closed on exit: decode everything needed from it inside the ``with`` block.
+
+    A compressed sibling (see :func:`find_file`) cannot be mapped: it is
+    decompressed in full and yielded as ``bytes``. Readers that only need the
+    ends of an output stream them with :func:`read_ends` instead.
+    """
+    p = find_file(path)
+    if p is None:
+        yield None
+        return
+    if is_compressed(p):
+        with open_compressed(p) as fh:
+            yield fh.read()
+        return
+    with p.open("rb") as fh:
+        if p.stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
 def write_text(path: str | Path, content: str) -> None:
     """Write *content* to *path*, creating parent directories as needed."""
     p = Path(path)
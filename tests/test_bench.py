@@ -0,0 +1,150 @@
+"""Tests for pya3eda.bench — parser micro-benchmarks on synthetic outputs."""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pya3eda.bench import (
+    BUFFERS,
+    CASES,
+    REPORT_SCHEMA,
+    Comparison,
+    OutputShape,
+    compare_reports,
+    format_report,
+    generate_outputs,
+    load_report,
+    run_parse_benchmarks,
+    write_report,
+)
+from pya3eda.errors import PyA3EDAError
+from pya3eda.parser import qchem, xyz
+from pya3eda.parser.trajectory import parse_trajectory
+
+SMALL = OutputShape(cycles=6, atoms=7, modes=5, scf_iterations=4, fragments=2)
+
+
+@pytest.fixture(scope="module")
+def report() -> dict[str, object]:
+    """A report over small outputs."""
+    return run_parse_benchmarks(SMALL, repeat=2)
+
+
+class TestOutputs:
+    def test_every_parser_is_benchmarked(self) -> None:
+        names = {case.name.split("[")[0] for case in CASES}
+        public = {
+            name
+            for name, func in vars(qchem).items()
+            if name.startswith("parse_") and func.__module__ == qchem.__name__
+        }
+        assert public | {"parse_output_xyz", "parse_output_fragments"} <= names
+
+    def test_opt_output_parses_to_its_shape(self) -> None:
+        text = generate_outputs(SMALL)["opt"]
+        summary = qchem.scan_opt_output(text)
+        assert summary.opt_converged
+        assert summary.imag_freq == 0
+        assert summary.geometry is not None and summary.geometry.n_atoms == SMALL.atoms
+        layout = xyz.parse_output_fragments(text)
+        assert layout is not None
+        assert [f.n_atoms for f in layout.fragments] == [3, 4]
+        trajectory = parse_trajectory(text)
+        assert trajectory is not None
+        assert trajectory.coords.shape == (SMALL.cycles + 1, SMALL.atoms, 3)
+        assert not math.isnan(trajectory.max_gradients[0])
+        assert qchem.parse_status(text)[0] == "SUCCESSFUL"
+
+    def test_running_output_has_no_outcome(self) -> None:
+        assert qchem.parse_status(generate_outputs(SMALL)["running"])[0] == "running"
+
+    def test_eda_output_reads_the_last_values(self) -> None:
+        text = generate_outputs(SMALL)["eda"]
+        assert qchem.parse_cds_print(text) == pytest.approx(-2.411)
+        pol = qchem.parse_eda_energies(text, "pol_cat")
+        full = qchem.parse_eda_energies(text, "full_cat")
+        assert pol is not None and full is not None
+        assert pol.sp_energy_ha == pytest.approx(-1814.157030967601 - 0.01 / SMALL.cycles)
+        assert full.sp_energy_ha == pytest.approx(-1815.1481418253)
+        assert full.bsse_kcal is not None
+        smd = qchem.parse_smd(text)
+        assert smd is not None and smd.cds_kcal == pytest.approx(-2.411)
+
+    def test_outputs_grow_with_the_shape(self) -> None:
+        small, large = generate_outputs(SMALL), generate_outputs(SMALL._replace(cycles=12))
+        assert all(len(large[name]) > len(small[name]) for name in ("opt", "running", "eda"))
+
+
+class TestRunParseBenchmarks:
+    def test_report_layout(self, report: dict[str, object]) -> None:
+        assert report["schema"] == REPORT_SCHEMA
+        assert report["shape"] == SMALL._asdict()
+        assert report["repeat"] == 2
+        assert set(report["outputs"]) == {"opt", "running", "eda"}  # type: ignore[arg-type]
+        results = report["results"]
+        assert isinstance(results, list)
+        assert len(results) == len(CASES) * len(BUFFERS)
+        row = results[0]
+        assert set(row) == {
+            "name",
+            "output",
+            "buffer",
+            "best_s",
+            "median_s",
+            "mb_per_s",
+            "peak_bytes",
+        }
+        assert 0 < row["best_s"] <= row["median_s"]
+        assert row["peak_bytes"] > 0
+        json.dumps(report)  # machine-readable as-is
+
+    def test_rejects_no_repeats(self) -> None:
+        with pytest.raises(PyA3EDAError, match="repeat"):
+            run_parse_benchmarks(SMALL, repeat=0)
+
+    def test_unmeasurably_fast_call_has_no_rate(self) -> None:
+        with patch("pya3eda.bench.time.perf_counter", return_value=1.0):
+            quick = run_parse_benchmarks(SMALL, repeat=1, cases=CASES[:1])
+        row = quick["results"][0]
+        assert row["best_s"] == 0
+        assert row["mb_per_s"] is None
+        assert format_report(quick).splitlines()[2].split()[4] == "-"
+
+
+class TestReports:
+    def test_round_trip(self, tmp_path: Path, report: dict[str, object]) -> None:
+        path = tmp_path / "report.json"
+        write_report(report, path)
+        assert load_report(path) == report
+
+    @pytest.mark.parametrize("content", [None, "not json", '{"schema": 0}', "[]"])
+    def test_load_rejects_non_reports(self, tmp_path: Path, content: str | None) -> None:
+        path = tmp_path / "report.json"
+        if content is not None:
+            path.write_text(content)
+        with pytest.raises(PyA3EDAError, match="report"):
+            load_report(path)
+
+    def test_compare_pairs_common_cases(self, report: dict[str, object]) -> None:
+        results = report["results"]
+        assert isinstance(results, list)
+        baseline = report | {"results": [r | {"best_s": r["best_s"] / 2} for r in results[1:]]}
+        comparisons = compare_reports(baseline, report)
+        assert len(comparisons) == len(results) - 1
+        assert comparisons[0].ratio == pytest.approx(2.0)
+
+    def test_ratio_against_zero_baseline(self) -> None:
+        assert Comparison("parse_energy", "str", 0.0, 1.0).ratio == math.inf
+
+    def test_format_with_baseline(self, report: dict[str, object]) -> None:
+        text = format_report(report, report)
+        lines = text.splitlines()
+        assert "vs base" in lines[1]
+        assert len(lines) == 2 + len(CASES) * len(BUFFERS)
+        assert all(line.endswith("1.00x") for line in lines[2:])
+        assert "vs base" not in format_report(report)
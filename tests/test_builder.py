@@ -12,7 +12,9 @@ Tests cover:
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -49,7 +51,8 @@ from pya3eda.config import (
     TheoryConfig,
 )
 from pya3eda.errors import TemplateNotFoundError
-from pya3eda.ids import CalcID, CalcSpec
+from pya3eda.ids import CalcContext, CalcID, CalcSpec
+from pya3eda.listing import FileIndex
 from pya3eda.parser.xyz import XYZData
 from pya3eda.registry import CalcRegistry
 
@@ -185,12 +188,14 @@ def _make_spec(
         id=cid,
         input_path=input_path,
         output_path=input_path.with_suffix(".out"),
-        method_name=method_name,
-        basis_set=basis_set,
-        dispersion=dispersion,
-        solvent=solvent,
-        eda2=eda2,
-        sp_subfolder=sp_subfolder,
+        context=CalcContext(
+            method_name=method_name,
+            basis_set=basis_set,
+            dispersion=dispersion,
+            solvent=solvent,
+            eda2=eda2,
+            sp_subfolder=sp_subfolder,
+        ),
         is_fragmented=is_fragmented,
     )
 
@@ -764,7 +769,7 @@ class TestBuildStandard:
     def test_loads_and_builds(self, tmp_path: Path) -> None:
         tpl = _make_template_dir(tmp_path)
         _write_xyz(tpl, "water", _XYZ_3ATOM)
-        result = _build_standard(tpl, "water", opt_output_text=None)
+        result = _build_standard(tpl, "water", opt_geometry=None)
         assert result is not None
         text, n_atoms = result
         assert text.startswith("0 1\n")
@@ -772,7 +777,7 @@ class TestBuildStandard:
 
     def test_missing_template(self, tmp_path: Path) -> None:
         tpl = _make_template_dir(tmp_path)
-        result = _build_standard(tpl, "nonexistent", opt_output_text=None)
+        result = _build_standard(tpl, "nonexistent", opt_geometry=None)
         assert result is None
 
 
@@ -788,7 +793,7 @@ class TestBuildFragmentedInputs:
             catalyst="cat1",
             species="cat1-mol_a",
             calc_type=None,
-            opt_output_text=None,
+            opt_geometry=None,
         )
         assert result is not None
         text, n_atoms = result
@@ -807,7 +812,7 @@ class TestBuildFragmentedInputs:
             catalyst="cat1",
             species="cat1-mol_a",
             calc_type="full_cat",
-            opt_output_text=None,
+            opt_geometry=None,
         )
         assert result is not None
 
@@ -821,7 +826,7 @@ class TestBuildFragmentedInputs:
             catalyst="cat1",
             species="cat1-mol_a",
             calc_type=None,
-            opt_output_text=None,
+            opt_geometry=None,
         )
         assert result is None
 
@@ -835,7 +840,7 @@ class TestBuildFragmentedInputs:
             catalyst="cat1",
             species="cat1-mol_a",
             calc_type=None,
-            opt_output_text=None,
+            opt_geometry=None,
         )
         assert result is None
 
@@ -849,7 +854,7 @@ class TestBuildFragmentedInputs:
             catalyst="cat1",
             species="cat1-mol_a",
             calc_type=None,
-            opt_output_text=None,
+            opt_geometry=None,
         )
         assert result is None
 
@@ -871,7 +876,7 @@ class TestBuildFragmentedInputs:
             catalyst="cat1",
             species="cat1-A-B",
             calc_type=None,
-            opt_output_text=None,
+            opt_geometry=None,
         )
         assert result is not None
         text, n_atoms = result
@@ -1425,6 +1430,16 @@ class TestShouldOverwrite:
         # OPT_OUTPUT is SUCCESSFUL, not CRASH
         assert _should_overwrite(f, "CRASH") is False
 
+    def test_overwrite_uses_the_given_listing(self, tmp_path: Path) -> None:
+        f = tmp_path / "test.in"
+        f.write_text("content")
+        f.with_suffix(".out").write_text("SCF failed to converge")
+        files = FileIndex()
+        with patch("pya3eda.listing.os.scandir", wraps=os.scandir) as scandir:
+            assert files.is_file(f)
+            assert _should_overwrite(f, "CRASH", files=files) is True
+        assert scandir.call_count == 1
+
 
 # ===================================================================
 # 15. Full build_all integration
@@ -1648,6 +1663,53 @@ class TestBuildAll:
         )
         assert sp_spec.input_path.exists()
 
+    @staticmethod
+    def _sp_setup(root: Path) -> tuple[CalcRegistry, Path]:
+        """SP-enabled registry with OPT inputs built and one OPT output finished."""
+        base = root / "data"
+        base.mkdir(parents=True)
+        reg = CalcRegistry(_config_with_sp(), base)
+        tpl = _make_template_dir(root)
+        for name, xyz in [
+            ("mol_a", _XYZ_SUB),
+            ("mol_p", _XYZ_SUB),
+            ("tscomplex", _XYZ_SUB),
+            ("cat1", _XYZ_CAT),
+            ("preTS_cat1-mol_a", _XYZ_COMPOSITE),
+            ("postTS_cat1-mol_p", _XYZ_COMPOSITE),
+            ("ts_cat1-tscomplex", _XYZ_COMPOSITE),
+        ]:
+            _write_xyz(tpl, name, xyz)
+        build_all(reg, tpl, sp_strategy="never")
+        opt_spec = reg.get(
+            CalcID(method_key="HF_STO-3G_smd", stage="reactants", species="mol_a", mode="opt")
+        )
+        opt_spec.output_path.write_text(OPT_OUTPUT)
+        return reg, tpl
+
+    def test_parallel_geometries_match_serial(self, tmp_path: Path) -> None:
+        """jobs > 1 prefetches the OPT geometries but writes the same SP inputs."""
+        built = []
+        for jobs in (1, 2):
+            reg, tpl = self._sp_setup(tmp_path / f"jobs{jobs}")
+            build_all(reg, tpl, sp_strategy="always", jobs=jobs)
+            build_all(reg, tpl, sp_strategy="always", overwrite="all", jobs=jobs)
+            built.append(
+                {
+                    spec.input_path.relative_to(reg.base_dir): spec.input_path.read_text()
+                    for spec in reg.all_calcs
+                    if spec.id.mode == "sp"
+                }
+            )
+        assert built[0] and built[0] == built[1]
+
+    def test_parallel_geometries_skip_unregistered_opt(self, tmp_path: Path) -> None:
+        reg, tpl = self._sp_setup(tmp_path)
+        with patch.object(reg, "get", side_effect=KeyError):
+            build_all(reg, tpl, sp_strategy="always", jobs=2)
+        # Without their OPT, SP inputs fall back to the template geometry.
+        assert any(s.input_path.exists() for s in reg.all_calcs if s.id.mode == "sp")
+
     def test_missing_base_template(self, tmp_path: Path) -> None:
         """build_all raises FileNotFoundError if base_template.in missing."""
         cfg = _simple_config()
@@ -1842,7 +1904,7 @@ class TestBuildOneEdgeCases:
         """XYZ with invalid content → parse_xyz returns None → _build_standard returns None."""
         tpl = _make_template_dir(tmp_path)
         _write_xyz(tpl, "bad", "not valid xyz\n")
-        result = _build_standard(tpl, "bad", opt_output_text=None)
+        result = _build_standard(tpl, "bad", opt_geometry=None)
         assert result is None
 
     def test_build_standard_mol_build_fails(self, tmp_path: Path) -> None:
@@ -1852,7 +1914,7 @@ class TestBuildOneEdgeCases:
         from unittest.mock import patch
 
         with patch("pya3eda.builder.inputs.build_standard_molecule", return_value=None):
-            result = _build_standard(tpl, "badmol", opt_output_text=None)
+            result = _build_standard(tpl, "badmol", opt_geometry=None)
         assert result is None
 
     def test_build_fragmented_mol_build_fails(self, tmp_path: Path) -> None:
@@ -1870,7 +1932,7 @@ class TestBuildOneEdgeCases:
                 catalyst="cat1",
                 species="cat1-mol_a",
                 calc_type=None,
-                opt_output_text=None,
+                opt_geometry=None,
             )
         assert result is None
 
@@ -1886,7 +1948,7 @@ class TestBuildOneEdgeCases:
             catalyst="cat1",
             species="cat1-mol_a",
             calc_type=None,
-            opt_output_text=None,
+            opt_geometry=None,
         )
         assert result is None
 
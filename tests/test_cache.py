@@ -0,0 +1,276 @@
+"""Tests for pya3eda.cache — the persistent parsed-output cache."""
+
+from __future__ import annotations
+
+import math
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pya3eda import cache as cache_module
+from pya3eda.cache import CACHE_DIR, CacheKind, OutputCache, cached, cached_many, file_stamp
+from pya3eda.extractor.data import OptThermo, extract_one
+from pya3eda.ids import CalcContext, CalcID, CalcSpec, ExtractedData
+from pya3eda.status.checker import Status, get_status
+from tests.synthetic_outputs import OPT_OUTPUT
+
+_DAY_NS = 86_400 * 10**9
+
+
+class _Planted:
+    """Unpickling this would call ``exit``."""
+
+    def __reduce__(self) -> tuple[object, tuple[()]]:
+        return exit, ()
+
+
+_SP: CacheKind[float] = CacheKind("sp", float)
+_STATUS: CacheKind[tuple[str, str]] = CacheKind("status", tuple[str, str])
+
+
+def _aged(path: Path, content: str) -> Path:
+    """Write *content* with an mtime a day in the past (outside the racy window)."""
+    path.write_text(content, encoding="utf-8")
+    past = path.stat().st_mtime_ns - _DAY_NS
+    os.utime(path, ns=(past, past))
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    with OutputCache.open(tmp_path) as c:
+        yield c
+
+
+class TestFileStamp:
+    def test_missing(self, tmp_path: Path) -> None:
+        assert file_stamp(tmp_path / "absent.out") is None
+
+    def test_identity(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        path.write_text("abc")
+        st = path.stat()
+        assert file_stamp(path) == (3, st.st_mtime_ns, st.st_ino)
+
+    def test_compressed_stands_in_for_missing(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        compressed = tmp_path / "job.out.gz"
+        compressed.write_bytes(b"x")
+        st = compressed.stat()
+        assert file_stamp(path) == (1, st.st_mtime_ns, st.st_ino)
+
+    def test_vanished_after_lookup(self, tmp_path: Path) -> None:
+        with patch.object(cache_module, "find_file", return_value=tmp_path / "gone.out"):
+            assert file_stamp(tmp_path / "job.out") is None
+
+
+class TestOutputCache:
+    def test_creates_state_dir(self, tmp_path: Path, cache: OutputCache) -> None:
+        assert (tmp_path / CACHE_DIR / "cache.sqlite").is_file()
+
+    def test_round_trip(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        cache.store(_STATUS, path, stamps, ("CRASH", "boom"), extra=True)
+        assert cache.lookup(_STATUS, path, stamps, extra=True) == ("CRASH", "boom")
+
+    def test_persists_across_sessions(self, tmp_path: Path) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        with OutputCache.open(tmp_path) as first:
+            first.store(_SP, path, stamps, 1.5)
+        with OutputCache.open(tmp_path) as second:
+            assert second.lookup(_SP, path, stamps) == 1.5
+
+    def test_changed_file_misses(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        cache.store(_SP, path, (file_stamp(path),), 1.5)
+        _aged(path, "xy")
+        assert cache.lookup(_SP, path, (file_stamp(path),)) is None
+
+    def test_different_extra_misses(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        cache.store(_SP, path, stamps, 1.5, extra="full_cat")
+        assert cache.lookup(_SP, path, stamps, extra="pol_cat") is None
+
+    def test_recently_modified_file_is_not_stored(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = tmp_path / "job.out"
+        path.write_text("still being written")
+        stamps = (file_stamp(path),)
+        cache.store(_SP, path, stamps, 1.5)
+        assert cache.lookup(_SP, path, stamps) is None
+
+    def test_missing_file_stamp_is_storable(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = tmp_path / "job.out"
+        cache.store(_STATUS, path, (None,), ("nofile", ""))
+        assert cache.lookup(_STATUS, path, (None,)) == ("nofile", "")
+
+    def test_other_version_is_discarded(self, tmp_path: Path) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        with OutputCache.open(tmp_path) as first:
+            first.store(_SP, path, stamps, 1.5)
+        with (
+            patch.object(cache_module, "_SCHEMA", cache_module._SCHEMA + 1),
+            OutputCache.open(tmp_path) as second,
+        ):
+            assert second.lookup(_SP, path, stamps) is None
+
+    def test_unreadable_value_misses(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        cache.store(_SP, path, stamps, 1.5)
+        cache._conn.execute("UPDATE entries SET value = ?", (b"not JSON",))  # type: ignore[union-attr]
+        assert cache.lookup(_SP, path, stamps) is None
+
+    def test_value_of_another_kind_misses(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        cache.store(_SP, path, stamps, 1.5)
+        assert cache.lookup(CacheKind("sp", tuple[str, str]), path, stamps) is None
+
+    def test_pickles_are_never_loaded(self, tmp_path: Path, cache: OutputCache) -> None:
+        """A planted pickle is not unpickled (that could run arbitrary code)."""
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        cache.store(_SP, path, stamps, 1.5)
+        blob = pickle.dumps(_Planted())
+        cache._conn.execute("UPDATE entries SET value = ?", (blob,))  # type: ignore[union-attr]
+        with patch("pickle.loads", side_effect=AssertionError("unpickled")):
+            assert cache.lookup(_SP, path, stamps) is None
+
+    def test_non_finite_floats_round_trip(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        kind: CacheKind[tuple[ExtractedData, OptThermo]] = CacheKind(
+            "extracted", tuple[ExtractedData, OptThermo]
+        )
+        cid = CalcID(method_key="m", stage="reactants", species="mol", calc_type="full_cat")
+        value = (ExtractedData(calc_id=cid, energy=math.inf), OptThermo(*[None] * 7, math.inf))
+        cache.store(kind, path, stamps, value)
+        assert cache.lookup(kind, path, stamps) == value
+        assert repr(kind) == "CacheKind('extracted')"
+
+    def test_periodic_commit(self, tmp_path: Path) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        with patch.object(cache_module, "_COMMIT_EVERY", 1):
+            c = OutputCache.open(tmp_path)
+            c.store(_SP, path, stamps, 1.5)
+        # Committed without close(): a second connection already sees it.
+        with OutputCache.open(tmp_path) as other:
+            assert other.lookup(_SP, path, stamps) == 1.5
+        c.close()
+
+    def test_unavailable_directory_disables_cache(self, tmp_path: Path) -> None:
+        with OutputCache.open(tmp_path / "missing" / "base") as c:
+            c.store(_SP, tmp_path / "job.out", (None,), 1.5)
+            assert c.lookup(_SP, tmp_path / "job.out", (None,)) is None
+        assert not (tmp_path / "missing").exists()
+
+    def test_database_errors_are_misses(self, tmp_path: Path) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        stamps = (file_stamp(path),)
+        broken = sqlite3.connect(":memory:")  # no tables → every statement fails
+        c = OutputCache(broken)
+        c.store(_SP, path, stamps, 1.5)
+        assert c.lookup(_SP, path, stamps) is None
+        c.close()
+
+    def test_failed_commit_is_dropped(self, tmp_path: Path) -> None:
+        class _NoCommit(sqlite3.Connection):
+            def commit(self) -> None:
+                raise sqlite3.OperationalError("database is locked")
+
+        c = OutputCache(sqlite3.connect(":memory:", factory=_NoCommit))
+        c.close()  # logs and closes instead of raising
+
+
+class TestCached:
+    def test_without_cache_always_parses(self, tmp_path: Path) -> None:
+        calls = []
+        for _ in range(2):
+            cached(None, _SP, (tmp_path / "job.out",), lambda: calls.append(1) or 1.5)
+        assert len(calls) == 2
+
+    def test_parses_once_while_unchanged(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        calls = []
+        for _ in range(2):
+            assert cached(cache, _SP, (path,), lambda: calls.append(1) or 1.5) == 1.5
+        assert len(calls) == 1
+
+    def test_none_is_not_stored(self, tmp_path: Path, cache: OutputCache) -> None:
+        path = _aged(tmp_path / "job.out", "x")
+        calls = []
+        for _ in range(2):
+            assert cached(cache, _SP, (path,), lambda: calls.append(1)) is None
+        assert len(calls) == 2
+
+    def test_many_parses_only_misses(self, tmp_path: Path, cache: OutputCache) -> None:
+        paths = [_aged(tmp_path / f"job{i}.out", "x") for i in range(3)]
+        cached(cache, _SP, (paths[1],), lambda: 1.5)
+        batches: list[list[int]] = []
+
+        def parse(misses: list[int]) -> list[float]:
+            batches.append(misses)
+            return [float(i) for i in misses]
+
+        entries = [((p,), ()) for p in paths]
+        assert cached_many(cache, _SP, entries, parse) == [0.0, 1.5, 2.0]
+        assert cached_many(cache, _SP, entries, parse) == [0.0, 1.5, 2.0]
+        assert batches == [[0, 2]]
+
+
+def _spec(tmp_path: Path, mode: str = "opt") -> CalcSpec:
+    inp = tmp_path / f"mol_{mode}.in"
+    inp.touch()
+    return CalcSpec(
+        id=CalcID(method_key="m", stage="reactants", species="mol", mode=mode),
+        input_path=inp,
+        output_path=inp.with_suffix(".out"),
+        context=CalcContext(
+            method_name="HF", basis_set="STO-3G", dispersion="false", solvent="false"
+        ),
+    )
+
+
+class TestCallers:
+    """Status and extraction are served from the cache for unchanged outputs."""
+
+    def test_get_status_reuses_parse(self, tmp_path: Path, cache: OutputCache) -> None:
+        spec = _spec(tmp_path)
+        _aged(spec.output_path, OPT_OUTPUT)
+        first = get_status(spec, cache)
+        with patch("pya3eda.status.checker.parse_status_file", side_effect=AssertionError):
+            assert get_status(spec, cache) == first == (Status.SUCCESSFUL, first[1])
+
+    def test_get_status_keys_on_the_sentinel(self, tmp_path: Path, cache: OutputCache) -> None:
+        spec = _spec(tmp_path)
+        _aged(spec.output_path, OPT_OUTPUT)
+        assert get_status(spec, cache)[0] == Status.SUCCESSFUL
+        (tmp_path / "mol_opt.in_1234.5678").touch()
+        assert get_status(spec, cache)[0] == Status.RUNNING
+
+    def test_extract_one_reuses_parse(self, tmp_path: Path, cache: OutputCache) -> None:
+        opt = _spec(tmp_path)
+        sp = _spec(tmp_path, "sp")
+        _aged(opt.output_path, OPT_OUTPUT)
+        _aged(sp.output_path, "Total energy = -100.0\nThank you very much\n")
+        opt_cache: dict = {}
+        first = [extract_one(s, "all", opt_cache, cache) for s in (opt, sp)]
+        with (
+            patch("pya3eda.extractor.data.parse_many", side_effect=AssertionError),
+            patch("pya3eda.extractor.data.map_file", side_effect=AssertionError),
+        ):
+            again = [extract_one(s, "all", opt_cache, cache) for s in (opt, sp)]
+        assert again == first
+        assert first[1] is not None
+        assert first[1].sp_energy is not None
+        # Only the OPT's thermo is kept for its SPs, not the parsed output.
+        assert [type(v) for v in opt_cache.values()] == [OptThermo]
@@ -105,6 +105,99 @@ class TestParsingAndDispatch:
             result = runner.invoke(app, ["status", str(config_path)])
         assert result.exit_code == 0
         mock_ca.assert_called_once()
+        assert mock_ca.call_args.kwargs["jobs"] == 1
+        assert mock_ca.call_args.kwargs["recheck"] is False
+
+    def test_status_recheck(self, config_path: Path) -> None:
+        with patch("pya3eda.status.checker.check_all") as mock_ca:
+            result = runner.invoke(app, ["status", str(config_path), "--recheck"])
+        assert result.exit_code == 0
+        assert mock_ca.call_args.kwargs["recheck"] is True
+
+    def test_jobs_option(self, config_path: Path) -> None:
+        with (
+            patch("pya3eda.status.checker.check_all") as mock_ca,
+            patch("pya3eda.builder.inputs.build_all") as mock_ba,
+            patch("pya3eda.extractor.data.extract_all", return_value={}) as mock_ea,
+            patch("pya3eda.pipeline.finalize_extraction"),
+        ):
+            for command in ("status", "build", "extract"):
+                result = runner.invoke(app, [command, str(config_path), "--jobs", "8"])
+                assert result.exit_code == 0
+        for mock in (mock_ca, mock_ba, mock_ea):
+            assert mock.call_args.kwargs["jobs"] == 8
+
+    def test_status_watch(self, config_path: Path) -> None:
+        with (
+            patch("pya3eda.status.watch.watch_all") as mock_wa,
+            patch("pya3eda.status.checker.check_all") as mock_ca,
+        ):
+            args = ["status", str(config_path), "--watch", "--interval", "2"]
+            result = runner.invoke(app, args)
+        assert result.exit_code == 0
+        mock_ca.assert_not_called()
+        assert mock_wa.call_args.kwargs["interval"] == 2.0
+
+    def test_status_format(self, config_path: Path) -> None:
+        with (
+            patch("pya3eda.status.export.export_all") as mock_ex,
+            patch("pya3eda.status.checker.check_all") as mock_ca,
+        ):
+            args = ["status", str(config_path), "--format", "csv", "--summary-only"]
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            mock_ca.assert_not_called()
+            assert mock_ex.call_args.args[1] == "csv"
+            assert mock_ex.call_args.kwargs["summary_only"] is True
+
+            result = runner.invoke(app, ["status", str(config_path), "--summary-only"])
+            assert result.exit_code == 0
+            assert mock_ca.call_args.kwargs["summary_only"] is True
+
+    def test_status_watch_rejects_export(self, config_path: Path) -> None:
+        with patch("pya3eda.status.watch.watch_all") as mock_wa:
+            args = ["status", str(config_path), "--watch", "--format", "jsonl"]
+            result = runner.invoke(app, args)
+        assert result.exit_code == 6
+        mock_wa.assert_not_called()
+
+    def test_io_threads_option(self, config_path: Path) -> None:
+        with (
+            patch("pya3eda.status.checker.check_all") as mock_ca,
+            patch("pya3eda.runner.executor.run_all") as mock_ra,
+            patch("pya3eda.extractor.data.extract_all", return_value={}) as mock_ea,
+            patch("pya3eda.pipeline.finalize_extraction"),
+        ):
+            for command in ("status", "run", "extract"):
+                result = runner.invoke(app, [command, str(config_path), "--io-threads", "16"])
+                assert result.exit_code == 0
+            assert runner.invoke(app, ["status", str(config_path), "--io-threads", "0"]).exit_code
+        for mock in (mock_ca, mock_ra, mock_ea):
+            assert mock.call_args.kwargs["io_threads"] == 16
+
+    def test_compact(self, config_path: Path) -> None:
+        with patch("pya3eda.compact.compact_all") as mock_cc:
+            result = runner.invoke(app, ["compact", str(config_path), "--format", "xz"])
+            assert result.exit_code == 0
+            assert mock_cc.call_args.kwargs == {"fmt": "xz", "jobs": 1, "force": False}
+            assert runner.invoke(app, ["compact", str(config_path), "--force"]).exit_code == 0
+            assert mock_cc.call_args.kwargs["force"] is True
+
+    def test_bench_parse(self, tmp_path: Path) -> None:
+        report = tmp_path / "report.json"
+        small = ["--cycles", "2", "--atoms", "3", "--modes", "2", "-r", "1"]
+        result = runner.invoke(app, ["bench", "parse", *small, "-o", str(report)])
+        assert result.exit_code == 0
+        assert "parse_output_fragments" in result.output
+        result = runner.invoke(app, ["bench", "parse", *small, "--baseline", str(report)])
+        assert result.exit_code == 0
+        assert "vs base" in result.output
+
+    def test_bench_parse_bad_baseline(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "report.json"
+        baseline.write_text("[]")
+        result = runner.invoke(app, ["bench", "parse", "--baseline", str(baseline)])
+        assert result.exit_code == 1
 
     def test_unknown_flag_errors(self, config_path: Path) -> None:
         result = runner.invoke(app, ["build", str(config_path), "--bad-flag"])
@@ -141,6 +234,16 @@ class TestExtract:
         m_pp.assert_not_called()
         m_pb.assert_not_called()
 
+    @pytest.mark.parametrize("flag", [[], ["--incremental"]])
+    def test_incremental_option(self, config_path: Path, flag: list[str]) -> None:
+        with (
+            patch("pya3eda.extractor.data.extract_all", return_value={}) as mock_ea,
+            patch("pya3eda.pipeline.finalize_extraction"),
+        ):
+            result = runner.invoke(app, ["extract", str(config_path), *flag])
+        assert result.exit_code == 0
+        assert mock_ea.call_args.kwargs["incremental"] is bool(flag)
+
 
 class TestErrorTranslation:
     def test_missing_config_rejected(self) -> None:
@@ -170,6 +273,8 @@ class TestDefaultCommand:
         from pya3eda.cli import _default_command
 
         assert _default_command(["build", "config.yaml"]) == ["build", "config.yaml"]
+        assert _default_command(["compact", "config.yaml"]) == ["compact", "config.yaml"]
+        assert _default_command(["bench", "parse"]) == ["bench", "parse"]
 
     def test_skips_log_value(self) -> None:
         from pya3eda.cli import _default_command
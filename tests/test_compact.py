@@ -0,0 +1,178 @@
+"""Tests for pya3eda.compact — compressing the outputs of finished calculations."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pya3eda.builder.molecule import read_opt_geometry
+from pya3eda.compact import compact_all, compress_file
+from pya3eda.config import CatalystConfig, Config, LevelConfig, SpeciesConfig, TheoryConfig
+from pya3eda.errors import RunOptionError
+from pya3eda.extractor.data import extract_all, extract_one
+from pya3eda.ids import CalcSpec
+from pya3eda.registry import CalcRegistry
+from pya3eda.status.checker import Status, get_status
+from tests.synthetic_outputs import OPT_OUTPUT, SP_OUTPUT
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> CalcRegistry:
+    """Every input written; a successful reactant OPT, a crashed product OPT.
+
+    Outputs are dated in the past, so an incremental extraction records them.
+    """
+    config = Config(
+        levels=[LevelConfig(opt=TheoryConfig(method="HF", basis="STO-3G", solvent="smd"))],
+        reactants=[SpeciesConfig(name="mol_a")],
+        products=[SpeciesConfig(name="mol_p")],
+        catalysts=[CatalystConfig(name="cat1")],
+    )
+    reg = CalcRegistry(config, tmp_path)
+    for spec in reg.all_calcs:
+        spec.input_path.parent.mkdir(parents=True, exist_ok=True)
+        spec.input_path.touch()
+        if spec.id.species == "mol_a" and spec.id.catalyst is None:
+            spec.output_path.write_text(OPT_OUTPUT)
+        elif spec.id.species == "mol_p" and spec.id.catalyst is None:
+            spec.output_path.write_text("Running on host\n Q-Chem fatal error occurred\n")
+        if spec.output_path.exists():
+            os.utime(spec.output_path, (1e9, 1e9))
+    return reg
+
+
+def _output(reg: CalcRegistry, species: str) -> Path:
+    return next(
+        s.output_path for s in reg.all_calcs if s.id.species == species and s.id.catalyst is None
+    )
+
+
+class TestCompressFile:
+    def test_replaces_the_original(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        path.write_text(OPT_OUTPUT)
+        mtime = path.stat().st_mtime_ns
+        target = compress_file(path)
+        assert target == tmp_path / "job.out.gz"
+        assert not path.exists()
+        assert gzip.decompress(target.read_bytes()).decode() == OPT_OUTPUT
+        assert target.stat().st_mtime_ns == mtime
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["job.out.gz"]
+
+    def test_interrupted_compression_keeps_the_original(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        path.write_text(OPT_OUTPUT)
+        with (
+            patch("pya3eda.compact.shutil.copyfileobj", side_effect=KeyboardInterrupt),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            compress_file(path, "xz")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["job.out"]
+
+
+class TestCompactAll:
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_compresses_successful_outputs_only(self, registry: CalcRegistry, jobs: int) -> None:
+        done, crashed = _output(registry, "mol_a"), _output(registry, "mol_p")
+        extract_all(registry, incremental=True)
+        assert compact_all(registry, fmt="zst", jobs=jobs) == [done.with_name(done.name + ".zst")]
+        assert not done.exists()
+        assert crashed.exists()
+        # A second run finds nothing left to compress.
+        assert compact_all(registry, jobs=jobs) == []
+
+    def test_compacted_outputs_read_the_same(self, registry: CalcRegistry) -> None:
+        spec = next(s for s in registry.all_calcs if s.output_path == _output(registry, "mol_a"))
+        before = get_status(spec), extract_one(spec, "all", {})
+        compact_all(registry, jobs=1, force=True)
+        assert (get_status(spec), extract_one(spec, "all", {})) == before
+        assert before[0][0] == Status.SUCCESSFUL
+
+    def test_skips_outputs_not_extracted(
+        self, registry: CalcRegistry, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        done = _output(registry, "mol_a")
+        extract_all(registry)  # not incremental: nothing recorded
+        assert compact_all(registry, jobs=1) == []
+        assert done.exists()
+        assert "Skipped 1 successful output(s) not yet extracted" in caplog.text
+        # A record gone stale (the output changed since) counts as not extracted.
+        extract_all(registry, incremental=True)
+        done.write_text(OPT_OUTPUT + "\n")
+        os.utime(done, (2e9, 2e9))
+        assert compact_all(registry, jobs=1) == []
+        assert compact_all(registry, jobs=1, force=True) == [done.with_name(done.name + ".gz")]
+
+    @staticmethod
+    def _opt_and_sp(tmp_path: Path) -> CalcRegistry:
+        """A gas-phase registry with an SP level, every input written."""
+        config = Config(
+            levels=[
+                LevelConfig(
+                    opt=TheoryConfig(method="HF", basis="STO-3G"),
+                    sp=[TheoryConfig(method="B3LYP", basis="STO-3G")],
+                )
+            ],
+            reactants=[SpeciesConfig(name="mol_a")],
+            products=[SpeciesConfig(name="mol_p")],
+        )
+        reg = CalcRegistry(config, tmp_path)
+        for spec in reg.all_calcs:
+            spec.input_path.parent.mkdir(parents=True, exist_ok=True)
+            spec.input_path.touch()
+        return reg
+
+    @staticmethod
+    def _specs(reg: CalcRegistry) -> tuple[CalcSpec, CalcSpec]:
+        """The OPT and SP specs of ``mol_a``."""
+        opt, sp = (
+            next(s for s in reg.all_calcs if s.id.species == "mol_a" and s.id.mode == mode)
+            for mode in ("opt", "sp")
+        )
+        return opt, sp
+
+    def test_sp_of_a_compressed_opt(self, tmp_path: Path) -> None:
+        """An SP extracted after its OPT was compacted is compacted in turn."""
+        reg = self._opt_and_sp(tmp_path)
+        opt, sp = self._specs(reg)
+        opt.output_path.write_text(OPT_OUTPUT)
+        os.utime(opt.output_path, (1e9, 1e9))
+        extract_all(reg, incremental=True)
+        assert compact_all(reg, jobs=1) == [opt.output_path.with_name(opt.output_path.name + ".gz")]
+        sp.output_path.write_text(SP_OUTPUT)
+        os.utime(sp.output_path, (1e9, 1e9))
+        assert compact_all(reg, jobs=1) == []  # not extracted yet
+        extract_all(reg, incremental=True)
+        assert compact_all(reg, jobs=1) == [sp.output_path.with_name(sp.output_path.name + ".gz")]
+
+    def test_compacted_outputs_are_streamed(self, tmp_path: Path) -> None:
+        """SP energies and SP-input geometries are read without decompressing whole outputs."""
+        reg = self._opt_and_sp(tmp_path)
+        opt, sp = self._specs(reg)
+        for spec, text in ((opt, OPT_OUTPUT), (sp, SP_OUTPUT)):
+            spec.output_path.write_text(text)
+            os.utime(spec.output_path, (1e9, 1e9))
+        before = extract_all(reg), read_opt_geometry(opt.output_path)
+        assert compact_all(reg, jobs=1, force=True) == [
+            spec.output_path.with_name(spec.output_path.name + ".gz") for spec in (opt, sp)
+        ]
+        with (
+            patch("pya3eda.extractor.data.map_file", side_effect=AssertionError),
+            patch("pya3eda.builder.molecule.map_file", side_effect=AssertionError),
+        ):
+            assert (extract_all(reg), read_opt_geometry(opt.output_path)) == before
+        assert before[1] is not None
+
+    def test_empty_compressed_opt_has_no_geometry(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        path.touch()
+        compress_file(path)
+        assert read_opt_geometry(path) is None
+
+    def test_unknown_format(self, registry: CalcRegistry) -> None:
+        with pytest.raises(RunOptionError, match="bz2"):
+            compact_all(registry, fmt="bz2")
@@ -5,12 +5,14 @@ All tests are self-contained using synthetic YAML config.
 
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
 from pya3eda.config import (
+    ComplexConfig,
     Config,
     LevelConfig,
     SpeciesConfig,
@@ -145,6 +147,59 @@ class TestConfig:
             )
 
 
+# ===================================================================
+# ComplexConfig
+# ===================================================================
+
+
+class TestComplexConfig:
+    def test_defaults_unbounded(self) -> None:
+        cc = ComplexConfig()
+        assert (cc.max_size, cc.allowed, cc.generator) == (None, None, None)
+        assert cc.generator_func() is None
+        assert ComplexConfig(generator=None, max_size=None) == cc
+
+    def test_max_size_positive(self) -> None:
+        with pytest.raises(ValueError, match="max_size must be at least 1"):
+            ComplexConfig(max_size=0)
+
+    def test_generator_resolved(self) -> None:
+        assert ComplexConfig(generator="itertools:chain").generator_func() is itertools.chain
+
+    @pytest.mark.parametrize(
+        ("path", "message"),
+        [
+            ("itertools.chain", "must be 'module:function'"),
+            (":chain", "must be 'module:function'"),
+            ("no_such_module_xyz:f", "cannot import generator"),
+            ("itertools:no_such_function", "cannot import generator"),
+            ("math:pi", "is not callable"),
+        ],
+    )
+    def test_bad_generator(self, path: str, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            ComplexConfig(generator=path)
+
+    def test_allowed_and_generator_exclusive(self) -> None:
+        with pytest.raises(ValueError, match="either 'allowed' or 'generator'"):
+            ComplexConfig(allowed=[["A"]], generator="itertools:chain")
+
+    @pytest.mark.parametrize("combo", [[], ["A", "B"], ["A", "missing"], ["free"]])
+    def test_allowed_must_name_one_included_side(self, combo: list[str]) -> None:
+        with pytest.raises(ValueError, match=r"complexes\.allowed entry"):
+            Config(
+                levels=[LevelConfig(opt=TheoryConfig(method="hf", basis="b"))],
+                reactants=[SpeciesConfig(name="A"), SpeciesConfig(name="free", include=False)],
+                products=[SpeciesConfig(name="B")],
+                complexes=ComplexConfig(allowed=[combo]),
+            )
+
+    def test_load_from_yaml(self, tmp_path: Path) -> None:
+        cfg_path = tmp_path / "bounded.yaml"
+        cfg_path.write_text(SAMPLE_CONFIG_YAML + "complexes:\n  max_size: 2\n")
+        assert load_config(cfg_path).complexes == ComplexConfig(max_size=2)
+
+
 # ===================================================================
 # load_config
 # ===================================================================
@@ -411,3 +411,19 @@ class TestExportAll:
         # At least raw data + xyz should be written
         all_files = list(results_dir.rglob("*.*"))
         assert len(all_files) >= 2
+
+    def test_each_method_gets_only_its_own_results(self, tmp_path: Path) -> None:
+        registry = MagicMock()
+        registry.method_keys = [MK, "other"]
+        own = _cid(species="water")
+        other = own.replace(method_key="other")
+        extracted = {cid: _ed(cid, energy=-100.0) for cid in (own, other)}
+        dd_list = [_dd("cat1", "E", barrier_uncat=50.0, barrier_full=40.0, dd_complete=-10.0)]
+
+        export_all(registry, extracted, {}, dd_list, tmp_path)
+
+        for mk in (MK, "other"):
+            (raw,) = (tmp_path / "results" / mk / "raw_data").glob("*.csv")
+            assert raw.read_text().count("water") == 1
+        assert list((tmp_path / "results" / MK / "delta_delta").glob("*.csv"))
+        assert not (tmp_path / "results" / "other" / "delta_delta").exists()
@@ -18,14 +18,8 @@ from pya3eda.extractor.barriers import (
     _compute_for_catalyst,
     _should_use_preTS,
 )
-from pya3eda.extractor.stages import (
-    _argmin,
-    _build_one,
-    _build_stage_best,
-    _g_ni_for_stage,
-    _normalize,
-    _sum_energies,
-)
+from pya3eda.extractor.stages import ProfileMatrix
+from pya3eda.extractor.table import ExtractedTable
 from pya3eda.ids import (
     CalcID,
     DeltaDeltaData,
@@ -45,6 +39,7 @@ from tests.synthetic_outputs import (
     EDA_FULL_SP_OUTPUT,
     EDA_POL_OUTPUT,
     OPT_OUTPUT,
+    QCHEM_ERR,
     SAMPLE_CONFIG_YAML,
     SP_OUTPUT,
     TS_OUTPUT,
@@ -188,11 +183,16 @@ def tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
     return base
 
 
+def _write_config(base: Path) -> Path:
+    """Write the sample config into *base* and return its path."""
+    cfg_path = base / "new.yaml"
+    cfg_path.write_text(SAMPLE_CONFIG_YAML)
+    return cfg_path
+
+
 @pytest.fixture(scope="module")
 def registry(tree: Path) -> CalcRegistry:
-    cfg_path = tree / "new.yaml"
-    cfg_path.write_text(SAMPLE_CONFIG_YAML)
-    cfg = load_config(cfg_path)
+    cfg = load_config(_write_config(tree))
     return CalcRegistry(cfg, tree)
 
 
@@ -213,6 +213,40 @@ class TestExtractAll:
     def test_extracts_some_data(self, extracted: dict) -> None:
         assert len(extracted) > 0
 
+    def test_worker_processes_match_serial(self, registry: CalcRegistry, extracted: dict) -> None:
+        from pya3eda.extractor.data import extract_all
+
+        assert extract_all(registry, criteria="all", jobs=2) == extracted
+
+    def test_io_threads_match_serial(self, registry: CalcRegistry, extracted: dict) -> None:
+        from pya3eda.extractor.data import extract_all
+
+        assert extract_all(registry, criteria="all", io_threads=4) == extracted
+
+    def test_pipelined_pool_matches_serial_with_cache(self, tmp_path: Path) -> None:
+        """Cold and warm pipelined runs, and SPs whose OPT was re-parsed, match serial."""
+        import os
+
+        from pya3eda.extractor.data import extract_all
+
+        _populate_tree(tmp_path)
+        registry = CalcRegistry(load_config(_write_config(tmp_path)), tmp_path)
+        for path in tmp_path.rglob("*.out"):  # old enough for the cache to store
+            os.utime(path, (1e9, 1e9))
+        cold = extract_all(registry, criteria="all", jobs=2)
+        warm = extract_all(registry, criteria="all", jobs=2)
+        assert list(cold.items()) == list(warm.items())
+        # An OPT re-parsed while its SP is a cache hit, then an SP re-parsed alone.
+        for rel in (
+            f"{MK}/no_cat/reactants/prop2enal/prop2enal_opt.out",
+            f"{MK}/no_cat/ts/{SP_SUB}/tscomplex_sp.out",
+        ):
+            os.utime(tmp_path / rel, (2e9, 2e9))
+            touched = extract_all(registry, criteria="all", jobs=2)
+            assert list(touched.items()) == list(cold.items())
+        assert list(extract_all(registry, criteria="all").items()) == list(cold.items())
+        assert extract_all(registry, jobs=2) == extract_all(registry)
+
     def test_opt_prop2enal(self, extracted: dict) -> None:
         cid = CalcID(
             method_key=MK,
@@ -294,6 +328,74 @@ class TestExtractAll:
         assert len(lines) == n_atoms + 2
 
 
+class TestIncrementalExtraction:
+    """``extract_all(incremental=True)`` re-extracts only what changed."""
+
+    OPT_REL = f"{MK}/no_cat/reactants/prop2enal/prop2enal_opt.out"
+
+    @pytest.fixture
+    def campaign(self, tmp_path: Path) -> CalcRegistry:
+        """A fresh tree whose outputs are old enough for the cache to store."""
+        import os
+
+        _populate_tree(tmp_path)
+        for path in tmp_path.rglob("*.out"):
+            os.utime(path, (1e9, 1e9))
+        return CalcRegistry(load_config(_write_config(tmp_path)), tmp_path)
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_unchanged_outputs_are_not_re_extracted(
+        self, campaign: CalcRegistry, jobs: int
+    ) -> None:
+        from unittest.mock import patch
+
+        from pya3eda.extractor.data import extract_all
+
+        full = extract_all(campaign, criteria="all")
+        assert list(extract_all(campaign, criteria="all", incremental=True).items()) == list(
+            full.items()
+        )
+        with patch("pya3eda.extractor.data._extract", side_effect=AssertionError):
+            warm = extract_all(campaign, criteria="all", jobs=jobs, incremental=True)
+        assert list(warm.items()) == list(full.items())
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_changed_opt_re_extracts_its_sps(self, campaign: CalcRegistry, jobs: int) -> None:
+        import os
+        from unittest.mock import patch
+
+        from pya3eda.extractor import data
+
+        data.extract_all(campaign, criteria="all", incremental=True)
+        opt = campaign.base_dir / self.OPT_REL
+        opt.write_text(OPT_OUTPUT.replace("-191.709724458668", "-191.719724458668"))
+        os.utime(opt, (2e9, 2e9))
+        with patch.object(data, "_extract", wraps=data._extract) as extract:
+            incremental = data.extract_all(campaign, criteria="all", jobs=jobs, incremental=True)
+        redone = {call.args[0].id for call in extract.call_args_list}
+        cid = CalcID(method_key=MK, stage="reactants", species="prop2enal", mode="opt")
+        sp = cid.replace(mode="sp", sp_subfolder=SP_SUB)
+        assert redone == {cid, sp}
+        full = data.extract_all(campaign, criteria="all")
+        assert list(incremental.items()) == list(full.items())
+
+    def test_regated_opt_re_extracts_its_sps(self, campaign: CalcRegistry) -> None:
+        """An SP whose OPT no longer passes the status gate fails loud, as in a full run."""
+        from pya3eda.errors import IncompleteDataError
+        from pya3eda.extractor.data import extract_all
+
+        for spec in campaign.all_calcs:
+            spec.input_path.parent.mkdir(parents=True, exist_ok=True)
+            spec.input_path.touch()
+        extract_all(campaign, criteria="SUCCESSFUL", incremental=True)
+        (campaign.base_dir / self.OPT_REL).with_suffix(".err").write_text(QCHEM_ERR)
+        with pytest.raises(IncompleteDataError) as full:
+            extract_all(campaign, criteria="SUCCESSFUL")
+        with pytest.raises(IncompleteDataError) as incremental:
+            extract_all(campaign, criteria="SUCCESSFUL", incremental=True)
+        assert str(incremental.value) == str(full.value)
+
+
 # ===================================================================
 # build_profiles
 # ===================================================================
@@ -425,24 +527,49 @@ def _ed(
     )
 
 
-class TestSumEnergies:
+_PID = ProfileID(method_key="m", catalyst="cat", calc_type="full_cat")
+_NI_PID = _PID.model_copy(update={"calc_type": "ni"})
+
+
+def _stage_of(
+    stage_spec: StageSpec, extracted: dict[CalcID, ExtractedData], *, ni: bool = False
+) -> StageData:
+    """The single stage of a one-stage leader profile (or of its NI profile)."""
+    pspec = ProfileSpec(id=_PID, stages=(stage_spec,), selection_leader=True)
+    profiles = ProfileMatrix([pspec]).evaluate(extracted)
+    return profiles[_NI_PID if ni else _PID].stages[0]
+
+
+def _sums(
+    calc_ids: tuple[CalcID, ...], extracted: dict[CalcID, ExtractedData]
+) -> tuple[float | None, float | None]:
+    """E and G of a stage summing *calc_ids*."""
+    sd = _stage_of(StageSpec(name="reactants", calc_ids=calc_ids, label="x"), extracted)
+    return sd.E, sd.G
+
+
+class TestStageSums:
     def test_missing_cid_returns_none(self) -> None:
         cid = CalcID(method_key="m", stage="reactants", species="x")
-        result = _sum_energies((cid,), {})
-        assert result == (None, None)
+        assert _sums((cid,), {}) == (None, None)
+
+    def test_missing_cid_poisons_whole_sum(self) -> None:
+        c1 = CalcID(method_key="m", stage="reactants", species="a")
+        c2 = CalcID(method_key="m", stage="reactants", species="b")
+        assert _sums((c1, c2), {c1: _ed(calc_id=c1, energy=1.0, G=10.0)}) == (None, None)
 
     def test_has_E_false(self) -> None:
         """When energy and sp_energy are both None, E comes back None."""
         cid = CalcID(method_key="m", stage="reactants", species="x")
         ed = _ed(calc_id=cid, energy=None, sp_energy=None, G=10.0)
-        E, G = _sum_energies((cid,), {cid: ed})
+        E, G = _sums((cid,), {cid: ed})
         assert E is None
         assert pytest.approx(10.0) == G
 
     def test_has_G_false(self) -> None:
         cid = CalcID(method_key="m", stage="reactants", species="x")
         ed = _ed(calc_id=cid, energy=5.0, G=None)
-        E, G = _sum_energies((cid,), {cid: ed})
+        E, G = _sums((cid,), {cid: ed})
         assert pytest.approx(5.0) == E
         assert G is None
 
@@ -451,78 +578,114 @@ class TestSumEnergies:
         c2 = CalcID(method_key="m", stage="reactants", species="b")
         d1 = _ed(calc_id=c1, energy=1.0, G=10.0)
         d2 = _ed(calc_id=c2, energy=2.0, G=20.0)
-        E, G = _sum_energies((c1, c2), {c1: d1, c2: d2})
+        E, G = _sums((c1, c2), {c1: d1, c2: d2})
         assert pytest.approx(3.0) == E
         assert pytest.approx(30.0) == G
 
+    def test_repeated_cid_counts_twice(self) -> None:
+        cid = CalcID(method_key="m", stage="reactants", species="x")
+        E, G = _sums((cid, cid), {cid: _ed(calc_id=cid, energy=1.5, G=10.0)})
+        assert (E, G) == (3.0, 20.0)
+
+    def test_empty_stage_sums_to_zero(self) -> None:
+        assert _sums((), {}) == (0.0, 0.0)
+
     def test_sp_energy_fallback(self) -> None:
         """When energy=None, sp_energy is used for E."""
         cid = CalcID(method_key="m", stage="reactants", species="x")
         ed = _ed(calc_id=cid, energy=None, sp_energy=7.0, G=10.0)
-        E, _G = _sum_energies((cid,), {cid: ed})
+        E, _G = _sums((cid,), {cid: ed})
         assert pytest.approx(7.0) == E
 
+    def test_table_and_dict_agree(self) -> None:
+        cid = CalcID(method_key="m", stage="reactants", species="x")
+        extracted = {cid: _ed(calc_id=cid, energy=1.0, G=10.0)}
+        stage_spec = StageSpec(name="reactants", calc_ids=(cid,), label="x")
+        table = ExtractedTable.from_data(extracted.values())
+        assert _stage_of(stage_spec, table) == _stage_of(stage_spec, extracted)
+
+
+class TestSelection:
+    """Best-candidate choice among a stage's primary + alternatives."""
+
+    def _best(self, energies: list[float | None]) -> str:
+        """Label of the best-E candidate, one calc per candidate."""
+        cids = [
+            CalcID(method_key="m", stage="preTS", species=f"c{i}", calc_type="full_cat")
+            for i in range(len(energies))
+        ]
+        extracted = {
+            cid: _ed(calc_id=cid, energy=e, G=e) for cid, e in zip(cids, energies, strict=True)
+        }
+        alts = tuple(StageAlt(calc_ids=(cid,), label=cid.species) for cid in cids[1:])
+        stage_spec = StageSpec(name="preTS", calc_ids=cids[:1], label="c0", alternatives=alts)
+        return _stage_of(stage_spec, extracted).species_label
 
-class TestArgmin:
     def test_picks_smallest(self) -> None:
-        assert _argmin([3.0, 1.0, 2.0]) == 1
+        assert self._best([3.0, 1.0, 2.0]) == "c1"
 
     def test_all_none(self) -> None:
-        assert _argmin([None, None]) == 0
+        assert self._best([None, None]) == "c0"
 
-    def test_single_value(self) -> None:
-        assert _argmin([5.0]) == 0
+    def test_first_of_ties(self) -> None:
+        assert self._best([2.0, 1.0, 1.0]) == "c1"
 
     def test_none_mixed(self) -> None:
-        assert _argmin([None, 2.0, None]) == 1
+        assert self._best([None, 2.0, None]) == "c1"
 
 
 class TestNormalize:
-    def _sd(self, name: str, E: float | None, G: float | None) -> StageData:
-        return StageData(name=name, E=E, G=G)
+    def _profile(self, E: list[float | None], G: list[float], ref_stage: str) -> ProfileData:
+        names = ["reactants", "ts"]
+        cids = [CalcID(method_key="m", stage=n, species="x") for n in names]
+        stages = tuple(
+            StageSpec(name=n, calc_ids=(cid,), label=n) for n, cid in zip(names, cids, strict=True)
+        )
+        pspec = ProfileSpec(id=ProfileID(method_key="m"), stages=stages, ref_stage=ref_stage)
+        extracted = {
+            cid: _ed(calc_id=cid, energy=e, G=g) for cid, e, g in zip(cids, E, G, strict=True)
+        }
+        return ProfileMatrix([pspec]).evaluate(extracted)[pspec.id]
 
     def test_ref_not_found(self) -> None:
-        stages = [self._sd("reactants", 10.0, 20.0)]
-        result = _normalize(stages, "nonexistent")
-        assert result[0].rel("E") is None  # no normalization performed
+        pd = self._profile([10.0, 15.0], [20.0, 30.0], "products")
+        assert pd.stages[0].rel("E") is None  # no normalization performed
 
     def test_normal_subtraction(self) -> None:
-        stages = [
-            self._sd("reactants", 10.0, 100.0),
-            self._sd("ts", 15.0, 110.0),
-        ]
-        result = _normalize(stages, "reactants")
-        assert result[0].rel("E") == pytest.approx(0.0)
-        assert result[0].rel("G") == pytest.approx(0.0)
-        assert result[1].rel("E") == pytest.approx(5.0)
-        assert result[1].rel("G") == pytest.approx(10.0)
+        pd = self._profile([10.0, 15.0], [100.0, 110.0], "reactants")
+        assert pd.stages[0].rel("E") == pytest.approx(0.0)
+        assert pd.stages[0].rel("G") == pytest.approx(0.0)
+        assert pd.stages[1].rel("E") == pytest.approx(5.0)
+        assert pd.stages[1].rel("G") == pytest.approx(10.0)
 
     def test_partial_rel_E_none(self) -> None:
-        """NI profile: E=None → _rel has only G key."""
-        stages = [
-            self._sd("reactants", None, 100.0),
-            self._sd("ts", None, 110.0),
-        ]
-        result = _normalize(stages, "reactants")
-        assert result[0].rel("E") is None
-        assert result[0].rel("G") == pytest.approx(0.0)
-        assert result[1].rel("E") is None
-        assert result[1].rel("G") == pytest.approx(10.0)
+        """E=None → _rel has only G key."""
+        pd = self._profile([None, None], [100.0, 110.0], "reactants")
+        assert pd.stages[0].rel("E") is None
+        assert pd.stages[0].rel("G") == pytest.approx(0.0)
+        assert pd.stages[1].rel("E") is None
+        assert pd.stages[1].rel("G") == pytest.approx(10.0)
 
 
 class TestGniForStage:
-    """Unit tests for _g_ni_for_stage."""
+    """The NI profile's G of a stage with a non-interacting reference."""
 
     def _cid(self, sp: str) -> CalcID:
         return CalcID(method_key="m", stage="reactants", species=sp)
 
+    def _g_ni(self, ni: NiStageRef, extracted: dict[CalcID, ExtractedData]) -> float | None:
+        complex_cid = self._cid("complex")
+        extracted = {complex_cid: _ed(calc_id=complex_cid, energy=1.0, G=2.0), **extracted}
+        stage_spec = StageSpec(name="ts", calc_ids=(complex_cid,), label="c", ni_ref=ni)
+        return _stage_of(stage_spec, extracted, ni=True).G
+
     def test_missing_ref_data(self) -> None:
         """ref_cid not in extracted → None."""
         ni = NiStageRef(
             ref_cids=(self._cid("missing"),),
             trans_cids=(self._cid("x"),),
         )
-        assert _g_ni_for_stage(ni, {}) is None
+        assert self._g_ni(ni, {}) is None
 
     def test_missing_s_trans_on_ref(self) -> None:
         ref_cid = self._cid("ref")
@@ -532,7 +695,7 @@ class TestGniForStage:
             ref_cid: _ed(calc_id=ref_cid, H=10.0, s_corr=0.05, s_trans=None, temperature=298.15),
             trans_cid: _ed(calc_id=trans_cid, s_trans=0.03),
         }
-        assert _g_ni_for_stage(ni, extracted) is None
+        assert self._g_ni(ni, extracted) is None
 
     def test_missing_trans_data(self) -> None:
         ref_cid = self._cid("ref")
@@ -542,17 +705,33 @@ class TestGniForStage:
             ref_cid: _ed(calc_id=ref_cid, H=10.0, s_corr=0.05, s_trans=0.03, temperature=298.15),
             # trans_cid missing from extracted
         }
-        assert _g_ni_for_stage(ni, extracted) is None
+        assert self._g_ni(ni, extracted) is None
 
-    def test_no_temperature(self) -> None:
+    @pytest.mark.parametrize("temperature", [None, 0.0])
+    def test_no_temperature(self, temperature: float | None) -> None:
         ref_cid = self._cid("ref")
         trans_cid = self._cid("trans")
         ni = NiStageRef(ref_cids=(ref_cid,), trans_cids=(trans_cid,))
         extracted = {
-            ref_cid: _ed(calc_id=ref_cid, H=10.0, s_corr=0.05, s_trans=0.03, temperature=None),
+            ref_cid: _ed(
+                calc_id=ref_cid, H=10.0, s_corr=0.05, s_trans=0.03, temperature=temperature
+            ),
+            trans_cid: _ed(calc_id=trans_cid, s_trans=0.03),
+        }
+        assert self._g_ni(ni, extracted) is None
+
+    def test_first_nonzero_temperature(self) -> None:
+        """T comes from the first reference with a non-zero temperature."""
+        r1, r2, trans_cid = self._cid("r1"), self._cid("r2"), self._cid("trans")
+        ref = {"H": 10.0, "s_corr": 0.05, "s_trans": 0.03}
+        extracted = {
+            r1: _ed(calc_id=r1, temperature=0.0, **ref),
+            r2: _ed(calc_id=r2, temperature=300.0, **ref),
             trans_cid: _ed(calc_id=trans_cid, s_trans=0.03),
         }
-        assert _g_ni_for_stage(ni, extracted) is None
+        both = self._g_ni(NiStageRef(ref_cids=(r1, r2), trans_cids=(trans_cid,)), extracted)
+        extracted[r1] = _ed(calc_id=r1, temperature=300.0, **ref)
+        assert both == self._g_ni(NiStageRef(ref_cids=(r1, r2), trans_cids=(trans_cid,)), extracted)
 
     def test_happy_path_no_ssc(self) -> None:
         """Complete data, apply_ssc=False → computed G_ni value."""
@@ -576,7 +755,7 @@ class TestGniForStage:
             trans_cid: _ed(calc_id=trans_cid, s_trans=s_trans, temperature=T),
         }
 
-        result = _g_ni_for_stage(ni, extracted)
+        result = self._g_ni(ni, extracted)
         assert result is not None
 
         # Manual calculation
@@ -607,17 +786,26 @@ class TestGniForStage:
             trans_cid: _ed(calc_id=trans_cid, s_trans=s_trans, temperature=T),
         }
 
-        result = _g_ni_for_stage(ni, extracted)
-        result_no_ssc = _g_ni_for_stage(
+        result = self._g_ni(ni, extracted)
+        result_no_ssc = self._g_ni(
             NiStageRef(ref_cids=(ref_cid,), trans_cids=(trans_cid,), apply_ssc_to_g_ni=False),
             extracted,
         )
+        assert result is not None and result_no_ssc is not None
         ssc = standard_state_correction(T)
         assert result == pytest.approx(result_no_ssc + 1 * ssc, rel=1e-9)
 
 
-class TestBuildStageBest:
-    """Tests for _build_stage_best with alternatives."""
+def _candidate_cids(pspec: ProfileSpec) -> tuple[CalcID, ...]:
+    """The single calc of each candidate of *pspec*'s first stage."""
+    stage = pspec.stages[0]
+    return (stage.calc_ids[0], *(a.calc_ids[0] for a in stage.alternatives))
+
+
+class TestStageBest:
+    """Stages with alternatives: leaders choose, followers reuse the choice."""
+
+    _FOLLOWER = ProfileID(method_key="m", catalyst="cat", calc_type="frz_cat")
 
     def _make_specs(
         self,
@@ -638,8 +826,7 @@ class TestBuildStageBest:
             label="prim-label",
             alternatives=(alt,),
         )
-        pid = ProfileID(method_key="m", catalyst="cat", calc_type="full_cat")
-        pspec = ProfileSpec(id=pid, stages=(stage_spec,), selection_leader=True)
+        pspec = ProfileSpec(id=_PID, stages=(stage_spec,), selection_leader=True)
 
         extracted = {
             c_prim: _ed(calc_id=c_prim, energy=10.0, G=100.0),
@@ -647,49 +834,72 @@ class TestBuildStageBest:
         }
         return stage_spec, pspec, extracted
 
+    def _follower(self, stage_spec: StageSpec) -> ProfileSpec:
+        """A follower whose candidates are *stage_spec*'s with frz_cat calcs."""
+        frz = [
+            (
+                tuple(
+                    CalcID(method_key="m", stage=c.stage, species=c.species, calc_type="frz_cat")
+                    for c in cids
+                ),
+                label,
+            )
+            for cids, label in [
+                (stage_spec.calc_ids, stage_spec.label),
+                *((a.calc_ids, a.label) for a in stage_spec.alternatives),
+            ]
+        ]
+        stage = StageSpec(
+            name=stage_spec.name,
+            calc_ids=frz[0][0],
+            label=frz[0][1],
+            alternatives=tuple(StageAlt(calc_ids=c, label=lbl) for c, lbl in frz[1:]),
+        )
+        return ProfileSpec(id=self._FOLLOWER, stages=(stage,))
+
     def test_leader_picks_best(self) -> None:
-        stage_spec, pspec, extracted = self._make_specs()
-        selections: dict = {}
-        sd = _build_stage_best(stage_spec, pspec, extracted, selections)
+        stage_spec, _pspec, extracted = self._make_specs()
+        sd = _stage_of(stage_spec, extracted)
         # Best E → candidate 1 (idx 1, E=5.0)
         assert pytest.approx(5.0) == sd.E
-        # Best G → candidate 0 (idx 0, G=100.0)
+        # Best G → candidate 0 (idx 0, G=100.0); the label follows G
         assert pytest.approx(100.0) == sd.G
-        # Selection recorded
-        assert len(selections) == 1
+        assert sd.species_label == "prim-label"
 
     def test_follower_reuses_selection(self) -> None:
         stage_spec, pspec, extracted = self._make_specs()
-        selections: dict = {}
-        # Leader run
-        _build_stage_best(stage_spec, pspec, extracted, selections)
-
-        # Follower: same key, but not selection_leader
-        pid_fol = ProfileID(method_key="m", catalyst="cat", calc_type="frz_cat")
-        pspec_fol = ProfileSpec(id=pid_fol, stages=(stage_spec,), selection_leader=False)
-        sd_fol = _build_stage_best(stage_spec, pspec_fol, extracted, selections)
+        follower = self._follower(stage_spec)
+        # The follower's own data would pick the other candidates.
+        for cid, e, g in zip(_candidate_cids(follower), (1.0, 9.0), (300.0, 50.0), strict=True):
+            extracted[cid] = _ed(calc_id=cid, energy=e, G=g)
+        sd_fol = ProfileMatrix([follower, pspec]).evaluate(extracted)[self._FOLLOWER].stages[0]
         # Should use same indices as leader
-        assert pytest.approx(5.0) == sd_fol.E
-        assert pytest.approx(100.0) == sd_fol.G
+        assert pytest.approx(9.0) == sd_fol.E
+        assert pytest.approx(300.0) == sd_fol.G
+
+    def test_follower_without_leader_chooses(self) -> None:
+        stage_spec, _pspec, extracted = self._make_specs()
+        follower = self._follower(stage_spec)
+        for cid, e, g in zip(_candidate_cids(follower), (1.0, 9.0), (300.0, 50.0), strict=True):
+            extracted[cid] = _ed(calc_id=cid, energy=e, G=g)
+        sd_fol = ProfileMatrix([follower]).evaluate(extracted)[self._FOLLOWER].stages[0]
+        assert (sd_fol.E, sd_fol.G) == (1.0, 50.0)
 
     def test_follower_missing_data_logs_warning(self, caplog: pytest.LogCaptureFixture) -> None:
         """Follower reusing a leader index with no data → None + warning (no fallback)."""
         import logging
 
         stage_spec, pspec, extracted = self._make_specs()
-        selections: dict = {}
-        _build_stage_best(stage_spec, pspec, extracted, selections)  # leader records
-
-        pid_fol = ProfileID(method_key="m", catalyst="cat", calc_type="frz_cat")
-        pspec_fol = ProfileSpec(id=pid_fol, stages=(stage_spec,), selection_leader=False)
+        matrix = ProfileMatrix([pspec, self._follower(stage_spec)])
         with caplog.at_level(logging.WARNING):
-            sd_fol = _build_stage_best(stage_spec, pspec_fol, {}, selections)
+            sd_fol = matrix.evaluate(extracted)[self._FOLLOWER].stages[0]
         assert sd_fol.E is None
         assert sd_fol.G is None
         assert "left as None" in caplog.text
+        assert "frz_cat" in caplog.text
 
     def test_is_ni_overrides_G(self) -> None:
-        """When is_ni=True and g_ni_ref is present, G is overridden."""
+        """The NI profile takes G from the chosen candidate's ni_ref."""
         c_prim = CalcID(method_key="m", stage="preTS", species="a", calc_type="full_cat")
         ref_cid = CalcID(method_key="m", stage="reactants", species="ref")
         trans_cid = CalcID(method_key="m", stage="reactants", species="trans")
@@ -705,22 +915,19 @@ class TestBuildStageBest:
             label="lbl",
             ni_ref=ni_ref,
         )
-        pid = ProfileID(method_key="m", catalyst="cat", calc_type="full_cat")
-        pspec = ProfileSpec(id=pid, stages=(stage_spec,), selection_leader=True)
-
         extracted = {
             c_prim: _ed(calc_id=c_prim, energy=10.0, G=100.0),
             ref_cid: _ed(calc_id=ref_cid, H=-50.0, s_corr=0.06, s_trans=0.03, temperature=298.15),
             trans_cid: _ed(calc_id=trans_cid, s_trans=0.03, temperature=298.15),
         }
-        sd = _build_stage_best(stage_spec, pspec, extracted, {}, is_ni=True)
+        sd = _stage_of(stage_spec, extracted, ni=True)
         assert sd.E is None  # NI always sets E=None
-        assert sd.G is not None
+        assert sd.G is not None and sd.G != 100.0
         assert sd.calc_type == "ni"
 
 
-class TestBuildOne:
-    """Test _build_one integrating _sum_energies + _normalize."""
+class TestProfileMatrix:
+    """Whole profiles: ordering, NI profiles and the compiled-matrix cache."""
 
     def test_ni_profile_has_no_E(self) -> None:
         """NI profile sets E=None on all stages."""
@@ -731,23 +938,23 @@ class TestBuildOne:
             StageSpec(name="reactants", calc_ids=(c_r,), label="r"),
             StageSpec(name="ts", calc_ids=(c_ts,), label="ts"),
         )
-        pid = ProfileID(method_key="m", catalyst="cat", calc_type="full_cat")
-        pspec = ProfileSpec(id=pid, stages=stages, selection_leader=True, ref_stage="reactants")
+        pspec = ProfileSpec(id=_PID, stages=stages, selection_leader=True, ref_stage="reactants")
 
         extracted = {
             c_r: _ed(calc_id=c_r, energy=10.0, G=100.0),
             c_ts: _ed(calc_id=c_ts, energy=20.0, G=110.0),
         }
 
-        pd = _build_one(pspec, extracted, {}, is_ni=True)
-        assert pd is not None
-        assert pd.profile_id.calc_type == "ni"
+        profiles = ProfileMatrix([pspec]).evaluate(extracted)
+        assert list(profiles) == [_PID, _NI_PID]
+        pd = profiles[_NI_PID]
         for s in pd.stages:
             assert s.E is None
             assert s.calc_type == "ni"
+        assert pd.stages[1].rel("G") == pytest.approx(10.0)
 
     def test_ni_profile_with_ni_ref(self) -> None:
-        """NI profile uses ni_ref for G on complex stages."""
+        """NI profile uses ni_ref for G on complex stages, the normal sum elsewhere."""
         c_r = CalcID(method_key="m", stage="reactants", species="x", calc_type="full_cat")
         c_ts = CalcID(method_key="m", stage="ts", species="y", calc_type="full_cat")
         ref_cid = CalcID(method_key="m", stage="reactants", species="ref")
@@ -762,8 +969,7 @@ class TestBuildOne:
             StageSpec(name="reactants", calc_ids=(c_r,), label="r"),
             StageSpec(name="ts", calc_ids=(c_ts,), label="ts", ni_ref=ni_ref),
         )
-        pid = ProfileID(method_key="m", catalyst="cat", calc_type="full_cat")
-        pspec = ProfileSpec(id=pid, stages=stages, selection_leader=True, ref_stage="reactants")
+        pspec = ProfileSpec(id=_PID, stages=stages, selection_leader=True, ref_stage="reactants")
 
         extracted = {
             c_r: _ed(calc_id=c_r, energy=10.0, G=100.0),
@@ -772,11 +978,10 @@ class TestBuildOne:
             trans_cid: _ed(calc_id=trans_cid, s_trans=0.03, temperature=298.15),
         }
 
-        pd = _build_one(pspec, extracted, {}, is_ni=True)
-        assert pd is not None
-        ts_stage = next(s for s in pd.stages if s.name == "ts")
-        # G should come from _g_ni_for_stage, not from the normal sum
-        assert ts_stage.G != 110.0  # not the raw value
+        pd = ProfileMatrix([pspec]).evaluate(extracted)[_NI_PID]
+        assert pd.stages[0].G == 100.0
+        # G should come from the ni_ref, not from the normal sum
+        assert pd.stages[1].G != 110.0  # not the raw value
 
     def test_regular_profile(self) -> None:
         """Non-NI profile preserves E and G."""
@@ -794,16 +999,16 @@ class TestBuildOne:
             c_ts: _ed(calc_id=c_ts, energy=20.0, G=110.0),
         }
 
-        pd = _build_one(pspec, extracted, {})
-        assert pd is not None
-        ts_stage = next(s for s in pd.stages if s.name == "ts")
+        profiles = ProfileMatrix([pspec]).evaluate(extracted)
+        assert list(profiles) == [pid]  # no NI profile for a follower
+        ts_stage = profiles[pid].stages[1]
         assert pytest.approx(20.0) == ts_stage.E
         assert pytest.approx(110.0) == ts_stage.G
         assert ts_stage.rel("E") == pytest.approx(10.0)
         assert ts_stage.rel("G") == pytest.approx(10.0)
 
-    def test_build_one_with_alternatives(self) -> None:
-        """_build_one delegates to _build_stage_best when alternatives exist."""
+    def test_with_alternatives(self) -> None:
+        """Stages with and without alternatives mix in one profile."""
         c_r = CalcID(method_key="m", stage="reactants", species="x", calc_type="full_cat")
         c_ts_a = CalcID(method_key="m", stage="ts", species="a", calc_type="full_cat")
         c_ts_b = CalcID(method_key="m", stage="ts", species="b", calc_type="full_cat")
@@ -813,8 +1018,7 @@ class TestBuildOne:
             StageSpec(name="reactants", calc_ids=(c_r,), label="r"),
             StageSpec(name="ts", calc_ids=(c_ts_a,), label="ts", alternatives=(alt,)),
         )
-        pid = ProfileID(method_key="m", catalyst="cat", calc_type="full_cat")
-        pspec = ProfileSpec(id=pid, stages=stages, selection_leader=True, ref_stage="reactants")
+        pspec = ProfileSpec(id=_PID, stages=stages, selection_leader=True, ref_stage="reactants")
 
         extracted = {
             c_r: _ed(calc_id=c_r, energy=10.0, G=100.0),
@@ -822,13 +1026,28 @@ class TestBuildOne:
             c_ts_b: _ed(calc_id=c_ts_b, energy=15.0, G=115.0),
         }
 
-        pd = _build_one(pspec, extracted, {})
-        assert pd is not None
-        ts_stage = next(s for s in pd.stages if s.name == "ts")
+        ts_stage = ProfileMatrix([pspec]).evaluate(extracted)[_PID].stages[1]
         # Best E = 15.0 (alt), Best G = 110.0 (primary)
         assert pytest.approx(15.0) == ts_stage.E
         assert pytest.approx(110.0) == ts_stage.G
 
+    def test_leaders_come_first(self) -> None:
+        follower = ProfileSpec(id=ProfileID(method_key="m"), stages=())
+        leader = ProfileSpec(id=_PID, stages=(), selection_leader=True)
+        profiles = ProfileMatrix([follower, leader]).evaluate({})
+        assert list(profiles) == [_PID, follower.id, _NI_PID]
+        assert profiles[_PID].stages == ()
+
+    def test_no_profiles(self) -> None:
+        assert ProfileMatrix([]).evaluate({}) == {}
+
+    def test_compiled_once_per_registry(self, registry: CalcRegistry) -> None:
+        from pya3eda.extractor.stages import build_profiles
+
+        matrix = ProfileMatrix.of(registry)
+        assert ProfileMatrix.of(registry) is matrix
+        assert build_profiles(registry, {}) == matrix.evaluate({})
+
 
 # ===================================================================
 # Unit tests — barriers.py internals
@@ -1079,7 +1298,7 @@ class TestExtractOneEdgeCases:
             },
         )()
         (tmp_path / "mol.in").touch()
-        with patch("pya3eda.extractor.data.get_status", return_value=("CRASH", "err")):
+        with patch("pya3eda.extractor.data.StatusSnapshot.status", return_value=("CRASH", "err")):
             result = extract_one(spec, "SUCCESSFUL", {})
         assert result is None
 
@@ -1102,7 +1321,9 @@ class TestExtractOneEdgeCases:
         )()
         (tmp_path / "mol.in").touch()
         (tmp_path / "mol.out").touch()  # empty file
-        with patch("pya3eda.extractor.data.get_status", return_value=(Status.SUCCESSFUL, "ok")):
+        with patch(
+            "pya3eda.extractor.data.StatusSnapshot.status", return_value=(Status.SUCCESSFUL, "ok")
+        ):
             result = extract_one(spec, "all", {})
         assert result is None
 
@@ -1127,10 +1348,44 @@ class TestExtractOneEdgeCases:
         )()
         (tmp_path / "mol.in").touch()
         (tmp_path / "mol.out").write_text("some output without energy")
-        with patch("pya3eda.extractor.data.get_status", return_value=(Status.SUCCESSFUL, "ok")):
+        with patch(
+            "pya3eda.extractor.data.StatusSnapshot.status", return_value=(Status.SUCCESSFUL, "ok")
+        ):
             result = extract_one(spec, "all", {})
         assert result is None
 
+    def test_sp_without_opt_thermo_raises(self, tmp_path: Path) -> None:
+        """SP energy present but its OPT's thermo incomplete → loud error naming the gaps."""
+        from unittest.mock import patch
+
+        from pya3eda.errors import IncompleteDataError
+        from pya3eda.extractor.data import OptThermo, extract_one
+        from pya3eda.status.checker import Status
+
+        cid = CalcID(method_key="m", stage="reactants", species="mol", mode="sp")
+        thermo = OptThermo(None, 0.01, None, None, None, None, None, None)
+        spec = type(
+            "Spec",
+            (),
+            {
+                "id": cid,
+                "output_path": tmp_path / "mol.out",
+                "input_path": tmp_path / "mol.in",
+                "solvent": "false",
+                "is_fragmented": False,
+            },
+        )()
+        (tmp_path / "mol.in").touch()
+        (tmp_path / "mol.out").write_text(SP_OUTPUT)
+        with (
+            patch(
+                "pya3eda.extractor.data.StatusSnapshot.status",
+                return_value=(Status.SUCCESSFUL, "ok"),
+            ),
+            pytest.raises(IncompleteDataError, match=r"h_corr.*temperature"),
+        ):
+            extract_one(spec, "all", {cid.to_opt(): thermo})
+
     def test_eda_sp_no_eda_data_returns_none(self, tmp_path: Path) -> None:
         """EDA SP output without parseable EDA energies → None."""
         from unittest.mock import patch
@@ -1152,7 +1407,9 @@ class TestExtractOneEdgeCases:
         )()
         (tmp_path / "mol.in").touch()
         (tmp_path / "mol.out").write_text("some output without EDA data")
-        with patch("pya3eda.extractor.data.get_status", return_value=(Status.SUCCESSFUL, "ok")):
+        with patch(
+            "pya3eda.extractor.data.StatusSnapshot.status", return_value=(Status.SUCCESSFUL, "ok")
+        ):
             result = extract_one(spec, "all", {})
         assert result is None
 
@@ -1179,7 +1436,10 @@ class TestExtractOneEdgeCases:
         (tmp_path / "mol.in").touch()
         (tmp_path / "mol.out").write_text("Final energy is -100.5 Ha\n")
         with (
-            patch("pya3eda.extractor.data.get_status", return_value=(Status.SUCCESSFUL, "ok")),
+            patch(
+                "pya3eda.extractor.data.StatusSnapshot.status",
+                return_value=(Status.SUCCESSFUL, "ok"),
+            ),
             pytest.raises(IncompleteDataError, match="OPT thermo"),
         ):
             extract_one(spec, "all", {})  # empty opt_cache
@@ -1206,13 +1466,45 @@ class TestExtractOneEdgeCases:
                 "is_fragmented": False,
             },
         )()
-        reg = MagicMock(all_calcs=[spec])
+        reg = MagicMock()
+        reg.by_mode.side_effect = lambda mode: [spec] if mode == "opt" else []
         with (
-            patch("pya3eda.extractor.data.get_status", return_value=(Status.SUCCESSFUL, "ok")),
+            patch(
+                "pya3eda.extractor.data.StatusSnapshot.statuses",
+                side_effect=lambda specs: [(Status.SUCCESSFUL, "ok")] * len(specs),
+            ),
             pytest.raises(IncompleteDataError, match="Incomplete data for 1 computation"),
         ):
             extract_all(reg, criteria="all")
 
+    def test_worker_parse_matches_serial_parse(self, registry: CalcRegistry) -> None:
+        """What a pool worker parses equals what the serial path parses."""
+        from pya3eda.extractor.data import _parse_output, _parse_outputs
+        from pya3eda.status.checker import Status
+
+        specs = [s for s in registry.all_calcs if s.output_path.exists()]
+        serial = _parse_outputs(specs, [(Status.SUCCESSFUL, "")] * len(specs), "all", None)
+        assert [_parse_output(spec) for spec in specs] == serial
+        assert {spec.id.mode for spec in specs} == {"opt", "sp"}
+
+    def test_pipelined_errors_in_registry_order(self, tmp_path: Path) -> None:
+        """The pool reports the same gaps as the serial path, in the same order."""
+        from pya3eda.errors import IncompleteDataError
+        from pya3eda.extractor.data import extract_all
+
+        _populate_tree(tmp_path)
+        registry = CalcRegistry(load_config(_write_config(tmp_path)), tmp_path)
+        for spec in registry.by_mode("opt"):
+            if spec.output_path.exists():
+                spec.output_path.write_text("Total energy = -100.500000\n")  # no thermo
+        messages = []
+        for jobs in (1, 2):
+            with pytest.raises(IncompleteDataError) as info:
+                extract_all(registry, criteria="all", jobs=jobs)
+            messages.append(str(info.value))
+        assert messages[0] == messages[1]
+        assert "mode='sp'" in messages[0]  # SPs of the thermo-less OPTs fail too
+
 
 class TestParseSpEnergyBranches:
     def test_eda_without_cds(self) -> None:
@@ -1221,45 +1513,7 @@ class TestParseSpEnergyBranches:
 
         content = "   10   -1814.1288377459      3.50e-09     00000 Convergence criterion met\n"
         spec = type("S", (), {"id": type("I", (), {"calc_type": "frz_cat"})()})()
-        assert _parse_sp_energy(content, spec) is not None
-
-
-class TestDeriveHG:
-    """Fail-loud derivation of H/G from a present electronic energy."""
-
-    _CID = CalcID(method_key="m", stage="reactants", species="mol", mode="opt")
-
-    def test_gas_phase_skips_ssc(self) -> None:
-        """Gas-phase H/G omit the standard-state correction."""
-        from pya3eda.extractor.data import _derive_hg
-
-        H, G = _derive_hg(self._CID, 10.0, 2.0, 0.01, 298.0, None, "false")
-        assert pytest.approx(12.0) == H
-        assert pytest.approx(12.0 - 298.0 * 0.01) == G
-
-    def test_solvent_adds_ssc(self) -> None:
-        """Solvent phase with a pressure adds the standard-state correction."""
-        from pya3eda.extractor.data import _derive_hg
-        from pya3eda.utils import standard_state_correction
-
-        _H, G = _derive_hg(self._CID, 10.0, 2.0, 0.01, 298.0, 1.0, "smd")
-        assert pytest.approx(12.0 - 298.0 * 0.01 + standard_state_correction(298.0, 1.0)) == G
-
-    def test_missing_thermo_raises(self) -> None:
-        """Energy present but h_corr/temperature missing → loud error naming them."""
-        from pya3eda.errors import IncompleteDataError
-        from pya3eda.extractor.data import _derive_hg
-
-        with pytest.raises(IncompleteDataError, match=r"h_corr.*temperature"):
-            _derive_hg(self._CID, 10.0, None, 0.01, None, None, "false")
-
-    def test_solvent_missing_pressure_raises(self) -> None:
-        """Solvent phase without a pressure → loud error (SSC cannot be applied)."""
-        from pya3eda.errors import IncompleteDataError
-        from pya3eda.extractor.data import _derive_hg
-
-        with pytest.raises(IncompleteDataError, match="pressure"):
-            _derive_hg(self._CID, 10.0, 2.0, 0.01, 298.0, None, "smd")
+        assert _parse_sp_energy(content, spec).energy_kcal is not None
 
 
 class TestComputeForCatalystBranches:
@@ -1292,9 +1546,11 @@ class TestValidateSpCds:
         )
 
     def _validate(self, *, sp: str, opt: str, solvent: str, calc_type: str | None = "full_cat"):
-        from pya3eda.extractor.data import _validate_sp_cds
+        from pya3eda.extractor.data import _opt_thermo, _validate_sp_cds
+        from pya3eda.parser.qchem import parse_cds_print, scan_opt_output
 
-        _validate_sp_cds(self._cid(calc_type), sp, opt, solvent)
+        thermo = _opt_thermo(scan_opt_output(opt, ("smd",)))
+        _validate_sp_cds(self._cid(calc_type), parse_cds_print(sp), thermo, solvent)
 
     def test_skips_non_eda(self, caplog: pytest.LogCaptureFixture) -> None:
         import logging
@@ -0,0 +1,128 @@
+"""Tests for pya3eda.extractor.table — the columnar extracted-data table."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from pya3eda.extractor.table import FLOAT_COLUMNS, ExtractedTable
+from pya3eda.ids import CalcID, ExtractedData
+from pya3eda.utils import standard_state_correction
+
+_CID = CalcID(method_key="m", stage="reactants", species="mol", mode="opt")
+_SP = CalcID(method_key="m", stage="reactants", species="mol", mode="sp")
+
+
+def _data(cid: CalcID = _CID, **fields: object) -> ExtractedData:
+    values: dict[str, object] = {
+        "energy": 10.0,
+        "h_corr": 2.0,
+        "s_corr": 0.01,
+        "temperature": 298.0,
+    }
+    return ExtractedData(calc_id=cid, status="SUCCESSFUL", **{**values, **fields})
+
+
+class TestMapping:
+    def test_rows_round_trip(self) -> None:
+        data = [_data(imag_freq=0, xyz_text="1\n\nH 0 0 0\n"), _data(_SP, energy=None)]
+        table = ExtractedTable.from_data(data)
+        assert tuple(table) == table.ids == (_CID, _SP)
+        assert len(table) == 2
+        assert _SP in table and "x" not in table
+        assert table.index(_SP) == 1
+        assert table.rows(
+            [_SP, _SP.to_opt(), CalcID(method_key="x", stage="ts", species="y")]
+        ).tolist() == [
+            1,
+            0,
+            -1,
+        ]
+        assert table[_CID] == data[0]
+        assert table == dict(zip(table.ids, data, strict=True))
+        assert table.row(1).energy is None
+
+    def test_of(self) -> None:
+        table = ExtractedTable.from_data([_data()])
+        assert ExtractedTable.of(table) is table
+        assert ExtractedTable.of({_CID: _data()}) == table
+
+    def test_columns_are_read_only(self) -> None:
+        table = ExtractedTable.from_data([_data(), _data(_SP, energy=None)])
+        energy = table.column("energy")
+        assert energy.dtype == np.float64
+        assert energy[0] == 10.0 and math.isnan(energy[1])
+        with pytest.raises(ValueError, match="read-only"):
+            energy[0] = 1.0
+
+    def test_take(self) -> None:
+        table = ExtractedTable.from_data(
+            [_data(), _data(_SP, energy=1.0, pressure=1.0)], [False, True]
+        )
+        taken = table.take([1])
+        assert list(taken) == [_SP]
+        assert taken[_SP] == table[_SP]
+        taken.derive()
+        assert taken.column("G")[0] == pytest.approx(
+            3.0 - 298.0 * 0.01 + standard_state_correction(298.0, 1.0)
+        )
+
+    def test_frame(self) -> None:
+        table = ExtractedTable.from_data([_data(imag_freq=1), _data(_SP, energy=None)])
+        frame = table.frame([0])
+        assert list(frame.columns) == ["status", *FLOAT_COLUMNS, "imag_freq"]
+        assert frame["imag_freq"].tolist() == [1]
+        assert len(table.frame()) == 2
+
+    def test_duplicate_ids(self) -> None:
+        with pytest.raises(ValueError, match="distinct"):
+            ExtractedTable.from_data([_data(), _data()])
+
+    def test_length_mismatch(self) -> None:
+        with pytest.raises(ValueError, match="one value per row"):
+            ExtractedTable.from_data([_data()], [True, False])
+
+
+class TestDerive:
+    """Fail-loud derivation of H/G from a present electronic energy."""
+
+    def _derived(self, solvated: bool = False, **fields: object) -> tuple[ExtractedData, str]:
+        table = ExtractedTable.from_data([_data(**fields)], [solvated])
+        gaps = table.derive()
+        return table.row(0), gaps.get(0, "")
+
+    def test_gas_phase_skips_ssc(self) -> None:
+        """Gas-phase H/G omit the standard-state correction."""
+        data, gap = self._derived()
+        assert not gap
+        assert pytest.approx(12.0) == data.H
+        assert pytest.approx(12.0 - 298.0 * 0.01) == data.G
+
+    def test_solvent_adds_ssc(self) -> None:
+        """Solvent phase with a pressure adds the standard-state correction."""
+        data, _ = self._derived(True, pressure=1.0)
+        assert pytest.approx(12.0 - 298.0 * 0.01 + standard_state_correction(298.0, 1.0)) == data.G
+
+    def test_sp_energy_used_without_opt_energy(self) -> None:
+        data, _ = self._derived(energy=None, sp_energy=5.0)
+        assert pytest.approx(7.0) == data.H
+
+    def test_no_energy_is_not_a_gap(self) -> None:
+        data, gap = self._derived(energy=None, h_corr=None)
+        assert not gap
+        assert data.H is None and data.G is None
+
+    def test_missing_thermo(self) -> None:
+        """Energy present but h_corr/temperature missing → message naming them."""
+        data, gap = self._derived(h_corr=None, temperature=None)
+        assert gap.startswith(f"{_CID}: ")
+        assert "h_corr" in gap and "temperature" in gap and "s_corr" not in gap
+        assert data.H is None and data.G is None
+
+    def test_solvent_missing_pressure(self) -> None:
+        """Solvent phase without a pressure → message (SSC cannot be applied)."""
+        data, gap = self._derived(True)
+        assert gap.endswith("missing pressure")
+        assert data.G is None
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+from pathlib import Path
+
 import pytest
 from pydantic import ValidationError
 
-from pya3eda.ids import CalcID, ExtractedData, ProfileID, StageData
+from pya3eda.ids import CalcContext, CalcID, CalcSpec, ExtractedData, ProfileID, StageData
+from pya3eda.vocab import Mode, Stage
 
 
 class TestCalcID:
@@ -34,8 +39,123 @@ class TestCalcID:
 
     def test_frozen(self) -> None:
         cid = CalcID(method_key="mk", stage="reactants", species="s")
-        with pytest.raises(ValidationError):
+        with pytest.raises(AttributeError, match="immutable"):
             cid.species = "new"
+        with pytest.raises(AttributeError, match="immutable"):
+            del cid.species
+
+    def test_compact(self) -> None:
+        """No per-instance __dict__; strings are interned, vocabulary fields are enums."""
+        a = CalcID(method_key="mk", stage="ts", species="".join(["m", "ol"]), mode="sp")
+        b = CalcID(method_key="mk", stage="ts", species="mol", mode="sp")
+        assert not hasattr(a, "__dict__")
+        assert a.species is b.species
+        assert (type(a.stage), type(a.mode)) == (Stage, Mode)
+
+    @pytest.mark.parametrize("field", ["stage", "mode", "calc_type"])
+    def test_unknown_vocabulary_raises(self, field: str) -> None:
+        fields = {"method_key": "mk", "stage": "ts", "species": "mol", field: "bogus"}
+        with pytest.raises(ValueError, match="bogus"):
+            CalcID(**fields)
+
+    def test_replace_and_to_opt(self) -> None:
+        sp = CalcID(method_key="mk", stage="ts", species="mol", mode="sp", sp_subfolder="x_sp")
+        opt = CalcID(method_key="mk", stage="ts", species="mol")
+        assert sp.to_opt() == opt
+        assert hash(sp.to_opt()) == hash(opt)
+        assert opt.replace(mode="sp", sp_subfolder="x_sp") == sp
+        with pytest.raises(ValueError, match="bogus"):
+            opt.replace(stage="bogus")
+
+    def test_not_equal_to_other_types(self) -> None:
+        cid = CalcID(method_key="mk", stage="ts", species="mol")
+        assert cid != ("mk", None, "ts", "mol", None, "opt", None)
+
+    def test_pickle_and_copy(self) -> None:
+        cid = CalcID(
+            method_key="mk", catalyst="cat", stage="ts", species="mol", calc_type="pol_cat"
+        )
+        for clone in (pickle.loads(pickle.dumps(cid)), copy.deepcopy(cid)):
+            assert clone == cid
+            assert hash(clone) == hash(cid)
+
+    def test_repr(self) -> None:
+        cid = CalcID(method_key="mk", stage="ts", species="mol")
+        assert repr(cid) == (
+            "CalcID(method_key='mk', catalyst=None, stage='ts', species='mol', "
+            "calc_type=None, mode='opt', sp_subfolder=None)"
+        )
+
+    def test_pydantic_fields(self) -> None:
+        cid = CalcID(method_key="mk", stage="ts", species="mol")
+        assert ExtractedData(calc_id=cid).calc_id is cid
+        with pytest.raises(ValidationError):
+            ExtractedData(calc_id="mk/ts/mol")
+
+    def test_json_round_trip(self) -> None:
+        cid = CalcID(method_key="mk", stage="ts", species="mol", calc_type="full_cat", mode="sp")
+        blob = ExtractedData(calc_id=cid).model_dump_json()
+        assert '"calc_id":["mk",null,"ts","mol","full_cat","sp",null]' in blob
+        assert ExtractedData.model_validate_json(blob).calc_id == cid
+        with pytest.raises(ValidationError, match="bogus"):
+            ExtractedData.model_validate_json(blob.replace('"ts"', '"bogus"'))
+
+
+class TestCalcSpec:
+    CONTEXT = CalcContext(
+        method_name="HF",
+        basis_set="STO-3G",
+        dispersion="false",
+        solvent="smd",
+        eda2=1,
+        sp_subfolder="x_sp",
+        all_reactants=("a", "b"),
+        all_products=("p",),
+        all_catalysts=("cat",),
+    )
+
+    def _spec(self, species: str = "mol") -> CalcSpec:
+        return CalcSpec(
+            id=CalcID(method_key="mk", stage="ts", species=species),
+            input_path=Path("/b/mol.in"),
+            output_path=Path("/b/mol.out"),
+            context=self.CONTEXT,
+            present_reactants=("a",),
+        )
+
+    def test_context_properties(self) -> None:
+        spec = self._spec()
+        assert (spec.method_name, spec.basis_set, spec.dispersion, spec.solvent) == (
+            "HF",
+            "STO-3G",
+            "false",
+            "smd",
+        )
+        assert (spec.eda2, spec.sp_subfolder) == (1, "x_sp")
+        assert (spec.all_reactants, spec.all_products, spec.all_catalysts) == (
+            ("a", "b"),
+            ("p",),
+            ("cat",),
+        )
+        assert spec.is_fragmented is False
+        assert spec.present_products == ()
+
+    def test_value_semantics(self) -> None:
+        spec = self._spec()
+        assert spec == self._spec()
+        assert hash(spec) == hash(self._spec())
+        assert spec != self._spec("other")
+        assert spec != spec.id
+        assert pickle.loads(pickle.dumps(spec)) == spec
+        assert repr(spec).startswith("CalcSpec(id=CalcID(")
+
+    def test_frozen(self) -> None:
+        spec = self._spec()
+        assert not hasattr(spec, "__dict__")
+        with pytest.raises(AttributeError, match="immutable"):
+            spec.input_path = Path("/elsewhere.in")
+        with pytest.raises(AttributeError, match="immutable"):
+            del spec.context
 
 
 class TestProfileID:
@@ -54,7 +174,7 @@ class TestProfileID:
 class TestStageData:
     def test_rel_private_attr_survives_model_copy(self) -> None:
         """Guard the relative-energy mechanism: ``StageData._rel`` is a Pydantic
-        PrivateAttr that ``extractor.stages._normalize`` populates via
+        PrivateAttr that ``extractor.stages.ProfileMatrix`` populates via
         ``model_copy(update={"_rel": ...})``. If a Pydantic upgrade ever stops
         applying ``update`` to a private attribute, every relative energy would
         silently become ``None`` (empty profile CSVs/plots) — this fails loudly
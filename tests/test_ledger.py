@@ -0,0 +1,127 @@
+"""Tests for pya3eda.ledger — the persistent record of submissions and status transitions."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pya3eda import ledger as ledger_module
+from pya3eda.cache import CACHE_DIR
+from pya3eda.ledger import SUBMITTED, JobLedger, LedgerEntry
+
+
+@pytest.fixture
+def ledger(tmp_path: Path) -> Iterator[JobLedger]:
+    with JobLedger.open(tmp_path) as lg:
+        yield lg
+
+
+class TestLedgerEntry:
+    @pytest.mark.parametrize(
+        ("status", "terminal"),
+        [("SUCCESSFUL", True), ("CRASH", True), ("running", False), (SUBMITTED, False)],
+    )
+    def test_terminal(self, status: str, terminal: bool) -> None:
+        entry = LedgerEntry(status, "", None, None, None, None, None, None)
+        assert entry.terminal is terminal
+
+
+class TestJobLedger:
+    def test_creates_state_dir(self, tmp_path: Path, ledger: JobLedger) -> None:
+        assert (tmp_path / CACHE_DIR / "jobs.sqlite").is_file()
+
+    def test_submission(self, tmp_path: Path, ledger: JobLedger) -> None:
+        inp = tmp_path / "mol_opt.in"
+        ledger.record_submission(inp, "42", backend="slurm", cores=8)
+        entry = ledger.entry(inp)
+        assert entry is not None
+        assert (entry.status, entry.job_id, entry.backend, entry.cores) == (
+            SUBMITTED,
+            "42",
+            "slurm",
+            8,
+        )
+        assert entry.submitted is not None
+        assert entry.started is None and entry.ended is None
+        assert "42" in entry.detail
+
+    def test_lifecycle_times(self, tmp_path: Path, ledger: JobLedger) -> None:
+        inp = tmp_path / "mol_opt.in"
+        ledger.record_submission(inp, "42", backend="local", cores=1)
+        with patch.object(ledger_module.time, "time", return_value=100.0):
+            ledger.record_statuses([(inp, "running", "Job running")])
+        with patch.object(ledger_module.time, "time", return_value=200.0):
+            ledger.record_statuses([(inp, "running", "Job running")])
+            ledger.record_statuses([(inp, "SUCCESSFUL", "Done")])
+        with patch.object(ledger_module.time, "time", return_value=300.0):
+            ledger.record_statuses([(inp, "SUCCESSFUL", "Done, re-read")])
+        entry = ledger.entry(inp)
+        assert entry is not None
+        assert (entry.status, entry.detail) == ("SUCCESSFUL", "Done, re-read")
+        assert (entry.started, entry.ended) == (100.0, 200.0)
+        assert entry.job_id == "42"  # kept from the submission
+
+        history = ledger.history(inp)
+        assert [row[0] for row in history] == [SUBMITTED, "running", "SUCCESSFUL"]
+        assert all(row[2] == "42" for row in history)
+
+    def test_resubmission_resets_times(self, tmp_path: Path, ledger: JobLedger) -> None:
+        inp = tmp_path / "mol_opt.in"
+        ledger.record_submission(inp, "1", backend="local", cores=1)
+        ledger.record_statuses([(inp, "running", ""), (inp.with_name("x.in"), "nofile", "")])
+        ledger.record_statuses([(inp, "CRASH", "SCF failed")])
+        ledger.record_submission(inp, "2", backend="local", cores=2)
+        entry = ledger.entry(inp)
+        assert entry is not None
+        assert (entry.status, entry.job_id, entry.cores) == (SUBMITTED, "2", 2)
+        assert entry.started is None and entry.ended is None
+
+    def test_unsubmitted_calcs_have_no_times(self, tmp_path: Path, ledger: JobLedger) -> None:
+        inp = tmp_path / "mol_opt.in"
+        ledger.record_statuses([(inp, "running", "")])
+        ledger.record_statuses([(inp, "SUCCESSFUL", "")])
+        entry = ledger.entry(inp)
+        assert entry is not None
+        assert entry.job_id is None
+        assert entry.started is None and entry.ended is None
+        assert [row[2] for row in ledger.history(inp)] == [None, None]
+
+    def test_entries_in_batches(self, tmp_path: Path, ledger: JobLedger) -> None:
+        paths = [tmp_path / f"calc{i}.in" for i in range(5)]
+        ledger.record_statuses((p, "nofile", "") for p in paths)
+        with patch.object(ledger_module, "_QUERY_BATCH", 2):
+            entries = ledger.entries([*paths, tmp_path / "unknown.in"])
+        assert set(entries) == {str(p) for p in paths}
+        assert set(ledger.entries()) == set(entries)
+        assert ledger.entry(tmp_path / "unknown.in") is None
+
+    def test_persists_across_sessions(self, tmp_path: Path) -> None:
+        inp = tmp_path / "mol_opt.in"
+        with JobLedger.open(tmp_path) as first:
+            first.record_statuses([(inp, "CRASH", "boom")])
+        with JobLedger.open(tmp_path) as second:
+            entry = second.entry(inp)
+        assert entry is not None and entry.terminal
+
+    def test_unavailable_directory_disables_ledger(self, tmp_path: Path) -> None:
+        inp = tmp_path / "mol_opt.in"
+        with JobLedger.open(tmp_path / "missing" / "base") as lg:
+            lg.record_submission(inp, "1", backend="local", cores=1)
+            lg.record_statuses([(inp, "running", "")])
+            assert lg.entries() == {}
+            assert lg.history(inp) == []
+        assert not (tmp_path / "missing").exists()
+
+    def test_database_errors_are_ignored(self, tmp_path: Path) -> None:
+        inp = tmp_path / "mol_opt.in"
+        lg = JobLedger(sqlite3.connect(":memory:"))  # no tables → every statement fails
+        lg.record_submission(inp, "1", backend="local", cores=1)
+        lg.record_statuses([(inp, "running", "")])
+        assert lg.entries() == {}
+        assert lg.history(inp) == []
+        lg.close()
+        lg.close()  # closing twice is harmless
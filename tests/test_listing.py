@@ -0,0 +1,149 @@
+"""Tests for pya3eda.listing — per-directory listings shared by a command's file checks."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pya3eda.cache import file_stamp
+from pya3eda.listing import DirListing, FileIndex
+
+
+class TestDirListing:
+    def test_missing_directory_lists_empty(self, tmp_path: Path) -> None:
+        listing = DirListing(tmp_path / "nowhere")
+        assert not listing.is_file("job.out")
+        assert listing.stamp("job.out") is None
+        assert not listing.submitted("job")
+
+    def test_only_files_are_listed(self, tmp_path: Path) -> None:
+        (tmp_path / "job.out").write_text("x")
+        (tmp_path / "sub").mkdir()
+        listing = DirListing(tmp_path)
+        assert listing.is_file("job.out")
+        assert not listing.is_file("sub")
+
+    def test_find_prefers_the_plain_file(self, tmp_path: Path) -> None:
+        (tmp_path / "a.out.gz").write_bytes(gzip.compress(b"x"))
+        (tmp_path / "b.out").write_text("x")
+        (tmp_path / "b.out.xz").write_text("x")
+        listing = DirListing(tmp_path)
+        assert listing.find("a.out") == "a.out.gz"
+        assert listing.find("b.out") == "b.out"
+        assert listing.find("c.out") is None
+
+    def test_stamp_matches_file_stamp(self, tmp_path: Path) -> None:
+        (tmp_path / "job.out").write_text("x" * 10)
+        (tmp_path / "old.out.gz").write_bytes(gzip.compress(b"x"))
+        listing = DirListing(tmp_path)
+        for name in ("job.out", "old.out", "none.out"):
+            assert listing.stamp(name) == file_stamp(tmp_path / name)
+
+    def test_stamp_of_a_file_removed_since_listing(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        path.write_text("x")
+        listing = DirListing(tmp_path)
+        path.unlink()
+        assert listing.is_file("job.out")  # a snapshot
+        assert listing.stamp("job.out") is None
+
+    @pytest.mark.parametrize(
+        ("name", "stem"),
+        [
+            ("mol_opt.in_12345.67890", "mol_opt"),
+            (".mol_opt.in.12345.qcin.1", "mol_opt"),
+            ("a.in_b.in_1.2", "a.in_b"),
+        ],
+    )
+    def test_sentinels(self, tmp_path: Path, name: str, stem: str) -> None:
+        (tmp_path / name).touch()
+        listing = DirListing(tmp_path)
+        assert listing.submitted(stem)
+        assert not listing.submitted("other")
+
+    @pytest.mark.parametrize(
+        "name",
+        ["mol_opt.in", "mol_opt.in_x.1", "mol_opt.in_1", "mol_opt.in.1.qcin.2", ".mol_opt.in.1"],
+    )
+    def test_not_sentinels(self, tmp_path: Path, name: str) -> None:
+        (tmp_path / name).touch()
+        assert not DirListing(tmp_path).submitted("mol_opt")
+
+    def test_added_files_are_seen(self, tmp_path: Path) -> None:
+        listing = DirListing(tmp_path)
+        assert not listing.submitted("mol_opt")
+        for name in ("mol_opt.in", "mol_opt.in_1.2"):
+            (tmp_path / name).write_text("x")
+            listing.add(name)
+        assert listing.is_file("mol_opt.in")
+        assert listing.submitted("mol_opt")
+        assert listing.stamp("mol_opt.in") == file_stamp(tmp_path / "mol_opt.in")
+
+
+class TestFileIndex:
+    def test_lists_each_directory_once(self, tmp_path: Path) -> None:
+        for d in ("a", "b"):
+            (tmp_path / d).mkdir()
+            (tmp_path / d / "job.in").touch()
+        index = FileIndex()
+        with patch("pya3eda.listing.os.scandir", wraps=os.scandir) as scandir:
+            for _ in range(3):
+                for d in ("a", "b"):
+                    assert index.is_file(tmp_path / d / "job.in")
+                    assert index.find_file(tmp_path / d / "job.out") is None
+                    assert not index.submission_exists(tmp_path / d / "job.in")
+        assert scandir.call_count == 2
+
+    def test_paths_and_stamps(self, tmp_path: Path) -> None:
+        (tmp_path / "job.out.zst").write_text("x")
+        index = FileIndex()
+        assert index.find_file(tmp_path / "job.out") == tmp_path / "job.out.zst"
+        assert not index.is_file(tmp_path / "job.out")
+        assert index.stamp(tmp_path / "job.out") == file_stamp(tmp_path / "job.out")
+
+    def test_prefetch_lists_each_directory_once(self, tmp_path: Path) -> None:
+        paths = []
+        for d in ("a", "b", "c"):
+            (tmp_path / d).mkdir()
+            (tmp_path / d / "job.out").write_text("x")
+            paths += [tmp_path / d / "job.out", tmp_path / d / "job.err"]
+        index = FileIndex()
+        index.listing(tmp_path / "a")  # already listed: not scanned again
+        with patch("pya3eda.listing.os.scandir", wraps=os.scandir) as scandir:
+            index.prefetch(paths, threads=4, stamps=True)
+            assert scandir.call_count == 2
+            for path in paths:
+                assert index.stamp(path) == file_stamp(path)
+            assert scandir.call_count == 2
+        unstamped = FileIndex()
+        unstamped.prefetch(paths)
+        assert unstamped.is_file(paths[0])
+
+    def test_prefetch_stamps_once(self, tmp_path: Path) -> None:
+        (tmp_path / "job.out").write_text("x")
+        index = FileIndex()
+        index.prefetch([tmp_path / "job.out"], threads=2, stamps=True)
+        with patch("pathlib.Path.stat") as stat:
+            assert index.stamp(tmp_path / "job.out") is not None
+        stat.assert_not_called()  # cached on the directory entry
+
+    def test_add_and_invalidate(self, tmp_path: Path) -> None:
+        index = FileIndex()
+        path = tmp_path / "job.in"
+        assert not index.is_file(path)
+        path.touch()
+        assert not index.is_file(path)  # not rescanned
+        index.add(path)
+        assert index.is_file(path)
+
+        out = tmp_path / "job.out"
+        out.touch()
+        index.invalidate(tmp_path)
+        assert index.is_file(out)
+        out.unlink()
+        index.invalidate()
+        assert not index.is_file(out)
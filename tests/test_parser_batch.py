@@ -0,0 +1,92 @@
+"""Tests for pya3eda.parser.batch — ordered process-pool fan-out of parsing."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pya3eda.parser.batch import iter_many, parse_many, resolve_jobs, run_many
+from pya3eda.parser.tail import scan_opt_file
+from tests.synthetic_outputs import FRAGMENTED_OPT_OUTPUT, OPT_OUTPUT, SP_OUTPUT, TS_OUTPUT
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+@pytest.fixture
+def outputs(tmp_path: Path) -> list[Path]:
+    """Real outputs, plus a missing and an empty one."""
+    paths = []
+    for i, text in enumerate([OPT_OUTPUT, TS_OUTPUT, SP_OUTPUT, FRAGMENTED_OPT_OUTPUT, ""]):
+        path = tmp_path / f"calc{i}.out"
+        path.write_text(text)
+        paths.append(path)
+    return [*paths, tmp_path / "missing.out"]
+
+
+class TestRunMany:
+    def test_serial(self) -> None:
+        assert run_many(_square, [3, 1, 2]) == [9, 1, 4]
+
+    @pytest.mark.parametrize("chunksize", [None, 1, 5])
+    def test_pool_keeps_input_order(self, chunksize: int | None) -> None:
+        items = list(range(50))
+        assert run_many(_square, items, jobs=3, chunksize=chunksize) == [x * x for x in items]
+
+    def test_single_item_runs_in_process(self) -> None:
+        # A lambda cannot be pickled: it only works because no pool is started.
+        assert run_many(lambda x: x + 1, [1], jobs=8) == [2]
+
+    def test_threads_keep_input_order(self) -> None:
+        threads = set()
+
+        def work(x: int) -> int:
+            threads.add(threading.get_ident())
+            time.sleep(0.01 * (x % 3))
+            return x * x
+
+        items = list(range(12))
+        assert run_many(work, items, threads=4) == [x * x for x in items]
+        assert threading.get_ident() not in threads  # ran on the pool, not inline
+
+    def test_empty(self) -> None:
+        assert run_many(_square, [], jobs=4) == []
+
+    def test_resolve_jobs(self) -> None:
+        assert resolve_jobs(3) == 3
+        assert resolve_jobs(0) == (os.cpu_count() or 1)
+
+
+class TestIterMany:
+    def test_serial_in_input_order(self) -> None:
+        assert list(iter_many(_square, [3, 1, 2])) == [(0, 9), (1, 1), (2, 4)]
+
+    @pytest.mark.parametrize("chunksize", [None, 1, 7])
+    def test_pool_yields_every_index_once(self, chunksize: int | None) -> None:
+        items = list(range(50))
+        results = list(iter_many(_square, items, jobs=3, chunksize=chunksize))
+        assert sorted(results) == [(x, x * x) for x in items]
+
+    def test_single_item_runs_in_process(self) -> None:
+        assert list(iter_many(lambda x: x + 1, [1], jobs=8)) == [(0, 2)]
+
+    def test_empty(self) -> None:
+        assert list(iter_many(_square, [], jobs=4)) == []
+
+
+class TestParseMany:
+    @pytest.mark.parametrize(("jobs", "threads"), [(1, 1), (2, 1), (1, 3)])
+    def test_matches_scan_opt_file(self, outputs: list[Path], jobs: int, threads: int) -> None:
+        fields = ("energy", "thermo", "geometry")
+        expected = [scan_opt_file(p, fields) for p in outputs]
+        assert parse_many(outputs, fields, jobs=jobs, threads=threads) == expected
+        assert expected[-1] is None and expected[-2] is None
+
+    def test_unknown_field_raises_before_parsing(self, outputs: list[Path]) -> None:
+        with pytest.raises(ValueError, match="bogus"):
+            parse_many(outputs, ("bogus",), jobs=2)
@@ -0,0 +1,134 @@
+"""Tests for pya3eda.parser.follow — incremental parsing of growing outputs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pya3eda.parser.follow import LiveProgress, OutputFollower
+from tests.synthetic_outputs import OPT_OUTPUT
+
+_CYCLE_1 = """\
+Running on host compute01
+ ---------------------------------------
+  Cycle       Energy         DIIS error
+ ---------------------------------------
+    1    -191.2000000000      4.21e-02
+    2    -191.5000000000      1.05e-03
+    3    -191.6000000000      2.30e-06  Convergence criterion met
+ ---------------------------------------
+ Total energy in the final basis set =     -191.6000000000
+** OPTIMIZATION CYCLE **
+ Optimization Cycle:   1
+                Maximum     Tolerance    Cnvgd?
+         Gradient      0.009165      0.000300      NO
+         Displacement  0.038766      0.001200      NO
+"""
+
+_CYCLE_2 = """\
+  Cycle       Energy         DIIS error
+    1    -191.6500000000      3.00e-03
+    2    -191.7000000000      1.00e-04
+ Optimization Cycle:   2
+         Gradient      0.000812      0.000300      NO
+"""
+
+
+def _append(path: Path, text: str) -> None:
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+class TestOutputFollower:
+    def test_progress_of_a_growing_output(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        follower = OutputFollower()
+        _append(path, _CYCLE_1)
+        assert follower.poll(path) == LiveProgress(1, -191.6, 0.009165, 3)
+        _append(path, _CYCLE_2)
+        # The second SCF has not printed its final energy yet: the last one stands.
+        assert follower.poll(path) == LiveProgress(2, -191.6, 0.000812, 2)
+
+    def test_matches_a_single_read(self, tmp_path: Path) -> None:
+        text = _CYCLE_1 + _CYCLE_2 + OPT_OUTPUT
+        whole, piecewise = tmp_path / "whole.out", tmp_path / "piecewise.out"
+        whole.write_text(text)
+        follower = OutputFollower()
+        for i in range(0, len(text), 97):  # chunks cut mid-line
+            _append(piecewise, text[i : i + 97])
+            follower.poll(piecewise)
+        assert follower.poll(piecewise) == OutputFollower().poll(whole)
+        assert follower.poll(piecewise).done
+
+    def test_unfinished_line_is_held_back(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        follower = OutputFollower()
+        _append(path, " Optimization Cycle:   1")
+        assert follower.poll(path) == LiveProgress()
+        _append(path, "2\n")
+        assert follower.poll(path).opt_step == 12
+
+    def test_reads_only_appended_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        follower = OutputFollower()
+        _append(path, " Optimization Cycle:   1\n")
+        follower.poll(path)
+        # Rewrite the already-read prefix in place (same size and inode): never re-read.
+        with path.open("r+b") as fh:
+            fh.write(b" Optimization Cycle:   7\n")
+        _append(path, " Gradient  0.5  0.0003  NO\n")
+        assert follower.poll(path) == LiveProgress(opt_step=1, max_gradient=0.5)
+
+    def test_unchanged_output_is_not_reread(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        _append(path, _CYCLE_1)
+        follower = OutputFollower()
+        first = follower.poll(path)
+        assert follower.poll(path) is first
+
+    def test_truncated_output_is_followed_from_the_start(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        follower = OutputFollower()
+        _append(path, _CYCLE_1 + _CYCLE_2)
+        follower.poll(path)
+        path.write_text(" Optimization Cycle:   1\n")
+        assert follower.poll(path) == LiveProgress(opt_step=1)
+
+    def test_replaced_output_is_followed_from_the_start(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        follower = OutputFollower()
+        _append(path, " Optimization Cycle:   1\n")
+        follower.poll(path)
+        replacement = tmp_path / "new.out"
+        replacement.write_text(" Optimization Cycle:   5\n Gradient  0.5  0.0003  NO\n")
+        replacement.replace(path)
+        assert follower.poll(path) == LiveProgress(opt_step=5, max_gradient=0.5)
+
+    def test_missing_output(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        follower = OutputFollower()
+        _append(path, _CYCLE_1)
+        follower.poll(path)
+        path.unlink()
+        assert follower.poll(path) == LiveProgress()
+        follower.forget(path)  # already forgotten: a no-op
+
+    @pytest.mark.parametrize(
+        "marker",
+        [
+            " Thank you very much for using Q-Chem.\n",
+            " Q-Chem fatal error occurred in module\n",
+            " SCF failed to converge\n",
+            " Process killed by signal 9\n",
+        ],
+    )
+    def test_done_on_completion_or_failure(self, tmp_path: Path, marker: str) -> None:
+        path = tmp_path / "job.out"
+        follower = OutputFollower()
+        _append(path, _CYCLE_1)
+        assert not follower.poll(path).done
+        _append(path, marker)
+        assert follower.poll(path).done
+        _append(path, "\n")
+        assert follower.poll(path).done  # stays done
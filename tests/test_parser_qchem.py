@@ -8,8 +8,10 @@ from __future__ import annotations
 import pytest
 
 from pya3eda.parser.qchem import (
+    OPT_FIELDS,
     EDAData,
     EnergyResult,
+    OptOutputSummary,
     SMDData,
     parse_cds_print,
     parse_eda_energies,
@@ -23,12 +25,15 @@ from pya3eda.parser.qchem import (
     parse_thermo_conditions,
     parse_translational_entropy,
     parse_zpve,
+    scan_opt_output,
 )
+from pya3eda.parser.xyz import parse_output_xyz
 from pya3eda.utils import convert_unit
 from tests.synthetic_outputs import (
     EDA_FRZ_OUTPUT,
     EDA_FULL_SP_OUTPUT,
     EDA_POL_OUTPUT,
+    FRAGMENTED_OPT_OUTPUT,
     OPT_OUTPUT,
     SP_OUTPUT,
     TS_OUTPUT,
@@ -239,6 +244,116 @@ class TestParseSMD:
         assert parse_smd("regular output without smd") is None
 
 
+# ===================================================================
+# scan_opt_output — the single-pass scanner behind the parse_* views
+# ===================================================================
+
+_ALL_OUTPUTS = [
+    OPT_OUTPUT,
+    TS_OUTPUT,
+    SP_OUTPUT,
+    FRAGMENTED_OPT_OUTPUT,
+    EDA_POL_OUTPUT,
+    EDA_FRZ_OUTPUT,
+    EDA_FULL_SP_OUTPUT,
+]
+
+
+class TestScanOptOutput:
+    @pytest.mark.parametrize("text", _ALL_OUTPUTS)
+    def test_one_pass_matches_every_per_field_view(self, text: str) -> None:
+        """Scanning all fields together equals each field scanned on its own."""
+        summary = scan_opt_output(text)
+        assert summary == OptOutputSummary(
+            energy=parse_energy(text),
+            opt_converged=parse_opt_converged(text),
+            thermo=parse_thermo_conditions(text),
+            imag_freq=parse_imaginary_freq(text),
+            zpve=parse_zpve(text),
+            enthalpy=parse_enthalpy(text),
+            entropy=parse_entropy(text),
+            trans_entropy=parse_translational_entropy(text),
+            smd=parse_smd(text),
+            geometry=parse_output_xyz(text),
+        )
+
+    def test_opt_output_values(self) -> None:
+        summary = scan_opt_output(OPT_OUTPUT)
+        assert summary.energy is not None
+        assert summary.energy.value_ha == pytest.approx(-191.709724458668)
+        assert summary.opt_converged is True
+        assert summary.thermo == (pytest.approx(298.15), pytest.approx(1.0))
+        assert summary.imag_freq == 0
+        assert summary.zpve == pytest.approx(38.832)
+        assert summary.enthalpy == pytest.approx(42.119)  # QRRHO, not the plain total
+        assert summary.entropy == pytest.approx(66.534e-3)
+        assert summary.trans_entropy == pytest.approx(37.991e-3)
+        assert summary.smd is None
+        assert summary.geometry is not None
+        assert summary.geometry.n_atoms == 8
+        assert "0.4205497061" in summary.geometry.atoms[0]  # last orientation block
+
+    def test_unrequested_fields_keep_defaults(self) -> None:
+        summary = scan_opt_output(OPT_OUTPUT, ("zpve",))
+        assert summary.zpve == pytest.approx(38.832)
+        assert summary == OptOutputSummary(zpve=summary.zpve)
+
+    def test_unknown_field_raises(self) -> None:
+        with pytest.raises(ValueError, match="bogus"):
+            scan_opt_output(OPT_OUTPUT, ("energy", "bogus"))
+
+    def test_default_selection_is_every_field(self) -> None:
+        assert set(OPT_FIELDS) == set(OptOutputSummary._fields)
+
+    def test_undecodable_last_hit_falls_back_to_previous(self) -> None:
+        """A marker whose final occurrence does not decode yields the previous good one."""
+        text = "Total energy =  -100.5\nTotal energy =  n/a\n"
+        result = parse_energy(text)
+        assert result is not None
+        assert result.value_ha == pytest.approx(-100.5)
+
+    def test_thermo_header_and_imag_count_follow_the_last_block(self) -> None:
+        """T/P and the imaginary count come from the same (last) block as H and S."""
+        text = (
+            "STANDARD THERMODYNAMIC QUANTITIES AT   300.00 K  AND     2.00 ATM\n"
+            "This Molecule has  2 Imaginary Frequencies\n"
+            "STANDARD THERMODYNAMIC QUANTITIES AT   310.00 K  AND     3.00 ATM\n"
+            "This Molecule has  0 Imaginary Frequencies\n"
+        )
+        summary = scan_opt_output(text, ("thermo", "imag_freq"))
+        assert summary.thermo == (pytest.approx(310.0), pytest.approx(3.0))
+        assert summary.imag_freq == 0
+        assert parse_thermo_conditions(text) == summary.thermo
+        assert parse_imaginary_freq(text) == 0
+
+    def test_qrrho_line_is_not_mistaken_for_plain_total(self) -> None:
+        """The plain-total fallback never reads the total embedded in a QRRHO line."""
+        text = (
+            "Total Enthalpy:  10.000 kcal/mol\n"
+            "QRRHO-Total Enthalpy:  20.000 kcal/mol\n"
+            "Total Entropy:  30.000 cal/mol.K\n"
+        )
+        summary = scan_opt_output(text, ("enthalpy", "entropy"))
+        assert summary.enthalpy == pytest.approx(20.0)
+        assert summary.entropy == pytest.approx(30.0e-3)
+
+    def test_geometry_without_molecule_block_defaults_charge(self) -> None:
+        text = (
+            "Standard Nuclear Orientation (Angstroms)\n"
+            "    1      H       1.0000000    2.0000000    3.0000000\n"
+            " -----\n"
+        )
+        geometry = scan_opt_output(text, ("geometry",)).geometry
+        assert geometry is not None
+        assert (geometry.charge, geometry.multiplicity) == (0, 1)
+
+    def test_smd_summary_cds_fallback(self) -> None:
+        """Without the detailed (4) row the summary G_CDS line supplies CDS."""
+        text = "        G_CDS  =    -0.5000 kcal/mol (non-electrostatic energy)\n"
+        smd = parse_smd(text)
+        assert smd == SMDData(None, None, pytest.approx(-0.5))
+
+
 # ===================================================================
 # parse_eda_energies
 # ===================================================================
@@ -393,6 +508,19 @@ class TestParseStatus:
         status, _ = parse_status("   \n  \n")
         assert status == "empty"
 
+    @pytest.mark.parametrize(
+        ("out", "err", "status"),
+        [
+            (OPT_OUTPUT, "", "SUCCESSFUL"),
+            ("Q-Chem fatal error occurred\nSGeom Failed\n", "", "CRASH"),
+            ("error occurred in module\n  Something happened.\n", "Error in Q-Chem run", "CRASH"),
+        ],
+    )
+    def test_without_detail(self, out: str, err: str, status: str) -> None:
+        """detail=False gives the same status without working out the message."""
+        assert parse_status(out, err, detail=False) == (status, "")
+        assert parse_status(out, err)[0] == status
+
     def test_crash_detail_known_tag(self) -> None:
         """_crash_detail returns known failure message for SGeom Failed."""
         status, detail = parse_status("Q-Chem fatal error occurred\nSGeom Failed\n")
@@ -442,3 +570,57 @@ class TestParseStatus:
         status, detail = parse_status(text)
         assert status == "SUCCESSFUL"
         assert "5 minutes 30 seconds" in detail
+
+
+# ===================================================================
+# Raw (bytes / mmap) buffers
+# ===================================================================
+
+_STATUS_CASES = [
+    (OPT_OUTPUT, ""),
+    (SP_OUTPUT, ""),
+    ("", ""),
+    ("   \n  \n", ""),
+    ("Running on host abc\nSCF failed to converge\n", ""),
+    ("Running on host abc\nProcess KILLED by signal\n", ""),
+    ("Running on host abc\n", ""),
+    ("some output", "CANCELLED AT 2024-01-01"),
+    ("error occurred in module\n  Something specific happened here.\n\n", "Error in Q-Chem run"),
+    ("Q-Chem fatal error occurred\nSGeom Failed\n", ""),
+    ("Running on host\nThank you very much.\nTotal job time: 5 minutes\n", ""),
+]
+
+
+class TestRawBuffers:
+    """Every parser gives the same answer on the raw bytes as on the decoded text."""
+
+    @pytest.mark.parametrize("text", _ALL_OUTPUTS)
+    def test_scan_opt_output(self, text: str) -> None:
+        assert scan_opt_output(text.encode()) == scan_opt_output(text)
+
+    @pytest.mark.parametrize("text", _ALL_OUTPUTS)
+    @pytest.mark.parametrize("calc_type", ["pol_cat", "frz_cat", "full_cat"])
+    def test_eda_energies(self, text: str, calc_type: str) -> None:
+        assert parse_eda_energies(text.encode(), calc_type) == parse_eda_energies(text, calc_type)
+
+    @pytest.mark.parametrize("text", _ALL_OUTPUTS)
+    def test_geometry(self, text: str) -> None:
+        assert parse_output_xyz(text.encode()) == parse_output_xyz(text)
+
+    @pytest.mark.parametrize(("out", "err"), _STATUS_CASES)
+    def test_status(self, out: str, err: str) -> None:
+        assert parse_status(out.encode(), err.encode()) == parse_status(out, err)
+
+    def test_memory_map(self, tmp_path) -> None:
+        from pya3eda.utils import map_file
+
+        path = tmp_path / "opt.out"
+        path.write_text(OPT_OUTPUT, encoding="utf-8")
+        with map_file(path) as buf:
+            assert buf is not None
+            assert scan_opt_output(buf) == scan_opt_output(OPT_OUTPUT)
+            assert parse_status(buf) == parse_status(OPT_OUTPUT)
+
+    def test_non_ascii_group_is_decoded(self) -> None:
+        text = "error occurred in module\n  Bad ångström value.\n\n"
+        assert parse_status(text.encode(), b"Aborted") == ("CRASH", "Bad ångström value")
@@ -0,0 +1,281 @@
+"""Tests for pya3eda.parser.tail — tail-first OPT output reading.
+
+Every case compares against :func:`scan_opt_output` over the full text: the
+tail-first reader may only change how much of the file is read, never the answer.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pya3eda.parser._buffer import Text
+from pya3eda.parser.qchem import (
+    OptOutputSummary,
+    parse_eda_energies,
+    parse_energy,
+    parse_status,
+    scan_opt_output,
+    sp_energy_patterns,
+)
+from pya3eda.parser.tail import (
+    distill_file,
+    parse_status_file,
+    parse_status_windows,
+    read_head,
+    scan_opt_file,
+    scan_opt_tail,
+)
+from pya3eda.parser.xyz import MOLECULE_BLOCK_RE, parse_output_fragments
+from pya3eda.utils import open_compressed
+from pya3eda.vocab import CalcType
+from tests.synthetic_outputs import (
+    EDA_FRZ_OUTPUT,
+    EDA_FULL_SP_OUTPUT,
+    EDA_POL_OUTPUT,
+    FRAGMENTED_OPT_OUTPUT,
+    OPT_OUTPUT,
+    SP_OUTPUT,
+    TS_OUTPUT,
+)
+
+_OUTPUTS = [OPT_OUTPUT, TS_OUTPUT, SP_OUTPUT, FRAGMENTED_OPT_OUTPUT, EDA_FULL_SP_OUTPUT]
+
+
+def _write(tmp_path: Path, data: str | bytes) -> Path:
+    path = tmp_path / "job.out"
+    if isinstance(data, str):
+        path.write_text(data, encoding="utf-8")
+    else:
+        path.write_bytes(data)
+    return path
+
+
+def _write_compressed(tmp_path: Path, text: str, fmt: str) -> Path:
+    """Write *text* as ``job.out.<fmt>``; return the plain path readers are given."""
+    with open_compressed(tmp_path / f"job.out.{fmt}", "wb") as fh:
+        fh.write(text.encode())
+    return tmp_path / "job.out"
+
+
+class TestScanOptFile:
+    @pytest.mark.parametrize("text", _OUTPUTS)
+    @pytest.mark.parametrize("window", [16, 256, 1 << 16])
+    def test_matches_full_text_scan(self, tmp_path: Path, text: str, window: int) -> None:
+        path = _write(tmp_path, text)
+        assert scan_opt_file(path, window=window) == scan_opt_output(text)
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert scan_opt_file(tmp_path / "absent.out") is None
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        assert scan_opt_file(_write(tmp_path, "")) is None
+
+    def test_no_fields(self, tmp_path: Path) -> None:
+        assert scan_opt_file(_write(tmp_path, OPT_OUTPUT), ()) == OptOutputSummary()
+
+    def test_unknown_field_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="bogus"):
+            scan_opt_file(_write(tmp_path, OPT_OUTPUT), ("bogus",))
+
+    def test_stops_once_every_marker_is_found(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Last-wins fields resolved near EOF never search the head of the file."""
+        from pya3eda.parser import tail
+
+        starts: list[int] = []
+        real_scan = tail._scan
+
+        def spy(buf: Text, markers: frozenset[str], pos: int = 0, endpos: int | None = None):
+            starts.append(pos)
+            return real_scan(buf, markers, pos, endpos)
+
+        monkeypatch.setattr(tail, "_scan", spy)
+        fields = ("energy", "thermo", "zpve", "enthalpy", "entropy", "imag_freq")
+        text = "-\n" * 100_000 + OPT_OUTPUT
+        path = _write(tmp_path, text)
+        assert scan_opt_file(path, fields, window=2048) == scan_opt_output(text, fields)
+        assert starts == [len(text) - 2048]
+
+    def test_missing_preferred_marker_reads_the_whole_file(self, tmp_path: Path) -> None:
+        """No ``Final energy is`` near the end: an earlier one must still win."""
+        text = " Final energy is   -10.000000000000\n" + "-\n" * 5000 + " Total energy =  -20.0\n"
+        result = scan_opt_file(_write(tmp_path, text), ("energy",), window=64)
+        assert result is not None
+        assert result.energy is not None
+        assert result.energy.value_ha == pytest.approx(-10.0)
+
+    def test_head_hit_near_window_edge_is_reread(self, tmp_path: Path) -> None:
+        """A ``$molecule`` header cut by the head window is decoded from a larger one."""
+        text = "x\n" * 1000 + "$molecule\n" + "\n" * 5000 + "0 2\n" + OPT_OUTPUT.split("$end", 1)[1]
+        text += "x\n" * 5000
+        path = _write(tmp_path, text)
+        result = scan_opt_file(path, ("geometry",), window=4096)
+        assert result == scan_opt_output(text, ("geometry",))
+        assert result is not None
+        assert result.geometry is not None
+        assert result.geometry.multiplicity == 2
+
+    def test_window_cut_inside_a_multibyte_character(self, tmp_path: Path) -> None:
+        text = OPT_OUTPUT + "Å" * 40
+        path = _write(tmp_path, text)
+        # An odd window lands inside a two-byte "Å".
+        assert scan_opt_file(path, window=51) == scan_opt_output(text)
+
+    @pytest.mark.parametrize("text", _OUTPUTS)
+    def test_scan_opt_tail_on_text(self, text: str) -> None:
+        assert scan_opt_tail(text, window=64) == scan_opt_output(text)
+
+
+_FILLER = "-\n" * 2000
+
+# (output, err) — the middle of each output is padded past twice the test window.
+_STATUS_CASES = [
+    (OPT_OUTPUT, ""),
+    (SP_OUTPUT, ""),
+    ("Running on host abc\n" + _FILLER + "SCF failed to converge\n", ""),
+    ("Running on host abc\n" + _FILLER + "Process KILLED by signal\n", ""),
+    ("Running on host abc\n" + _FILLER, ""),
+    ("Running on host abc\n" + _FILLER + "Q-Chem fatal error occurred\nSGeom Failed\n", ""),
+    (_FILLER + "error occurred in module\n  Something specific.\n\n", "Error in Q-Chem run"),
+    ("   \n" * 1000, ""),
+    ("", ""),
+]
+
+
+def _padded(text: str) -> str:
+    """Insert the filler after the first line, so markers sit in the head or the tail."""
+    first, _, rest = text.partition("\n")
+    return first + "\n" + _FILLER + rest
+
+
+class TestParseStatusWindows:
+    @pytest.mark.parametrize(("out", "err"), _STATUS_CASES)
+    @pytest.mark.parametrize("raw", [False, True])
+    def test_matches_full_scan(self, out: str, err: str, raw: bool) -> None:
+        text = _padded(out) if out.strip() else out
+        buf: Text = text.encode() if raw else text
+        assert parse_status_windows(buf, err, window=1024) == parse_status(text, err)
+
+    @pytest.mark.parametrize(("out", "err"), _STATUS_CASES)
+    def test_status_without_detail(self, out: str, err: str) -> None:
+        text = _padded(out) if out.strip() else out
+        status, _ = parse_status(text, err)
+        assert parse_status_windows(text, err, window=1024, detail=False)[0] == status
+
+    def test_short_output_is_read_whole(self) -> None:
+        assert parse_status_windows(OPT_OUTPUT) == parse_status(OPT_OUTPUT)
+
+    def test_unclassified_windows_fall_back_to_a_full_scan(self) -> None:
+        text = "garbage\n" + _FILLER + "SGeom Failed\n" + _FILLER
+        assert parse_status_windows(text, window=1024) == ("CRASH", "Geometry optimization failed")
+
+    def test_middle_of_a_running_output_is_not_read(self) -> None:
+        """A failure marker buried mid-output does not override a live head/tail."""
+        text = "Running on host abc\n" + _FILLER + "SCF failed to converge\n" + _FILLER
+        assert parse_status_windows(text, window=1024) == ("running", "Calculation in progress")
+
+    @pytest.mark.parametrize("raw", [False, True])
+    def test_parse_status_file(self, tmp_path: Path, raw: bool) -> None:
+        text = _padded(OPT_OUTPUT)
+        path = _write(tmp_path, text) if raw else _write_compressed(tmp_path, text, "gz")
+        assert parse_status_file(path, window=1024) == parse_status(text)
+
+    def test_parse_status_file_missing_output(self, tmp_path: Path) -> None:
+        assert parse_status_file(tmp_path / "job.out") == ("nofile", "Output file not found")
+
+
+@pytest.mark.parametrize("fmt", ["gz", "zst", "xz"])
+class TestCompressedOutputs:
+    """Compressed outputs give exactly the answers of their plain text."""
+
+    @pytest.mark.parametrize("text", _OUTPUTS)
+    @pytest.mark.parametrize("window", [16, 1 << 16])
+    def test_scan_matches_full_text(self, tmp_path: Path, fmt: str, text: str, window: int) -> None:
+        path = _write_compressed(tmp_path, text, fmt)
+        assert scan_opt_file(path, window=window) == scan_opt_output(text)
+
+    def test_head_and_tail_of_a_large_output(self, tmp_path: Path, fmt: str) -> None:
+        head, _, rest = FRAGMENTED_OPT_OUTPUT.partition("Standard Nuclear Orientation")
+        text = head + "-\n" * 50_000 + "Standard Nuclear Orientation" + rest
+        path = _write_compressed(tmp_path, text, fmt)
+        fields = ("energy", "geometry")
+        result = scan_opt_file(path, fields, window=4096)
+        assert result == scan_opt_output(text, fields)
+        assert result is not None
+        assert result.geometry is not None
+        assert result.energy is not None
+
+    def test_empty(self, tmp_path: Path, fmt: str) -> None:
+        assert scan_opt_file(_write_compressed(tmp_path, "", fmt)) is None
+
+    @pytest.mark.parametrize(("out", "err"), _STATUS_CASES)
+    def test_status_matches_full_scan(self, tmp_path: Path, fmt: str, out: str, err: str) -> None:
+        text = _padded(out) if out.strip() else out
+        path = _write_compressed(tmp_path, text, fmt)
+        assert parse_status_file(path, err, window=1024) == parse_status(text, err)
+
+
+def _sp_energy(text: Text, calc_type: str) -> object:
+    """What the extractor reads from an SP output of *calc_type*."""
+    return parse_eda_energies(text, calc_type) if calc_type else parse_energy(text)
+
+
+_SP_CASES = [
+    (SP_OUTPUT, ""),
+    (EDA_POL_OUTPUT, CalcType.POL_CAT),
+    (EDA_FRZ_OUTPUT, CalcType.FRZ_CAT),
+    (EDA_FULL_SP_OUTPUT, CalcType.FULL_CAT),
+]
+
+
+class TestDistillFile:
+    """Parsing the distilled text gives exactly the SP energies of the full output."""
+
+    @pytest.mark.parametrize(("text", "calc_type"), _SP_CASES)
+    @pytest.mark.parametrize("fmt", ["", "gz", "zst", "xz"])
+    @pytest.mark.parametrize("block", [16, 1 << 20])
+    def test_matches_full_text(
+        self, tmp_path: Path, text: str, calc_type: str, fmt: str, block: int
+    ) -> None:
+        # Twice over, padded: the energies that count are in the second copy.
+        text = text + _FILLER + text.replace("1", "2") + _FILLER
+        path = _write_compressed(tmp_path, text, fmt) if fmt else _write(tmp_path, text)
+        source = path.with_name(f"job.out.{fmt}") if fmt else path
+        distilled, size = distill_file(
+            source, *sp_energy_patterns(calc_type), block=block, overlap=256
+        )
+        assert size == len(text.encode())
+        assert _sp_energy(distilled, calc_type) == _sp_energy(text, calc_type)
+        assert len(distilled) < 1024
+
+    def test_first_wins_pattern_keeps_the_first_match(self, tmp_path: Path) -> None:
+        text = EDA_FULL_SP_OUTPUT + _FILLER + EDA_FULL_SP_OUTPUT.replace("0.3295", "9.9")
+        path = _write(tmp_path, text)
+        distilled, _ = distill_file(path, *sp_energy_patterns(CalcType.FULL_CAT), block=64)
+        result = parse_eda_energies(distilled, CalcType.FULL_CAT)
+        assert result == parse_eda_energies(text, CalcType.FULL_CAT)
+        assert result is not None
+        assert result.bsse_kcal == pytest.approx(0.3295 / 4.184, rel=1e-4)
+
+    def test_empty_and_unmatched(self, tmp_path: Path) -> None:
+        assert distill_file(_write(tmp_path, ""), *sp_energy_patterns("")) == (b"", 0)
+        assert distill_file(_write(tmp_path, "x" * 100), *sp_energy_patterns("")) == (b"", 100)
+
+
+@pytest.mark.parametrize("fmt", ["gz", "xz"])
+class TestReadHead:
+    def test_stops_once_the_block_is_read(self, tmp_path: Path, fmt: str) -> None:
+        text = FRAGMENTED_OPT_OUTPUT + _FILLER * 10
+        path = _write_compressed(tmp_path, text, fmt).with_name(f"job.out.{fmt}")
+        head = read_head(path, MOLECULE_BLOCK_RE, window=64)
+        assert len(head) < len(text)
+        assert parse_output_fragments(head) == parse_output_fragments(text)
+        assert parse_output_fragments(head) is not None
+
+    def test_whole_content_without_a_block(self, tmp_path: Path, fmt: str) -> None:
+        text = "no block\n" + _FILLER
+        path = _write_compressed(tmp_path, text, fmt).with_name(f"job.out.{fmt}")
+        assert read_head(path, MOLECULE_BLOCK_RE, window=64) == text.encode()
@@ -0,0 +1,123 @@
+"""Tests for pya3eda.parser.trajectory — every geometry step as NumPy arrays."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pya3eda.parser.trajectory import (
+    format_xyz_trajectory,
+    iter_steps,
+    parse_trajectory,
+    read_trajectory,
+)
+from pya3eda.parser.xyz import parse_output_xyz, parse_xyz
+from tests.synthetic_outputs import OPT_OUTPUT, SP_OUTPUT
+
+
+def _orientation(*atoms: tuple[str, float]) -> str:
+    rows = "".join(
+        f"    {i}      {el}       {x:.10f}    0.0000000000    0.0000000000\n"
+        for i, (el, x) in enumerate(atoms, start=1)
+    )
+    return (
+        " Standard Nuclear Orientation (Angstroms)\n"
+        "    I     Atom           X            Y            Z\n"
+        " ----------------------------------------------------------------\n"
+        f"{rows}"
+        " ----------------------------------------------------------------\n"
+    )
+
+
+def _cycle(step: int, energy: float, gradient: float) -> str:
+    return (
+        f" Total energy in the final basis set =     {energy:.10f}\n"
+        f" Optimization Cycle:   {step}\n"
+        f"         Gradient      {gradient:.6f}      0.000300      NO\n"
+    )
+
+
+_THREE_STEPS = (
+    _orientation(("O", 0.0), ("H", 0.9), ("H", -0.9))
+    + _cycle(1, -76.0, 0.05)
+    + _orientation(("O", 0.0), ("H", 0.95), ("H", -0.95))
+    + _cycle(2, -76.2, 0.004)
+    + _orientation(("O", 0.0), ("H", 0.96), ("H", -0.96))
+)
+
+
+class TestIterSteps:
+    def test_steps_in_order(self) -> None:
+        steps = list(iter_steps(_THREE_STEPS))
+        assert [s.energy_ha for s in steps] == [-76.0, -76.2, None]
+        assert [s.max_gradient for s in steps] == [0.05, 0.004, None]
+        assert steps[1].elements == ["O", "H", "H"]
+        np.testing.assert_array_equal(steps[1].coords[:, 0], [0.0, 0.95, -0.95])
+
+    def test_bytes_match_text(self) -> None:
+        text = list(iter_steps(_THREE_STEPS))
+        raw = list(iter_steps(_THREE_STEPS.encode()))
+        assert [s.energy_ha for s in raw] == [s.energy_ha for s in text]
+        for a, b in zip(raw, text, strict=True):
+            np.testing.assert_array_equal(a.coords, b.coords)
+
+    def test_empty_table_is_skipped(self) -> None:
+        text = " Standard Nuclear Orientation (Angstroms)\n (truncated)\n"
+        assert list(iter_steps(text)) == []
+
+
+class TestParseTrajectory:
+    def test_shapes(self) -> None:
+        traj = parse_trajectory(_THREE_STEPS)
+        assert traj is not None
+        assert traj.coords.shape == (3, 3, 3)
+        assert traj.coords.dtype == np.float64
+        assert list(traj.elements) == ["O", "H", "H"]
+        np.testing.assert_array_equal(traj.energies, [-76.0, -76.2, np.nan])
+        np.testing.assert_array_equal(traj.max_gradients, [0.05, 0.004, np.nan])
+
+    def test_last_frame_matches_parse_output_xyz(self) -> None:
+        traj = parse_trajectory(OPT_OUTPUT)
+        assert traj is not None
+        assert len(traj.coords) == 2  # the optimised geometry, then the frequency job's
+        assert traj.energies[0] == pytest.approx(-191.709724458668)
+        assert traj.frame(-1, charge=0, multiplicity=1) == parse_output_xyz(OPT_OUTPUT)
+
+    def test_truncated_last_block_is_dropped(self) -> None:
+        cut = _THREE_STEPS + _orientation(("O", 0.0))
+        traj = parse_trajectory(cut)
+        assert traj is not None
+        assert traj.coords.shape == (3, 3, 3)
+
+    def test_no_geometry(self) -> None:
+        assert parse_trajectory(SP_OUTPUT.replace("Standard Nuclear Orientation", "")) is None
+
+
+class TestReadTrajectory:
+    def test_reads_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        path.write_text(_THREE_STEPS)
+        traj = read_trajectory(path)
+        assert traj is not None
+        np.testing.assert_array_equal(traj.coords, parse_trajectory(_THREE_STEPS).coords)  # type: ignore[union-attr]
+
+    def test_missing_or_empty(self, tmp_path: Path) -> None:
+        assert read_trajectory(tmp_path / "missing.out") is None
+        (tmp_path / "empty.out").touch()
+        assert read_trajectory(tmp_path / "empty.out") is None
+
+
+class TestFormatXyzTrajectory:
+    def test_multi_frame(self) -> None:
+        traj = parse_trajectory(_THREE_STEPS)
+        assert traj is not None
+        text = format_xyz_trajectory(traj)
+        lines = text.splitlines()
+        assert len(lines) == 3 * (2 + 3)
+        assert lines[1] == "step 1  E = -76.0000000000  max gradient = 0.050000"
+        assert lines[11] == "step 3"
+        # Each frame is itself a valid XYZ block (its header line aside).
+        frame = parse_xyz("3\n0 1\n" + "\n".join(lines[2:5]))
+        assert frame == traj.frame(0)
@@ -6,9 +6,11 @@ All tests are self-contained using synthetic Q-Chem output snippets.
 from __future__ import annotations
 
 from pya3eda.parser.xyz import (
+    ORIENTATION_TAG,
     XYZData,
     format_coord_line,
     format_xyz,
+    parse_orientation_block,
     parse_output_fragments,
     parse_output_xyz,
     parse_xyz,
@@ -200,6 +202,28 @@ class TestParseXYZEdgeCases:
         result = parse_output_xyz(text)
         assert result is None
 
+    def test_table_at_end_of_text_without_trailing_newline(self) -> None:
+        """A geometry table that ends the text (no final newline) is still read."""
+        text = (
+            "$molecule\n-1 2\n$end\n"
+            "Standard Nuclear Orientation (Angstroms)\n"
+            "    1      H       1.0000000    2.0000000    3.0000000"
+        )
+        result = parse_output_xyz(text)
+        assert result is not None
+        assert (result.n_atoms, result.charge, result.multiplicity) == (1, -1, 2)
+
+
+class TestParseOrientationBlock:
+    def test_reads_the_block_at_the_given_offset(self) -> None:
+        """The first of two blocks is read when its offset is passed explicitly."""
+        start = OPT_OUTPUT.index(ORIENTATION_TAG)
+        result = parse_orientation_block(OPT_OUTPUT, start, charge=1, multiplicity=2)
+        assert result is not None
+        assert result.n_atoms == 8
+        assert (result.charge, result.multiplicity) == (1, 2)
+        assert "0.0000000000" in result.atoms[0]  # the first (dummy) geometry
+
 
 # ===================================================================
 # parse_output_fragments
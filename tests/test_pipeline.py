@@ -7,6 +7,7 @@ exercised without a real backend.
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -14,11 +15,13 @@ from unittest.mock import patch
 import pytest
 
 from pya3eda.config import Config, LevelConfig, SpeciesConfig, TheoryConfig
+from pya3eda.ledger import JobLedger
 from pya3eda.pipeline import _Pipeline, run_pipeline
 from pya3eda.registry import CalcRegistry
 from pya3eda.runner.clusters import ClusterConfig, QChemVersion
 from pya3eda.runner.executor import RunOptions
 from pya3eda.runner.throttle import Throttler
+from pya3eda.status import checker
 from tests.conftest import _make_template_dir, _write_xyz
 from tests.synthetic_outputs import OPT_OUTPUT, SP_OUTPUT, TS_OUTPUT
 
@@ -119,6 +122,20 @@ class TestEndToEnd:
         raw = base / "results" / "HF_STO-3G_smd" / "raw_data"
         assert (raw / "opt_HF_STO-3G_smd.csv").exists()
         assert (raw / "sp_HF_STO-3G_smd.csv").exists()
+        # every job's submission and outcome recorded
+        with JobLedger.open(base) as ledger:
+            entries = ledger.entries()
+        assert len(entries) == 6
+        assert all(e.status == "SUCCESSFUL" and e.ended is not None for e in entries.values())
+
+    def test_each_output_is_classified_once(self, project: tuple[CalcRegistry, Path, Path]) -> None:
+        registry, tpl, base = project
+        with patch.object(checker, "_classify", wraps=checker._classify) as classify:
+            _run(registry, tpl, base, FakeBackend())
+        read = [call.args[0].out_path for call in classify.call_args_list]
+        read = [path for path in read if path is not None]
+        assert len(read) == 6  # 3 OPTs + 3 SPs, each once after its job finished
+        assert len(set(read)) == len(read)
 
     def test_resume_skips_already_done(self, project: tuple[CalcRegistry, Path, Path]) -> None:
         registry, tpl, base = project
@@ -182,6 +199,43 @@ class TestSchedulerBranches:
         _run(registry, tpl, base, SlowBackend(), max_cores=1)
         assert sleeps  # the idle-but-inflight sleep path was taken
 
+    def test_logs_progress_of_inflight_jobs(
+        self, project: tuple[CalcRegistry, Path, Path], caplog: pytest.LogCaptureFixture
+    ) -> None:
+        registry, tpl, base = project
+        pipe = _pipeline(registry, base, tpl, FakeBackend())
+        spec = next(s for s in registry.all_calcs if s.id.mode == "opt")
+        spec.output_path.parent.mkdir(parents=True, exist_ok=True)
+        spec.output_path.write_text("Running on host\n Optimization Cycle:   3\n")
+        pipe.inflight["job-1"] = spec
+        with caplog.at_level(logging.INFO, logger="pya3eda.pipeline"):
+            pipe._follow_inflight()
+            pipe._follow_inflight()  # nothing new written → not logged again
+        assert pipe.progress[spec.id].opt_step == 3
+        assert sum("step 3" in r.getMessage() for r in caplog.records) == 1
+
+    def test_scf_only_progress_logged_at_debug(
+        self, project: tuple[CalcRegistry, Path, Path], caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """SCF iterations change on every poll: not worth an INFO line per job."""
+        registry, tpl, base = project
+        pipe = _pipeline(registry, base, tpl, FakeBackend())
+        spec = next(s for s in registry.all_calcs if s.id.mode == "opt")
+        spec.output_path.parent.mkdir(parents=True, exist_ok=True)
+        spec.output_path.write_text(" Optimization Cycle:   3\n")
+        pipe.inflight["job-1"] = spec
+        with caplog.at_level(logging.DEBUG, logger="pya3eda.pipeline"):
+            pipe._follow_inflight()
+            with spec.output_path.open("a") as f:
+                f.write("    1     -232.1234567890      1.23e-02\n")
+            pipe._follow_inflight()
+            with spec.output_path.open("a") as f:
+                f.write(" Thank you very much for using Q-Chem.\n")
+            pipe._follow_inflight()
+        levels = [r.levelno for r in caplog.records if "step 3" in r.getMessage()]
+        assert levels == [logging.INFO, logging.DEBUG, logging.INFO]
+        assert pipe.progress[spec.id].scf_cycles == 1
+
     def test_submit_skips_missing_input(self, project: tuple[CalcRegistry, Path, Path]) -> None:
         registry, tpl, base = project
         be = FakeBackend()
@@ -222,9 +276,6 @@ class TestSchedulerBranches:
         tpl = _make_template_dir(tmp_path)
         registry = CalcRegistry(_config(), tmp_path)
         pipe = _pipeline(registry, tmp_path, tpl, FakeBackend())
-        for s in registry.all_calcs:
-            if s.id.mode == "sp":
-                pipe.sp_by_opt.setdefault(s.id.to_opt(), []).append(s)
         opt = next(s for s in registry.all_calcs if s.id.mode == "opt" and s.id.species == "mol_a")
         pipe._enqueue_sps(opt)
         assert not pipe.ready  # SP molecule build failed → input not built → not enqueued
@@ -5,18 +5,21 @@ All tests are self-contained using inline Config objects.
 
 from __future__ import annotations
 
+from itertools import pairwise
 from pathlib import Path
 
 import pytest
 
 from pya3eda.config import (
     CatalystConfig,
+    ComplexConfig,
     Config,
     LevelConfig,
     SpeciesConfig,
     TheoryConfig,
     load_config,
 )
+from pya3eda.errors import ConfigError
 from pya3eda.ids import CalcID, ProfileID
 from pya3eda.registry import CalcRegistry, build_method_key
 from pya3eda.registry.paths import build_input_path
@@ -100,6 +103,39 @@ class TestRegistrySyntheticConfig:
         for spec in sp_calcs:
             assert spec.id.sp_subfolder == "wB97M-V_def2-TZVPPD_smd_sp"
 
+    def test_indexes_match_scans(self, registry: CalcRegistry) -> None:
+        """Every indexed lookup equals the filtered scan, in registry order."""
+        calcs = registry.all_calcs
+        assert registry.all_calcs is calcs  # built once, not per access
+        for mk in [*registry.method_keys, "missing"]:
+            assert registry.by_method(mk) == tuple(c for c in calcs if c.id.method_key == mk)
+            assert registry.profiles_for_method(mk) == tuple(
+                p for p in registry.all_profiles if p.id.method_key == mk
+            )
+        for mode in ("opt", "sp"):
+            assert registry.by_mode(mode) == tuple(c for c in calcs if c.id.mode == mode)
+        for cat in (None, "lip", "bf3", "missing"):
+            assert registry.by_catalyst(cat) == tuple(c for c in calcs if c.id.catalyst == cat)
+        for stage in ("reactants", "preTS", "ts", "postTS", "products"):
+            assert registry.by_stage(stage) == tuple(c for c in calcs if c.id.stage == stage)
+
+    def test_specs_share_level_context(self, registry: CalcRegistry) -> None:
+        """One CalcContext per (level, theory), referenced by each of its specs."""
+        contexts = {id(spec.context) for spec in registry.all_calcs}
+        assert len(contexts) == 2  # the OPT theory and its one SP theory
+        assert {spec.context.sp_subfolder for spec in registry.by_mode("sp")} == {
+            "wB97M-V_def2-TZVPPD_smd_sp"
+        }
+
+    def test_sps_for(self, registry: CalcRegistry) -> None:
+        for opt in registry.by_mode("opt"):
+            sps = registry.sps_for(opt.id)
+            assert sps == tuple(c for c in registry.by_mode("sp") if c.id.to_opt() == opt.id)
+        assert sum(len(registry.sps_for(opt.id)) for opt in registry.by_mode("opt")) == len(
+            registry.by_mode("sp")
+        )
+        assert registry.sps_for(registry.by_mode("sp")[0].id) == ()
+
     def test_get_nonexistent_raises(self, registry: CalcRegistry) -> None:
         fake = CalcID(method_key="fake", stage="ts", species="x")
         with pytest.raises(KeyError):
@@ -220,7 +256,7 @@ class TestRegistryProperties:
         assert len(profiles) > 0
         assert all(p.id.method_key == "HF_STO-3G" for p in profiles)
         # Non-existent method
-        assert reg.profiles_for_method("NONEXISTENT") == []
+        assert reg.profiles_for_method("NONEXISTENT") == ()
 
 
 # ===================================================================
@@ -257,6 +293,116 @@ class TestPostTSAlternatives:
                 assert post_stages[0].alternatives is not None
 
 
+# ===================================================================
+# Bounded complex enumeration (``complexes``)
+# ===================================================================
+
+
+def pairs_only(species: tuple[str, ...]) -> list[list[str]]:
+    """Combination generator: adjacent pairs only (duplicates and a reversal)."""
+    pairs = [[a, b] for a, b in pairwise(species)]
+    return [*pairs, *pairs, list(reversed(pairs[0]))] if pairs else []
+
+
+def stranger(species: tuple[str, ...]) -> list[tuple[str, ...]]:
+    """Combination generator naming a species that is not in the config."""
+    return [(*species[:1], "unobtanium")]
+
+
+def _complex_config(complexes: ComplexConfig) -> Config:
+    """Four included reactants, three included products, one catalyst."""
+    return Config(
+        levels=[LevelConfig(opt=TheoryConfig(method="HF", basis="STO-3G"))],
+        reactants=[SpeciesConfig(name=f"r{i}") for i in range(1, 5)],
+        products=[SpeciesConfig(name=f"p{i}") for i in range(1, 4)],
+        catalysts=[CatalystConfig(name="cat")],
+        complexes=complexes,
+    )
+
+
+class TestComplexBounds:
+    @staticmethod
+    def _species(reg: CalcRegistry, stage: str) -> list[str]:
+        """Species of one stage's full_cat (or uncatalysed) calcs, in registry order."""
+        return [
+            c.id.species
+            for c in reg.by_stage(stage)
+            if c.id.calc_type in (None, "full_cat") and c.id.catalyst in (None, "cat")
+        ]
+
+    @staticmethod
+    def _assert_profiles_resolve(reg: CalcRegistry) -> None:
+        """Every CalcID a profile stage or alternative sums exists in the registry."""
+        for pspec in reg.all_profiles:
+            for stage in pspec.stages:
+                for ids in (stage.calc_ids, *(alt.calc_ids for alt in stage.alternatives)):
+                    for calc_id in ids:
+                        reg.get(calc_id)
+
+    def test_unbounded_by_default(self, tmp_path: Path) -> None:
+        reg = CalcRegistry(_complex_config(ComplexConfig()), tmp_path)
+        assert len(self._species(reg, "preTS")) == 2**4 - 1
+        assert len(self._species(reg, "postTS")) == 2**3 - 1
+
+    def test_max_size_keeps_full_complex(self, tmp_path: Path) -> None:
+        reg = CalcRegistry(_complex_config(ComplexConfig(max_size=1)), tmp_path)
+        assert self._species(reg, "preTS") == [
+            "cat-r1",
+            "cat-r2",
+            "cat-r3",
+            "cat-r4",
+            "cat-r1-r2-r3-r4",
+        ]
+        assert self._species(reg, "postTS") == ["cat-p1", "cat-p2", "cat-p3", "cat-p1-p2-p3"]
+        clusters = [s for s in self._species(reg, "reactants") if "-" in s]
+        assert clusters == ["r1-r2-r3-r4"]
+        self._assert_profiles_resolve(reg)
+        pre = next(p for p in reg.all_profiles if p.id.calc_type == "full_cat").stages[1]
+        assert [alt.label for alt in pre.alternatives][:1] == ["cat-r1 + r2 + r3 + r4"]
+        assert len(pre.alternatives) == 4
+
+    def test_allowed_combinations(self, tmp_path: Path) -> None:
+        complexes = ComplexConfig(allowed=[["r3", "r1"], ["p2"], ["r1", "r3"], ["r2"]])
+        reg = CalcRegistry(_complex_config(complexes), tmp_path)
+        assert self._species(reg, "preTS") == ["cat-r1-r3", "cat-r2", "cat-r1-r2-r3-r4"]
+        assert self._species(reg, "postTS") == ["cat-p2", "cat-p1-p2-p3"]
+        self._assert_profiles_resolve(reg)
+
+    def test_allowed_full_set_not_repeated(self, tmp_path: Path) -> None:
+        complexes = ComplexConfig(allowed=[["p1", "p2", "p3"], ["p1"]])
+        reg = CalcRegistry(_complex_config(complexes), tmp_path)
+        assert self._species(reg, "postTS") == ["cat-p1-p2-p3", "cat-p1"]
+
+    def test_generator_plugin(self, tmp_path: Path) -> None:
+        complexes = ComplexConfig(generator="tests.test_registry:pairs_only", max_size=2)
+        reg = CalcRegistry(_complex_config(complexes), tmp_path)
+        assert self._species(reg, "preTS") == [
+            "cat-r1-r2",
+            "cat-r2-r3",
+            "cat-r3-r4",
+            "cat-r1-r2-r3-r4",
+        ]
+        clusters = [s for s in self._species(reg, "reactants") if "-" in s]
+        assert clusters == ["r1-r2", "r2-r3", "r3-r4", "r1-r2-r3-r4"]
+        self._assert_profiles_resolve(reg)
+
+    def test_generator_with_single_species(self, tmp_path: Path) -> None:
+        cfg = Config(
+            levels=[LevelConfig(opt=TheoryConfig(method="HF", basis="STO-3G"))],
+            reactants=[SpeciesConfig(name="r1")],
+            products=[SpeciesConfig(name="p1")],
+            catalysts=[CatalystConfig(name="cat")],
+            complexes=ComplexConfig(generator="tests.test_registry:pairs_only"),
+        )
+        reg = CalcRegistry(cfg, tmp_path)
+        assert self._species(reg, "preTS") == ["cat-r1"]
+
+    def test_generator_unknown_species(self, tmp_path: Path) -> None:
+        complexes = ComplexConfig(generator="tests.test_registry:stranger")
+        with pytest.raises(ConfigError, match="unobtanium"):
+            CalcRegistry(_complex_config(complexes), tmp_path)
+
+
 # ===================================================================
 # Duplicate CalcID detection (L310) — merged OPT levels
 # ===================================================================
@@ -0,0 +1,181 @@
+"""Tests for pya3eda.registry.compiled — the compiled-registry cache."""
+
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import pickle
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from pya3eda.cache import CACHE_DIR
+from pya3eda.errors import ConfigError
+from pya3eda.registry import CalcRegistry, compiled
+from pya3eda.registry.compiled import REGISTRY_FILE, load_registry, registry_key
+from tests.synthetic_outputs import SAMPLE_CONFIG_YAML
+
+from .registry_dump import dump_registry, snapshot_config
+
+_SNAPSHOT = Path(__file__).parent / "registry_snapshot.txt"
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "config.yaml"
+    path.write_text(SAMPLE_CONFIG_YAML)
+    return path
+
+
+def _cache_file(config_path: Path) -> Path:
+    return config_path.parent / CACHE_DIR / REGISTRY_FILE
+
+
+def _no_load_config() -> Any:
+    """Patch ``load_config`` to fail: a cache hit must not need it."""
+    return patch("pya3eda.config.load_config", side_effect=AssertionError("config reloaded"))
+
+
+class TestLoadRegistry:
+    def test_miss_then_hit(self, config_path: Path) -> None:
+        built = load_registry(config_path)
+        assert _cache_file(config_path).is_file()
+        with _no_load_config():
+            restored = load_registry(config_path)
+        assert restored is not built
+        assert restored.all_calcs == built.all_calcs
+        assert restored.all_profiles == built.all_profiles
+        assert restored.config == built.config
+        assert restored.base_dir == built.base_dir == config_path.parent
+        assert restored.method_keys == built.method_keys
+        spec = restored.all_calcs[-1]
+        assert restored.get(spec.id) is spec
+        assert restored.sps_for(spec.id.to_opt()) == built.sps_for(spec.id.to_opt())
+
+    @pytest.mark.parametrize("gc_enabled", [True, False])
+    def test_gc_state_restored(self, config_path: Path, gc_enabled: bool) -> None:
+        load_registry(config_path)
+        was = gc.isenabled()
+        (gc.enable if gc_enabled else gc.disable)()
+        try:
+            load_registry(config_path)
+            assert gc.isenabled() is gc_enabled
+        finally:
+            (gc.enable if was else gc.disable)()
+
+    def test_restored_registry_matches_snapshot(self, tmp_path: Path) -> None:
+        """The full enumeration survives the round trip (same oracle as the snapshot test)."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.safe_dump(snapshot_config().model_dump(mode="json")))
+        load_registry(config_path)
+        restored = load_registry(config_path)
+        expected = dump_registry(CalcRegistry(snapshot_config(), Path("/B")))
+        assert dump_registry(restored).replace(str(tmp_path), "/B") == expected
+        assert expected == _SNAPSHOT.read_text()
+
+    def test_profiles_loaded_on_first_use(self, config_path: Path) -> None:
+        load_registry(config_path)
+        with patch.object(compiled, "_load_profiles", wraps=compiled._load_profiles) as load:
+            restored = load_registry(config_path)
+            restored.all_calcs  # noqa: B018
+            load.assert_not_called()
+            mk = restored.method_keys[0]
+            assert restored.profiles_for_method(mk)
+            pid = restored.all_profiles[0].id
+            assert restored.get_profile(pid).id == pid
+        load.assert_called_once()
+
+    def test_edited_config_is_rebuilt(self, config_path: Path) -> None:
+        load_registry(config_path)
+        config_path.write_text(SAMPLE_CONFIG_YAML.replace("- name: bf3\n", ""))
+        registry = load_registry(config_path)
+        assert registry.catalyst_order == ["lip"]
+        with _no_load_config():
+            assert load_registry(config_path).catalyst_order == ["lip"]
+
+    def test_edit_during_enumeration_not_stored(self, config_path: Path) -> None:
+        source = config_path.read_bytes()
+        with patch.object(compiled, "_read_bytes", side_effect=[source, source + b"\n"]):
+            load_registry(config_path)
+        assert not _cache_file(config_path).exists()
+
+    @pytest.mark.parametrize(
+        "content", [b"", b"not a registry\n", b"pya3eda-registry\nstale-key\n", None]
+    )
+    def test_unusable_cache_is_replaced(self, config_path: Path, content: bytes | None) -> None:
+        load_registry(config_path)
+        cache = _cache_file(config_path)
+        if content is None:  # right header, truncated body
+            content = cache.read_bytes()[:200]
+        cache.write_bytes(content)
+        assert load_registry(config_path).all_calcs
+        with _no_load_config():
+            load_registry(config_path)
+
+    def test_stored_as_json(self, config_path: Path) -> None:
+        load_registry(config_path)
+        magic, _, header, profiles = _cache_file(config_path).read_bytes().split(b"\n")
+        assert magic == b"pya3eda-registry"
+        assert set(json.loads(header)) == {"config", "method_keys", "contexts", "groups", "rows"}
+        assert isinstance(json.loads(profiles), list)
+
+    def test_pickle_is_never_loaded(self, config_path: Path) -> None:
+        """A pickled body (as older versions wrote) is a miss, never unpickled."""
+        load_registry(config_path)
+        cache = _cache_file(config_path)
+        magic, key, *_ = cache.read_bytes().split(b"\n")
+        cache.write_bytes(magic + b"\n" + key + b"\n" + pickle.dumps(("config", [], [], b"")))
+        with patch("pickle.loads", side_effect=AssertionError("unpickled")):
+            assert load_registry(config_path).all_calcs
+
+    @pytest.mark.parametrize("field", ["stage", "mode"])
+    def test_unknown_vocabulary_is_a_miss(
+        self, config_path: Path, field: str, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        load_registry(config_path)
+        cache = _cache_file(config_path)
+        magic, key, header, profiles = cache.read_bytes().split(b"\n")
+        values = json.loads(header)
+        values["rows"][0][0][{"stage": 2, "mode": 5}[field]] = "bogus"
+        cache.write_bytes(b"\n".join((magic, key, json.dumps(values).encode(), profiles)))
+        with caplog.at_level(logging.DEBUG, logger="pya3eda.registry.compiled"):
+            assert load_registry(config_path).all_calcs
+        assert "unusable: 'bogus'" in caplog.text
+
+    def test_unwritable_base_dir(self, config_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        (config_path.parent / CACHE_DIR).write_text("not a directory")
+        with caplog.at_level(logging.DEBUG, logger="pya3eda.registry.compiled"):
+            assert load_registry(config_path).all_calcs
+        assert "not stored" in caplog.text
+        assert sorted(p.name for p in config_path.parent.iterdir()) == [
+            CACHE_DIR,
+            "config.yaml",
+        ]
+
+    def test_generator_configs_not_stored(self, config_path: Path) -> None:
+        config_path.write_text(
+            SAMPLE_CONFIG_YAML + "complexes:\n  generator: tests.test_registry:pairs_only\n"
+        )
+        assert load_registry(config_path).all_calcs
+        assert not _cache_file(config_path).exists()
+
+    def test_missing_config(self, tmp_path: Path) -> None:
+        with pytest.raises(ConfigError, match="not found"):
+            load_registry(tmp_path / "missing.yaml")
+
+
+class TestRegistryKey:
+    def test_depends_on_source_and_base_dir(self) -> None:
+        key = registry_key(b"levels: []", Path("/a"))
+        assert key == registry_key(b"levels: []", Path("/a"))
+        assert key != registry_key(b"levels: [] ", Path("/a"))
+        assert key != registry_key(b"levels: []", Path("/b"))
+
+    def test_depends_on_enumeration_code(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        key = registry_key(b"", Path("/a"))
+        monkeypatch.setattr(compiled, "_SOURCES", (*compiled._SOURCES, "missing.py"))
+        assert registry_key(b"", Path("/a")) != key
@@ -8,7 +8,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from pya3eda.errors import RunOptionError
-from pya3eda.ids import CalcID, CalcSpec
+from pya3eda.ids import CalcContext, CalcID, CalcSpec
+from pya3eda.ledger import SUBMITTED, JobLedger
 from pya3eda.runner import executor
 from pya3eda.runner.clusters import ClusterConfig, QChemVersion
 from pya3eda.runner.executor import (
@@ -19,6 +20,7 @@ from pya3eda.runner.executor import (
     cores_for,
     run_all,
 )
+from pya3eda.status.checker import get_statuses
 
 # ===================================================================
 # Fixtures / helpers
@@ -54,10 +56,9 @@ def _spec(
         id=cid,
         input_path=inp,
         output_path=inp.with_suffix(".out"),
-        method_name="HF",
-        basis_set="STO-3G",
-        dispersion="false",
-        solvent="false",
+        context=CalcContext(
+            method_name="HF", basis_set="STO-3G", dispersion="false", solvent="false"
+        ),
     )
 
 
@@ -89,7 +90,7 @@ class TestRunAll:
         assert run_all(MagicMock(), criteria="") == 0
 
     def test_missing_input_skipped(self, tmp_path: Path) -> None:
-        reg = MagicMock(all_calcs=[_spec(tmp_path, create=False)])
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[_spec(tmp_path, create=False)])
         be = FakeBackend("slurm")
         with (
             patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
@@ -101,18 +102,20 @@ class TestRunAll:
     def test_criteria_filtering(self, tmp_path: Path) -> None:
         s1 = _spec(tmp_path, stage="reactants")
         s2 = _spec(tmp_path, stage="ts")
-        reg = MagicMock(all_calcs=[s1, s2])
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[s1, s2])
         be = FakeBackend("slurm")
         with (
             patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
             patch.object(executor, "get_backend", return_value=be),
-            patch.object(executor, "should_process", side_effect=lambda s, c: s.id.stage == "ts"),
+            patch.object(
+                executor, "should_process", side_effect=lambda s, c, *_: s.id.stage == "ts"
+            ),
         ):
             assert run_all(reg, criteria="all") == 1
         assert len(be.submitted) == 1
 
     def test_slurm_fire_and_forget_no_throttle(self, tmp_path: Path) -> None:
-        reg = MagicMock(all_calcs=[_spec(tmp_path)])
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[_spec(tmp_path)])
         be = FakeBackend("slurm")
         with (
             patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
@@ -124,7 +127,7 @@ class TestRunAll:
         throttler_cls.assert_not_called()  # fire-and-forget → no throttler
 
     def test_local_backend_throttles_and_waits(self, tmp_path: Path) -> None:
-        reg = MagicMock(all_calcs=[_spec(tmp_path)])
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[_spec(tmp_path)])
         be = FakeBackend("local")
         with (
             patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
@@ -133,9 +136,13 @@ class TestRunAll:
         ):
             assert run_all(reg, criteria="all", max_cores=4) == 1
         assert (tmp_path / "reactants_opt.slurm").exists()  # local script written
+        with JobLedger.open(tmp_path) as ledger:
+            entry = ledger.entry(tmp_path / "reactants_opt.in")
+        assert entry is not None
+        assert (entry.status, entry.backend, entry.cores) == (SUBMITTED, "local", 1)
 
     def test_slurm_wait_uses_throttler(self, tmp_path: Path) -> None:
-        reg = MagicMock(all_calcs=[_spec(tmp_path)])
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[_spec(tmp_path)])
         be = FakeBackend("slurm")
         with (
             patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
@@ -147,7 +154,7 @@ class TestRunAll:
     def test_memory_overflow_skips_job(self, tmp_path: Path) -> None:
         # mem_total far exceeds the 1-cpu * 4000 MB budget → job skipped
         spec = _spec(tmp_path, content="$rem\nmem_total 999999\n$end\n")
-        reg = MagicMock(all_calcs=[spec])
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[spec])
         be = FakeBackend("slurm")
         with (
             patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
@@ -158,7 +165,7 @@ class TestRunAll:
         assert be.submitted == []
 
     def test_max_cores_defaults_to_cpu_count(self, tmp_path: Path) -> None:
-        reg = MagicMock(all_calcs=[_spec(tmp_path)])
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[_spec(tmp_path)])
         be = FakeBackend("local")
         with (
             patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
@@ -170,6 +177,40 @@ class TestRunAll:
         ):
             assert run_all(reg, criteria="all") == 1
 
+    def test_io_threads_prefetch_listings(self, tmp_path: Path) -> None:
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[_spec(tmp_path)])
+        be = FakeBackend("slurm")
+        with (
+            patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
+            patch.object(executor, "get_backend", return_value=be),
+            patch("pya3eda.listing.FileIndex.prefetch") as prefetch,
+        ):
+            assert run_all(reg, criteria="nofile", io_threads=8) == 1
+        assert prefetch.call_args.kwargs["threads"] == 8
+
+    def test_status_criteria_classify_once(self, tmp_path: Path) -> None:
+        crashed, done = _spec(tmp_path, stage="reactants"), _spec(tmp_path, stage="ts")
+        crashed.output_path.write_text("garbage")
+        done.output_path.write_text("Thank you very much for using Q-Chem.\n")
+        reg = MagicMock(base_dir=tmp_path, all_calcs=[crashed, done])
+        be = FakeBackend("slurm")
+        with (
+            patch.object(executor, "detect_cluster", return_value=("g2", _cluster())),
+            patch.object(executor, "get_backend", return_value=be),
+            patch("pya3eda.status.checker.get_statuses", wraps=get_statuses) as statuses,
+        ):
+            assert run_all(reg, criteria="CRASH") == 1
+        assert be.submitted == [tmp_path / "reactants_opt.slurm"]
+        statuses.assert_called_once()  # one batch for the whole run
+
+    def test_submit_job_without_ledger(self, tmp_path: Path) -> None:
+        spec = _spec(tmp_path)
+        be = FakeBackend("slurm")
+        job = executor.prepare_job(spec, RunOptions(), _cluster(), "g2")
+        assert job is not None
+        assert executor.submit_job(spec, job, be) == "job-1"
+        assert not (tmp_path / ".pya3eda").exists()  # nothing recorded
+
 
 # ===================================================================
 # Helpers
@@ -1,13 +1,17 @@
-"""Startup-cost guards: lazy ``__version__`` and a lean ``--help`` import graph."""
+"""Startup-cost guards: lazy ``__version__``, a lean ``--help`` import graph and a
+warm registry load that skips the config parse and the enumeration."""
 
 from __future__ import annotations
 
 import os
 import subprocess
 import sys
+from pathlib import Path
 
 import pytest
 
+from tests.synthetic_outputs import SAMPLE_CONFIG_YAML
+
 
 def test_version_attr_is_lazy_string() -> None:
     """``pya3eda.__version__`` resolves to a string via the PEP 562 __getattr__."""
@@ -56,3 +60,34 @@ def test_help_does_not_import_heavy_deps() -> None:
     imported = proc.stderr
     for mod in ("pandas", "matplotlib", "pydantic", "yaml"):
         assert mod not in imported, f"{mod} was imported on `--help` (startup regression)"
+
+
+def test_warm_registry_load_skips_yaml_and_enumeration(tmp_path: Path) -> None:
+    """A registry restored from the compiled cache neither parses YAML nor enumerates.
+
+    The first load enumerates and stores the registry; the second must not
+    import ``yaml`` or the enumeration modules at all.
+    """
+    config = tmp_path / "config.yaml"
+    config.write_text(SAMPLE_CONFIG_YAML)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(["src", env.get("PYTHONPATH", "")])
+    code = (
+        "import sys; from pya3eda.registry.compiled import load_registry; "
+        "print(len(load_registry(sys.argv[1]).all_calcs))"
+    )
+
+    def load() -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code, str(config)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+    cold, warm = load(), load()
+    assert cold.stdout == warm.stdout
+    assert "pya3eda.registry.calcs" in cold.stderr
+    for mod in ("yaml", "pya3eda.registry.calcs", "pya3eda.registry.profiles"):
+        assert f" {mod}\n" not in warm.stderr, f"{mod} was imported on a warm registry load"
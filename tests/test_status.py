@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import gzip
 import importlib
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from pya3eda.ids import CalcID, CalcSpec
+from pya3eda.cache import OutputCache
+from pya3eda.ids import CalcContext, CalcID, CalcSpec
+from pya3eda.ledger import JobLedger
+from pya3eda.parser.qchem import OptOutputSummary, scan_opt_output
 from pya3eda.status import checker as checker_module
 from pya3eda.status.checker import (
     Status,
+    StatusSnapshot,
     _interleave_opt_sp,
     _validate_opt,
     check_all,
     get_status,
+    get_statuses,
     should_process,
 )
+from tests.synthetic_outputs import CANCELLED_ERR
 
 
 def test_report_logger_idempotent_on_reload() -> None:
@@ -51,13 +59,16 @@ def _make_spec(
         id=cid,
         input_path=input_path,
         output_path=output_path or input_path.with_suffix(".out"),
-        method_name="HF",
-        basis_set="STO-3G",
-        dispersion="false",
-        solvent="false",
+        context=CalcContext(
+            method_name="HF", basis_set="STO-3G", dispersion="false", solvent="false"
+        ),
     )
 
 
+def _summary(text: str) -> OptOutputSummary:
+    return scan_opt_output(text, ("opt_converged", "imag_freq"))
+
+
 # ===================================================================
 # _validate_opt
 # ===================================================================
@@ -67,26 +78,26 @@ class TestValidateOpt:
     def test_min_with_zero_imag_ok(self) -> None:
         text = "**  OPTIMIZATION CONVERGED  **\nThis Molecule has  0 Imaginary Frequencies\n"
         spec = _make_spec(stage="reactants")
-        status, _ = _validate_opt(text, spec)
+        status, _ = _validate_opt(_summary(text), spec)
         assert status is None  # No validation error
 
     def test_ts_with_one_imag_ok(self) -> None:
         text = "** TRANSITION STATE CONVERGED  **\nThis Molecule has  1 Imaginary Frequencies\n"
         spec = _make_spec(stage="ts")
-        status, _ = _validate_opt(text, spec)
+        status, _ = _validate_opt(_summary(text), spec)
         assert status is None
 
     def test_min_with_imag_fails(self) -> None:
         text = "**  OPTIMIZATION CONVERGED  **\nThis Molecule has  1 Imaginary Frequencies\n"
         spec = _make_spec(stage="reactants")
-        status, detail = _validate_opt(text, spec)
+        status, detail = _validate_opt(_summary(text), spec)
         assert status == Status.VALIDATION
         assert "Imag: 1" in detail
 
     def test_ts_with_wrong_imag_fails(self) -> None:
         text = "** TRANSITION STATE CONVERGED  **\nThis Molecule has  2 Imaginary Frequencies\n"
         spec = _make_spec(stage="ts")
-        status, detail = _validate_opt(text, spec)
+        status, detail = _validate_opt(_summary(text), spec)
         assert status == Status.VALIDATION
         assert "Imag: 2" in detail
 
@@ -136,11 +147,52 @@ class TestShouldProcess:
         inp = tmp_path / "mol_opt.in"
         inp.touch()
         spec = _make_spec(input_path=inp)
-        with patch("pya3eda.status.checker.get_status", return_value=(Status.CRASH, "err")):
+        with patch.object(
+            checker_module.StatusSnapshot, "status", return_value=(Status.CRASH, "err")
+        ):
             assert should_process(spec, "CRASH") is True
             assert should_process(spec, "SUCCESSFUL") is False
 
 
+# ===================================================================
+# StatusSnapshot
+# ===================================================================
+
+
+class TestStatusSnapshot:
+    def _specs(self, tmp_path: Path) -> list[CalcSpec]:
+        specs = []
+        for d in ("a", "b"):
+            (tmp_path / d).mkdir()
+            inp = tmp_path / d / "mol_sp.in"
+            inp.touch()
+            inp.with_suffix(".out").write_text("garbage")
+            specs.append(_make_spec(input_path=inp, mode="sp"))
+        return specs
+
+    def test_each_output_is_read_once(self, tmp_path: Path) -> None:
+        specs = self._specs(tmp_path)
+        snapshot = StatusSnapshot()
+        with patch.object(checker_module, "_classify", wraps=checker_module._classify) as classify:
+            assert [s for s, _ in snapshot.statuses([*specs, specs[0]])] == [Status.CRASH] * 3
+            assert snapshot.status(specs[1])[0] == Status.CRASH
+            assert should_process(specs[0], "CRASH", snapshot)
+            assert not should_process(specs[0], "nofile", snapshot)
+        assert classify.call_count == 2
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        specs = self._specs(tmp_path)
+        snapshot = StatusSnapshot()
+        snapshot.statuses(specs)
+        for spec in specs:
+            spec.output_path.write_text("Thank you very much for using Q-Chem.\n")
+        assert snapshot.status(specs[0])[0] == Status.CRASH  # remembered
+        snapshot.invalidate(specs[0])
+        assert [s for s, _ in snapshot.statuses(specs)] == [Status.SUCCESSFUL, Status.CRASH]
+        snapshot.invalidate()
+        assert snapshot.status(specs[1])[0] == Status.SUCCESSFUL
+
+
 # ===================================================================
 # get_status
 # ===================================================================
@@ -243,6 +295,99 @@ class TestGetStatus:
         assert status == Status.CRASH
 
 
+class TestGetStatuses:
+    def test_worker_processes_match_serial(self, tmp_path: Path) -> None:
+        outputs = {
+            "done": "Thank you very much for using Q-Chem.\nTotal job time: 1.00s(wall)\n",
+            "crash": "some unknown content without any patterns",
+            "empty": "",
+        }
+        specs = [_make_spec(input_path=tmp_path / "missing.in")]
+        for name, text in outputs.items():
+            inp = tmp_path / f"{name}.in"
+            inp.touch()
+            inp.with_suffix(".out").write_text(text)
+            specs.append(_make_spec(input_path=inp, mode="sp"))
+        (tmp_path / "running.in").touch()
+        (tmp_path / "running.in_12345.67890").touch()
+        specs.append(_make_spec(input_path=tmp_path / "running.in"))
+
+        serial = get_statuses(specs)
+        assert [s for s, _ in serial] == [
+            Status.ABSENT,
+            Status.SUCCESSFUL,
+            Status.CRASH,
+            Status.NOFILE,
+            Status.RUNNING,
+        ]
+        assert get_statuses(specs, jobs=2) == serial
+
+    def test_io_threads_match_serial(self, tmp_path: Path) -> None:
+        specs = []
+        for i, text in enumerate(["Thank you very much for using Q-Chem.\n", "garbage", ""]):
+            d = tmp_path / f"d{i}"
+            d.mkdir()
+            inp = d / "calc.in"
+            inp.touch()
+            if text:
+                inp.with_suffix(".out").write_text(text)
+            specs.append(_make_spec(input_path=inp, mode="sp"))
+        serial = get_statuses(specs)
+        with OutputCache.open(tmp_path) as cache, JobLedger.open(tmp_path) as ledger:
+            ledger.record_statuses([(specs[0].input_path, "SUCCESSFUL", "Recorded")])
+            threaded = get_statuses(specs, cache, io_threads=4, ledger=ledger)
+        assert threaded[1:] == serial[1:]
+        assert threaded[0] == (Status.SUCCESSFUL, "Recorded")
+
+    def test_lists_each_directory_once(self, tmp_path: Path) -> None:
+        specs = []
+        for i in range(5):
+            inp = tmp_path / f"calc{i}.in"
+            inp.touch()
+            specs.append(_make_spec(input_path=inp, mode="sp"))
+        with (
+            patch("pya3eda.listing.os.scandir", wraps=os.scandir) as scandir,
+            patch.object(Path, "glob") as glob,
+        ):
+            statuses = get_statuses(specs)
+        assert {status for status, _ in statuses} == {Status.NOFILE}
+        assert scandir.call_count == 1
+        glob.assert_not_called()
+
+    def test_compressed_err(self, tmp_path: Path) -> None:
+        inp = tmp_path / "mol_opt.in"
+        inp.touch()
+        (tmp_path / "mol_opt.err.gz").write_bytes(gzip.compress(CANCELLED_ERR.encode()))
+        assert get_status(_make_spec(input_path=inp))[0] == Status.TERMINATED
+
+    def test_ledger_terminal_statuses_are_trusted(self, tmp_path: Path) -> None:
+        done, running = tmp_path / "done.in", tmp_path / "running.in"
+        for inp in (done, running):
+            inp.touch()
+        (tmp_path / "running.in_12345.67890").touch()
+        specs = [_make_spec(input_path=p, mode="sp") for p in (done, running)]
+        with JobLedger.open(tmp_path) as ledger:
+            ledger.record_statuses([(done, "SUCCESSFUL", "Recorded"), (running, "CRASH", "")])
+            ledger.record_submission(running, "7", backend="local", cores=1)
+            with patch.object(checker_module, "_classify") as classify:
+                classify.return_value = (Status.RUNNING, "Job running")
+                statuses = get_statuses(specs, ledger=ledger)
+            assert statuses == [(Status.SUCCESSFUL, "Recorded"), (Status.RUNNING, "Job running")]
+            classify.assert_called_once()  # only the non-terminal one is read
+            entry = ledger.entry(running)
+            assert entry is not None and entry.status == "running"
+
+            # --recheck reads everything, and the ledger learns the real status.
+            assert get_statuses(specs, ledger=ledger, recheck=True)[0][0] == Status.NOFILE
+            entry = ledger.entry(done)
+            assert entry is not None and entry.status == "nofile"
+
+    def test_absent_inputs_are_not_recorded(self, tmp_path: Path) -> None:
+        with JobLedger.open(tmp_path) as ledger:
+            get_status(_make_spec(input_path=tmp_path / "missing.in"), ledger=ledger)
+            assert ledger.entries() == {}
+
+
 # ===================================================================
 # _interleave_opt_sp
 # ===================================================================
@@ -305,6 +450,29 @@ class TestCheckAll:
         # Should not raise
         check_all(reg)
         reg.by_method.assert_called_once_with("test")
+        with JobLedger.open(tmp_path) as ledger:
+            entry = ledger.entry(inp)
+        assert entry is not None and entry.status == "SUCCESSFUL"
+
+    def test_summary_only(self, tmp_path: Path) -> None:
+        inp = tmp_path / "mol_sp.in"
+        inp.touch()
+        inp.with_suffix(".out").write_text("Q-Chem fatal error occurred\n")
+        reg = MagicMock(base_dir=tmp_path, method_keys=["test"])
+        reg.by_method.return_value = [_make_spec(input_path=inp, mode="sp")]
+
+        with (
+            patch.object(checker_module, "_report") as report,
+            patch("pya3eda.parser.qchem._crash_detail") as crash_detail,
+        ):
+            check_all(reg, summary_only=True)
+        crash_detail.assert_not_called()
+        lines = [call.args[0] for call in report.info.call_args_list]
+        assert "    Summary for test:" in lines
+        assert lines.count("    CRASH : 1") == 2  # group and overall
+        assert not any("mol_sp" in line for line in lines)
+        with JobLedger.open(tmp_path) as ledger:
+            assert ledger.entry(inp) is None  # detail-free statuses are not recorded
 
     def test_empty_method(self) -> None:
         reg = MagicMock()
@@ -325,14 +493,14 @@ class TestValidateOptExtra:
         """Non-converged, no freq → no validation issue."""
         text = "some output text without convergence or freq info"
         spec = _make_spec(stage="ts")
-        status, _ = _validate_opt(text, spec)
+        status, _ = _validate_opt(_summary(text), spec)
         assert status is None
 
     def test_ts_with_no_imag(self) -> None:
         """TS with converged but imag=0 → VALIDATION (expects 1)."""
         text = "** TRANSITION STATE CONVERGED  **\nThis Molecule has  0 Imaginary Frequencies\n"
         spec = _make_spec(stage="ts")
-        status, detail = _validate_opt(text, spec)
+        status, detail = _validate_opt(_summary(text), spec)
         assert status == Status.VALIDATION
         assert "Imag: 0" in detail
 
@@ -340,7 +508,7 @@ class TestValidateOptExtra:
         """Non-TS converged with 0 imag → OK."""
         text = "**  OPTIMIZATION CONVERGED  **\nThis Molecule has  0 Imaginary Frequencies\n"
         spec = _make_spec(stage="reactants")
-        status, _ = _validate_opt(text, spec)
+        status, _ = _validate_opt(_summary(text), spec)
         assert status is None
 
 
@@ -354,11 +522,12 @@ class TestGetStatusValueError:
         """parse_status returning an unknown string → CRASH via ValueError."""
         inp = tmp_path / "mol_opt.in"
         inp.touch()
+        (tmp_path / "mol_opt.out").write_text("Running on host\n")
         with patch(
-            "pya3eda.status.checker.parse_status",
+            "pya3eda.status.checker.parse_status_file",
             return_value=("SOME_UNKNOWN_STATUS", "detail"),
         ):
-            spec = _make_spec(input_path=inp, mode="sp")
+            spec = _make_spec(input_path=inp, output_path=tmp_path / "mol_opt.out", mode="sp")
             status, _ = get_status(spec)
             assert status == Status.CRASH
 
@@ -381,7 +550,7 @@ class TestCheckAllRelDisplay:
         reg.by_method.return_value = [spec]
 
         with patch(
-            "pya3eda.status.checker.get_status",
-            return_value=(Status.NOFILE, "not found"),
+            "pya3eda.status.checker.get_statuses",
+            return_value=[(Status.NOFILE, "not found")],
         ):
             check_all(reg)
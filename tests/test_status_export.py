@@ -0,0 +1,114 @@
+"""Tests for pya3eda.status.export — machine-readable ``status --format`` output."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pya3eda.errors import RunOptionError
+from pya3eda.ids import CalcContext, CalcID, CalcSpec
+from pya3eda.status.export import FIELDS, SUMMARY_FIELDS, _wall_seconds, export_all
+
+DONE = "Thank you very much for using Q-Chem.\nTotal job time: 3725.00s(wall)\n"
+
+
+def _spec(tmp_path: Path, stage: str, method_key: str, output: str | None) -> CalcSpec:
+    inp = tmp_path / method_key / f"{stage}_sp.in"
+    inp.parent.mkdir(exist_ok=True)
+    inp.touch()
+    if output is not None:
+        inp.with_suffix(".out").write_text(output)
+    return CalcSpec(
+        id=CalcID(method_key=method_key, stage=stage, species="mol", mode="sp"),
+        input_path=inp,
+        output_path=inp.with_suffix(".out"),
+        context=CalcContext(
+            method_name="HF", basis_set="STO-3G", dispersion="false", solvent="false"
+        ),
+    )
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> MagicMock:
+    specs = [
+        _spec(tmp_path, "reactants", "m1", DONE),
+        _spec(tmp_path, "products", "m1", None),
+        _spec(tmp_path, "reactants", "m2", "Q-Chem fatal error occurred\nSGeom Failed\n"),
+    ]
+    reg = MagicMock(base_dir=tmp_path, method_keys=["m1", "m2", "empty"])
+    reg.by_method.side_effect = lambda mk: [s for s in specs if s.id.method_key == mk]
+    return reg
+
+
+def _export(registry: MagicMock, fmt: str, **kwargs: Any) -> str:
+    out = io.StringIO()
+    export_all(registry, fmt, stream=out, **kwargs)
+    return out.getvalue()
+
+
+class TestExportAll:
+    def test_jsonl(self, registry: MagicMock) -> None:
+        records = [json.loads(line) for line in _export(registry, "jsonl").splitlines()]
+        assert [tuple(r) for r in records] == [FIELDS] * 3
+        done, missing, crashed = records
+        assert done["method_key"] == "m1"
+        assert (done["stage"], done["species"], done["mode"]) == ("reactants", "mol", "sp")
+        assert done["catalyst"] is None
+        assert done["input"] == "m1/reactants_sp"
+        assert (done["status"], done["wall_time_s"]) == ("SUCCESSFUL", 3725)
+        assert done["output_bytes"] == len(DONE)
+        assert (missing["status"], missing["wall_time_s"], missing["output_bytes"]) == (
+            "nofile",
+            None,
+            None,
+        )
+        assert (crashed["status"], crashed["detail"]) == ("CRASH", "Geometry optimization failed")
+
+    def test_csv(self, registry: MagicMock) -> None:
+        rows = list(csv.DictReader(io.StringIO(_export(registry, "csv", io_threads=4))))
+        assert [row["status"] for row in rows] == ["SUCCESSFUL", "nofile", "CRASH"]
+        assert rows[0]["wall_time_s"] == "3725"
+        assert rows[1]["output_bytes"] == ""
+
+    @pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+    def test_summary_only(self, registry: MagicMock, fmt: str) -> None:
+        with patch("pya3eda.parser.qchem._parse_wall_time") as wall_time:
+            text = _export(registry, fmt, summary_only=True)
+        wall_time.assert_not_called()
+        if fmt == "jsonl":
+            records = [json.loads(line) for line in text.splitlines()]
+        else:
+            records = list(csv.DictReader(io.StringIO(text)))
+        assert all(tuple(r) == SUMMARY_FIELDS for r in records)
+        counts = {(r["method_key"] or None, r["status"]): int(r["count"]) for r in records}
+        assert counts == {
+            ("m1", "SUCCESSFUL"): 1,
+            ("m1", "nofile"): 1,
+            ("m2", "CRASH"): 1,
+            (None, "SUCCESSFUL"): 1,
+            (None, "nofile"): 1,
+            (None, "CRASH"): 1,
+        }
+
+    def test_stdout_by_default(self, registry: MagicMock, capsys: pytest.CaptureFixture) -> None:
+        export_all(registry, "jsonl", summary_only=True)
+        assert len(capsys.readouterr().out.splitlines()) == 6
+
+    def test_unknown_format(self, registry: MagicMock) -> None:
+        with pytest.raises(RunOptionError, match="xml"):
+            export_all(registry, "xml")
+
+
+class TestWallSeconds:
+    @pytest.mark.parametrize(
+        ("detail", "seconds"),
+        [("Completed in 01:02:05", 3725), ("Completed in 123:00:00", 442800), ("", None)],
+    )
+    def test_parse(self, detail: str, seconds: int | None) -> None:
+        assert _wall_seconds(detail) == seconds
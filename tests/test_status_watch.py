@@ -0,0 +1,107 @@
+"""Tests for pya3eda.status.watch — incremental ``status --watch`` refreshes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from pya3eda.ids import CalcContext, CalcID, CalcSpec
+from pya3eda.status import checker, watch
+from pya3eda.status.checker import Status
+from pya3eda.status.watch import StatusWatcher, watch_all
+
+DONE = "Thank you very much for using Q-Chem.\nTotal job time: 1.00s(wall)\n"
+
+
+def _spec(tmp_path: Path, stage: str, method_key: str = "m") -> CalcSpec:
+    inp = tmp_path / method_key / f"{stage}_sp.in"
+    inp.parent.mkdir(exist_ok=True)
+    inp.touch()
+    return CalcSpec(
+        id=CalcID(method_key=method_key, stage=stage, species="mol", mode="sp"),
+        input_path=inp,
+        output_path=inp.with_suffix(".out"),
+        context=CalcContext(
+            method_name="HF", basis_set="STO-3G", dispersion="false", solvent="false"
+        ),
+    )
+
+
+def _touch_later(path: Path, text: str) -> None:
+    """Rewrite *path* with a distinct mtime (so its stamp changes even at equal size)."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestStatusWatcher:
+    def test_only_changed_outputs_are_reclassified(self, tmp_path: Path) -> None:
+        a, b = _spec(tmp_path, "reactants"), _spec(tmp_path, "products")
+        watcher = StatusWatcher([a, b])
+        with patch.object(checker, "_classify", wraps=checker._classify) as classify:
+            first = watcher.refresh()
+            assert [(c.spec, c.old, c.new[0]) for c in first] == [
+                (a, None, Status.NOFILE),
+                (b, None, Status.NOFILE),
+            ]
+            assert watcher.refresh() == []  # nothing changed → nothing read
+            assert classify.call_count == 2
+
+            _touch_later(a.output_path, DONE)
+            (change,) = watcher.refresh()
+            assert change.spec == a
+            assert change.old is not None and change.old[0] == Status.NOFILE
+            assert change.new[0] == Status.SUCCESSFUL
+            assert classify.call_count == 3
+
+            _touch_later(a.output_path, DONE)  # changed file, same status
+            assert watcher.refresh() == []
+            assert classify.call_count == 4
+        assert watcher.statuses([b, a])[1][0] == Status.SUCCESSFUL
+
+    def test_sentinel_counts_as_a_change(self, tmp_path: Path) -> None:
+        a = _spec(tmp_path, "reactants")
+        watcher = StatusWatcher([a], io_threads=4)
+        watcher.refresh()
+        (a.input_path.parent / "reactants_sp.in_12345.67890").touch()
+        (change,) = watcher.refresh()
+        assert change.new[0] == Status.RUNNING
+
+
+class TestWatchAll:
+    def _registry(self, tmp_path: Path) -> tuple[MagicMock, list[CalcSpec]]:
+        specs = [_spec(tmp_path, "reactants", "m1"), _spec(tmp_path, "products", "m2")]
+        reg = MagicMock(base_dir=tmp_path, method_keys=["m1", "m2"])
+        reg.by_method.side_effect = lambda mk: [s for s in specs if s.id.method_key == mk]
+        return reg, specs
+
+    def test_prints_only_changes(self, tmp_path: Path) -> None:
+        reg, specs = self._registry(tmp_path)
+        sleeps: list[float] = []
+
+        def finish_first(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                _touch_later(specs[0].output_path, DONE)
+
+        with (
+            patch.object(watch.time, "sleep", side_effect=finish_first),
+            patch.object(watch, "_report") as report,
+            patch.object(checker, "_report") as full_report,
+        ):
+            watch_all(reg, interval=2.0, rounds=2)
+        assert sleeps == [2.0, 2.0]
+        assert full_report.info.call_count > 0  # the initial grouped report
+        lines = [call.args[0] for call in report.info.call_args_list]
+        assert len(lines) == 2
+        assert "m1/reactants_sp | SP | nofile -> SUCCESSFUL" in lines[0]
+        assert lines[1].endswith("Summary for m1: SUCCESSFUL 1")
+
+    def test_stops_on_interrupt(self, tmp_path: Path) -> None:
+        reg, _ = self._registry(tmp_path)
+        with (
+            patch.object(watch.time, "sleep", side_effect=KeyboardInterrupt),
+            patch.object(checker, "_report"),
+        ):
+            watch_all(reg)  # returns instead of raising
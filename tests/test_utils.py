@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import math
+import sys
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from pya3eda import constants as C
-from pya3eda.utils import convert_unit, read_text, standard_state_correction, write_text
+from pya3eda.errors import PyA3EDAError
+from pya3eda.utils import (
+    convert_unit,
+    find_file,
+    map_file,
+    open_compressed,
+    read_ends,
+    read_text,
+    standard_state_correction,
+    write_text,
+)
 
 # ===================================================================
 # convert_unit
@@ -100,3 +113,83 @@ class TestFileIO:
         path = tmp_path / "a" / "b" / "c" / "file.txt"
         write_text(path, "data")
         assert path.exists()
+
+    def test_map_missing_yields_none(self, tmp_path) -> None:
+        with map_file(tmp_path / "does_not_exist.out") as buf:
+            assert buf is None
+
+    def test_map_empty_yields_empty_bytes(self, tmp_path) -> None:
+        path = tmp_path / "empty.out"
+        path.touch()
+        with map_file(path) as buf:
+            assert buf == b""
+
+    def test_map_exposes_raw_bytes(self, tmp_path) -> None:
+        path = tmp_path / "job.out"
+        write_text(path, "Å line\n")
+        with map_file(path) as buf:
+            assert buf is not None
+            assert buf[:] == "Å line\n".encode()
+
+
+# ===================================================================
+# Compressed files
+# ===================================================================
+
+
+def _compress(path: Path, data: bytes) -> Path:
+    with open_compressed(path, "wb") as fh:
+        fh.write(data)
+    return path
+
+
+@pytest.mark.parametrize("fmt", ["gz", "zst", "xz"])
+class TestCompressedFiles:
+    def test_round_trip(self, tmp_path: Path, fmt: str) -> None:
+        path = _compress(tmp_path / f"job.out.{fmt}", b"payload\n")
+        with open_compressed(path) as fh:
+            assert fh.read() == b"payload\n"
+
+    def test_read_text_falls_back_to_compressed(self, tmp_path: Path, fmt: str) -> None:
+        _compress(tmp_path / f"job.err.{fmt}", "Å\n".encode())
+        assert read_text(tmp_path / "job.err") == "Å\n"
+
+    def test_map_file_decompresses(self, tmp_path: Path, fmt: str) -> None:
+        _compress(tmp_path / f"job.out.{fmt}", b"abc")
+        with map_file(tmp_path / "job.out") as buf:
+            assert buf == b"abc"
+
+
+class TestFindFile:
+    def test_plain_file_wins(self, tmp_path: Path) -> None:
+        (tmp_path / "job.out").touch()
+        (tmp_path / "job.out.gz").touch()
+        assert find_file(tmp_path / "job.out") == tmp_path / "job.out"
+
+    def test_compressed_sibling(self, tmp_path: Path) -> None:
+        (tmp_path / "job.out.xz").touch()
+        assert find_file(tmp_path / "job.out") == tmp_path / "job.out.xz"
+
+    def test_missing(self, tmp_path: Path) -> None:
+        assert find_file(tmp_path / "job.out") is None
+
+    def test_zstd_without_zstandard(self, tmp_path: Path) -> None:
+        with (
+            patch.dict(sys.modules, {"zstandard": None}),
+            pytest.raises(PyA3EDAError, match="zstd"),
+        ):
+            open_compressed(tmp_path / "job.out.zst")
+
+
+class TestReadEnds:
+    def test_small_file_is_whole(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.out"
+        path.write_bytes(b"0123456789")
+        assert read_ends(path, 16) == (b"0123456789", b"0123456789", 10)
+
+    def test_large_compressed_file(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * 10_000
+        path = _compress(tmp_path / "job.out.gz", data)
+        with patch("pya3eda.utils._CHUNK", 1000):
+            head, tail, size = read_ends(path, 300)
+        assert (head, tail, size) == (data[:300], data[-300:], len(data))